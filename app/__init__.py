@@ -10,12 +10,12 @@ __version__ = '0.0.1'
 
 import argparse
 import flask
-import imp
+import importlib.util
 import logging
 import os
 
-from flask.ext.sqlalchemy import SQLAlchemy
-
+from .database import SQLAlchemy
+from . import registry
 from . import responses
 
 
@@ -32,20 +32,28 @@ http://docs.sqlalchemy.org/en/latest/
 """
 db = SQLAlchemy(session_options={"autoflush": False})
 
-logging.basicConfig(level=logging.DEBUG)
+"""Setup Logging.
+
+Handlers and levels are configured by `log.configure` when the
+Application is constructed, from the `LOG_*` settings.
+"""
 logger = logging.getLogger(__name__)
 
 responses = responses.Responses()
 
+registry = registry.PracticeRegistry()
+
 
-def create_application():
+def create_application(environment='production.ProductionConfig',
+                       config=None):
 
     from . import application
     from . import errors
 
     instance = application.Application(
         name='__main__',
-        environment='production.ProductionConfig'
+        environment=environment,
+        config=config
     )
 
     errors = errors.ErrorHandlers(instance.app)
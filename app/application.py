@@ -1,18 +1,27 @@
 #!/usr/bin/env python
 
 import os
+import sys
+import time
 
 from flask import request
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
 
 from . import db
 from . import flask
-from . import imp
+from . import importlib
+from . import instrumentation
+from . import jobs
+from . import log
 from . import logger
+from . import metrics
+from . import registry
 
 
 class Application(object):
 
-    def __init__(self, environment, name, extensions=None):
+    def __init__(self, environment, name, extensions=None, config=None):
         """Application Constructor.
 
         Setup our base Flask application, retaining it as our application
@@ -24,6 +33,8 @@ class Application(object):
             The name of the application.
         :param (str) environment
             The name of the environment in which to load the application.
+        :param (dict) config
+            Settings that override those of the environment.
         """
 
         extensions = extensions or {}
@@ -40,10 +51,34 @@ class Application(object):
 
         self.app.config.from_object(('app.config.%s') % (environment))
 
+        self.app.config.update(config or {})
+
+        self.app.config['ENVIRONMENT'] = environment
+
+        # Kept so worker processes are built with the same settings.
+
+        self.app.config['CONFIG_OVERRIDES'] = dict(config or {})
+
+        # Configure logging for the environment.
+
+        self.log_profile = log.configure(self.app.config)
+
         # Set up Cross-Origin Resource Sharing (CORS) rules.
 
         self.app.after_request(self.setup_cors)
 
+        # Time each request and count its database queries.
+
+        instrumentation.setup(self.app)
+
+        # Export request counts and latencies at `/metrics`.
+
+        metrics.setup(self.app)
+
+        # Accept long-running portfolios as background jobs at `/v1/jobs`.
+
+        jobs.setup(self.app)
+
         # Load system modules.
 
         self.load_modules()
@@ -52,6 +87,10 @@ class Application(object):
 
         self.setup_database()
 
+        # Import and preload the practices in `PRACTICE_WARMUP`.
+
+        self.warm_practices()
+
     def setup_cors(self, response):
         """Define global Cross-Origin Resource Sharing rules.
 
@@ -92,30 +131,156 @@ class Application(object):
         return response
 
     def setup_database(self):
-        """Setup all database schemas."""
-        logger.info('Application is setting up database')
+        """Setup all database schemas.
+
+        `DATABASE_SCHEMA_MODE` controls what happens at startup:
+
+        `'create'` (the default)
+            Create any missing tables with `db.create_all()`, which
+            inspects the catalog for every table.
+        `'alembic'`
+            Trust the schema managed by Alembic migrations and only read
+            the `alembic_version` table, in a single query. Set
+            `DATABASE_SCHEMA_REVISION` to also require that revision.
+        `'none'`
+            Do not touch the database.
+        """
+        mode = self.app.config.get('DATABASE_SCHEMA_MODE', 'create')
+
+        logger.info(
+            'Application is setting up database (schema mode `%s`)', mode)
 
         db.init_app(self.app)
         db.app = self.app
 
-        db.create_all()
+        started = time.time()
+
+        if mode == 'create':
+
+            db.create_all()
+
+        elif mode == 'alembic':
+
+            self.check_schema_revision()
+
+        elif mode != 'none':
+
+            raise ValueError('Unknown DATABASE_SCHEMA_MODE `%s`.' % mode)
+
+        logger.info(
+            'Application set up database in %.1f ms.',
+            (time.time() - started) * 1000)
+
+    def check_schema_revision(self):
+        """Verify that Alembic has migrated the database.
+
+        :raise RuntimeError: If the database has no Alembic revision, or
+            not the one in `DATABASE_SCHEMA_REVISION`.
+        """
+        expected = self.app.config.get('DATABASE_SCHEMA_REVISION')
+
+        try:
+
+            revisions = [
+                row[0] for row in db.session.execute(
+                    text('SELECT version_num FROM alembic_version'))
+            ]
+
+        except SQLAlchemyError as error:
+
+            raise RuntimeError(
+                'Unable to read the Alembic revision; run the migrations'
+                ' or set DATABASE_SCHEMA_MODE to `create`: %s' % error)
+
+        finally:
+
+            db.session.remove()
+
+        if not revisions:
+
+            raise RuntimeError('The database has no Alembic revision.')
+
+        if expected and expected not in revisions:
+
+            raise RuntimeError(
+                'The database is at Alembic revision %s, not %s.' % (
+                    ', '.join(revisions),
+                    expected))
+
+        logger.info(
+            'Application database is at Alembic revision %s.',
+            ', '.join(revisions))
+
+    def import_module(self, module_name, module_path):
+        """Import the module package found at `module_path`.
+
+        The package is imported under its directory name, as a top level
+        module, and reused if it has already been imported.
+
+        :param (str) module_name
+            the module directory name
+        :param (str) module_path
+            the module directory path
+        """
+        if module_name in sys.modules:
+
+            return sys.modules[module_name]
+
+        init_path = os.path.join(module_path, '__init__.py')
+
+        if not os.path.isfile(init_path):
+
+            raise ImportError('No module named %s' % module_name)
+
+        spec = importlib.util.spec_from_file_location(
+            module_name,
+            init_path,
+            submodule_search_locations=[module_path]
+        )
+
+        module = importlib.util.module_from_spec(spec)
+
+        sys.modules[module_name] = module
+
+        try:
+
+            spec.loader.exec_module(module)
+
+        except Exception:
+
+            del sys.modules[module_name]
+
+            raise
+
+        return module
 
     def load_modules(self):
         """Load all application modules.
 
         Open the module path defined in the configuration, for each module
-        directory found in the defined module path we need to `load_module`,
-        and create a Flask Blueprint with the module information.
+        directory found in the defined module path we need to import the
+        module package, and register its Flask Blueprint.
+
+        Practice modules only register themselves here; their utilities
+        are imported on first use, or now if listed in `PRACTICE_WARMUP`
+        (use `'*'` for every practice).
 
         :param (object) self
             the current class (i.e., Application)
         """
         logger.info('Application beginning to load modules')
 
-        logger.info('Application config: %s', self.app.config)
+        logger.info(
+            'Application environment `%s` with logging profile `%s`.',
+            self.environment,
+            self.log_profile)
+
+        logger.debug(
+            'Application config keys: %s',
+            ', '.join(sorted(self.app.config)))
 
         modules_path = self.app.config['MODULE_PATH']
-        modules_directory = os.listdir(modules_path)
+        modules_directory = sorted(os.listdir(modules_path))
 
         modules_list = {}
 
@@ -123,20 +288,21 @@ class Application(object):
 
             module_path = os.path.join(modules_path, module_name)
 
+            # Skip bytecode caches and hidden directories.
+
+            if module_name.startswith(('_', '.')):
+
+                continue
+
             if os.path.isdir(module_path):
 
-                try:
+                started = time.time()
 
-                    file_, pathname, descr = imp.find_module(
-                        module_name,
-                        [modules_path]
-                    )
+                try:
 
-                    modules_list[module_name] = imp.load_module(
+                    modules_list[module_name] = self.import_module(
                         module_name,
-                        file_,
-                        pathname,
-                        descr
+                        module_path
                     )
 
                 except ImportError:
@@ -145,9 +311,11 @@ class Application(object):
                         'Unable to locate the `__init__.py`'
                         ' file in your %s module.' % module_name
                     )
-                    
+
                     raise
 
+                elapsed = (time.time() - started) * 1000
+
                 # Register module as Flask blueprint.
 
                 if hasattr(modules_list[module_name], 'module'):
@@ -157,8 +325,8 @@ class Application(object):
                     self.app.register_blueprint(module_blueprint)
 
                     logger.info(
-                        'Application successfully loaded `%s` module.' %
-                        module_name
+                        'Application successfully loaded `%s` module'
+                        ' in %.1f ms.' % (module_name, elapsed)
                     )
 
                 else:
@@ -167,3 +335,37 @@ class Application(object):
                         'Application failed to load `%s` module.' %
                         module_name
                     )
+
+        logger.info(
+            'Application registered practices: %s',
+            ', '.join(registry.codes())
+        )
+
+    def warm_practices(self):
+        """Warm the practices in `PRACTICE_WARMUP`.
+
+        Runs once the database is set up, since `Practice.warm` lets the
+        utilities preload their data, e.g. the load rate index.
+        """
+        warmup = self.app.config.get('PRACTICE_WARMUP', [])
+
+        if warmup == '*':
+
+            warmup = registry.codes()
+
+        for code in warmup:
+
+            practice = registry.get(code)
+
+            if practice is None:
+
+                logger.error(
+                    'Application cannot warm unknown practice `%s`.' % code
+                )
+
+                continue
+
+            with self.app.app_context():
+
+                practice.warm(
+                    tables=self.app.config.get('CURVE_TABLES', False))
@@ -0,0 +1,30 @@
+#!/usr/bin/env python
+
+"""Configuration for the benchmarks in `benchmarks/`.
+
+Runs against a local SQLite database, seeded from
+`app/static/data/load_rate.json` by the benchmark runners. Set
+`BENCHMARK_DATABASE_URI` to point the benchmarks at Postgres instead.
+"""
+
+import os
+import tempfile
+
+from .default import DefaultConfig
+
+
+class BenchmarkConfig(DefaultConfig):
+
+    SQLALCHEMY_DATABASE_URI = os.environ.get(
+        'BENCHMARK_DATABASE_URI',
+        'sqlite:///%s' % os.path.join(
+            tempfile.gettempdir(),
+            'stream_restoration_benchmark.db'
+        )
+    )
+
+    PRACTICE_WARMUP = '*'
+
+    LOG_PROFILE = 'production'
+
+    LOG_FORMAT = 'text'
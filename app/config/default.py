@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+
+"""Settings shared by every environment.
+
+Environments subclass `DefaultConfig` and are selected by name, e.g.
+`--environment production.ProductionConfig`. Deployment specific values
+are read from the environment variables below, so no credentials live in
+the repository.
+
+`DATABASE_URL`
+    The SQLAlchemy database URI.
+`ACCESS_CONTROL_ALLOW_ORIGIN`
+    Comma separated origins allowed by CORS.
+`DATABASE_SCHEMA_MODE`, `DATABASE_SCHEMA_REVISION`
+    How the schema is checked at startup; see
+    `Application.setup_database`. Use `alembic` where migrations manage
+    the schema, so workers boot without catalog queries.
+`DATABASE_POOL_SIZE`, `DATABASE_MAX_OVERFLOW`, `DATABASE_POOL_TIMEOUT`,
+`DATABASE_POOL_RECYCLE`, `DATABASE_POOL_PRE_PING`,
+`DATABASE_STATEMENT_TIMEOUT`
+    Engine settings; see `app/database.py`. Size the pool to the threads
+    of a worker process: requests beyond `pool size + overflow` wait up
+    to `DATABASE_POOL_TIMEOUT` seconds for a connection.
+"""
+
+import os
+
+
+APP_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def environ_int(name, default):
+
+    value = os.environ.get(name)
+
+    return int(value) if value not in (None, '') else default
+
+
+def environ_bool(name, default):
+
+    value = os.environ.get(name)
+
+    if value in (None, ''):
+
+        return default
+
+    return value.lower() in ('1', 'true', 'yes', 'on')
+
+
+def environ_list(name, default):
+
+    value = os.environ.get(name)
+
+    if value is None:
+
+        return default
+
+    return [item.strip() for item in value.split(',') if item.strip()]
+
+
+class DefaultConfig(object):
+
+    DEBUG = False
+
+    TESTING = False
+
+    MODULE_PATH = os.path.join(APP_PATH, 'modules')
+
+    SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL')
+
+    SQLALCHEMY_TRACK_MODIFICATIONS = False
+
+    DATABASE_SCHEMA_MODE = os.environ.get('DATABASE_SCHEMA_MODE', 'create')
+
+    DATABASE_SCHEMA_REVISION = os.environ.get('DATABASE_SCHEMA_REVISION')
+
+    SQLALCHEMY_POOL_SIZE = environ_int('DATABASE_POOL_SIZE', 10)
+
+    SQLALCHEMY_MAX_OVERFLOW = environ_int('DATABASE_MAX_OVERFLOW', 10)
+
+    SQLALCHEMY_POOL_TIMEOUT = environ_int('DATABASE_POOL_TIMEOUT', 10)
+
+    SQLALCHEMY_POOL_RECYCLE = environ_int('DATABASE_POOL_RECYCLE', 1800)
+
+    SQLALCHEMY_POOL_PRE_PING = environ_bool('DATABASE_POOL_PRE_PING', True)
+
+    DATABASE_STATEMENT_TIMEOUT = environ_int(
+        'DATABASE_STATEMENT_TIMEOUT',
+        30000)
+
+    ACCESS_CONTROL_ALLOW_ORIGIN = environ_list(
+        'ACCESS_CONTROL_ALLOW_ORIGIN',
+        [])
+
+    ACCESS_CONTROL_ALLOW_METHODS = 'GET, POST, OPTIONS'
+
+    ACCESS_CONTROL_ALLOW_HEADERS = 'Content-Type'
+
+    ACCESS_CONTROL_ALLOW_CREDENTIALS = 'true'
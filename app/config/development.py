@@ -0,0 +1,20 @@
+#!/usr/bin/env python
+
+"""Local development settings, against a local Postgres by default."""
+
+import os
+
+from .default import DefaultConfig
+
+
+class DevelopmentConfig(DefaultConfig):
+
+    DEBUG = True
+
+    LOG_PROFILE = 'development'
+
+    SQLALCHEMY_DATABASE_URI = os.environ.get(
+        'DATABASE_URL',
+        'postgresql://localhost/stream_restoration')
+
+    SQLALCHEMY_POOL_SIZE = 2
@@ -0,0 +1,10 @@
+#!/usr/bin/env python
+
+"""Production settings; see `default.py` for the environment variables."""
+
+from .default import DefaultConfig
+
+
+class ProductionConfig(DefaultConfig):
+
+    LOG_PROFILE = 'production'
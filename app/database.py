@@ -0,0 +1,246 @@
+#!/usr/bin/env python
+
+"""Database engine configuration and connection pool metrics.
+
+Flask-SQLAlchemy reads `SQLALCHEMY_POOL_SIZE`, `SQLALCHEMY_MAX_OVERFLOW`,
+`SQLALCHEMY_POOL_TIMEOUT` and `SQLALCHEMY_POOL_RECYCLE` itself. The
+`SQLAlchemy` subclass below adds:
+
+`SQLALCHEMY_POOL_PRE_PING`
+    Test each connection when it is checked out, so connections dropped
+    by the server or a proxy are replaced instead of failing a request.
+`DATABASE_STATEMENT_TIMEOUT`
+    Milliseconds after which Postgres cancels a statement. `None` leaves
+    the server default.
+
+Pool sizing applies to server databases only. SQLite keeps the
+`NullPool` that Flask-SQLAlchemy gives it.
+
+Server databases use `TimedQueuePool`, which records how long each
+checkout waits for a connection. The wait is reported as the `pool`
+phase of the request (see `instrumentation`) and, with the pool's size
+and utilization, at `/metrics`.
+"""
+
+import bisect
+import threading
+import time
+import weakref
+
+import flask_sqlalchemy
+from sqlalchemy import exc
+from sqlalchemy.pool import QueuePool
+
+from . import instrumentation
+from . import metrics
+
+
+BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0
+)
+
+#: Options that only apply to a `QueuePool`.
+
+POOL_SIZING = (
+    'pool_size',
+    'max_overflow',
+    'pool_timeout'
+)
+
+
+class PoolStats(object):
+
+    """Checkout waits and timeouts of every `TimedQueuePool`."""
+
+    def __init__(self):
+
+        self.lock = threading.Lock()
+
+        self.pools = weakref.WeakSet()
+
+        self.reset()
+
+    def reset(self):
+
+        with self.lock:
+
+            self.buckets = [0] * (len(BUCKETS) + 1)
+
+            self.wait = 0
+
+            self.timeouts = 0
+
+    def observe(self, seconds, timeout=False):
+
+        with self.lock:
+
+            self.buckets[bisect.bisect_left(BUCKETS, seconds)] += 1
+
+            self.wait += seconds
+
+            if timeout:
+
+                self.timeouts += 1
+
+    def usage(self):
+        """Return the size, checked out, overflow and capacity of all pools."""
+
+        size = 0
+
+        checked_out = 0
+
+        overflow = 0
+
+        capacity = 0
+
+        for pool in list(self.pools):
+
+            size += pool.size()
+
+            checked_out += pool.checkedout()
+
+            overflow += max(0, pool.overflow())
+
+            capacity += pool.size() + max(0, pool.max_overflow)
+
+        return size, checked_out, overflow, capacity
+
+    def metric_lines(self):
+
+        if not self.pools:
+
+            return []
+
+        size, checked_out, overflow, capacity = self.usage()
+
+        with self.lock:
+
+            counts = list(self.buckets)
+
+            wait = self.wait
+
+            timeouts = self.timeouts
+
+        lines = [
+            '# HELP srm_db_pool_size Connections kept open by the pool.',
+            '# TYPE srm_db_pool_size gauge',
+            'srm_db_pool_size %d' % size,
+            '# HELP srm_db_pool_checked_out Connections in use.',
+            '# TYPE srm_db_pool_checked_out gauge',
+            'srm_db_pool_checked_out %d' % checked_out,
+            '# HELP srm_db_pool_overflow Connections open beyond the size.',
+            '# TYPE srm_db_pool_overflow gauge',
+            'srm_db_pool_overflow %d' % overflow,
+            '# HELP srm_db_pool_utilization Checked out share of capacity.',
+            '# TYPE srm_db_pool_utilization gauge',
+            'srm_db_pool_utilization %.4f' % (
+                checked_out / float(capacity) if capacity else 0),
+            '# HELP srm_db_pool_timeouts_total Checkouts that timed out.',
+            '# TYPE srm_db_pool_timeouts_total counter',
+            'srm_db_pool_timeouts_total %d' % timeouts,
+            '# HELP srm_db_pool_checkout_seconds Waits for a connection.',
+            '# TYPE srm_db_pool_checkout_seconds histogram'
+        ]
+
+        cumulative = 0
+
+        for bound, count in zip(BUCKETS + ('+Inf',), counts):
+
+            cumulative += count
+
+            lines.append('srm_db_pool_checkout_seconds_bucket{%s} %d' % (
+                metrics.format_labels(le=bound),
+                cumulative))
+
+        lines.extend([
+            'srm_db_pool_checkout_seconds_sum %.6f' % wait,
+            'srm_db_pool_checkout_seconds_count %d' % cumulative
+        ])
+
+        return lines
+
+
+pool_stats = PoolStats()
+
+metrics.register_collector(pool_stats.metric_lines)
+
+
+class TimedQueuePool(QueuePool):
+
+    """A `QueuePool` that records how long each checkout waits.
+
+    `max_overflow` keeps the configured overflow, -1 for unlimited, for
+    the capacity reported by `PoolStats`.
+    """
+
+    def __init__(self, creator, pool_size=5, max_overflow=10, **kwargs):
+
+        super(TimedQueuePool, self).__init__(
+            creator,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            **kwargs)
+
+        self.max_overflow = max_overflow
+
+        pool_stats.pools.add(self)
+
+    def _do_get(self):
+
+        started = time.perf_counter()
+
+        try:
+
+            connection = super(TimedQueuePool, self)._do_get()
+
+        except exc.TimeoutError:
+
+            pool_stats.observe(time.perf_counter() - started, timeout=True)
+
+            raise
+
+        elapsed = time.perf_counter() - started
+
+        pool_stats.observe(elapsed)
+
+        instrumentation.record('pool', elapsed)
+
+        return connection
+
+
+class SQLAlchemy(flask_sqlalchemy.SQLAlchemy):
+
+    """Flask-SQLAlchemy with the engine options described above.
+
+    Relies on the `apply_driver_hacks` hook of Flask-SQLAlchemy 2.x,
+    which 3.x no longer calls; `requirements.txt` pins `<3`.
+    """
+
+    def apply_driver_hacks(self, app, info, options):
+
+        config = app.config
+
+        if info.drivername.startswith('sqlite'):
+
+            for option in POOL_SIZING:
+
+                options.pop(option, None)
+
+        else:
+
+            options.setdefault('poolclass', TimedQueuePool)
+
+        if config.get('SQLALCHEMY_POOL_PRE_PING'):
+
+            options['pool_pre_ping'] = True
+
+        timeout = config.get('DATABASE_STATEMENT_TIMEOUT')
+
+        if timeout is not None and info.drivername.startswith('postgres'):
+
+            connect_args = options.setdefault('connect_args', {})
+
+            connect_args['options'] = '-c statement_timeout=%d' % timeout
+
+        return super(SQLAlchemy, self).apply_driver_hacks(app, info, options)
@@ -0,0 +1,306 @@
+#!/usr/bin/env python
+
+"""Run large portfolios on a pool of worker processes.
+
+Practice reductions are pure Python and hold the GIL, so one web worker
+computes one practice at a time however many threads it has.
+`PortfolioExecutor` splits a portfolio into shards of consecutive
+practices and runs them on a `ProcessPoolExecutor`, then reassembles
+the results in input order.
+
+Each worker process builds its own application once, for the same
+environment and `create_application()` overrides with `WORKER_CONFIG`
+applied, and warms every registered
+practice (see `Practice.warm`), so shards never pay for imports or load
+rate queries.
+Items are dispatched with `core.utilities.handle_item`, exactly as in
+`/v1/analyze/batch`; the result cache of each worker is its own. The
+pool starts with the first portfolio, which waits for the workers to
+warm up.
+
+Settings, read by `for_app()`:
+
+`PORTFOLIO_WORKERS`
+    Worker processes. `None` or 0 (the default) disables the pool, and
+    `'auto'` uses one worker per CPU.
+`PORTFOLIO_CHUNK_SIZE`
+    Practices per shard. By default each worker receives about four
+    shards, which keeps them busy when shards take uneven time.
+`PORTFOLIO_MIN_SIZE`
+    Smaller batches are computed in the request thread, where they do
+    not pay for pickling. Defaults to 100.
+`PORTFOLIO_START_METHOD`
+    The multiprocessing start method. Defaults to `'spawn'`, so workers
+    never inherit the locks or database connections of a threaded
+    server.
+"""
+
+import importlib
+import math
+import multiprocessing
+import os
+import threading
+import time
+
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from . import log
+
+
+logger = log.get_logger(__name__)
+
+#: Settings of worker applications. The web process has already set up
+#: the schema, and workers never accept jobs.
+
+WORKER_CONFIG = {
+    'DATABASE_SCHEMA_MODE': 'none',
+    'JOBS_ENABLED': False,
+    'PRACTICE_WARMUP': []
+}
+
+#: State of a worker process, set once by `initialize()`.
+
+worker = {}
+
+
+def initialize(environment, config=None):
+    """Build and warm the application of a worker process.
+
+    :param str environment: The configuration of the web process.
+    :param dict config: Its `create_application()` overrides, if any.
+    """
+
+    from . import create_application
+    from . import registry
+
+    started = time.perf_counter()
+
+    app = create_application(environment, dict(config or {}, **WORKER_CONFIG))
+
+    context = app.app_context()
+
+    context.push()
+
+    for code in registry.codes():
+
+        registry.get(code).warm(
+            tables=app.config.get('CURVE_TABLES', False))
+
+    worker.update({
+        'app': app,
+        'context': context,
+        'handle_item': importlib.import_module(
+            'core.utilities').handle_item
+    })
+
+    logger.info(
+        'executor.initialize: worker %s warmed %s practices in %.1f ms',
+        os.getpid(),
+        len(registry.codes()),
+        (time.perf_counter() - started) * 1000)
+
+
+def run_shard(shard, start, items, submitted):
+    """Dispatch one shard in a worker process.
+
+    :param int shard: Position of the shard in the portfolio.
+    :param int start: Portfolio index of the first item.
+    :param list items: Practice payloads.
+    :param float submitted: When the shard was submitted, as `time.time()`.
+
+    :return tuple: The shard position, its result items and its timing.
+    """
+
+    queued = time.time() - submitted
+
+    started = time.perf_counter()
+
+    handle_item = worker['handle_item']
+
+    results = [
+        handle_item(start + offset, data)
+        for offset, data in enumerate(items)
+    ]
+
+    return shard, results, {
+        'shard': shard,
+        'start': start,
+        'count': len(items),
+        'errors': sum(1 for item in results if 'error' in item),
+        'pid': os.getpid(),
+        'queued_ms': queued * 1000,
+        'compute_ms': (time.perf_counter() - started) * 1000
+    }
+
+
+class PortfolioExecutor(object):
+
+    """Shard portfolios across a lazily started process pool.
+
+    :param str environment: The configuration workers are built with,
+        e.g. `'production.ProductionConfig'`.
+    :param dict config: Settings applied on top of `environment`, as
+        passed to `create_application()`. They are sent to every worker,
+        so they must be picklable.
+    :param int workers: Worker processes, one per CPU by default.
+    :param int chunk_size: Practices per shard.
+    :param int min_size: Portfolios the caller should run in-process.
+    :param str start_method: The multiprocessing start method.
+    """
+
+    def __init__(self, environment, config=None, workers=None,
+                 chunk_size=None, min_size=100, start_method='spawn'):
+        """Initialize top level variables."""
+        self.environment = environment
+        self.config = dict(config or {})
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.min_size = min_size
+        self.start_method = start_method
+        self.lock = threading.Lock()
+        self.pool = None
+
+    def __repr__(self):
+        """Display of PortfolioExecutor when inspected."""
+        return '<PortfolioExecutor %s workers>' % self.workers
+
+    def start(self):
+        """Return the pool, starting it on first use."""
+
+        with self.lock:
+
+            if self.pool is None:
+
+                self.pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context(
+                        self.start_method),
+                    initializer=initialize,
+                    initargs=(self.environment, self.config))
+
+            return self.pool
+
+    def shutdown(self, wait=True):
+
+        with self.lock:
+
+            pool, self.pool = self.pool, None
+
+        if pool is not None:
+
+            pool.shutdown(wait=wait)
+
+    def shards(self, items, offset=0):
+        """Split `items` into `(start, items)` shards of consecutive items.
+
+        `start` is the portfolio index of the first item of the shard,
+        counted from `offset`.
+        """
+
+        size = self.chunk_size or int(
+            math.ceil(len(items) / float(self.workers * 4)))
+
+        size = max(1, size)
+
+        return [
+            (offset + start, items[start:start + size])
+            for start in range(0, len(items), size)
+        ]
+
+    def run(self, items, offset=0):
+        """Dispatch every practice payload in `items` on the pool.
+
+        :param list items: Practice payloads.
+        :param int offset: Portfolio index of the first item, for callers
+            that submit a portfolio in parts.
+
+        :return dict: Batch results in input order, as returned by
+            `/v1/analyze/batch`, with per-shard timings in `meta`.
+
+        :raise BrokenProcessPool: If a worker died. The pool is discarded
+            and started again by the next call.
+        """
+
+        pool = self.start()
+
+        started = time.perf_counter()
+
+        futures = [
+            pool.submit(run_shard, shard, start, chunk, time.time())
+            for shard, (start, chunk) in enumerate(
+                self.shards(items, offset))
+        ]
+
+        results = [None] * len(items)
+
+        shards = [None] * len(futures)
+
+        try:
+
+            for future in futures:
+
+                shard, chunk, timing = future.result()
+
+                start = timing['start'] - offset
+
+                results[start:start + len(chunk)] = chunk
+
+                shards[shard] = timing
+
+        except BrokenProcessPool:
+
+            logger.error(
+                'executor.run: a worker died; restarting the pool')
+
+            self.shutdown(wait=False)
+
+            raise
+
+        elapsed = time.perf_counter() - started
+
+        logger.info(
+            'executor.run: %s practices in %s shards on %s workers'
+            ' in %.1f ms',
+            len(items),
+            len(shards),
+            self.workers,
+            elapsed * 1000)
+
+        return {
+            'meta': {
+                'count': len(results),
+                'errors': sum(timing['errors'] for timing in shards),
+                'workers': self.workers,
+                'elapsed_ms': elapsed * 1000,
+                'shards': shards
+            },
+            'results': results
+        }
+
+
+def for_app(app):
+    """Return the executor configured for `app`, or None if disabled."""
+
+    workers = app.config.get('PORTFOLIO_WORKERS')
+
+    if not workers:
+
+        return None
+
+    executor = app.extensions.get('portfolio_executor')
+
+    if executor is None:
+
+        executor = app.extensions.setdefault(
+            'portfolio_executor',
+            PortfolioExecutor(
+                app.config['ENVIRONMENT'],
+                config=app.config.get('CONFIG_OVERRIDES'),
+                workers=None if workers == 'auto' else workers,
+                chunk_size=app.config.get('PORTFOLIO_CHUNK_SIZE'),
+                min_size=app.config.get('PORTFOLIO_MIN_SIZE', 100),
+                start_method=app.config.get(
+                    'PORTFOLIO_START_METHOD', 'spawn')))
+
+    return executor
@@ -0,0 +1,272 @@
+#!/usr/bin/env python
+
+"""Per-request timing and query instrumentation.
+
+Each request records how long it spends in the phases below, along with
+the number and duration of the SQL statements it issues:
+
+* `dispatch`: practice lookup and input validation.
+* `compute`: the practice module's `reduction()`.
+* `serialize`: encoding the JSON response.
+* `pool`: waiting for a database connection (see `database`). Waits
+  within a practice module are also counted in `compute`.
+* `db`: SQL statements, measured via SQLAlchemy engine events. Queries
+  issued by a practice module are also counted in `compute`.
+
+The phases are returned in a `Server-Timing` header, along with
+`X-Query-Count`. Requests that dispatched a practice are also added to
+`stats`, aggregated by practice code. Streamed responses are reported
+before their generator runs, so work done while streaming is not
+included.
+"""
+
+import collections
+import contextlib
+import threading
+import time
+
+from flask import g
+from flask import has_request_context
+from flask import request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from . import log
+
+
+#: Per-request debug events, sampled per `LOG_SAMPLE_EVERY`.
+
+hot_logger = log.SampledLogger(log.get_logger(__name__))
+
+
+#: Aggregation key for requests that dispatched several practice codes.
+
+MIXED = '(mixed)'
+
+
+class TimingStats(object):
+
+    """Request timings aggregated by practice code."""
+
+    FIELDS = (
+        'requests',
+        'dispatch',
+        'compute',
+        'serialize',
+        'pool',
+        'db',
+        'queries',
+        'total'
+    )
+
+    def __init__(self):
+
+        self.lock = threading.Lock()
+
+        self.totals = collections.defaultdict(
+            lambda: dict.fromkeys(self.FIELDS, 0))
+
+    def add(self, key, timings, queries, total):
+
+        with self.lock:
+
+            item = self.totals[key]
+
+            item['requests'] += 1
+
+            item['queries'] += queries
+
+            item['total'] += total
+
+            for phase, seconds in timings.items():
+
+                item[phase] += seconds
+
+    def reset(self):
+
+        with self.lock:
+
+            self.totals.clear()
+
+    def snapshot(self):
+        """Return totals and per-request means in milliseconds."""
+
+        with self.lock:
+
+            totals = {
+                key: dict(item)
+                for key, item in self.totals.items()
+            }
+
+        result = {}
+
+        for key, item in totals.items():
+
+            requests = item['requests']
+
+            entry = {
+                'requests': requests,
+                'queries': item['queries'],
+                'mean_queries': item['queries'] / float(requests)
+            }
+
+            for field in (
+                    'dispatch',
+                    'compute',
+                    'serialize',
+                    'pool',
+                    'db',
+                    'total'):
+
+                entry['%s_ms' % field] = item[field] * 1000
+
+                entry['mean_%s_ms' % field] = (
+                    item[field] * 1000 / float(requests))
+
+            result[key] = entry
+
+        return result
+
+
+stats = TimingStats()
+
+
+def record(phase, seconds):
+    """Add `seconds` to `phase` for the current request, if any."""
+
+    if has_request_context():
+
+        timings = g.setdefault('timings', collections.OrderedDict())
+
+        timings[phase] = timings.get(phase, 0) + seconds
+
+
+@contextlib.contextmanager
+def timer(phase):
+    """Time the enclosed block as `phase` of the current request."""
+
+    started = time.perf_counter()
+
+    try:
+
+        yield
+
+    finally:
+
+        record(phase, time.perf_counter() - started)
+
+
+def record_practice(code):
+    """Note that the current request dispatched practice `code`."""
+
+    if has_request_context():
+
+        codes = g.setdefault('practice_codes', [])
+
+        if code not in codes:
+
+            codes.append(code)
+
+
+def start_query(conn, cursor, statement, parameters, context, executemany):
+    """Count each statement executed while handling a request."""
+
+    if has_request_context():
+
+        g.query_count = g.get('query_count', 0) + 1
+
+        if context is not None:
+
+            context._query_started = time.perf_counter()
+
+
+def finish_query(conn, cursor, statement, parameters, context, executemany):
+
+    started = getattr(context, '_query_started', None)
+
+    if started is not None and has_request_context():
+
+        g.query_time = g.get('query_time', 0) + (
+            time.perf_counter() - started)
+
+
+def start_request():
+
+    g.request_started = time.perf_counter()
+
+
+def server_timing(timings, query_time, query_count, total):
+    """Format a `Server-Timing` header value."""
+
+    metrics = [
+        '%s;dur=%.3f' % (phase, seconds * 1000)
+        for phase, seconds in timings.items()
+    ]
+
+    metrics.append('db;dur=%.3f;desc="%d queries"' % (
+        query_time * 1000,
+        query_count))
+
+    metrics.append('total;dur=%.3f' % (total * 1000))
+
+    return ', '.join(metrics)
+
+
+def report_request(response):
+    """Report the timings and query count of the request."""
+
+    started = g.get('request_started')
+
+    total = time.perf_counter() - started if started is not None else 0
+
+    timings = g.get('timings', {})
+
+    query_count = g.get('query_count', 0)
+
+    query_time = g.get('query_time', 0)
+
+    response.headers['X-Query-Count'] = str(query_count)
+
+    response.headers['Server-Timing'] = server_timing(
+        timings,
+        query_time,
+        query_count,
+        total)
+
+    codes = g.get('practice_codes')
+
+    if codes:
+
+        key = codes[0] if len(codes) == 1 else MIXED
+
+        measured = dict(timings)
+
+        measured['db'] = query_time
+
+        stats.add(key, measured, query_count, total)
+
+    hot_logger.debug(
+        'instrumentation.report_request: %s %s issued %s queries: %s',
+        request.method,
+        request.path,
+        query_count,
+        response.headers['Server-Timing'])
+
+    return response
+
+
+def setup(app):
+    """Register request instrumentation for the application.
+
+    :param object app: Instantiated Flask application.
+    """
+
+    if not event.contains(Engine, 'before_cursor_execute', start_query):
+
+        event.listen(Engine, 'before_cursor_execute', start_query)
+
+        event.listen(Engine, 'after_cursor_execute', finish_query)
+
+    app.before_request(start_request)
+
+    app.after_request(report_request)
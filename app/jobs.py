@@ -0,0 +1,774 @@
+#!/usr/bin/env python
+
+"""Run large portfolios as background jobs.
+
+`POST /v1/jobs` accepts the same array of practices as
+`/v1/analyze/batch`, saves it as a job and answers `202 Accepted` at
+once, so long portfolios do not hold a connection open behind a proxy.
+Poll `GET /v1/jobs/<id>` for progress, then download the results from
+`GET /v1/jobs/<id>/results`, as JSON or, with `?format=ndjson`, one
+result per line.
+
+Jobs run on a thread pool in the web worker that accepted them. Each
+job is computed in chunks with `core.utilities.handle_item`, or on the
+process pool of `executor` when `PORTFOLIO_WORKERS` is set, and its
+progress and results are saved after every chunk. Jobs are not resumed
+if their worker stops: the worker renews a lease on its queued and
+running jobs every `JOBS_HEARTBEAT` seconds, and jobs whose lease is
+older than `JOBS_LEASE` are marked failed when they are next polled,
+submitted alongside or purged.
+
+Settings, read when the first job is submitted:
+
+`JOBS_ENABLED`
+    Set to False to leave `/v1/jobs` out.
+`JOBS_STORE`
+    `'sqlite'` (the default), `'memory'`, or a store class taking the
+    config. The SQLite store lets any worker process answer polls for any
+    job; the memory store only suits a single process.
+`JOBS_DATABASE`
+    The SQLite file. Defaults to `stream_restoration_jobs.db` in the
+    temporary directory.
+`JOBS_WORKERS`
+    Jobs computed at once by each process. Defaults to 2.
+`JOBS_CHUNK_SIZE`
+    Practices computed between progress updates. Defaults to 100; use a
+    few times `PORTFOLIO_WORKERS` times `PORTFOLIO_MIN_SIZE` to keep a
+    process pool busy.
+`JOBS_MAX_SIZE`
+    Larger portfolios are rejected. Unlimited by default.
+`JOBS_TTL`
+    Seconds finished and failed jobs and their results are kept.
+    Defaults to a day.
+`JOBS_HEARTBEAT`, `JOBS_LEASE`
+    Seconds between lease renewals, 15 by default, and seconds without
+    one after which a job is abandoned, 60 by default.
+"""
+
+import contextlib
+import importlib
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import uuid
+
+from concurrent.futures import ThreadPoolExecutor
+
+from flask import Response
+from flask import abort
+from flask import current_app
+from flask import json
+from flask import jsonify
+from flask import request
+from flask import stream_with_context
+from flask import url_for
+
+from . import executor
+from . import log
+
+
+logger = log.get_logger(__name__)
+
+QUEUED = 'queued'
+
+RUNNING = 'running'
+
+FINISHED = 'finished'
+
+FAILED = 'failed'
+
+#: Statuses of jobs that will not change again.
+
+DONE = (FINISHED, FAILED)
+
+FIELDS = (
+    'id',
+    'status',
+    'count',
+    'completed',
+    'errors',
+    'message',
+    'created_at',
+    'started_at',
+    'finished_at',
+    'heartbeat_at'
+)
+
+ABANDONED = 'The worker computing this job stopped.'
+
+
+class MemoryJobStore(object):
+
+    """Jobs and results kept in this process."""
+
+    def __init__(self, config=None):
+        """Initialize top level variables."""
+        self.lock = threading.Lock()
+        self.jobs = {}
+        self.chunks = {}
+
+    def __repr__(self):
+        """Display of MemoryJobStore when inspected."""
+        return '<MemoryJobStore %s>' % len(self.jobs)
+
+    def create(self, job):
+
+        with self.lock:
+
+            self.jobs[job['id']] = dict(job)
+
+            self.chunks[job['id']] = []
+
+    def get(self, job_id):
+
+        with self.lock:
+
+            job = self.jobs.get(job_id)
+
+            return dict(job) if job is not None else None
+
+    def update(self, job_id, **fields):
+
+        with self.lock:
+
+            self.jobs[job_id].update(fields)
+
+    def add_results(self, job_id, chunk, results):
+
+        with self.lock:
+
+            self.chunks[job_id].append(results)
+
+    def results(self, job_id):
+        """Yield the saved results of `job_id`, one chunk at a time."""
+
+        with self.lock:
+
+            chunks = list(self.chunks.get(job_id, ()))
+
+        for chunk in chunks:
+
+            yield chunk
+
+    def touch(self, job_ids, now):
+        """Renew the lease of the jobs in `job_ids` that are in flight."""
+
+        with self.lock:
+
+            for job_id in job_ids:
+
+                job = self.jobs.get(job_id)
+
+                if job is not None and job['status'] not in DONE:
+
+                    job['heartbeat_at'] = now
+
+    def abandon(self, before):
+        """Fail the jobs in flight whose lease was renewed before `before`.
+
+        They finish at their last renewal, so they expire as if they had
+        failed then.
+        """
+
+        with self.lock:
+
+            stale = [
+                job for job in self.jobs.values()
+                if job['status'] not in DONE and job['heartbeat_at'] < before
+            ]
+
+            for job in stale:
+
+                job.update({
+                    'status': FAILED,
+                    'message': ABANDONED,
+                    'finished_at': job['heartbeat_at']
+                })
+
+        return len(stale)
+
+    def purge(self, before):
+        """Delete the jobs that finished or failed before `before`."""
+
+        with self.lock:
+
+            expired = [
+                job_id for job_id, job in self.jobs.items()
+                if job['status'] in DONE and job['finished_at'] < before
+            ]
+
+            for job_id in expired:
+
+                del self.jobs[job_id]
+
+                del self.chunks[job_id]
+
+        return len(expired)
+
+
+class SQLiteJobStore(object):
+
+    """Jobs and results kept in a SQLite file shared by every process."""
+
+    SCHEMA = (
+        'CREATE TABLE IF NOT EXISTS jobs ('
+        ' id TEXT PRIMARY KEY,'
+        ' status TEXT NOT NULL,'
+        ' count INTEGER NOT NULL,'
+        ' completed INTEGER NOT NULL,'
+        ' errors INTEGER NOT NULL,'
+        ' message TEXT,'
+        ' created_at REAL NOT NULL,'
+        ' started_at REAL,'
+        ' finished_at REAL,'
+        ' heartbeat_at REAL NOT NULL)',
+        'CREATE TABLE IF NOT EXISTS job_results ('
+        ' job_id TEXT NOT NULL,'
+        ' chunk INTEGER NOT NULL,'
+        ' results TEXT NOT NULL,'
+        ' PRIMARY KEY (job_id, chunk))'
+    )
+
+    def __init__(self, config=None):
+        """Initialize top level variables."""
+        self.path = (config or {}).get('JOBS_DATABASE') or os.path.join(
+            tempfile.gettempdir(),
+            'stream_restoration_jobs.db')
+
+        with self.connect() as connection:
+
+            connection.execute('PRAGMA journal_mode=WAL')
+
+            for statement in self.SCHEMA:
+
+                connection.execute(statement)
+
+    def __repr__(self):
+        """Display of SQLiteJobStore when inspected."""
+        return '<SQLiteJobStore %s>' % self.path
+
+    @contextlib.contextmanager
+    def connect(self):
+        """Yield a connection that commits on success."""
+
+        connection = sqlite3.connect(self.path, timeout=30)
+
+        connection.row_factory = sqlite3.Row
+
+        try:
+
+            with connection:
+
+                yield connection
+
+        finally:
+
+            connection.close()
+
+    def create(self, job):
+
+        with self.connect() as connection:
+
+            connection.execute(
+                'INSERT INTO jobs (%s) VALUES (%s)' % (
+                    ', '.join(FIELDS),
+                    ', '.join('?' for _ in FIELDS)),
+                [job[field] for field in FIELDS])
+
+    def get(self, job_id):
+
+        with self.connect() as connection:
+
+            row = connection.execute(
+                'SELECT * FROM jobs WHERE id = ?',
+                (job_id,)).fetchone()
+
+        return dict(row) if row is not None else None
+
+    def update(self, job_id, **fields):
+
+        names = sorted(fields)
+
+        with self.connect() as connection:
+
+            connection.execute(
+                'UPDATE jobs SET %s WHERE id = ?' % ', '.join(
+                    '%s = ?' % name for name in names),
+                [fields[name] for name in names] + [job_id])
+
+    def add_results(self, job_id, chunk, results):
+
+        with self.connect() as connection:
+
+            connection.execute(
+                'INSERT INTO job_results (job_id, chunk, results)'
+                ' VALUES (?, ?, ?)',
+                (job_id, chunk, json.dumps(results)))
+
+    def results(self, job_id):
+        """Yield the saved results of `job_id`, one chunk at a time."""
+
+        with self.connect() as connection:
+
+            chunks = connection.execute(
+                'SELECT chunk FROM job_results WHERE job_id = ?'
+                ' ORDER BY chunk',
+                (job_id,)).fetchall()
+
+        for row in chunks:
+
+            with self.connect() as connection:
+
+                data = connection.execute(
+                    'SELECT results FROM job_results'
+                    ' WHERE job_id = ? AND chunk = ?',
+                    (job_id, row['chunk'])).fetchone()['results']
+
+            yield json.loads(data)
+
+    def touch(self, job_ids, now):
+        """Renew the lease of the jobs in `job_ids` that are in flight."""
+
+        job_ids = list(job_ids)
+
+        if not job_ids:
+
+            return
+
+        with self.connect() as connection:
+
+            connection.execute(
+                'UPDATE jobs SET heartbeat_at = ?'
+                ' WHERE status NOT IN (?, ?) AND id IN (%s)' % ', '.join(
+                    '?' for _ in job_ids),
+                (now,) + DONE + tuple(job_ids))
+
+    def abandon(self, before):
+        """Fail the jobs in flight whose lease was renewed before `before`.
+
+        They finish at their last renewal, so they expire as if they had
+        failed then.
+        """
+
+        with self.connect() as connection:
+
+            return connection.execute(
+                'UPDATE jobs SET status = ?, message = ?,'
+                ' finished_at = heartbeat_at'
+                ' WHERE status NOT IN (?, ?)'
+                ' AND heartbeat_at < ?',
+                (FAILED, ABANDONED) + DONE + (before,)).rowcount
+
+    def purge(self, before):
+        """Delete the jobs that finished or failed before `before`."""
+
+        with self.connect() as connection:
+
+            expired = '(SELECT id FROM jobs WHERE status IN (?, ?)' \
+                ' AND finished_at < ?)'
+
+            connection.execute(
+                'DELETE FROM job_results WHERE job_id IN %s' % expired,
+                DONE + (before,))
+
+            return connection.execute(
+                'DELETE FROM jobs WHERE id IN %s' % expired,
+                DONE + (before,)).rowcount
+
+
+STORES = {
+    'memory': MemoryJobStore,
+    'sqlite': SQLiteJobStore
+}
+
+
+class JobManager(object):
+
+    """Queue portfolios and compute them on a thread pool.
+
+    :param object app: The application jobs are computed with.
+    :param object store: Where jobs and their results are saved.
+    """
+
+    def __init__(self, app, store, workers=2, chunk_size=100, ttl=86400,
+                 heartbeat=15, lease=60):
+        """Initialize top level variables."""
+        self.app = app
+        self.store = store
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.ttl = ttl
+        self.heartbeat = heartbeat
+        self.lease = lease
+        self.lock = threading.Lock()
+        self.active = set()
+        self.pool = ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix='jobs')
+
+        self.reap()
+
+        self.renewer = threading.Thread(
+            target=self.renew,
+            name='jobs-heartbeat',
+            daemon=True)
+
+        self.renewer.start()
+
+    def __repr__(self):
+        """Display of JobManager when inspected."""
+        return '<JobManager %s>' % self.store
+
+    @classmethod
+    def from_config(cls, app):
+
+        config = app.config
+
+        store = config.get('JOBS_STORE', 'sqlite')
+
+        store = STORES[store] if isinstance(store, str) else store
+
+        return cls(
+            app,
+            store(config),
+            workers=config.get('JOBS_WORKERS', 2),
+            chunk_size=config.get('JOBS_CHUNK_SIZE', 100),
+            ttl=config.get('JOBS_TTL', 86400),
+            heartbeat=config.get('JOBS_HEARTBEAT', 15),
+            lease=config.get('JOBS_LEASE', 60))
+
+    def renew(self):
+        """Renew the lease of this process's jobs until it exits."""
+
+        while True:
+
+            time.sleep(self.heartbeat)
+
+            with self.lock:
+
+                active = list(self.active)
+
+            try:
+
+                self.store.touch(active, time.time())
+
+            except Exception:
+
+                logger.exception('jobs.renew: unable to renew leases')
+
+    def reap(self):
+        """Fail the jobs whose worker stopped renewing their lease.
+
+        :return int: The number of jobs failed.
+        """
+
+        count = self.store.abandon(time.time() - self.lease)
+
+        if count:
+
+            logger.warning('jobs.reap: %s abandoned jobs failed', count)
+
+        return count
+
+    def purge(self):
+        """Fail abandoned jobs, then delete jobs done for `ttl` seconds."""
+
+        self.reap()
+
+        if self.ttl is not None:
+
+            self.store.purge(time.time() - self.ttl)
+
+    def get(self, job_id):
+        """Return the job `job_id`, failing it first if it was abandoned."""
+
+        job = self.store.get(job_id)
+
+        if (job is not None and job['status'] not in DONE and
+                job['heartbeat_at'] < time.time() - self.lease):
+
+            self.reap()
+
+            job = self.store.get(job_id)
+
+        return job
+
+    def submit(self, items):
+        """Save a job for the practice payloads in `items` and queue it.
+
+        :return dict: The job.
+        """
+
+        self.purge()
+
+        now = time.time()
+
+        job = dict.fromkeys(FIELDS)
+
+        job.update({
+            'id': uuid.uuid4().hex,
+            'status': QUEUED,
+            'count': len(items),
+            'completed': 0,
+            'errors': 0,
+            'created_at': now,
+            'heartbeat_at': now
+        })
+
+        with self.lock:
+
+            self.active.add(job['id'])
+
+        self.store.create(job)
+
+        self.pool.submit(self.run, job['id'], items)
+
+        logger.info(
+            'jobs.submit: job %s queued with %s practices',
+            job['id'],
+            len(items))
+
+        return job
+
+    def run(self, job_id, items):
+
+        with self.app.app_context():
+
+            try:
+
+                self.compute(job_id, items)
+
+            except Exception as error:
+
+                logger.exception('jobs.run: job %s failed', job_id)
+
+                self.store.update(
+                    job_id,
+                    status=FAILED,
+                    message=str(error),
+                    finished_at=time.time())
+
+            finally:
+
+                with self.lock:
+
+                    self.active.discard(job_id)
+
+    def compute(self, job_id, items):
+
+        started = time.time()
+
+        self.store.update(job_id, status=RUNNING, started_at=started)
+
+        pool = executor.for_app(self.app)
+
+        handle_item = importlib.import_module('core.utilities').handle_item
+
+        completed = 0
+
+        errors = 0
+
+        for chunk, start in enumerate(range(0, len(items), self.chunk_size)):
+
+            part = items[start:start + self.chunk_size]
+
+            if pool is not None and len(part) >= pool.min_size:
+
+                results = pool.run(part, offset=start)['results']
+
+            else:
+
+                results = [
+                    handle_item(start + offset, data)
+                    for offset, data in enumerate(part)
+                ]
+
+            self.store.add_results(job_id, chunk, results)
+
+            completed += len(part)
+
+            errors += sum(1 for item in results if 'error' in item)
+
+            self.store.update(job_id, completed=completed, errors=errors)
+
+        self.store.update(job_id, status=FINISHED, finished_at=time.time())
+
+        logger.info(
+            'jobs.compute: job %s computed %s practices (%s errors)'
+            ' in %.1f s',
+            job_id,
+            completed,
+            errors,
+            time.time() - started)
+
+
+def for_app(app):
+    """Return the job manager of `app`, creating it on first use."""
+
+    manager = app.extensions.get('jobs')
+
+    if manager is None:
+
+        manager = app.extensions.setdefault(
+            'jobs',
+            JobManager.from_config(app))
+
+    return manager
+
+
+def current_manager():
+    """Return the job manager of the application handling the request.
+
+    Job threads outlive the request, so they keep the application itself
+    rather than the `current_app` proxy.
+    """
+
+    return for_app(current_app._get_current_object())
+
+
+def timestamp(seconds):
+
+    if seconds is None:
+
+        return None
+
+    return time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(seconds))
+
+
+def describe(job):
+    """Return the public representation of `job`, with its progress."""
+
+    item = dict(job)
+
+    item['progress'] = (
+        job['completed'] / float(job['count']) if job['count'] else 1.0)
+
+    for key in ('created_at', 'started_at', 'finished_at', 'heartbeat_at'):
+
+        item[key] = timestamp(job[key])
+
+    item['links'] = {
+        'self': url_for('job_get', job_id=job['id']),
+        'results': url_for('job_results_get', job_id=job['id'])
+    }
+
+    return item
+
+
+def find(job_id):
+
+    job = current_manager().get(job_id)
+
+    if job is None:
+
+        abort(404, 'Unknown or expired job.')
+
+    return job
+
+
+def jobs_post():
+
+    items = request.get_json()
+
+    if not isinstance(items, list):
+
+        abort(400, 'Request body must be an array of practices.')
+
+    max_size = current_app.config.get('JOBS_MAX_SIZE')
+
+    if max_size and len(items) > max_size:
+
+        abort(400, 'Portfolio exceeds %s practices.' % max_size)
+
+    job = current_manager().submit(items)
+
+    response = jsonify(**{
+        'meta': {
+            'status': 202
+        },
+        'job': describe(job)
+    })
+
+    response.headers['Location'] = url_for('job_get', job_id=job['id'])
+
+    return response, 202
+
+
+def job_get(job_id):
+
+    return jsonify(**{
+        'meta': {
+            'status': 200
+        },
+        'job': describe(find(job_id))
+    }), 200
+
+
+def job_results_get(job_id):
+    """Return the results of a finished or failed job.
+
+    Answers 202 with the job while it is queued or running. A failed
+    job returns the results of the chunks it completed.
+    """
+
+    job = find(job_id)
+
+    if job['status'] not in DONE:
+
+        return jsonify(**{
+            'meta': {
+                'status': 202
+            },
+            'job': describe(job)
+        }), 202
+
+    chunks = current_manager().store.results(job_id)
+
+    if request.args.get('format') == 'ndjson':
+
+        return Response(
+            stream_with_context(
+                json.dumps(item) + '\n'
+                for chunk in chunks
+                for item in chunk
+            ),
+            mimetype='application/x-ndjson'), 200
+
+    results = [item for chunk in chunks for item in chunk]
+
+    return jsonify(**{
+        'meta': {
+            'count': len(results),
+            'errors': job['errors'],
+            'status': job['status']
+        },
+        'job': describe(job),
+        'results': results
+    }), 200
+
+
+def setup(app):
+    """Serve `/v1/jobs` unless `JOBS_ENABLED` is false.
+
+    :param object app: Instantiated Flask application.
+    """
+
+    if not app.config.get('JOBS_ENABLED', True):
+
+        return
+
+    app.add_url_rule('/v1/jobs', 'jobs_post', jobs_post, methods=['POST'])
+
+    app.add_url_rule(
+        '/v1/jobs/<job_id>',
+        'job_get',
+        job_get,
+        methods=['GET'])
+
+    app.add_url_rule(
+        '/v1/jobs/<job_id>/results',
+        'job_results_get',
+        job_results_get,
+        methods=['GET'])
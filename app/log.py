@@ -0,0 +1,186 @@
+#!/usr/bin/env python
+
+"""Logging configuration.
+
+`configure()` is called once by `Application` with the Flask config and
+applies one of the `PROFILES` below, adjusted by these settings:
+
+* `LOG_PROFILE`: `'development'` or `'production'`. Defaults to
+  `'development'` when `DEBUG` is set and `'production'` otherwise.
+* `LOG_FORMAT`: `'text'`, or `'json'` for one JSON object per line.
+* `LOG_LEVELS`: `{logger name: level}`, merged over the profile levels.
+  Loggers are named `app.<module>`, e.g. `app.swp.utilities`.
+* `LOG_SAMPLE_EVERY`: emit one in N sampled hot-path debug events.
+
+Messages use `%` arguments so they are only formatted when emitted.
+Hot paths log through `SampledLogger`, which checks the level before
+doing any other work. The production profile disables debug output, so
+the analyze path does no formatting work at all.
+"""
+
+import collections
+import itertools
+import json
+import logging
+import sys
+import time
+
+
+PROFILES = {
+    'development': {
+        'format': 'text',
+        'levels': {
+            '': 'INFO',
+            'app': 'DEBUG'
+        },
+        'sample_every': 1
+    },
+    'production': {
+        'format': 'json',
+        'levels': {
+            '': 'WARNING',
+            'app': 'INFO'
+        },
+        'sample_every': 1000
+    }
+}
+
+TEXT_FORMAT = '%(asctime)s %(levelname)s %(name)s: %(message)s'
+
+#: Attributes of every `LogRecord`; anything else came from `extra`.
+
+RECORD_ATTRIBUTES = frozenset(vars(logging.LogRecord(
+    '', logging.INFO, '', 0, '', (), None)).keys()) | {'message', 'asctime'}
+
+settings = {
+    'sample_every': 1
+}
+
+
+def get_logger(name):
+    """Return the logger for module `name`, under the `app` namespace.
+
+    Practice modules are imported as top-level packages (`swp.utilities`),
+    so their names are prefixed to share the `app` configuration.
+    """
+
+    if name != 'app' and not name.startswith('app.'):
+
+        name = 'app.%s' % name
+
+    return logging.getLogger(name)
+
+
+class SampledLogger(object):
+
+    """Log one in `every` debug events from a hot path.
+
+    Events are counted per message, so each call site is sampled on its
+    own. The level check comes first, so disabled events cost one call.
+    """
+
+    def __init__(self, logger, every=None):
+
+        self.logger = logger
+
+        self.every = every
+
+        self.counters = collections.defaultdict(itertools.count)
+
+    def debug(self, msg, *args):
+
+        if not self.logger.isEnabledFor(logging.DEBUG):
+
+            return
+
+        every = self.every or settings['sample_every']
+
+        if next(self.counters[msg]) % every:
+
+            return
+
+        self.logger.debug(msg, *args, extra={
+            'sample_every': every
+        })
+
+
+class JSONFormatter(logging.Formatter):
+
+    """Format records as one JSON object per line."""
+
+    def format(self, record):
+
+        item = {
+            'time': time.strftime(
+                '%Y-%m-%dT%H:%M:%S',
+                time.gmtime(record.created)
+            ) + '.%03dZ' % record.msecs,
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage()
+        }
+
+        for key, value in vars(record).items():
+
+            if key not in RECORD_ATTRIBUTES:
+
+                item[key] = value
+
+        if record.exc_info:
+
+            item['exception'] = self.formatException(record.exc_info)
+
+        return json.dumps(item, default=str)
+
+
+class Handler(logging.StreamHandler):
+
+    """The handler installed by `configure`, replaced on reconfiguration."""
+
+
+def configure(config):
+    """Configure logging from a Flask config mapping.
+
+    :param config: The application config.
+    :return str: The name of the profile applied.
+    """
+
+    name = config.get('LOG_PROFILE') or (
+        'development' if config.get('DEBUG') else 'production')
+
+    profile = PROFILES[name]
+
+    levels = dict(profile['levels'])
+
+    levels.update(config.get('LOG_LEVELS') or {})
+
+    log_format = config.get('LOG_FORMAT') or profile['format']
+
+    settings['sample_every'] = max(1, int(
+        config.get('LOG_SAMPLE_EVERY') or profile['sample_every']))
+
+    handler = Handler(sys.stderr)
+
+    if log_format == 'json':
+
+        handler.setFormatter(JSONFormatter())
+
+    else:
+
+        handler.setFormatter(logging.Formatter(TEXT_FORMAT))
+
+    root = logging.getLogger()
+
+    for existing in list(root.handlers):
+
+        if isinstance(existing, Handler):
+
+            root.removeHandler(existing)
+
+    root.addHandler(handler)
+
+    for logger_name, level in levels.items():
+
+        logging.getLogger(logger_name).setLevel(level)
+
+    return name
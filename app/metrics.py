@@ -0,0 +1,313 @@
+#!/usr/bin/env python
+
+"""Prometheus metrics for the model service.
+
+Exposes, at `/metrics` in the Prometheus text format:
+
+* `srm_requests_total`: requests by endpoint, practice code and status.
+* `srm_request_errors_total`: the subset of those with a 4xx or 5xx
+  status, including the 400s raised via `abort` and the responses
+  produced by `errors.ErrorHandlers`.
+* `srm_request_duration_seconds`: a latency histogram by endpoint and
+  practice code.
+* `srm_db_queries_total`: SQL statements by endpoint and practice code.
+
+Requests that did not dispatch a practice are labeled `practice="none"`,
+and batches of several practices `practice="(mixed)"`.
+
+Each thread records into its own shard, so the request path never takes
+a lock. Shards are merged when `/metrics` is scraped, and the shards of
+finished threads are folded into a single retired shard. Counters are
+per worker process; scrape each worker, or add a `worker` label
+upstream.
+"""
+
+import bisect
+import collections
+import os
+import threading
+import time
+
+from flask import Response
+from flask import g
+from flask import request
+
+from . import instrumentation
+
+
+BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+class Shard(object):
+
+    """Counters recorded by a single thread."""
+
+    def __init__(self, thread=None):
+
+        self.thread = thread
+
+        self.requests = collections.Counter()
+
+        self.queries = collections.Counter()
+
+        self.buckets = collections.defaultdict(
+            lambda: [0] * (len(BUCKETS) + 1))
+
+        self.sums = collections.Counter()
+
+    def merge(self, other):
+        """Add the counters of `other`, which may still be recording.
+
+        `dict.copy` takes each snapshot in a single step, so the owning
+        thread can keep adding keys while it is merged.
+        """
+
+        self.requests.update(dict.copy(other.requests))
+
+        self.queries.update(dict.copy(other.queries))
+
+        self.sums.update(dict.copy(other.sums))
+
+        for key, counts in dict.copy(other.buckets).items():
+
+            totals = self.buckets[key]
+
+            for index, count in enumerate(list(counts)):
+
+                totals[index] += count
+
+
+class Metrics(object):
+
+    def __init__(self):
+
+        self.local = threading.local()
+
+        self.lock = threading.Lock()
+
+        self.shards = []
+
+        self.retired = Shard()
+
+    def shard(self):
+        """Return the calling thread's shard, creating it once."""
+
+        shard = getattr(self.local, 'shard', None)
+
+        if shard is None:
+
+            shard = Shard(threading.current_thread())
+
+            with self.lock:
+
+                self.shards.append(shard)
+
+            self.local.shard = shard
+
+        return shard
+
+    def observe(self, endpoint, practice, status, seconds, queries):
+
+        shard = self.shard()
+
+        shard.requests[(endpoint, practice, status)] += 1
+
+        shard.queries[(endpoint, practice)] += queries
+
+        shard.buckets[(endpoint, practice)][
+            bisect.bisect_left(BUCKETS, seconds)] += 1
+
+        shard.sums[(endpoint, practice)] += seconds
+
+    def collect(self):
+        """Merge every shard into one, retiring those of dead threads."""
+
+        merged = Shard()
+
+        with self.lock:
+
+            live = []
+
+            for shard in self.shards:
+
+                if shard.thread.is_alive():
+
+                    live.append(shard)
+
+                else:
+
+                    self.retired.merge(shard)
+
+            self.shards = live
+
+            merged.merge(self.retired)
+
+            for shard in live:
+
+                merged.merge(shard)
+
+        return merged
+
+    def reset(self):
+
+        with self.lock:
+
+            self.shards = []
+
+            self.retired = Shard()
+
+        self.local = threading.local()
+
+
+metrics = Metrics()
+
+#: Callables returning extra exposition lines, e.g. cache counters.
+
+collectors = []
+
+
+def register_collector(func):
+
+    collectors.append(func)
+
+
+def format_labels(**labels):
+
+    return ','.join(
+        '%s="%s"' % (key, str(value).replace('\\', '\\\\').replace('"', '\\"'))
+        for key, value in sorted(labels.items())
+    )
+
+
+def render(shard):
+    """Render a merged shard in the Prometheus text format."""
+
+    lines = [
+        '# HELP srm_requests_total Requests by endpoint, practice and status.',
+        '# TYPE srm_requests_total counter'
+    ]
+
+    for (endpoint, practice, status), count in sorted(shard.requests.items()):
+
+        lines.append('srm_requests_total{%s} %d' % (format_labels(
+            endpoint=endpoint, practice=practice, status=status), count))
+
+    lines.extend([
+        '# HELP srm_request_errors_total Requests with a 4xx or 5xx status.',
+        '# TYPE srm_request_errors_total counter'
+    ])
+
+    for (endpoint, practice, status), count in sorted(shard.requests.items()):
+
+        if status >= 400:
+
+            lines.append('srm_request_errors_total{%s} %d' % (format_labels(
+                endpoint=endpoint, practice=practice, status=status), count))
+
+    lines.extend([
+        '# HELP srm_request_duration_seconds Request latency.',
+        '# TYPE srm_request_duration_seconds histogram'
+    ])
+
+    for (endpoint, practice), counts in sorted(shard.buckets.items()):
+
+        cumulative = 0
+
+        for bound, count in zip(BUCKETS + ('+Inf',), counts):
+
+            cumulative += count
+
+            lines.append('srm_request_duration_seconds_bucket{%s} %d' % (
+                format_labels(endpoint=endpoint, practice=practice, le=bound),
+                cumulative))
+
+        labels = format_labels(endpoint=endpoint, practice=practice)
+
+        lines.append('srm_request_duration_seconds_sum{%s} %.6f' % (
+            labels, shard.sums[(endpoint, practice)]))
+
+        lines.append('srm_request_duration_seconds_count{%s} %d' % (
+            labels, cumulative))
+
+    lines.extend([
+        '# HELP srm_db_queries_total SQL statements issued by requests.',
+        '# TYPE srm_db_queries_total counter'
+    ])
+
+    for (endpoint, practice), count in sorted(shard.queries.items()):
+
+        lines.append('srm_db_queries_total{%s} %d' % (format_labels(
+            endpoint=endpoint, practice=practice), count))
+
+    for collector in collectors:
+
+        lines.extend(collector())
+
+    lines.extend([
+        '# HELP srm_process_id Worker process serving these metrics.',
+        '# TYPE srm_process_id gauge',
+        'srm_process_id %d' % os.getpid()
+    ])
+
+    return '\n'.join(lines) + '\n'
+
+
+def practice_label():
+
+    codes = g.get('practice_codes')
+
+    if not codes:
+
+        return 'none'
+
+    if len(codes) > 1:
+
+        return instrumentation.MIXED
+
+    return codes[0]
+
+
+def observe_request(response):
+    """Record the finished request in the calling thread's shard."""
+
+    started = g.get('request_started')
+
+    if started is None or request.endpoint == 'metrics':
+
+        return response
+
+    metrics.observe(
+        request.endpoint or 'none',
+        practice_label(),
+        response.status_code,
+        time.perf_counter() - started,
+        g.get('query_count', 0))
+
+    return response
+
+
+def metrics_get():
+
+    return Response(render(metrics.collect()), content_type=CONTENT_TYPE)
+
+
+def setup(app):
+    """Serve `/metrics` unless `METRICS_ENABLED` is false.
+
+    Relies on `instrumentation.setup` having been called to time the
+    request and count its queries.
+
+    :param object app: Instantiated Flask application.
+    """
+
+    if not app.config.get('METRICS_ENABLED', True):
+
+        return
+
+    app.after_request(observe_request)
+
+    app.add_url_rule('/metrics', 'metrics', metrics_get, methods=['GET'])
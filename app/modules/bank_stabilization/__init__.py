@@ -3,6 +3,9 @@
 
 from flask import Blueprint
 
+from app import registry
+from app.registry import Input
+
 
 module = Blueprint(**{
     'name': __name__,
@@ -17,4 +20,18 @@ module = Blueprint(**{
 
 if module:
     """Verify module Blueprint is instantiated."""
-    from . import utilities
+    registry.register('bank_stabilization', '%s.utilities' % __name__, **{
+        'inputs': [
+            Input('length_of_streambank', default=0),
+            Input('lateral_erosion_rate', default=0),
+            Input('soil_bulk_density', default=0),
+            Input('eroding_bank_height', default=0),
+            Input('soil_n_content', default=0),
+            Input('soil_p_content', default=0)
+        ],
+        'outputs': [
+            'tn_lbs_reduced',
+            'tp_lbs_reduced',
+            'tss_tons_reduced'
+        ]
+    })
@@ -1,24 +1,37 @@
 #!/usr/bin/env python
 
+from flask import Response
 from flask import abort
+from flask import current_app
+from flask import json
 from flask import request
+from sqlalchemy.exc import SQLAlchemyError
+from werkzeug.exceptions import HTTPException
 
-from app import logger
-from app.modules import bank_stabilization
-from app.modules import default
-from app.modules import denitrification
-from app.modules import floodplain_reconnection_1
-from app.modules import floodplain_reconnection_2
-from app.modules import floodplain_reconnection_3
-from app.modules import instream_habitat
-from app.modules import instream_processing
-from app.modules import outfall_and_gully_stabilization
-from app.modules import outfall_stabilization
-from app.modules import prevented_sediment
-from app.modules import shoreline_management
-from app.modules import stormwater
-from app.modules import swp
-from app.utilities import rgetattr
+from app import db
+from app import executor
+from app import instrumentation
+from app import log
+from app import registry
+from app import results
+
+
+logger = log.get_logger(__name__)
+
+#: Per-request debug events, sampled per `LOG_SAMPLE_EVERY`.
+
+hot_logger = log.SampledLogger(logger)
+
+#: Errors raised by a single practice payload that must not
+#: abort the remaining items of a batch.
+
+ITEM_ERRORS = (
+    ArithmeticError,
+    AttributeError,
+    KeyError,
+    TypeError,
+    ValueError,
+)
 
 
 def validate_request(data):
@@ -34,46 +47,26 @@ def validate_request(data):
         return False
 
 
-def get_mod_name(string):
+def dispatch(data):
 
-    return string.rsplit('.', 1)[1]
+    if validate_request(data):
 
+        codes = data.get('practice_code', '').split('.')
 
-def handle_request(data):
+        practice = registry.get(codes[0])
 
-    logger.debug(
-        'core.utilities.handle_request: %s',
-        str(request))
-
-    func_idx = {
-        get_mod_name(module.__name__): rgetattr(module, 'utilities')
-        for module in [
-            bank_stabilization,
-            default,
-            denitrification,
-            floodplain_reconnection_1,
-            floodplain_reconnection_2,
-            floodplain_reconnection_3,
-            instream_habitat,
-            instream_processing,
-            outfall_stabilization,
-            outfall_and_gully_stabilization,
-            prevented_sediment,
-            shoreline_management,
-            stormwater,
-            swp,
-        ]
-    }
+        if practice is not None:
 
-    logger.debug(
-        'core.utilities.handle_request.func_idx: %s',
-        func_idx)
+            instrumentation.record_practice(practice.code)
 
-    if validate_request(data):
+            with instrumentation.timer('dispatch'):
 
-        codes = data.get('practice_code', '').split('.')
+                invalid = practice.validate(data)
+
+            if invalid:
 
-        if codes[0] in func_idx:
+                abort(400, 'Missing or invalid numeric inputs: %s.' % (
+                    ', '.join(invalid)))
 
             if len(codes) > 1:
 
@@ -81,7 +74,23 @@ def handle_request(data):
                     'secondary_code': codes[1]
                 })
 
-            return func_idx.get(codes[0]).reduction(data)
+            key = results.cache.key(data)
+
+            result = results.cache.get(key)
+
+            if result is not results.MISS:
+
+                return result
+
+            with instrumentation.timer('compute'):
+
+                result = practice.reduction(
+                    data,
+                    tables=current_app.config.get('CURVE_TABLES', False))
+
+            results.cache.set(key, result)
+
+            return result
 
         else:
 
@@ -92,6 +101,216 @@ def handle_request(data):
         abort(400, 'Empty or invalid request body.')
 
 
+def record_practices(data):
+
+    """Label the request with the practices named in `data`.
+
+    Called before the ETag check and validation, so that 304 and 400
+    responses are counted against their practices in the request
+    metrics. `data` is a practice payload or a list of them.
+    """
+
+    for item in data if isinstance(data, list) else [data]:
+
+        if validate_request(item):
+
+            practice = registry.get(item['practice_code'].split('.')[0])
+
+            if practice is not None:
+
+                instrumentation.record_practice(practice.code)
+
+
+def entity_tag(data):
+
+    """Return the ETag for the response to `data` at this request's path.
+
+    Results are deterministic for a given payload and model/data
+    version, so the tag is known before anything is computed. Returns
+    None if `ANALYZE_ETAGS_ENABLED` is false or `data` is not plain JSON.
+    """
+
+    if not current_app.config.get('ANALYZE_ETAGS_ENABLED', True):
+
+        return None
+
+    return results.etag(request.path, data)
+
+
+def not_modified(etag):
+
+    """Answer a request whose `If-None-Match` matches `etag`."""
+
+    response = Response(status=304)
+
+    response.set_etag(etag)
+
+    return response
+
+
+def handle_request(data):
+
+    hot_logger.debug(
+        'core.utilities.handle_request: %s %s',
+        request.method,
+        request.path)
+
+    return dispatch(data)
+
+
+def handle_item(index, data):
+
+    """Dispatch a single practice payload on behalf of a batch.
+
+    Errors are reported in the item itself so that one bad record
+    does not abort the remaining items.
+    """
+
+    try:
+
+        return {
+            'index': index,
+            'result': dispatch(data)
+        }
+
+    except HTTPException as error:
+
+        return {
+            'index': index,
+            'error': {
+                'code': error.code,
+                'message': error.description
+            }
+        }
+
+    except SQLAlchemyError as error:
+
+        logger.error(
+            'core.utilities.handle_item: %s: %s',
+            index,
+            error)
+
+        db.session.rollback()
+
+        return {
+            'index': index,
+            'error': {
+                'code': 500,
+                'message': 'Unable to read load rate data.'
+            }
+        }
+
+    except ITEM_ERRORS as error:
+
+        logger.error(
+            'core.utilities.handle_item: %s: %s',
+            index,
+            error)
+
+        return {
+            'index': index,
+            'error': {
+                'code': 500,
+                'message': str(error)
+            }
+        }
+
+
+def handle_batch(items):
+
+    hot_logger.debug(
+        'core.utilities.handle_batch: %s %s',
+        request.method,
+        request.path)
+
+    if not isinstance(items, list):
+
+        abort(400, 'Request body must be an array of practices.')
+
+    max_size = current_app.config.get('ANALYZE_BATCH_MAX_SIZE')
+
+    if max_size and len(items) > max_size:
+
+        abort(400, 'Batch exceeds %s practices.' % max_size)
+
+    pool = executor.for_app(current_app)
+
+    if pool is not None and len(items) >= pool.min_size:
+
+        return handle_portfolio(pool, items)
+
+    results = [
+        handle_item(index, data)
+        for index, data in enumerate(items)
+    ]
+
+    return {
+        'meta': {
+            'count': len(results),
+            'errors': sum(1 for item in results if 'error' in item)
+        },
+        'results': results
+    }
+
+
+def handle_portfolio(pool, items):
+
+    """Dispatch a large batch on the worker processes of `pool`."""
+
+    record_practices(items)
+
+    with instrumentation.timer('compute'):
+
+        return pool.run(items)
+
+
+def handle_stream(stream):
+
+    """Dispatch newline-delimited JSON practice records.
+
+    Records are read from `stream` one line at a time and each result is
+    yielded as a serialized NDJSON line as soon as it is computed, so
+    memory use does not grow with the size of the portfolio.
+    """
+
+    hot_logger.debug(
+        'core.utilities.handle_stream: %s %s',
+        request.method,
+        request.path)
+
+    index = 0
+
+    for line in stream:
+
+        line = line.strip()
+
+        if not line:
+
+            continue
+
+        try:
+
+            data = json.loads(line.decode('utf-8'))
+
+        except ValueError:
+
+            item = {
+                'index': index,
+                'error': {
+                    'code': 400,
+                    'message': 'Invalid JSON record.'
+                }
+            }
+
+        else:
+
+            item = handle_item(index, data)
+
+        index += 1
+
+        yield json.dumps(item) + '\n'
+
+
 def fetch_tpl_path(practice_type):
 
     logger.debug(
@@ -1,7 +1,12 @@
 #!/usr/bin/env python
 
+from flask import Response
 from flask import jsonify
 from flask import request
+from flask import stream_with_context
+
+from app import instrumentation
+from app import registry
 
 from . import module
 from . import utilities
@@ -21,7 +26,116 @@ def analyze_options():
 @module.route('/v1/analyze', methods=['POST'])
 def analyze_post():
 
-    datum = utilities.handle_request(
-        request.get_json())
+    data = request.get_json()
+
+    utilities.record_practices(data)
+
+    etag = utilities.entity_tag(data)
+
+    if etag is not None and request.if_none_match.contains(etag):
+
+        return utilities.not_modified(etag)
+
+    datum = utilities.handle_request(data)
+
+    with instrumentation.timer('serialize'):
+
+        response = jsonify(**datum)
+
+    if etag is not None:
+
+        response.set_etag(etag)
+
+    return response, 200
+
+
+@module.route('/v1/analyze/batch', methods=['OPTIONS'])
+def analyze_batch_options():
+
+    """Define default user preflight check."""
+    return jsonify(**{
+        'meta': {
+            'status': 200
+        }
+    })
+
+
+@module.route('/v1/analyze/batch', methods=['POST'])
+def analyze_batch_post():
+
+    data = request.get_json()
+
+    utilities.record_practices(data)
+
+    etag = utilities.entity_tag(data)
+
+    if etag is not None and request.if_none_match.contains(etag):
+
+        return utilities.not_modified(etag)
+
+    datum = utilities.handle_batch(data)
+
+    with instrumentation.timer('serialize'):
 
-    return jsonify(**datum), 200
+        response = jsonify(**datum)
+
+    if etag is not None:
+
+        response.set_etag(etag)
+
+    return response, 200
+
+
+@module.route('/v1/analyze/stream', methods=['OPTIONS'])
+def analyze_stream_options():
+
+    """Define default user preflight check."""
+    return jsonify(**{
+        'meta': {
+            'status': 200
+        }
+    })
+
+
+@module.route('/v1/analyze/stream', methods=['POST'])
+def analyze_stream_post():
+
+    """Stream one NDJSON result line per NDJSON practice record.
+
+    Streamed responses carry no ETag: the tag would have to digest the
+    whole request body before the first result line is sent.
+    """
+    records = utilities.handle_stream(
+        request.stream)
+
+    return Response(
+        stream_with_context(records),
+        mimetype='application/x-ndjson'), 200
+
+
+@module.route('/v1/practices', methods=['GET'])
+def practices_get():
+
+    """List the registered practices and their declared inputs."""
+    practices = registry.describe()
+
+    return jsonify(**{
+        'meta': {
+            'count': len(practices)
+        },
+        'practices': practices
+    }), 200
+
+
+@module.route('/v1/timings', methods=['GET'])
+def timings_get():
+
+    """Report request timings aggregated by practice code."""
+    practices = instrumentation.stats.snapshot()
+
+    return jsonify(**{
+        'meta': {
+            'count': len(practices)
+        },
+        'practices': practices
+    }), 200
@@ -2,6 +2,9 @@
 
 from flask import Blueprint
 
+from app import registry
+from app.registry import Input
+
 
 module = Blueprint(**{
     'name': __name__,
@@ -16,4 +19,15 @@ module = Blueprint(**{
 
 if module:
     """Verify module Blueprint is instantiated."""
-    from . import utilities
+    registry.register('denitrification', '%s.utilities' % __name__, **{
+        'inputs': [
+            Input('floodplain_sq_ft', default=0),
+            Input('channel_sq_ft', default=0),
+            Input('brf', default=0),
+            Input('fhf', default=0),
+            Input('acrf', default=0)
+        ],
+        'outputs': [
+            'tn_lbs_reduced'
+        ]
+    })
@@ -17,38 +17,26 @@ def final_tn(operands, value):
 
 def reduction(data):
 
-    floodplain_sq_ft = data.get('floodplain_sq_ft', 0)
+    floodplain_sq_ft = data['floodplain_sq_ft']
 
-    channel_sq_ft = data.get('channel_sq_ft', 0)
+    channel_sq_ft = data['channel_sq_ft']
 
     # Baseflow reduction factor
 
-    brf = data.get('brf', 0)
+    brf = data['brf']
 
     # Floodplain height factor
 
-    fhf = data.get('fhf', 0)
+    fhf = data['fhf']
 
     # Aquifer conductivity reduction factor
 
-    acrf = data.get('acrf', 0)
-
-    values = [
-        floodplain_sq_ft,
-        channel_sq_ft,
-        brf,
-        fhf,
-        acrf,
-    ]
+    acrf = data['acrf']
 
     res = {
         'tn_lbs_reduced': 0
     }
 
-    if not all(isinstance(x, (float, int)) for x in values):
-
-        return res
-
     floodplain_tn = base_tn(floodplain_sq_ft)
 
     channel_tn = base_tn(channel_sq_ft)
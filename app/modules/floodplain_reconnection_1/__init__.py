@@ -2,6 +2,9 @@
 
 from flask import Blueprint
 
+from app import registry
+from app.registry import Input
+
 
 module = Blueprint(**{
     'name': __name__,
@@ -16,4 +19,16 @@ module = Blueprint(**{
 
 if module:
     """Verify module Blueprint is instantiated."""
-    from . import utilities
+    registry.register('floodplain_reconnection_1', '%s.utilities' % __name__, **{
+        'inputs': [
+            Input('existing_treated_discharge', required=True),
+            Input('proposed_treated_discharge', required=True),
+            Input('existing_total_discharge', required=True),
+            Input('proposed_total_discharge', required=True)
+        ],
+        'outputs': [
+            'existing_percent_flow_treated',
+            'proposed_percent_flow_treated',
+            'treatable_flow_credit'
+        ]
+    })
@@ -1,12298 +0,0 @@
-#!/usr/bin/env python
-
-LR_LOADS = {
-	"N24037PL0_5962_0000": {
-		"load_rate": 7.369910717,
-		"p": 603.4287109,
-		"tss": 2177887.5,
-		"n": 2906.710938
-	},
-	"N51171PS2_5560_5100": {
-		"load_rate": 50.09963681,
-		"p": 4520.692053,
-		"tss": 18785460.69,
-		"n": 18359.9334
-	},
-	"N51760JB3_6820_7053": {
-		"load_rate": 2.896598577,
-		"p": 354.4064941,
-		"tss": 1395148.5,
-		"n": 1048.71936
-	},
-	"N54037PS5_4370_4150": {
-		"load_rate": 13.89386046,
-		"p": 1317.259773,
-		"tss": 5485183.469,
-		"n": 5022.783966
-	},
-	"N42109SL3_1710_1740": {
-		"load_rate": 1.850455761,
-		"p": 213.9972992,
-		"tss": 623750.625,
-		"n": 703.4024658
-	},
-	"N51161JU1_7750_7560": {
-		"load_rate": 25.2997694,
-		"p": 2261.131691,
-		"tss": 7371532.703,
-		"n": 8637.083038
-	},
-	"N54003PU6_3730_3750": {
-		"load_rate": 10.98576546,
-		"p": 808.5,
-		"tss": 3351368.5,
-		"n": 4327.744141
-	},
-	"N24510WM0_3650_0001": {
-		"load_rate": 16.23108983,
-		"p": 1824.107918,
-		"tss": 16247845.03,
-		"n": 5771.242889
-	},
-	"N42111PU3_3680_3890": {
-		"load_rate": 9.702331543,
-		"p": 867.3656006,
-		"tss": 2133254.0,
-		"n": 3218.668213
-	},
-	"N24005WU3_3480_3481": {
-		"load_rate": 31.25700071,
-		"p": 3250.371244,
-		"tss": 15153782.72,
-		"n": 10689.03001
-	},
-	"N51135JA1_7600_7570": {
-		"load_rate": 152.7585754,
-		"p": 14428.51074,
-		"tss": 34787856.0,
-		"n": 53978.92188
-	},
-	"N24017PL0_5791_0000": {
-		"load_rate": 5.35294199,
-		"p": 388.8763428,
-		"tss": 1585866.75,
-		"n": 1916.628418
-	},
-	"N42081SW7_1320_1300": {
-		"load_rate": 25.73532867,
-		"p": 860.8082886,
-		"tss": 21957426.0,
-		"n": 6296.557617
-	},
-	"N10003EU2_3520_0001": {
-		"load_rate": 10.61850929,
-		"p": 771.8842163,
-		"tss": 2125463.5,
-		"n": 3678.86792
-	},
-	"N24510WM0_3961_0000": {
-		"load_rate": 0.8728862405,
-		"p": 103.8949661,
-		"tss": 1008907.313,
-		"n": 161.8160858
-	},
-	"N51159RL0_6500_0000": {
-		"load_rate": 44.41126251,
-		"p": 3348.75293,
-		"tss": 6983365.5,
-		"n": 15199.09473
-	},
-	"N51011JL2_7110_7120": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N42097SW7_1460_1640": {
-		"load_rate": 51.54099274,
-		"p": 3725.109131,
-		"tss": 11483951.0,
-		"n": 20640.5918
-	},
-	"N36101SU2_0680_0610": {
-		"load_rate": 14.98456097,
-		"p": 1286.940796,
-		"tss": 4995900.5,
-		"n": 5705.544434
-	},
-	"N42037SU8_1620_1610": {
-		"load_rate": 1.963266253,
-		"p": 164.4033356,
-		"tss": 630209.375,
-		"n": 684.1387939
-	},
-	"N10003DE0_2610_0000": {
-		"load_rate": 17.41675186,
-		"p": 1969.376953,
-		"tss": 6303628.5,
-		"n": 6328.114258
-	},
-	"N42105SW3_0930_1110": {
-		"load_rate": 44.78284073,
-		"p": 4389.269531,
-		"tss": 13922471.0,
-		"n": 16257.11035
-	},
-	"N10005EL0_4594_0000": {
-		"load_rate": 11.70073318,
-		"p": 628.4983521,
-		"tss": 1738356.125,
-		"n": 3927.797852
-	},
-	"N54023PU0_5620_5380": {
-		"load_rate": 0.7225598693,
-		"p": 80.7693634,
-		"tss": 203590.3438,
-		"n": 266.8780823
-	},
-	"H54031PU3_4280_3860": {
-		"load_rate": 9.333240509,
-		"p": 1084.069458,
-		"tss": 2409566.75,
-		"n": 3362.212402
-	},
-	"N24033XL3_4952_0000": {
-		"load_rate": 1.938462257,
-		"p": 188.0739098,
-		"tss": 586376.2266,
-		"n": 658.2784882
-	},
-	"N51153PL2_5470_5360": {
-		"load_rate": 66.33012009,
-		"p": 7448.66333,
-		"tss": 18489230.0,
-		"n": 24468.7002
-	},
-	"N51670JB0_7074_0000": {
-		"load_rate": 4.752033234,
-		"p": 579.5537109,
-		"tss": 2411171.75,
-		"n": 585.5272827
-	},
-	"N42107ZZ0_9999_9999": {
-		"load_rate": 324.6841125,
-		"p": 31373.97656,
-		"tss": 213970496.0,
-		"n": 119174.2734
-	},
-	"N42115SU6_0480_0520": {
-		"load_rate": 222.080307,
-		"p": 17556.58203,
-		"tss": 57639992.0,
-		"n": 66304.50781
-	},
-	"N36101SU3_0770_0690": {
-		"load_rate": 0.1790989786,
-		"p": 15.02267838,
-		"tss": 76325.01563,
-		"n": 69.27405548
-	},
-	"N51800JB0_7383_0000": {
-		"load_rate": 1.769882798,
-		"p": 266.6225281,
-		"tss": 571384.5625,
-		"n": 748.4855957
-	},
-	"N24039EL0_6002_0000": {
-		"load_rate": 8.340795517,
-		"p": 961.7321777,
-		"tss": 1796799.25,
-		"n": 2903.351563
-	},
-	"N42015SU2_0990_0950": {
-		"load_rate": 7.890331268,
-		"p": 641.7785645,
-		"tss": 1846228.125,
-		"n": 2516.272949
-	},
-	"N42115SU2_0670_0810": {
-		"load_rate": 2.013249874,
-		"p": 170.0283966,
-		"tss": 518803.5938,
-		"n": 587.5999146
-	},
-	"N24021PM1_3510_4000": {
-		"load_rate": 70.8891528,
-		"p": 4917.248604,
-		"tss": 23599346.52,
-		"n": 22507.41119
-	},
-	"N51683PL3_5360_5250": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N42063ZZ0_9999_9999": {
-		"load_rate": 922.9156675,
-		"p": 82459.1178,
-		"tss": 479056045.5,
-		"n": 351778.5371
-	},
-	"N42075SL0_2220_2140": {
-		"load_rate": 2.343846083,
-		"p": 288.1001892,
-		"tss": 830070.5,
-		"n": 894.4688721
-	},
-	"N42061SJ2_2580_2500": {
-		"load_rate": 107.4179459,
-		"p": 9962.289063,
-		"tss": 28769328.0,
-		"n": 38554.54297
-	},
-	"N24011EM0_4323_0000": {
-		"load_rate": 11.28559208,
-		"p": 823.2536011,
-		"tss": 2157210.5,
-		"n": 4128.566895
-	},
-	"N24017PL0_5670_0000": {
-		"load_rate": 3.993770361,
-		"p": 290.8831482,
-		"tss": 1176579.0,
-		"n": 1462.875488
-	},
-	"N24019EL0_5281_0000": {
-		"load_rate": 30.31118584,
-		"p": 3330.224854,
-		"tss": 7990357.5,
-		"n": 9112.507813
-	},
-	"N51005JU3_7490_7400": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N42001PU2_2790_3290": {
-		"load_rate": 25.43958855,
-		"p": 2660.325684,
-		"tss": 7463237.0,
-		"n": 9138.805664
-	},
-	"N51127JB3_6820_7053": {
-		"load_rate": 44.53333282,
-		"p": 5926.955078,
-		"tss": 12833426.0,
-		"n": 16803.0293
-	},
-	"N36123ZZ0_9999_9999": {
-		"load_rate": 459.1177673,
-		"p": 52983.99219,
-		"tss": 154783424.0,
-		"n": 178473.1719
-	},
-	"N42035SW4_1490_1400": {
-		"load_rate": 20.69845772,
-		"p": 2300.585449,
-		"tss": 6144752.0,
-		"n": 7197.706543
-	},
-	"N24009XL3_4950_0000": {
-		"load_rate": 35.25323868,
-		"p": 3140.161865,
-		"tss": 12414074.0,
-		"n": 12740.69238
-	},
-	"N51159RL1_6180_0001": {
-		"load_rate": 25.49682999,
-		"p": 1951.466187,
-		"tss": 3940319.75,
-		"n": 8674.042969
-	},
-	"N51161ZZ0_9999_9999": {
-		"load_rate": 327.347029,
-		"p": 33334.17219,
-		"tss": 292862837.2,
-		"n": 123415.8208
-	},
-	"N51095JB0_7390_0000": {
-		"load_rate": 7.186179399,
-		"p": 788.6914978,
-		"tss": 1952819.938,
-		"n": 2144.973633
-	},
-	"N24033PL7_4960_0000": {
-		"load_rate": 11.32680044,
-		"p": 1195.500975,
-		"tss": 7843714.594,
-		"n": 2604.218124
-	},
-	"N42029SL2_2200_2350": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"H51165PS2_6490_6420": {
-		"load_rate": 0.9595573545,
-		"p": 111.4839096,
-		"tss": 275737.875,
-		"n": 348.1719055
-	},
-	"L51157RU3_5610_5640": {
-		"load_rate": 0.8021307588,
-		"p": 68.47914124,
-		"tss": 217695.3281,
-		"n": 278.6058655
-	},
-	"N42067SJ2_2110_2170": {
-		"load_rate": 40.12572479,
-		"p": 3642.705322,
-		"tss": 9259834.0,
-		"n": 14242.11914
-	},
-	"N42075SL2_2300_2520": {
-		"load_rate": 7.334539413,
-		"p": 776.1237793,
-		"tss": 2719933.25,
-		"n": 2742.846436
-	},
-	"N42131SU2_0760_0960": {
-		"load_rate": 22.18868256,
-		"p": 1887.280273,
-		"tss": 7373541.5,
-		"n": 6942.058594
-	},
-	"N36017SU4_0300_0310": {
-		"load_rate": 35.28856659,
-		"p": 2195.452637,
-		"tss": 10077374.0,
-		"n": 9531.085938
-	},
-	"N24045EL0_4633_0000": {
-		"load_rate": 2.925502062,
-		"p": 243.5112457,
-		"tss": 668063.375,
-		"n": 935.6494141
-	},
-	"N42083ZZ0_9999_9999": {
-		"load_rate": 1165.401395,
-		"p": 117456.2601,
-		"tss": 553911340.0,
-		"n": 398687.3911
-	},
-	"N24047EL1_5660_0000": {
-		"load_rate": 20.30200195,
-		"p": 1374.085327,
-		"tss": 2958132.75,
-		"n": 4988.740723
-	},
-	"L54031PU4_4310_4210": {
-		"load_rate": 65.4777832,
-		"p": 6000.635742,
-		"tss": 15871303.0,
-		"n": 23303.22656
-	},
-	"N51017JU1_6340_6650": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N51069PS5_4380_4370": {
-		"load_rate": 35.01935196,
-		"p": 3922.475342,
-		"tss": 10169391.0,
-		"n": 14259.8877
-	},
-	"N51147JA1_7640_7280": {
-		"load_rate": 217.3567505,
-		"p": 21181.10742,
-		"tss": 54336632.0,
-		"n": 75707.24219
-	},
-	"N42009SJ2_2580_2500": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N24019EL0_4598_0000": {
-		"load_rate": 8.958535194,
-		"p": 987.3683472,
-		"tss": 2220445.75,
-		"n": 2664.881104
-	},
-	"N24035EU0_4470_0000": {
-		"load_rate": 23.54556274,
-		"p": 1112.169189,
-		"tss": 5769473.5,
-		"n": 7912.723633
-	},
-	"N42115SU2_0760_0960": {
-		"load_rate": 125.2857208,
-		"p": 9673.708984,
-		"tss": 33298630.0,
-		"n": 37214.90234
-	},
-	"N42009SJ3_2230_2060": {
-		"load_rate": 3.175985098,
-		"p": 292.1768494,
-		"tss": 816772.5625,
-		"n": 1156.691528
-	},
-	"N24015EU1_2980_0000": {
-		"load_rate": 32.72250232,
-		"p": 2361.452934,
-		"tss": 10288104.75,
-		"n": 11523.89676
-	},
-	"N10005DE0_5020_0000": {
-		"load_rate": 56.47659302,
-		"p": 3593.000244,
-		"tss": 10272330.0,
-		"n": 28899.32227
-	},
-	"N42065ZZ0_9999_9999": {
-		"load_rate": 755.5804024,
-		"p": 72044.83728,
-		"tss": 271060545.0,
-		"n": 272017.354
-	},
-	"H51045JU3_7490_7400": {
-		"load_rate": 14.94301188,
-		"p": 1748.086212,
-		"tss": 4881327.063,
-		"n": 5526.094666
-	},
-	"N11001PL7_4940_0000": {
-		"load_rate": 0.6278057098,
-		"p": 61.88891292,
-		"tss": 394547.6563,
-		"n": 195.2319012
-	},
-	"N51660PS0_6150_6160": {
-		"load_rate": 4.94740963,
-		"p": 655.8703003,
-		"tss": 8623465.0,
-		"n": 1992.159302
-	},
-	"N42015SU2_0800_0850": {
-		"load_rate": 210.5621643,
-		"p": 16944.4707,
-		"tss": 50719600.0,
-		"n": 66366.57031
-	},
-	"N51087JB0_7071_0000": {
-		"load_rate": 30.05052757,
-		"p": 2796.319336,
-		"tss": 9079349.0,
-		"n": 10920.36816
-	},
-	"N36077SU3_0190_0300": {
-		"load_rate": 3.420231581,
-		"p": 211.8092041,
-		"tss": 1440302.0,
-		"n": 899.0108643
-	},
-	"N24017PL0_5450_0000": {
-		"load_rate": 39.75331256,
-		"p": 3909.37722,
-		"tss": 12676618.5,
-		"n": 15089.68178
-	},
-	"N36007ZZ0_9999_9999": {
-		"load_rate": 89.32119751,
-		"p": 7357.949707,
-		"tss": 40763272.0,
-		"n": 27824.60938
-	},
-	"N51710JB0_7393_0000": {
-		"load_rate": 3.101409197,
-		"p": 374.3758469,
-		"tss": 1291090.031,
-		"n": 1150.947571
-	},
-	"N51061PL0_5141_5140": {
-		"load_rate": 69.24001527,
-		"p": 6136.503204,
-		"tss": 17474283.25,
-		"n": 23232.46417
-	},
-	"N42013SJ3_2250_2230": {
-		"load_rate": 255.5783842,
-		"p": 16423.58539,
-		"tss": 69027289.94,
-		"n": 86723.43475
-	},
-	"H24021PM1_3510_4000": {
-		"load_rate": 13.7639788,
-		"p": 1131.717981,
-		"tss": 4725844.398,
-		"n": 4602.294966
-	},
-	"N10001DE0_3840_0000": {
-		"load_rate": 29.6978125,
-		"p": 2182.841156,
-		"tss": 5467911.156,
-		"n": 10187.99286
-	},
-	"N51091PU2_5700_5210": {
-		"load_rate": 40.29345322,
-		"p": 4565.189819,
-		"tss": 12910051.0,
-		"n": 15009.81152
-	},
-	"N24021PM7_4410_4620": {
-		"load_rate": 0.3359155953,
-		"p": 26.9741478,
-		"tss": 124363.5938,
-		"n": 107.4031296
-	},
-	"N24017PL0_5583_0000": {
-		"load_rate": 12.01774635,
-		"p": 1109.259754,
-		"tss": 3721149.574,
-		"n": 4530.813282
-	},
-	"N36101SU4_0580_0630": {
-		"load_rate": 62.80527878,
-		"p": 5201.152832,
-		"tss": 23700144.0,
-		"n": 23813.49609
-	},
-	"N51001DE0_5650_0000": {
-		"load_rate": 138.7967186,
-		"p": 10958.39853,
-		"tss": 26682841.69,
-		"n": 63825.82874
-	},
-	"N51127JB3_7053_0001": {
-		"load_rate": 36.82221985,
-		"p": 5291.750977,
-		"tss": 12003233.0,
-		"n": 13752.29785
-	},
-	"N42035SW6_1230_1440": {
-		"load_rate": 303.1425476,
-		"p": 30765.50586,
-		"tss": 87780272.0,
-		"n": 106248.6406
-	},
-	"N24023PU3_4450_4440": {
-		"load_rate": 10.85090518,
-		"p": 1133.514801,
-		"tss": 4230828.875,
-		"n": 3737.310059
-	},
-	"N42099SL3_2260_2050": {
-		"load_rate": 63.06656593,
-		"p": 6633.8219,
-		"tss": 18367429.76,
-		"n": 24548.27066
-	},
-	"N36053SU3_0010_0190": {
-		"load_rate": 57.76421738,
-		"p": 3232.923584,
-		"tss": 15157140.0,
-		"n": 16935.11133
-	},
-	"N42067SJ1_2280_2450": {
-		"load_rate": 9.897895813,
-		"p": 1055.952759,
-		"tss": 2512673.25,
-		"n": 3618.545166
-	},
-	"N51045JU1_7560_7500": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N10001EM3_4326_0000": {
-		"load_rate": 28.33152771,
-		"p": 1432.443726,
-		"tss": 3902815.75,
-		"n": 9433.922852
-	},
-	"N24039EL0_6011_0000": {
-		"load_rate": 11.13995457,
-		"p": 519.744873,
-		"tss": 2903397.25,
-		"n": 2318.030518
-	},
-	"N51049JA2_7550_7280": {
-		"load_rate": 25.83897591,
-		"p": 2626.499023,
-		"tss": 6136412.5,
-		"n": 8075.724609
-	},
-	"N42079ZZ0_9999_9999": {
-		"load_rate": 134.5847515,
-		"p": 13741.3708,
-		"tss": 51872463.19,
-		"n": 46186.33398
-	},
-	"N42071SL9_2700_2720": {
-		"load_rate": 14.38582993,
-		"p": 1525.141602,
-		"tss": 4417164.0,
-		"n": 4799.850098
-	},
-	"N42037SU1_1480_1500": {
-		"load_rate": 1.045963168,
-		"p": 114.6271362,
-		"tss": 295232.4375,
-		"n": 372.0624695
-	},
-	"N24043PU6_3752_4080": {
-		"load_rate": 2.301168799,
-		"p": 228.4478302,
-		"tss": 849434.5625,
-		"n": 784.3455505
-	},
-	"N10001DE0_4141_0001": {
-		"load_rate": 23.32849884,
-		"p": 990.7945557,
-		"tss": 3839597.25,
-		"n": 12891.62695
-	},
-	"N36017SU1_0380_0400": {
-		"load_rate": 14.5428648,
-		"p": 980.5841675,
-		"tss": 3976679.25,
-		"n": 3965.622559
-	},
-	"N51133PL0_6270_0000": {
-		"load_rate": 46.15913391,
-		"p": 3195.151611,
-		"tss": 6477085.0,
-		"n": 16005.51074
-	},
-	"N24510WM3_4060_0001": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N51193PL0_6141_0000": {
-		"load_rate": 1.347467542,
-		"p": 102.2748413,
-		"tss": 249166.6094,
-		"n": 442.0931091
-	},
-	"N42105SW6_1230_1440": {
-		"load_rate": 26.30870247,
-		"p": 3050.456055,
-		"tss": 7922698.5,
-		"n": 9559.666992
-	},
-	"N42071SL1_2190_2350": {
-		"load_rate": 111.9374771,
-		"p": 10909.04492,
-		"tss": 36949376.0,
-		"n": 36408.02344
-	},
-	"N42037SW2_1190_1410": {
-		"load_rate": 1.838935971,
-		"p": 165.4685059,
-		"tss": 591762.4375,
-		"n": 657.7251587
-	},
-	"N51113RU2_5940_6200": {
-		"load_rate": 134.0580184,
-		"p": 11946.9747,
-		"tss": 34276759.75,
-		"n": 46256.34442
-	},
-	"N42061SJ3_2450_2120": {
-		"load_rate": 38.53616333,
-		"p": 3447.8396,
-		"tss": 9683709.0,
-		"n": 13718.79785
-	},
-	"N24009WL0_4921_0000": {
-		"load_rate": 18.34034348,
-		"p": 1545.728638,
-		"tss": 5629890.5,
-		"n": 6400.379883
-	},
-	"N42043SL9_2310_2430": {
-		"load_rate": 26.59436226,
-		"p": 2223.935059,
-		"tss": 7983223.5,
-		"n": 8447.96582
-	},
-	"N36101SU2_0741_0690": {
-		"load_rate": 1.09466207,
-		"p": 93.94049072,
-		"tss": 574725.8125,
-		"n": 429.2729187
-	},
-	"N51071ZZ0_9999_9999": {
-		"load_rate": 342.5592427,
-		"p": 35304.91962,
-		"tss": 140748267.1,
-		"n": 126130.1755
-	},
-	"N51073YL0_7010_0000": {
-		"load_rate": 58.80256271,
-		"p": 6394.064453,
-		"tss": 12718411.0,
-		"n": 21111.31641
-	},
-	"N51003JL2_6440_6441": {
-		"load_rate": 69.97864532,
-		"p": 5667.040039,
-		"tss": 20182086.0,
-		"n": 24522.36719
-	},
-	"N42055PM3_3040_3340": {
-		"load_rate": 1.067775249,
-		"p": 124.8986511,
-		"tss": 589928.8125,
-		"n": 408.0513611
-	},
-	"N51011JL6_7440_7430": {
-		"load_rate": 30.56335449,
-		"p": 3369.899658,
-		"tss": 9014227.0,
-		"n": 11353.70215
-	},
-	"N51131EL0_6610_0000": {
-		"load_rate": 30.53768349,
-		"p": 1761.417358,
-		"tss": 4704743.5,
-		"n": 10327.50488
-	},
-	"N42133SL9_2700_2720": {
-		"load_rate": 43.94465637,
-		"p": 3267.842041,
-		"tss": 10943824.0,
-		"n": 16399.48828
-	},
-	"N51029JL6_6890_6990": {
-		"load_rate": 36.6421051,
-		"p": 4353.755859,
-		"tss": 11141673.0,
-		"n": 14072.24805
-	},
-	"N42047ZZ0_9999_9999": {
-		"load_rate": 684.9657345,
-		"p": 72865.69543,
-		"tss": 286931548.0,
-		"n": 237302.7002
-	},
-	"N24015SL9_2720_0001": {
-		"load_rate": 7.411549496,
-		"p": 661.5892407,
-		"tss": 2003391.766,
-		"n": 2263.439511
-	},
-	"N24035EU0_4473_0000": {
-		"load_rate": 7.786060333,
-		"p": 442.3825989,
-		"tss": 2199701.5,
-		"n": 2641.260986
-	},
-	"N24017PL2_5630_0001": {
-		"load_rate": 18.38613814,
-		"p": 1590.724,
-		"tss": 5286781.254,
-		"n": 6842.841637
-	},
-	"N51179PL0_5730_5690": {
-		"load_rate": 43.20713234,
-		"p": 5336.958252,
-		"tss": 15239417.5,
-		"n": 17646.27051
-	},
-	"N51830JB0_7072_0000": {
-		"load_rate": 4.779452741,
-		"p": 560.3104248,
-		"tss": 1641140.219,
-		"n": 1924.052444
-	},
-	"N42027SL3_1710_1740": {
-		"load_rate": 175.5865936,
-		"p": 13891.63477,
-		"tss": 40026984.0,
-		"n": 58571.25391
-	},
-	"N24027WM3_3880_4060": {
-		"load_rate": 8.728038602,
-		"p": 608.9724545,
-		"tss": 2880759.984,
-		"n": 2857.390958
-	},
-	"N24005WU0_3541_0000": {
-		"load_rate": 3.349706769,
-		"p": 353.6507111,
-		"tss": 956406.8438,
-		"n": 576.2107906
-	},
-	"N36077SU1_0080_0210": {
-		"load_rate": 61.74650192,
-		"p": 3799.481201,
-		"tss": 15142188.0,
-		"n": 16776.21484
-	},
-	"N42035SW3_1091_1380": {
-		"load_rate": 0.1181611866,
-		"p": 14.06838131,
-		"tss": 55800.34766,
-		"n": 44.54824448
-	},
-	"N10003EU1_2983_0000": {
-		"load_rate": 2.421184063,
-		"p": 258.5482788,
-		"tss": 652442.25,
-		"n": 808.4915771
-	},
-	"N42023SW5_1540_1400": {
-		"load_rate": 5.268163204,
-		"p": 588.4667358,
-		"tss": 1410640.75,
-		"n": 1861.541016
-	},
-	"N24003WL0_4421_0000": {
-		"load_rate": 11.68414013,
-		"p": 1118.114193,
-		"tss": 4401542.07,
-		"n": 4451.45768
-	},
-	"N42033SW5_1540_1400": {
-		"load_rate": 108.8942947,
-		"p": 8949.763672,
-		"tss": 31635990.0,
-		"n": 34658.33203
-	},
-	"N36101SU2_0640_0630": {
-		"load_rate": 75.80807495,
-		"p": 6283.997559,
-		"tss": 27314826.0,
-		"n": 28768.5332
-	},
-	"N24037WL0_5880_0000": {
-		"load_rate": 8.686559677,
-		"p": 607.2989502,
-		"tss": 2072610.75,
-		"n": 2835.885986
-	},
-	"N51049JL3_7020_7100": {
-		"load_rate": 158.1631622,
-		"p": 15750.31738,
-		"tss": 39748012.0,
-		"n": 49374.68359
-	},
-	"N51133RL0_6530_0000": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N24017PL0_5584_0000": {
-		"load_rate": 19.80594845,
-		"p": 1795.143761,
-		"tss": 6355213.939,
-		"n": 7450.858335
-	},
-	"N24015EU0_3364_0000": {
-		"load_rate": 0.05110941082,
-		"p": 6.480332375,
-		"tss": 17921.18555,
-		"n": 20.49230576
-	},
-	"N42065SW2_1950_1940": {
-		"load_rate": 0.6851879954,
-		"p": 64.47683716,
-		"tss": 248075.6094,
-		"n": 244.6526489
-	},
-	"H51023JU5_7500_7420": {
-		"load_rate": 4.278199196,
-		"p": 496.9350281,
-		"tss": 1248674.125,
-		"n": 1560.897095
-	},
-	"N51049JL6_6970_6740": {
-		"load_rate": 11.44396114,
-		"p": 1266.503418,
-		"tss": 2924513.75,
-		"n": 3766.554932
-	},
-	"N51033YM2_6120_6430": {
-		"load_rate": 78.27068445,
-		"p": 8156.317772,
-		"tss": 23656269.88,
-		"n": 30174.88209
-	},
-	"N51139PS4_5840_5240": {
-		"load_rate": 64.95692444,
-		"p": 7121.606995,
-		"tss": 24117427.38,
-		"n": 23529.48218
-	},
-	"N51001EL0_6550_0000": {
-		"load_rate": 25.361763,
-		"p": 1940.612549,
-		"tss": 4109061.5,
-		"n": 9434.063477
-	},
-	"N11001PL7_4942_0000": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N24009XL0_5343_0000": {
-		"load_rate": 5.930724144,
-		"p": 481.5145874,
-		"tss": 1664755.625,
-		"n": 2066.980713
-	},
-	"N51099PL0_5921_0000": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N42131SU7_0980_1120": {
-		"load_rate": 54.1864624,
-		"p": 4549.263672,
-		"tss": 17236208.0,
-		"n": 16382.17773
-	},
-	"N54003PU6_3602_3730": {
-		"load_rate": 2.024275541,
-		"p": 218.7299805,
-		"tss": 791449.0625,
-		"n": 842.8448486
-	},
-	"N42107SL2_1810_2030": {
-		"load_rate": 96.45939636,
-		"p": 9363.112305,
-		"tss": 26380456.0,
-		"n": 36518.72266
-	},
-	"N51023JU3_7490_7400": {
-		"load_rate": 36.96365356,
-		"p": 4084.428589,
-		"tss": 11056802.5,
-		"n": 13491.46143
-	},
-	"N51005JU5_7300_7510": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N51059PL7_4911_0000": {
-		"load_rate": 12.10303688,
-		"p": 1450.712898,
-		"tss": 7161038.938,
-		"n": 4315.40509
-	},
-	"N51005JU2_7140_7330": {
-		"load_rate": 204.5061493,
-		"p": 22558.34668,
-		"tss": 61823458.0,
-		"n": 77464.9375
-	},
-	"N51047RU2_5500_5610": {
-		"load_rate": 0.7926703095,
-		"p": 74.63653564,
-		"tss": 349655.875,
-		"n": 260.7385864
-	},
-	"L51023JU3_6650_7300": {
-		"load_rate": 3.490888715,
-		"p": 392.7162247,
-		"tss": 1096276.656,
-		"n": 1294.262085
-	},
-	"N51199YL0_6931_0000": {
-		"load_rate": 17.11943173,
-		"p": 2197.993073,
-		"tss": 6105886.938,
-		"n": 6670.19165
-	},
-	"N54077GY0_4532_3951": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N36077SU2_0100_0230": {
-		"load_rate": 156.4138184,
-		"p": 10448.88477,
-		"tss": 41000736.0,
-		"n": 43691.03906
-	},
-	"N51085YP0_6840_0001": {
-		"load_rate": 9.646631241,
-		"p": 2526.116211,
-		"tss": 2210137.75,
-		"n": 8612.384766
-	},
-	"N24019EM0_5263_0000": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N51095JB0_7052_0001": {
-		"load_rate": 4.099747181,
-		"p": 506.285675,
-		"tss": 1025893.625,
-		"n": 1188.547241
-	},
-	"N51157RU2_5810_5610": {
-		"load_rate": 28.08836937,
-		"p": 2512.111572,
-		"tss": 7501482.5,
-		"n": 9830.882813
-	},
-	"N54037PU2_4220_3900": {
-		"load_rate": 33.44039917,
-		"p": 2483.264648,
-		"tss": 9182641.0,
-		"n": 12195.89551
-	},
-	"N51600PM7_4580_4820": {
-		"load_rate": 0.1456236243,
-		"p": 15.94696808,
-		"tss": 83679.02344,
-		"n": 53.28609085
-	},
-	"N24005WU0_3671_0000": {
-		"load_rate": 6.407351203,
-		"p": 623.078022,
-		"tss": 2586954.59,
-		"n": 2252.506498
-	},
-	"N24015EU1_2983_0000": {
-		"load_rate": 8.000971727,
-		"p": 566.7557173,
-		"tss": 2130750.219,
-		"n": 2579.364435
-	},
-	"N42081SW7_1410_1460": {
-		"load_rate": 98.56494141,
-		"p": 4618.264648,
-		"tss": 24808624.0,
-		"n": 29705.78711
-	},
-	"N36053SU2_0120_0260": {
-		"load_rate": 44.89396667,
-		"p": 2505.887695,
-		"tss": 11342574.0,
-		"n": 12885.04199
-	},
-	"N24029EU0_4125_0000": {
-		"load_rate": 4.782660484,
-		"p": 352.9473572,
-		"tss": 1156812.25,
-		"n": 1515.153198
-	},
-	"N42009SJ2_2530_2820": {
-		"load_rate": 224.4835968,
-		"p": 21535.41602,
-		"tss": 64369160.0,
-		"n": 81989.28125
-	},
-	"N42055PU3_3390_3730": {
-		"load_rate": 4.908082008,
-		"p": 506.6379089,
-		"tss": 1258989.5,
-		"n": 1919.486206
-	},
-	"N42037SU2_1200_1310": {
-		"load_rate": 11.72426128,
-		"p": 940.2202148,
-		"tss": 3173575.25,
-		"n": 4140.639648
-	},
-	"N24047DE0_5410_0000": {
-		"load_rate": 45.77465439,
-		"p": 3924.91748,
-		"tss": 12454669.0,
-		"n": 19192.50195
-	},
-	"N51101YP4_6750_0001": {
-		"load_rate": 43.34660721,
-		"p": 2633.67334,
-		"tss": 6207678.0,
-		"n": 13724.54785
-	},
-	"N42105SW1_1170_1270": {
-		"load_rate": 29.88250732,
-		"p": 3257.87207,
-		"tss": 9091850.0,
-		"n": 10929.11426
-	},
-	"N51139PS4_5080_4380": {
-		"load_rate": 8.517590016,
-		"p": 1000.164764,
-		"tss": 2619175.469,
-		"n": 3158.658997
-	},
-	"N24045EL0_5760_0000": {
-		"load_rate": 25.77992058,
-		"p": 1177.032104,
-		"tss": 7452038.5,
-		"n": 5242.54834
-	},
-	"N42131SU7_0960_0950": {
-		"load_rate": 11.12499237,
-		"p": 167.3822784,
-		"tss": 3265379.75,
-		"n": 1306.384888
-	},
-	"N51187RU2_5220_5640": {
-		"load_rate": 0.03081566282,
-		"p": 3.64921546,
-		"tss": 10042.55176,
-		"n": 11.39438057
-	},
-	"N24029EU0_3720_0000": {
-		"load_rate": 13.40621185,
-		"p": 777.4821777,
-		"tss": 2966572.5,
-		"n": 4203.495605
-	},
-	"N51121JU1_7690_7490": {
-		"load_rate": 34.35324192,
-		"p": 3783.968872,
-		"tss": 8903300.75,
-		"n": 11233.13037
-	},
-	"L51091JU1_6340_6650": {
-		"load_rate": 0.9135975502,
-		"p": 59.9090395,
-		"tss": 249464.0703,
-		"n": 329.4128819
-	},
-	"N36097SU3_0370_0490": {
-		"load_rate": 27.85156631,
-		"p": 2689.842529,
-		"tss": 8844712.0,
-		"n": 10313.45898
-	},
-	"N51003JL4_6520_6710": {
-		"load_rate": 183.2188568,
-		"p": 6565.26416,
-		"tss": 61257380.0,
-		"n": 42090.21094
-	},
-	"N42055SL4_2370_2330": {
-		"load_rate": 28.34205055,
-		"p": 3151.974121,
-		"tss": 7503538.5,
-		"n": 11303.39648
-	},
-	"N42015SU7_0750_0850": {
-		"load_rate": 66.68579865,
-		"p": 5462.561035,
-		"tss": 13727182.0,
-		"n": 21148.53516
-	},
-	"N51630RU5_6030_0001": {
-		"load_rate": 0.03062760085,
-		"p": 5.810106754,
-		"tss": 68773.28906,
-		"n": 17.95986748
-	},
-	"N42115SU3_0710_0910": {
-		"load_rate": 84.54812622,
-		"p": 6948.067383,
-		"tss": 23914392.0,
-		"n": 25486.90234
-	},
-	"N42113SW1_1180_1190": {
-		"load_rate": 15.91989803,
-		"p": 1469.791504,
-		"tss": 4195920.0,
-		"n": 5568.552734
-	},
-	"N42061SJ4_2360_2340": {
-		"load_rate": 218.3508301,
-		"p": 21238.2771,
-		"tss": 57178926.0,
-		"n": 74179.01465
-	},
-	"N42027SW1_1910_1890": {
-		"load_rate": 48.9737587,
-		"p": 3724.972656,
-		"tss": 16557025.0,
-		"n": 16290.88184
-	},
-	"N24017PL0_5390_0000": {
-		"load_rate": 6.927353539,
-		"p": 1256.692016,
-		"tss": 4049498.277,
-		"n": 5985.675087
-	},
-	"N51179PL1_5690_0001": {
-		"load_rate": 29.94888216,
-		"p": 3593.556419,
-		"tss": 9819874.219,
-		"n": 9419.67012
-	},
-	"N24027XU2_4480_4650": {
-		"load_rate": 2.384500533,
-		"p": 221.4286842,
-		"tss": 1174133.359,
-		"n": 810.4344254
-	},
-	"H54071PU2_5700_5210": {
-		"load_rate": 47.12244225,
-		"p": 4994.490723,
-		"tss": 13900521.75,
-		"n": 16862.84473
-	},
-	"N36077SU2_0130_0250": {
-		"load_rate": 129.4522552,
-		"p": 8554.047852,
-		"tss": 31028488.0,
-		"n": 35844.04688
-	},
-	"N51099PL0_6100_0000": {
-		"load_rate": 28.69714737,
-		"p": 3120.909668,
-		"tss": 7286184.5,
-		"n": 10254.3623
-	},
-	"N24009WL0_4920_0000": {
-		"load_rate": 13.56844044,
-		"p": 1647.622314,
-		"tss": 5092286.0,
-		"n": 5250.84668
-	},
-	"N10005DE0_4230_0000": {
-		"load_rate": 41.82786179,
-		"p": 2072.300537,
-		"tss": 7126474.5,
-		"n": 23191.52148
-	},
-	"N51085YP0_6860_6840": {
-		"load_rate": 35.86493069,
-		"p": 4225.172546,
-		"tss": 10455388.47,
-		"n": 14221.5274
-	},
-	"N51810JB0_7660_0000": {
-		"load_rate": 42.95219612,
-		"p": 5289.306702,
-		"tss": 13499025.13,
-		"n": 16607.20886
-	},
-	"N24019EL0_5766_0000": {
-		"load_rate": 0.9750946164,
-		"p": 111.9968185,
-		"tss": 215180.5313,
-		"n": 283.261261
-	},
-	"N54057PU4_3890_3990": {
-		"load_rate": 0.06724237651,
-		"p": 6.837828159,
-		"tss": 150624.125,
-		"n": 24.25609779
-	},
-	"N42131SU7_0860_0960": {
-		"load_rate": 25.88168144,
-		"p": 2303.961914,
-		"tss": 7698815.5,
-		"n": 7859.017578
-	},
-	"N42015SU2_0450_0720": {
-		"load_rate": 0.3551951647,
-		"p": 33.74549103,
-		"tss": 339757.875,
-		"n": 111.8300552
-	},
-	"N42133SL0_2831_2830": {
-		"load_rate": 22.55699348,
-		"p": 1855.286743,
-		"tss": 6672561.0,
-		"n": 7781.230469
-	},
-	"N51015JU3_6640_6790": {
-		"load_rate": 27.89312553,
-		"p": 2183.842712,
-		"tss": 7618624.0,
-		"n": 10864.83984
-	},
-	"N51199YL0_6929_0000": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N42079SU3_0970_1120": {
-		"load_rate": 4.381606102,
-		"p": 423.8518677,
-		"tss": 892379.625,
-		"n": 1194.819458
-	},
-	"N24047EL3_5970_0000": {
-		"load_rate": 2.581217766,
-		"p": 94.01633453,
-		"tss": 765052.25,
-		"n": 650.1144409
-	},
-	"N51013PL7_4962_0000": {
-		"load_rate": 12.21962616,
-		"p": 1305.842525,
-		"tss": 8220632.484,
-		"n": 4213.266678
-	},
-	"N42035SW7_1410_1460": {
-		"load_rate": 0.3979365528,
-		"p": 45.52378082,
-		"tss": 112443.0859,
-		"n": 145.3133545
-	},
-	"H54023PU2_4720_4750": {
-		"load_rate": 34.18569183,
-		"p": 3608.074951,
-		"tss": 8540903.0,
-		"n": 12033.30273
-	},
-	"N24015EU0_3301_0000": {
-		"load_rate": 2.961792707,
-		"p": 176.0582123,
-		"tss": 672044.8125,
-		"n": 952.1260986
-	},
-	"N24031PM1_4252_4250": {
-		"load_rate": 3.503382191,
-		"p": 417.5209656,
-		"tss": 2548951.406,
-		"n": 1286.171835
-	},
-	"N51097YM0_6623_0000": {
-		"load_rate": 29.10862541,
-		"p": 2743.662842,
-		"tss": 5204299.0,
-		"n": 9701.774414
-	},
-	"N51011JA2_7550_7280": {
-		"load_rate": 152.9323516,
-		"p": 16783.14288,
-		"tss": 41843164.38,
-		"n": 58035.83789
-	},
-	"N51065JL6_6740_7100": {
-		"load_rate": 85.90467072,
-		"p": 6847.006348,
-		"tss": 19925472.0,
-		"n": 28191.83398
-	},
-	"N36023SU4_0350_0420": {
-		"load_rate": 0.9240168929,
-		"p": 66.25759888,
-		"tss": 206099.8438,
-		"n": 257.5471497
-	},
-	"N54003PU2_4220_3900": {
-		"load_rate": 85.2302475,
-		"p": 3923.820801,
-		"tss": 18744356.0,
-		"n": 27737.49023
-	},
-	"N42001PM3_3040_3340": {
-		"load_rate": 78.85699803,
-		"p": 7246.694145,
-		"tss": 22772450.23,
-		"n": 27762.18086
-	},
-	"N51057RL5_6321_0000": {
-		"load_rate": 74.46595764,
-		"p": 5294.220703,
-		"tss": 13615053.0,
-		"n": 25144.17969
-	},
-	"N36107SU3_0590_0540": {
-		"load_rate": 5.576188564,
-		"p": 491.9372864,
-		"tss": 1689128.375,
-		"n": 1760.570679
-	},
-	"H42027SW1_1570_1640": {
-		"load_rate": 4.336552143,
-		"p": 477.5566101,
-		"tss": 1318408.375,
-		"n": 1529.177734
-	},
-	"N51069PS1_4830_5080": {
-		"load_rate": 30.77574563,
-		"p": 2958.892548,
-		"tss": 7637059.125,
-		"n": 12622.43439
-	},
-	"N42055PU0_3601_3602": {
-		"load_rate": 1.875363827,
-		"p": 235.8527222,
-		"tss": 601663.375,
-		"n": 764.9743042
-	},
-	"N36097SU3_0490_0530": {
-		"load_rate": 26.68201637,
-		"p": 2721.465576,
-		"tss": 7913995.0,
-		"n": 10285.00293
-	},
-	"N42081SW1_1560_1460": {
-		"load_rate": 1.011812329,
-		"p": 114.9533615,
-		"tss": 293206.0625,
-		"n": 359.9483948
-	},
-	"N24043PM7_4150_4290": {
-		"load_rate": 8.651352599,
-		"p": 794.453331,
-		"tss": 3042623.5,
-		"n": 2869.57338
-	},
-	"N51049JA4_7280_7340": {
-		"load_rate": 109.9325867,
-		"p": 11587.0918,
-		"tss": 24635582.0,
-		"n": 34567.29297
-	},
-	"N36007SU5_0460_0480": {
-		"load_rate": 16.99856949,
-		"p": 1265.989014,
-		"tss": 5282757.0,
-		"n": 4625.912598
-	},
-	"N24033XU2_4330_4480": {
-		"load_rate": 0.04316942941,
-		"p": 4.764483511,
-		"tss": 98330.5332,
-		"n": 14.39982709
-	},
-	"H51139PS5_5240_5200": {
-		"load_rate": 10.58472109,
-		"p": 1287.70546,
-		"tss": 4313803.0,
-		"n": 4008.439758
-	},
-	"N42009SJ4_2360_2340": {
-		"load_rate": 17.95079625,
-		"p": 2102.419235,
-		"tss": 5569723.531,
-		"n": 7010.210144
-	},
-	"N51041JA5_7480_0001": {
-		"load_rate": 68.35466766,
-		"p": 9514.040039,
-		"tss": 23419352.0,
-		"n": 28441.42773
-	},
-	"N51036JB0_7270_0000": {
-		"load_rate": 18.96391678,
-		"p": 1488.709961,
-		"tss": 3312875.25,
-		"n": 6695.547852
-	},
-	"N51179PL0_5851_0000": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N51011JL6_7430_7320": {
-		"load_rate": 47.00697327,
-		"p": 4087.548096,
-		"tss": 11830939.0,
-		"n": 16285.34766
-	},
-	"N10005DE0_4570_0000": {
-		"load_rate": 7.182806015,
-		"p": 542.4730225,
-		"tss": 2143986.0,
-		"n": 4662.146484
-	},
-	"N24001PU1_3940_3970": {
-		"load_rate": 65.01780701,
-		"p": 4086.031738,
-		"tss": 23487474.0,
-		"n": 20703.9375
-	},
-	"N36053SU2_0070_0090": {
-		"load_rate": 114.0819702,
-		"p": 6169.304688,
-		"tss": 32391880.0,
-		"n": 32662.0625
-	},
-	"N24019EL0_4892_0000": {
-		"load_rate": 6.052961349,
-		"p": 592.8529053,
-		"tss": 1474451.875,
-		"n": 1839.79541
-	},
-	"N51650YL0_7370_0000": {
-		"load_rate": 36.63848466,
-		"p": 4550.776237,
-		"tss": 12674509.47,
-		"n": 14126.05513
-	},
-	"N24005SL2_2910_3060": {
-		"load_rate": 16.63591194,
-		"p": 1052.748291,
-		"tss": 4952620.0,
-		"n": 6024.468262
-	},
-	"N24015EU0_3203_0000": {
-		"load_rate": 6.857099533,
-		"p": 374.9628906,
-		"tss": 1518385.625,
-		"n": 2196.456787
-	},
-	"N24005WM0_3744_0000": {
-		"load_rate": 0.4386801124,
-		"p": 25.29681206,
-		"tss": 122503.4531,
-		"n": 116.1365356
-	},
-	"N54065PU2_3630_3590": {
-		"load_rate": 136.6235046,
-		"p": 12864.02441,
-		"tss": 37201252.0,
-		"n": 48532.66406
-	},
-	"N36025SU2_0150_0220": {
-		"load_rate": 50.4733429,
-		"p": 3452.179688,
-		"tss": 18191024.0,
-		"n": 13629.6123
-	},
-	"N42117SU1_0820_0740": {
-		"load_rate": 44.91444016,
-		"p": 3954.52832,
-		"tss": 12486316.0,
-		"n": 15881.63281
-	},
-	"N51009JL2_7350_7090": {
-		"load_rate": 3.492589235,
-		"p": 369.2130432,
-		"tss": 1101503.875,
-		"n": 1400.548096
-	},
-	"N51019JL6_7440_7430": {
-		"load_rate": 67.88922882,
-		"p": 7968.15332,
-		"tss": 25043986.0,
-		"n": 26287.51953
-	},
-	"N51810JB0_7381_0000": {
-		"load_rate": 12.99760914,
-		"p": 754.2844238,
-		"tss": 3627199.75,
-		"n": 4302.188965
-	},
-	"N10003DE0_2800_0000": {
-		"load_rate": 3.48528266,
-		"p": 379.3817444,
-		"tss": 1671396.375,
-		"n": 1154.732422
-	},
-	"N24031PM0_4640_4820": {
-		"load_rate": 28.71350516,
-		"p": 3247.136232,
-		"tss": 18221088.24,
-		"n": 10265.87076
-	},
-	"N24047EL2_5110_5270": {
-		"load_rate": 3.761315107,
-		"p": 264.4601135,
-		"tss": 538291.375,
-		"n": 933.8827515
-	},
-	"N42015SU5_0610_0600": {
-		"load_rate": 58.710186,
-		"p": 4807.321289,
-		"tss": 13485511.0,
-		"n": 18603.76563
-	},
-	"N42071SL3_2350_2470": {
-		"load_rate": 26.74772072,
-		"p": 2348.155762,
-		"tss": 11289251.0,
-		"n": 8204.181641
-	},
-	"N51101YM4_6620_0001": {
-		"load_rate": 56.16093063,
-		"p": 4893.084961,
-		"tss": 10033391.0,
-		"n": 18718.54297
-	},
-	"N24021PM2_3400_3340": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N51119YL0_6581_0000": {
-		"load_rate": 22.80242157,
-		"p": 2671.950195,
-		"tss": 4755320.0,
-		"n": 8114.772949
-	},
-	"N42117SW3_0930_1110": {
-		"load_rate": 181.3554993,
-		"p": 14555.44043,
-		"tss": 49405140.0,
-		"n": 58597.29688
-	},
-	"N10005EL2_4630_0000": {
-		"load_rate": 105.1307144,
-		"p": 6487.492676,
-		"tss": 16174512.0,
-		"n": 34526.51172
-	},
-	"N36007SU4_0430_0420": {
-		"load_rate": 5.163768291,
-		"p": 417.8647461,
-		"tss": 1791891.75,
-		"n": 1573.185059
-	},
-	"N51097YP0_6783_0000": {
-		"load_rate": 1.664031744,
-		"p": 184.8321075,
-		"tss": 316326.0625,
-		"n": 557.1443481
-	},
-	"N24045EL2_5272_5270": {
-		"load_rate": 16.40200424,
-		"p": 1327.354492,
-		"tss": 3767506.0,
-		"n": 5090.834961
-	},
-	"N36015SU2_0680_0610": {
-		"load_rate": 52.19440842,
-		"p": 4410.671387,
-		"tss": 15833437.0,
-		"n": 18415.40039
-	},
-	"N51075JL7_7030_6800": {
-		"load_rate": 18.82835197,
-		"p": 1541.571777,
-		"tss": 4178474.25,
-		"n": 7229.660645
-	},
-	"N42035SW5_1540_1400": {
-		"load_rate": 52.08619308,
-		"p": 5595.784668,
-		"tss": 14995921.0,
-		"n": 18070.38281
-	},
-	"N42107SL2_1990_2070": {
-		"load_rate": 24.92592621,
-		"p": 1999.622314,
-		"tss": 7202494.5,
-		"n": 8506.066406
-	},
-	"N51093ZZ0_9999_9999": {
-		"load_rate": 157.2553406,
-		"p": 10170.69336,
-		"tss": 46618628.0,
-		"n": 54582.46875
-	},
-	"N51530JU4_7260_7380": {
-		"load_rate": 9.454813063,
-		"p": 671.5918121,
-		"tss": 4408371.859,
-		"n": 2786.004303
-	},
-	"N54063JU2_7450_7360": {
-		"load_rate": 64.28365898,
-		"p": 6698.481201,
-		"tss": 18374190.0,
-		"n": 22147.81543
-	},
-	"N51029JL2_7110_7120": {
-		"load_rate": 316.6319275,
-		"p": 37543.20703,
-		"tss": 97507176.0,
-		"n": 124369.7891
-	},
-	"N51810ZZ0_9999_9999": {
-		"load_rate": 250.471962,
-		"p": 26175.51416,
-		"tss": 71141130.13,
-		"n": 86452.02747
-	},
-	"N24005WU3_3481_0001": {
-		"load_rate": 52.12685177,
-		"p": 4695.234676,
-		"tss": 24199315.13,
-		"n": 18170.26272
-	},
-	"N42009SJ4_2660_2360": {
-		"load_rate": 22.0000782,
-		"p": 2753.552979,
-		"tss": 6971692.5,
-		"n": 8445.963867
-	},
-	"N42027SW2_1770_1690": {
-		"load_rate": 128.9616699,
-		"p": 11771.25781,
-		"tss": 36509208.0,
-		"n": 44593.125
-	},
-	"N36007SU7_0550_0540": {
-		"load_rate": 16.0889225,
-		"p": 1369.369751,
-		"tss": 5481201.0,
-		"n": 4940.116699
-	},
-	"N24045EL2_4634_0000": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N24047DE0_5650_0000": {
-		"load_rate": 100.6107559,
-		"p": 8730.76815,
-		"tss": 27433249.66,
-		"n": 41225.59393
-	},
-	"N24041EM0_4882_0000": {
-		"load_rate": 10.08884811,
-		"p": 555.055542,
-		"tss": 2040145.0,
-		"n": 3203.974365
-	},
-	"N24037PL0_5952_0000": {
-		"load_rate": 9.951038361,
-		"p": 699.2680054,
-		"tss": 2385973.25,
-		"n": 3489.030273
-	},
-	"N42119SW7_1460_1640": {
-		"load_rate": 17.50042152,
-		"p": 1485.533447,
-		"tss": 4763686.5,
-		"n": 6412.503906
-	},
-	"N24045EL0_4596_0000": {
-		"load_rate": 2.458848476,
-		"p": 198.5941162,
-		"tss": 571365.3125,
-		"n": 767.6495361
-	},
-	"N51091PU2_6050_5190": {
-		"load_rate": 4.266062379,
-		"p": 455.1582489,
-		"tss": 1413195.313,
-		"n": 1611.633362
-	},
-	"N24039EL0_5761_0000": {
-		"load_rate": 1.684474111,
-		"p": 189.4959412,
-		"tss": 391609.9375,
-		"n": 581.0797729
-	},
-	"N36101SU2_0570_0580": {
-		"load_rate": 14.07597065,
-		"p": 495.2125549,
-		"tss": 6057418.0,
-		"n": 4604.615723
-	},
-	"H42117SW3_0930_1110": {
-		"load_rate": 4.999222755,
-		"p": 533.9502563,
-		"tss": 1565438.5,
-		"n": 1790.528442
-	},
-	"N42041SL4_2370_2330": {
-		"load_rate": 226.2910922,
-		"p": 24403.9519,
-		"tss": 68358369.72,
-		"n": 90251.59448
-	},
-	"N54037PU6_3752_4080": {
-		"load_rate": 3.183322906,
-		"p": 249.4687805,
-		"tss": 760237.125,
-		"n": 1137.096069
-	},
-	"L51079RU2_6220_6170": {
-		"load_rate": 14.62572956,
-		"p": 1230.217407,
-		"tss": 4252202.0,
-		"n": 4903.216797
-	},
-	"N24003WL0_4424_0000": {
-		"load_rate": 5.103555381,
-		"p": 525.0702744,
-		"tss": 2518702.125,
-		"n": 1953.415527
-	},
-	"N51660PS2_5560_5100": {
-		"load_rate": 0.1959506571,
-		"p": 25.41194344,
-		"tss": 512295.3125,
-		"n": 72.92325592
-	},
-	"N42075SL9_2310_2430": {
-		"load_rate": 22.70392799,
-		"p": 2909.567139,
-		"tss": 6728112.0,
-		"n": 8679.912109
-	},
-	"H42113SW1_1180_1190": {
-		"load_rate": 7.910001755,
-		"p": 859.3632202,
-		"tss": 1878453.375,
-		"n": 2755.351807
-	},
-	"N54003PU2_3900_3750": {
-		"load_rate": 41.8804245,
-		"p": 1683.528809,
-		"tss": 12307679.0,
-		"n": 12994.66211
-	},
-	"N24015EU1_2810_0001": {
-		"load_rate": 49.72111386,
-		"p": 3605.136597,
-		"tss": 14662635.0,
-		"n": 16357.49728
-	},
-	"N51017JU1_6300_6650": {
-		"load_rate": 2.417904854,
-		"p": 233.4911194,
-		"tss": 634596.0,
-		"n": 907.8721924
-	},
-	"N42015SU7_0540_0720": {
-		"load_rate": 82.90116882,
-		"p": 6818.437988,
-		"tss": 18132558.0,
-		"n": 26566.61914
-	},
-	"N24035EU0_4872_0000": {
-		"load_rate": 21.91897774,
-		"p": 1658.416504,
-		"tss": 6365847.5,
-		"n": 7652.568359
-	},
-	"N24033PL7_4980_0000": {
-		"load_rate": 4.807775208,
-		"p": 508.5454065,
-		"tss": 3545759.738,
-		"n": 1776.598816
-	},
-	"N24009WL0_4772_0000": {
-		"load_rate": 30.50327224,
-		"p": 3063.409546,
-		"tss": 12958436.91,
-		"n": 11702.02975
-	},
-	"N42029ZZ0_9999_9999": {
-		"load_rate": 690.5883627,
-		"p": 65904.3902,
-		"tss": 464376439.2,
-		"n": 256040.7925
-	},
-	"N24019EL0_5151_0000": {
-		"load_rate": 89.22819519,
-		"p": 6413.603516,
-		"tss": 19367210.0,
-		"n": 29164.10547
-	},
-	"N24015EU0_3361_0000": {
-		"load_rate": 5.188447952,
-		"p": 256.6925659,
-		"tss": 1002823.5,
-		"n": 1603.032471
-	},
-	"N24003WL0_4394_0000": {
-		"load_rate": 1.699691636,
-		"p": 33.81407213,
-		"tss": 490560.1675,
-		"n": 164.9877474
-	},
-	"N51181JB0_7270_0000": {
-		"load_rate": 36.53392792,
-		"p": 3199.575439,
-		"tss": 5734523.0,
-		"n": 12302.96875
-	},
-	"N42055PU2_2840_3080": {
-		"load_rate": 4.319269657,
-		"p": 522.7111816,
-		"tss": 1175946.75,
-		"n": 1738.514771
-	},
-	"N51061PL2_5470_5360": {
-		"load_rate": 80.85758305,
-		"p": 7475.56604,
-		"tss": 15513802.25,
-		"n": 26984.31592
-	},
-	"N42105SW4_1150_1350": {
-		"load_rate": 8.509272575,
-		"p": 988.5750732,
-		"tss": 2514597.75,
-		"n": 3074.776367
-	},
-	"N24025WU0_3253_0000": {
-		"load_rate": 35.89063632,
-		"p": 3258.589386,
-		"tss": 13817001.0,
-		"n": 12629.66443
-	},
-	"N42001PM2_2860_3040": {
-		"load_rate": 226.9245882,
-		"p": 20002.19714,
-		"tss": 57735280.0,
-		"n": 80688.21338
-	},
-	"N24045EL0_5767_0001": {
-		"load_rate": 9.975357056,
-		"p": 771.8897095,
-		"tss": 2730952.0,
-		"n": 2952.540771
-	},
-	"N42061SJ1_2280_2450": {
-		"load_rate": 59.79307556,
-		"p": 6053.8125,
-		"tss": 16212406.0,
-		"n": 21377.49219
-	},
-	"N51510PL7_4980_0000": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N54057PU2_4160_3930": {
-		"load_rate": 86.46697998,
-		"p": 8204.795898,
-		"tss": 26557906.0,
-		"n": 31748.4375
-	},
-	"N51017JU2_6810_6900": {
-		"load_rate": 3.434498072,
-		"p": 398.740448,
-		"tss": 1291208.625,
-		"n": 1259.512573
-	},
-	"N51109YP2_6390_6330": {
-		"load_rate": 158.1401062,
-		"p": 18359.5918,
-		"tss": 44176032.0,
-		"n": 59419.76172
-	},
-	"N24019EL0_4592_0000": {
-		"load_rate": 17.14894772,
-		"p": 1421.387726,
-		"tss": 3903556.75,
-		"n": 5932.05658
-	},
-	"N51127JB0_7050_0000": {
-		"load_rate": 3.975804806,
-		"p": 507.5305481,
-		"tss": 1309875.125,
-		"n": 1550.14978
-	},
-	"N24001PU4_3970_3890": {
-		"load_rate": 73.95527217,
-		"p": 4480.00939,
-		"tss": 24564906.34,
-		"n": 23156.59624
-	},
-	"N42081SW1_1450_1510": {
-		"load_rate": 0.9466428757,
-		"p": 75.45610046,
-		"tss": 263841.4375,
-		"n": 314.9595032
-	},
-	"N51113RU2_6220_6170": {
-		"load_rate": 31.58195114,
-		"p": 2344.934814,
-		"tss": 6737631.5,
-		"n": 10652.07617
-	},
-	"N51023JU1_7750_7560": {
-		"load_rate": 29.28427196,
-		"p": 3167.47522,
-		"tss": 9726183.5,
-		"n": 10947.65161
-	},
-	"N24001PU1_3580_3780": {
-		"load_rate": 34.73278427,
-		"p": 3040.916504,
-		"tss": 12714177.0,
-		"n": 11974.7168
-	},
-	"N10003DE0_2690_0000": {
-		"load_rate": 46.08422852,
-		"p": 5067.680176,
-		"tss": 14527805.0,
-		"n": 18467.83789
-	},
-	"N51085JB3_6820_7053": {
-		"load_rate": 107.173336,
-		"p": 10807.41785,
-		"tss": 33185427.0,
-		"n": 34552.59668
-	},
-	"N51007JA2_7570_7480": {
-		"load_rate": 43.67556381,
-		"p": 5103.503418,
-		"tss": 9974223.0,
-		"n": 17121.01758
-	},
-	"H42079SU2_1210_1310": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N51187PS5_5200_4380": {
-		"load_rate": 14.89446896,
-		"p": 1199.361443,
-		"tss": 9824968.094,
-		"n": 3209.601807
-	},
-	"N42133WU2_3020_3320": {
-		"load_rate": 2.763190985,
-		"p": 202.5018311,
-		"tss": 1215082.375,
-		"n": 987.4415283
-	},
-	"N54027PU4_4310_4210": {
-		"load_rate": 228.8388024,
-		"p": 14476.64833,
-		"tss": 49744881.53,
-		"n": 79229.60213
-	},
-	"N24035EU0_4120_0000": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N24001PU2_3180_3370": {
-		"load_rate": 4.44909811,
-		"p": 330.127594,
-		"tss": 1355138.75,
-		"n": 1565.182373
-	},
-	"H54023PU2_4750_4451": {
-		"load_rate": 6.330255508,
-		"p": 625.6992188,
-		"tss": 1784192.5,
-		"n": 2229.920898
-	},
-	"N36007SU6_0520_0500": {
-		"load_rate": 54.96653748,
-		"p": 5308.234375,
-		"tss": 34755352.0,
-		"n": 18313.52539
-	},
-	"N51059PM7_4580_4820": {
-		"load_rate": 114.293457,
-		"p": 13398.95447,
-		"tss": 46244460.75,
-		"n": 46173.26257
-	},
-	"N24033XL3_4950_0000": {
-		"load_rate": 28.20150802,
-		"p": 2382.436822,
-		"tss": 7005164.066,
-		"n": 8745.313462
-	},
-	"N36097ZZ0_9999_9999": {
-		"load_rate": 388.6588783,
-		"p": 45884.20972,
-		"tss": 130852923.5,
-		"n": 156271.6699
-	},
-	"L54071PU0_5620_5380": {
-		"load_rate": 30.76358569,
-		"p": 2976.983582,
-		"tss": 8059027.75,
-		"n": 11093.56027
-	},
-	"N51047RU4_5640_6030": {
-		"load_rate": 138.0734558,
-		"p": 12969.7998,
-		"tss": 33360964.0,
-		"n": 46452.78125
-	},
-	"N24043PU2_2840_3080": {
-		"load_rate": 2.375263214,
-		"p": 251.8048096,
-		"tss": 728383.4375,
-		"n": 836.4709473
-	},
-	"N24019EM0_4322_0000": {
-		"load_rate": 13.45855522,
-		"p": 935.4911499,
-		"tss": 3010273.25,
-		"n": 4305.183105
-	},
-	"N51109YP3_6470_6690": {
-		"load_rate": 330.5051956,
-		"p": 35579.76929,
-		"tss": 86826102.5,
-		"n": 121427.9414
-	},
-	"N42029EU1_2650_0001": {
-		"load_rate": 50.20610809,
-		"p": 4935.913086,
-		"tss": 17668348.0,
-		"n": 17753.56641
-	},
-	"N42109SJ2_1900_1930": {
-		"load_rate": 3.191574574,
-		"p": 371.5718994,
-		"tss": 990174.1875,
-		"n": 1274.653931
-	},
-	"N24033XL1_4690_0001": {
-		"load_rate": 108.6479936,
-		"p": 11733.20307,
-		"tss": 44757970.58,
-		"n": 39768.05761
-	},
-	"N24005WU0_3670_0001": {
-		"load_rate": 21.77083313,
-		"p": 2497.998924,
-		"tss": 13520911.59,
-		"n": 8346.217316
-	},
-	"N36017SU1_0200_0270": {
-		"load_rate": 68.73557281,
-		"p": 4610.840332,
-		"tss": 18711984.0,
-		"n": 18958.28516
-	},
-	"N24003WL0_4391_0000": {
-		"load_rate": 0.1825570464,
-		"p": 19.02148628,
-		"tss": 379877.1875,
-		"n": 63.55353546
-	},
-	"H51165PS4_5840_5240": {
-		"load_rate": 26.91937447,
-		"p": 3204.026733,
-		"tss": 11104663.5,
-		"n": 9906.870361
-	},
-	"N51019ZZ0_9999_9999": {
-		"load_rate": 1062.423893,
-		"p": 106170.1332,
-		"tss": 396010467.0,
-		"n": 385878.0479
-	},
-	"N36025SU2_0290_0291": {
-		"load_rate": 101.1466251,
-		"p": 6634.654501,
-		"tss": 29708308.27,
-		"n": 27016.02182
-	},
-	"N42105ZZ0_9999_9999": {
-		"load_rate": 473.7919617,
-		"p": 49341.24219,
-		"tss": 182985920.0,
-		"n": 178196.9219
-	},
-	"N36015SU5_0600_0750": {
-		"load_rate": 63.78226089,
-		"p": 5175.09375,
-		"tss": 19605084.0,
-		"n": 22145.37891
-	},
-	"N51740JB0_7390_0000": {
-		"load_rate": 1.446761489,
-		"p": 193.7560272,
-		"tss": 514368.9688,
-		"n": 539.6889038
-	},
-	"N54065PU3_3860_3610": {
-		"load_rate": 35.1926918,
-		"p": 3854.138184,
-		"tss": 9859466.0,
-		"n": 12035.59082
-	},
-	"N42033SW4_1720_1650": {
-		"load_rate": 136.2859192,
-		"p": 12390.80273,
-		"tss": 48642372.0,
-		"n": 38855.25781
-	},
-	"N42021SW2_1950_1940": {
-		"load_rate": 48.31768799,
-		"p": 4020.101563,
-		"tss": 19201360.0,
-		"n": 15648.47266
-	},
-	"N51023JU3_6650_7300": {
-		"load_rate": 0.2366761416,
-		"p": 27.49220467,
-		"tss": 67986.97656,
-		"n": 87.72181702
-	},
-	"H51165PS2_5550_5560": {
-		"load_rate": 7.112552881,
-		"p": 835.8271942,
-		"tss": 2371927.563,
-		"n": 2592.595123
-	},
-	"N36053SU2_0110_0240": {
-		"load_rate": 39.33198547,
-		"p": 2201.12085,
-		"tss": 10592534.0,
-		"n": 11437.25293
-	},
-	"H42113SU2_1210_1310": {
-		"load_rate": 55.30323029,
-		"p": 6328.774902,
-		"tss": 14992213.0,
-		"n": 19419.61523
-	},
-	"N24003XL3_4711_0000": {
-		"load_rate": 18.29861877,
-		"p": 1324.091454,
-		"tss": 4173763.377,
-		"n": 5942.875452
-	},
-	"N36007SU1_0410_0480": {
-		"load_rate": 6.776185036,
-		"p": 546.7091675,
-		"tss": 2021176.125,
-		"n": 1973.068237
-	},
-	"H42043SL8_2080_2050": {
-		"load_rate": 6.822296619,
-		"p": 781.9985352,
-		"tss": 1914836.375,
-		"n": 2428.827881
-	},
-	"N42009PU2_3180_3370": {
-		"load_rate": 84.45855713,
-		"p": 8141.132813,
-		"tss": 23214244.0,
-		"n": 30582.5625
-	},
-	"N51023JU2_7180_7380": {
-		"load_rate": 0.9380176067,
-		"p": 108.4031448,
-		"tss": 377042.4688,
-		"n": 340.7976685
-	},
-	"N51510PL7_4963_0000": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N24039EL3_5974_0000": {
-		"load_rate": 23.41833687,
-		"p": 2718.066895,
-		"tss": 4998395.5,
-		"n": 8048.150879
-	},
-	"N42111ZZ0_9999_9999": {
-		"load_rate": 1036.835399,
-		"p": 97323.76261,
-		"tss": 585817592.1,
-		"n": 377955.2247
-	},
-	"N54065PU6_3870_3690": {
-		"load_rate": 29.03051376,
-		"p": 2883.737061,
-		"tss": 8682700.0,
-		"n": 9772.612305
-	},
-	"N51710JB0_7661_0000": {
-		"load_rate": 9.33746323,
-		"p": 573.4702492,
-		"tss": 2266730.078,
-		"n": 4144.557495
-	},
-	"N24021PM7_4150_4290": {
-		"load_rate": 25.52838415,
-		"p": 1897.473701,
-		"tss": 7833502.219,
-		"n": 7517.076492
-	},
-	"N24019EM0_5260_0000": {
-		"load_rate": 6.893728018,
-		"p": 595.4669342,
-		"tss": 1706217.906,
-		"n": 2186.774475
-	},
-	"N54023PU2_4360_4160": {
-		"load_rate": 73.2427597,
-		"p": 6166.580078,
-		"tss": 18943590.0,
-		"n": 26018.26367
-	},
-	"N42111PU2_3140_3680": {
-		"load_rate": 125.9938354,
-		"p": 11930.27539,
-		"tss": 37840628.0,
-		"n": 44087.62109
-	},
-	"N42035SW6_1400_1330": {
-		"load_rate": 41.17815018,
-		"p": 4644.908691,
-		"tss": 11598629.0,
-		"n": 14488.7168
-	},
-	"N42081SW2_1190_1410": {
-		"load_rate": 158.4232635,
-		"p": 13985.59961,
-		"tss": 41893220.0,
-		"n": 51527.73047
-	},
-	"N42041SL9_2050_2270": {
-		"load_rate": 1.680360556,
-		"p": 194.488739,
-		"tss": 2991028.0,
-		"n": 639.0141602
-	},
-	"N10003DE0_3280_0000": {
-		"load_rate": 4.333805084,
-		"p": 265.6800842,
-		"tss": 689679.875,
-		"n": 1019.572021
-	},
-	"N51033YP3_6670_6720": {
-		"load_rate": 13.327178,
-		"p": 1345.205933,
-		"tss": 3896550.75,
-		"n": 5208.160645
-	},
-	"N42057PU1_3100_3690": {
-		"load_rate": 28.0802803,
-		"p": 2924.107666,
-		"tss": 7420847.0,
-		"n": 10491.41797
-	},
-	"N36069SU3_0370_0490": {
-		"load_rate": 1.415252447,
-		"p": 126.826416,
-		"tss": 477593.75,
-		"n": 446.3509521
-	},
-	"N24039EL3_5971_0000": {
-		"load_rate": 8.486210823,
-		"p": 973.6699829,
-		"tss": 1791768.375,
-		"n": 2848.025879
-	},
-	"N24037PL0_5671_0000": {
-		"load_rate": 5.161783218,
-		"p": 485.5109863,
-		"tss": 1677097.75,
-		"n": 1950.698975
-	},
-	"N24033PL1_5230_0001": {
-		"load_rate": 27.78052571,
-		"p": 2998.200752,
-		"tss": 9677898.297,
-		"n": 10012.68517
-	},
-	"N51073YL0_7230_0000": {
-		"load_rate": 21.42923355,
-		"p": 2407.184814,
-		"tss": 3627201.5,
-		"n": 7979.536621
-	},
-	"N36007SU3_0240_0350": {
-		"load_rate": 12.0402807,
-		"p": 1006.446793,
-		"tss": 4423582.469,
-		"n": 3550.9776
-	},
-	"N10003DE0_2590_0000": {
-		"load_rate": 15.71067715,
-		"p": 1989.941162,
-		"tss": 5523763.5,
-		"n": 6514.378906
-	},
-	"N24017PL0_5790_0000": {
-		"load_rate": 17.40576944,
-		"p": 1265.88336,
-		"tss": 5296975.688,
-		"n": 5771.222122
-	},
-	"N51157RU2_5220_5640": {
-		"load_rate": 15.00580813,
-		"p": 1301.667883,
-		"tss": 4289803.406,
-		"n": 5197.143257
-	},
-	"N42061SJ3_2230_2060": {
-		"load_rate": 24.83302307,
-		"p": 2007.932617,
-		"tss": 6546533.0,
-		"n": 8519.329102
-	},
-	"N36025SU4_0220_0250": {
-		"load_rate": 2.361283302,
-		"p": 200.1650238,
-		"tss": 733410.1875,
-		"n": 734.5309448
-	},
-	"N24017PL0_5510_0001": {
-		"load_rate": 57.81912196,
-		"p": 4824.71884,
-		"tss": 18366052.35,
-		"n": 21992.45252
-	},
-	"N42115SU6_0500_0550": {
-		"load_rate": 28.60327339,
-		"p": 2371.328857,
-		"tss": 7438093.5,
-		"n": 8725.522461
-	},
-	"N51740JB0_7397_0000": {
-		"load_rate": 0.491286546,
-		"p": 24.36587143,
-		"tss": 221469.4531,
-		"n": 73.30796814
-	},
-	"N24037PL0_6060_0000": {
-		"load_rate": 19.00817108,
-		"p": 1397.277344,
-		"tss": 5090556.5,
-		"n": 6760.706055
-	},
-	"N24043PU2_3080_3640": {
-		"load_rate": 25.15531731,
-		"p": 2423.875977,
-		"tss": 7264486.5,
-		"n": 8791.785156
-	},
-	"N24017PL0_5671_0000": {
-		"load_rate": 13.4524581,
-		"p": 1078.060658,
-		"tss": 4351607.84,
-		"n": 4843.363145
-	},
-	"N51041JB0_7071_0000": {
-		"load_rate": 123.4462724,
-		"p": 10021.85382,
-		"tss": 47736905.94,
-		"n": 34734.85358
-	},
-	"N42069SU3_0810_0970": {
-		"load_rate": 41.33881202,
-		"p": 4853.786669,
-		"tss": 12848304.23,
-		"n": 17322.55527
-	},
-	"N51101YM0_6621_0000": {
-		"load_rate": 25.18842888,
-		"p": 2606.477783,
-		"tss": 4180887.0,
-		"n": 8808.472656
-	},
-	"N36025SU4_0250_0340": {
-		"load_rate": 0.01727668755,
-		"p": 1.243208766,
-		"tss": 771954.5,
-		"n": 4.670842648
-	},
-	"N51043PS5_4380_4370": {
-		"load_rate": 144.0771813,
-		"p": 10602.08856,
-		"tss": 36070023.0,
-		"n": 47088.13452
-	},
-	"N51179RU5_6030_0001": {
-		"load_rate": 18.04656792,
-		"p": 2467.87793,
-		"tss": 6073522.5,
-		"n": 7973.547852
-	},
-	"N24037PL0_5980_0000": {
-		"load_rate": 4.925241187,
-		"p": 385.0017853,
-		"tss": 1398698.789,
-		"n": 1680.065937
-	},
-	"N54065PU6_3590_3640": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N24003WL0_4425_0000": {
-		"load_rate": 2.668464661,
-		"p": 284.0580444,
-		"tss": 883711.3125,
-		"n": 938.9621582
-	},
-	"N51179PL0_5493_0000": {
-		"load_rate": 28.74317575,
-		"p": 3444.95694,
-		"tss": 9191728.5,
-		"n": 10166.8576
-	},
-	"N42037SU2_1550_1620": {
-		"load_rate": 42.5830574,
-		"p": 3608.890381,
-		"tss": 12325264.0,
-		"n": 14890.19727
-	},
-	"N24011EM4_4740_0000": {
-		"load_rate": 18.74727058,
-		"p": 1487.685547,
-		"tss": 3746101.75,
-		"n": 7009.273438
-	},
-	"N36097SU2_0450_0720": {
-		"load_rate": 57.25123596,
-		"p": 5796.215332,
-		"tss": 16916102.0,
-		"n": 21998.50195
-	},
-	"N51107PL2_4970_5250": {
-		"load_rate": 43.36664319,
-		"p": 4710.542175,
-		"tss": 15164828.25,
-		"n": 18221.13733
-	},
-	"N24037PL0_6110_0000": {
-		"load_rate": 4.50070858,
-		"p": 312.462616,
-		"tss": 1190000.375,
-		"n": 1524.227661
-	},
-	"N42113SU3_0870_0730": {
-		"load_rate": 0.0887843743,
-		"p": 8.15282917,
-		"tss": 47358.69531,
-		"n": 31.14807892
-	},
-	"N51740JB0_7383_0000": {
-		"load_rate": 7.859193802,
-		"p": 1032.250977,
-		"tss": 3675646.0,
-		"n": 2326.605225
-	},
-	"N42107SU2_1550_1620": {
-		"load_rate": 74.81694794,
-		"p": 5509.770508,
-		"tss": 21812574.0,
-		"n": 25333.64453
-	},
-	"N51163JU3_6650_7300": {
-		"load_rate": 0.459610492,
-		"p": 53.15550232,
-		"tss": 642384.125,
-		"n": 167.9094696
-	},
-	"N42015SW2_1030_1060": {
-		"load_rate": 16.32735634,
-		"p": 1396.295288,
-		"tss": 3518083.0,
-		"n": 5358.213867
-	},
-	"N36101SU1_0820_0740": {
-		"load_rate": 3.790053606,
-		"p": 311.6564636,
-		"tss": 1362155.0,
-		"n": 1470.662598
-	},
-	"N51091PU0_6080_5620": {
-		"load_rate": 32.96791077,
-		"p": 2370.303711,
-		"tss": 12656313.0,
-		"n": 12349.10449
-	},
-	"H24021PM3_3040_3340": {
-		"load_rate": 2.978376765,
-		"p": 253.5885501,
-		"tss": 1356623.242,
-		"n": 1012.746937
-	},
-	"N42061SJ3_2040_1980": {
-		"load_rate": 11.60287285,
-		"p": 870.2564697,
-		"tss": 3124661.0,
-		"n": 3828.998779
-	},
-	"N51193PL0_6100_0000": {
-		"load_rate": 54.80077945,
-		"p": 3293.721558,
-		"tss": 9699637.273,
-		"n": 16538.88964
-	},
-	"N51163JU2_7180_7380": {
-		"load_rate": 111.7054493,
-		"p": 9799.728943,
-		"tss": 35961489.56,
-		"n": 38941.14819
-	},
-	"H51003JL2_6440_6441": {
-		"load_rate": 31.09835911,
-		"p": 3460.98291,
-		"tss": 10090768.0,
-		"n": 11098.43799
-	},
-	"N51153PL3_5360_5250": {
-		"load_rate": 29.12233734,
-		"p": 3896.78125,
-		"tss": 11033417.0,
-		"n": 12522.13379
-	},
-	"H42079SU7_1140_1420": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N36109SU2_0450_0720": {
-		"load_rate": 37.70528793,
-		"p": 3765.098633,
-		"tss": 10722432.0,
-		"n": 12989.72266
-	},
-	"N24033XL0_5340_0000": {
-		"load_rate": 10.81674794,
-		"p": 909.979445,
-		"tss": 3075450.949,
-		"n": 3587.17212
-	},
-	"N42081SW4_1260_1300": {
-		"load_rate": 66.18133545,
-		"p": 5278.55127,
-		"tss": 19008560.0,
-		"n": 21350.29102
-	},
-	"N24003WM0_3963_0000": {
-		"load_rate": 3.555604935,
-		"p": 345.072998,
-		"tss": 1428193.375,
-		"n": 1409.073242
-	},
-	"N42055SL1_2670_2370": {
-		"load_rate": 19.7281723,
-		"p": 1997.146851,
-		"tss": 4802586.0,
-		"n": 7535.126465
-	},
-	"N42013SW3_1920_1750": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N24043PU3_3290_3390": {
-		"load_rate": 0.4794864058,
-		"p": 38.21162415,
-		"tss": 227917.2344,
-		"n": 159.6484985
-	},
-	"N51085YP5_6780_0000": {
-		"load_rate": 58.07502344,
-		"p": 5318.004154,
-		"tss": 16074161.3,
-		"n": 22849.02956
-	},
-	"N42057PU2_2840_3080": {
-		"load_rate": 211.7071533,
-		"p": 20577.16406,
-		"tss": 59127548.0,
-		"n": 77952.60938
-	},
-	"H54023PU1_4760_4451": {
-		"load_rate": 3.020141125,
-		"p": 298.2363281,
-		"tss": 816481.625,
-		"n": 1067.53894
-	},
-	"N51125JL1_6770_6850": {
-		"load_rate": 112.3679084,
-		"p": 11174.80287,
-		"tss": 34545941.88,
-		"n": 42308.69159
-	},
-	"H42043SL9_2050_2270": {
-		"load_rate": 14.10264111,
-		"p": 1622.729004,
-		"tss": 4035505.5,
-		"n": 5002.226074
-	},
-	"N36077SU2_0020_0140": {
-		"load_rate": 74.58742523,
-		"p": 4685.920898,
-		"tss": 19355196.0,
-		"n": 20115.46094
-	},
-	"H42113SW2_1070_1060": {
-		"load_rate": 25.98796463,
-		"p": 2697.012207,
-		"tss": 6487595.5,
-		"n": 8529.448242
-	},
-	"N51125JL6_7150_6890": {
-		"load_rate": 27.48749352,
-		"p": 2684.078125,
-		"tss": 8131677.5,
-		"n": 9280.678711
-	},
-	"N54093ZZ0_9999_9999": {
-		"load_rate": 469.7104111,
-		"p": 49705.20215,
-		"tss": 190828737.0,
-		"n": 167703.1338
-	},
-	"N42015SU2_0920_0830": {
-		"load_rate": 13.97558594,
-		"p": 1333.995605,
-		"tss": 3268897.0,
-		"n": 4859.15918
-	},
-	"N51036JB0_7271_0000": {
-		"load_rate": 1.075102568,
-		"p": 77.3229599,
-		"tss": 191306.2344,
-		"n": 390.1319885
-	},
-	"N51131EL0_7060_0000": {
-		"load_rate": 19.6245079,
-		"p": 1189.782104,
-		"tss": 3076325.0,
-		"n": 6653.847168
-	},
-	"N10003DE0_2870_0000": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N51023JU3_7400_7510": {
-		"load_rate": 46.03195477,
-		"p": 5200.871704,
-		"tss": 13701549.0,
-		"n": 16914.17432
-	},
-	"N42081SU3_1280_1590": {
-		"load_rate": 8.162273407,
-		"p": 645.2453613,
-		"tss": 2781795.5,
-		"n": 2702.643555
-	},
-	"N36017ZZ0_9999_9999": {
-		"load_rate": 3.086385965,
-		"p": 264.2715149,
-		"tss": 1041028.5,
-		"n": 1010.155518
-	},
-	"N51033YP4_6720_6750": {
-		"load_rate": 14.98822021,
-		"p": 1518.266235,
-		"tss": 4416762.0,
-		"n": 6084.464844
-	},
-	"N51145JL7_7030_6800": {
-		"load_rate": 18.45651627,
-		"p": 1837.925049,
-		"tss": 4010869.0,
-		"n": 6096.685547
-	},
-	"H51003JL2_6240_6520": {
-		"load_rate": 0.2266484052,
-		"p": 28.28951263,
-		"tss": 126806.7969,
-		"n": 87.53599548
-	},
-	"N51125JL6_7430_7320": {
-		"load_rate": 9.145552635,
-		"p": 907.3710327,
-		"tss": 2996266.25,
-		"n": 3389.819336
-	},
-	"N51095JB0_7072_0000": {
-		"load_rate": 45.68851084,
-		"p": 6582.227325,
-		"tss": 15639705.0,
-		"n": 18888.00287
-	},
-	"N10003DE0_2990_0000": {
-		"load_rate": 43.3303833,
-		"p": 4294.023438,
-		"tss": 8029944.0,
-		"n": 13004.30664
-	},
-	"N51005JU3_6950_7330": {
-		"load_rate": 76.22574997,
-		"p": 2688.102539,
-		"tss": 23526097.0,
-		"n": 28450.47266
-	},
-	"N24510WM0_3740_0001": {
-		"load_rate": 15.59193099,
-		"p": 1699.372543,
-		"tss": 14344545.0,
-		"n": 5425.036469
-	},
-	"H42119SL3_1710_1740": {
-		"load_rate": 3.43548727,
-		"p": 390.0073547,
-		"tss": 973674.875,
-		"n": 1240.140381
-	},
-	"N54065PU6_3690_3610": {
-		"load_rate": 14.16795063,
-		"p": 1425.54248,
-		"tss": 3970283.25,
-		"n": 5248.412109
-	},
-	"H51165PS2_6420_6360": {
-		"load_rate": 1.752452135,
-		"p": 203.5651093,
-		"tss": 500656.8438,
-		"n": 635.2454224
-	},
-	"N51075JL7_7100_7030": {
-		"load_rate": 0.07288654149,
-		"p": 6.075953484,
-		"tss": 39002.8125,
-		"n": 23.1746006
-	},
-	"N42067SL8_2030_2080": {
-		"load_rate": 2.277545214,
-		"p": 235.7014313,
-		"tss": 627602.3125,
-		"n": 854.895813
-	},
-	"N24029EU0_4013_0000": {
-		"load_rate": 4.116707325,
-		"p": 277.4892883,
-		"tss": 980600.875,
-		"n": 1328.277222
-	},
-	"N24015EU0_3010_0000": {
-		"load_rate": 13.43506578,
-		"p": 983.2892585,
-		"tss": 3301623.883,
-		"n": 4526.69129
-	},
-	"N24033XU3_4650_0001": {
-		"load_rate": 4.019380331,
-		"p": 436.7077312,
-		"tss": 1857248.836,
-		"n": 1401.096695
-	},
-	"N10005DE0_4680_0000": {
-		"load_rate": 69.14582062,
-		"p": 3386.47168,
-		"tss": 12229413.0,
-		"n": 45653.05078
-	},
-	"N24039EL1_5570_0001": {
-		"load_rate": 14.75171947,
-		"p": 1587.676392,
-		"tss": 3002275.5,
-		"n": 4823.443359
-	},
-	"N42055PU3_3290_3390": {
-		"load_rate": 10.31302643,
-		"p": 891.6790161,
-		"tss": 2869329.75,
-		"n": 3956.020264
-	},
-	"N36107SU2_0470_0590": {
-		"load_rate": 166.1849518,
-		"p": 13415.70215,
-		"tss": 46583060.0,
-		"n": 50500.41797
-	},
-	"N36051ZZ0_9999_9999": {
-		"load_rate": 937.3273764,
-		"p": 108019.7759,
-		"tss": 406122252.5,
-		"n": 391055.469
-	},
-	"N42055PU0_3000_3090": {
-		"load_rate": 95.0910742,
-		"p": 7598.21806,
-		"tss": 26454514.39,
-		"n": 35338.43259
-	},
-	"N24510WM0_3964_0000": {
-		"load_rate": 0.4988950789,
-		"p": 45.90838623,
-		"tss": 872492.125,
-		"n": 31.80123901
-	},
-	"N54071PU1_5820_5380": {
-		"load_rate": 14.6631093,
-		"p": 1050.608612,
-		"tss": 3904762.625,
-		"n": 4310.265747
-	},
-	"N54077ZZ0_9999_9999": {
-		"load_rate": 677.7714915,
-		"p": 65793.72925,
-		"tss": 324412684.0,
-		"n": 251256.0526
-	},
-	"N24015EU0_3300_0000": {
-		"load_rate": 8.346057892,
-		"p": 660.289093,
-		"tss": 2244945.438,
-		"n": 2652.493896
-	},
-	"N51069PU2_4220_3900": {
-		"load_rate": 65.60812378,
-		"p": 5160.67627,
-		"tss": 21693022.0,
-		"n": 23408.81445
-	},
-	"H54071PU0_5620_5380": {
-		"load_rate": 1.659263313,
-		"p": 183.1239166,
-		"tss": 489708.7656,
-		"n": 591.0515137
-	},
-	"N42113SU2_1210_1310": {
-		"load_rate": 6.416960239,
-		"p": 720.3313599,
-		"tss": 1693038.875,
-		"n": 2303.025391
-	},
-	"N24041EU0_4474_0000": {
-		"load_rate": 1.126747966,
-		"p": 65.76908112,
-		"tss": 259908.0625,
-		"n": 365.3865051
-	},
-	"N51109JL4_6710_6740": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N36017SU3_0010_0190": {
-		"load_rate": 38.90810394,
-		"p": 2468.973389,
-		"tss": 11372402.0,
-		"n": 10924.95898
-	},
-	"N51147ZZ0_9999_9999": {
-		"load_rate": 19.04339218,
-		"p": 1656.64209,
-		"tss": 5996643.5,
-		"n": 5575.444824
-	},
-	"N24029EU2_3520_0001": {
-		"load_rate": 35.13998795,
-		"p": 2099.605469,
-		"tss": 7737405.5,
-		"n": 11094.4082
-	},
-	"N24037PL0_5950_0000": {
-		"load_rate": 18.48306465,
-		"p": 1261.170654,
-		"tss": 4470246.0,
-		"n": 6682.469238
-	},
-	"N51179PL0_5495_0000": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N42023SW3_1270_1370": {
-		"load_rate": 90.59065247,
-		"p": 9420.695313,
-		"tss": 24875476.0,
-		"n": 30323.5293
-	},
-	"N54023PU4_3970_3890": {
-		"load_rate": 19.65000153,
-		"p": 1844.331543,
-		"tss": 4588751.5,
-		"n": 7080.418945
-	},
-	"N51061PL1_5370_5470": {
-		"load_rate": 136.9053066,
-		"p": 13344.42302,
-		"tss": 33075993.63,
-		"n": 47650.0448
-	},
-	"N10005EL0_5400_0001": {
-		"load_rate": 1.460627079,
-		"p": 106.2936707,
-		"tss": 269941.3125,
-		"n": 477.8332214
-	},
-	"N42081SW5_1350_1470": {
-		"load_rate": 19.73469543,
-		"p": 1914.976807,
-		"tss": 6676051.5,
-		"n": 6576.53125
-	},
-	"N24003WL0_4772_0000": {
-		"load_rate": 16.26630332,
-		"p": 928.2021053,
-		"tss": 5131701.836,
-		"n": 4014.116495
-	},
-	"N36065ZZ0_9999_9999": {
-		"load_rate": 1469.166043,
-		"p": 121017.0932,
-		"tss": 680559170.2,
-		"n": 482588.0784
-	},
-	"N42023ZZ0_9999_9999": {
-		"load_rate": 1.664854646,
-		"p": 178.9087372,
-		"tss": 507186.0313,
-		"n": 564.6062012
-	},
-	"N36101SU2_0510_0570": {
-		"load_rate": 54.00286245,
-		"p": 4960.245605,
-		"tss": 21005991.38,
-		"n": 20859.55579
-	},
-	"N51023ZZ0_9999_9999": {
-		"load_rate": 134.3250895,
-		"p": 11950.27502,
-		"tss": 76383144.0,
-		"n": 46821.14026
-	},
-	"N51001EL0_6480_0000": {
-		"load_rate": 27.1992618,
-		"p": 1977.802796,
-		"tss": 4661647.138,
-		"n": 9798.953691
-	},
-	"N51011JL1_7530_7430": {
-		"load_rate": 90.04619598,
-		"p": 7243.48877,
-		"tss": 20738800.0,
-		"n": 30818.83008
-	},
-	"N24015EU0_3130_0000": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N42097SW1_1510_1680": {
-		"load_rate": 5.853361607,
-		"p": 418.1850281,
-		"tss": 998737.0,
-		"n": 2108.26709
-	},
-	"N51045JU3_7490_7400": {
-		"load_rate": 88.46879196,
-		"p": 9666.412598,
-		"tss": 26358587.0,
-		"n": 32326.25586
-	},
-	"N42033SW2_2020_1940": {
-		"load_rate": 52.28086472,
-		"p": 5032.591309,
-		"tss": 15824273.0,
-		"n": 16885.45703
-	},
-	"N24019EM0_4889_0000": {
-		"load_rate": 0.5304450989,
-		"p": 40.20499802,
-		"tss": 149464.75,
-		"n": 176.1589508
-	},
-	"N10005EL0_4591_0000": {
-		"load_rate": 1.869517207,
-		"p": 96.4575119,
-		"tss": 271481.5625,
-		"n": 633.612854
-	},
-	"N51103RL0_6500_0000": {
-		"load_rate": 24.13047409,
-		"p": 2226.239014,
-		"tss": 3422833.5,
-		"n": 7894.319336
-	},
-	"N51003JL1_6770_6850": {
-		"load_rate": 8.684373856,
-		"p": 821.4228516,
-		"tss": 2015821.125,
-		"n": 3104.381104
-	},
-	"N24041EU0_4550_0000": {
-		"load_rate": 11.09845284,
-		"p": 740.8858773,
-		"tss": 2320891.652,
-		"n": 3552.338498
-	},
-	"N51153PL1_5690_0001": {
-		"load_rate": 0.9125447869,
-		"p": 106.4359894,
-		"tss": 265537.8125,
-		"n": 324.0535583
-	},
-	"N24001PU4_3990_3780": {
-		"load_rate": 0.5300946832,
-		"p": 6.265319347,
-		"tss": 79777.82031,
-		"n": 48.80541229
-	},
-	"N54031PU4_5050_4310": {
-		"load_rate": 29.85134125,
-		"p": 3289.093262,
-		"tss": 7705528.0,
-		"n": 10539.13672
-	},
-	"N42093SU3_1280_1590": {
-		"load_rate": 0.3173942566,
-		"p": 25.58725929,
-		"tss": 139121.2344,
-		"n": 114.1802902
-	},
-	"N24023GY0_3951_3952": {
-		"load_rate": 45.31555975,
-		"p": 3732.206381,
-		"tss": 19517688.15,
-		"n": 18728.1513
-	},
-	"N51069PU2_4730_4220": {
-		"load_rate": 52.58901978,
-		"p": 3054.466553,
-		"tss": 17066402.0,
-		"n": 15011.49414
-	},
-	"N51087JB0_7073_0000": {
-		"load_rate": 64.7003727,
-		"p": 2677.16394,
-		"tss": 12350897.5,
-		"n": 14425.70557
-	},
-	"H51157RU2_5220_5640": {
-		"load_rate": 1.133782864,
-		"p": 131.635802,
-		"tss": 431279.9409,
-		"n": 407.7261581
-	},
-	"N51033YP3_6330_6700": {
-		"load_rate": 41.64475524,
-		"p": 4889.541546,
-		"tss": 12710798.98,
-		"n": 16588.43779
-	},
-	"N51047RU2_6200_6170": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N24011EL2_4630_0000": {
-		"load_rate": 0.33444345,
-		"p": 25.85117149,
-		"tss": 63140.34375,
-		"n": 122.939209
-	},
-	"N51187PS1_4830_5080": {
-		"load_rate": 0.471485436,
-		"p": 62.72005463,
-		"tss": 172135.5469,
-		"n": 191.9385834
-	},
-	"N51177RU5_6030_0001": {
-		"load_rate": 24.86930656,
-		"p": 3359.17993,
-		"tss": 9422566.688,
-		"n": 10913.46477
-	},
-	"N42011SL2_2200_2350": {
-		"load_rate": 25.15383911,
-		"p": 2500.664307,
-		"tss": 9410680.0,
-		"n": 9376.552734
-	},
-	"N51033RL5_6070_0000": {
-		"load_rate": 140.1430916,
-		"p": 12520.00207,
-		"tss": 42134520.79,
-		"n": 51929.38014
-	},
-	"N54031PU2_5190_4310": {
-		"load_rate": 80.78097934,
-		"p": 9016.165473,
-		"tss": 20762160.5,
-		"n": 29125.00451
-	},
-	"N24011EM0_4327_0000": {
-		"load_rate": 10.99979496,
-		"p": 833.1541748,
-		"tss": 2202331.5,
-		"n": 4125.550781
-	},
-	"N24035EU0_4474_0000": {
-		"load_rate": 0.1954439133,
-		"p": 18.0555439,
-		"tss": 94835.03906,
-		"n": 74.98215485
-	},
-	"N42057PU1_3030_3440": {
-		"load_rate": 173.7472229,
-		"p": 17680.27734,
-		"tss": 47828140.0,
-		"n": 64883.42578
-	},
-	"N42097SL1_1700_1780": {
-		"load_rate": 87.4732132,
-		"p": 5304.063477,
-		"tss": 22543530.0,
-		"n": 28772.80664
-	},
-	"N51065JL4_6520_6710": {
-		"load_rate": 115.4689407,
-		"p": 12632.95117,
-		"tss": 36757056.0,
-		"n": 61994.74609
-	},
-	"N42079SU7_1120_1140": {
-		"load_rate": 87.40562439,
-		"p": 7152.913086,
-		"tss": 35126720.0,
-		"n": 27496.92578
-	},
-	"N51193RL5_6071_0000": {
-		"load_rate": 20.98828125,
-		"p": 1156.478882,
-		"tss": 3269795.5,
-		"n": 6590.998047
-	},
-	"N42119SW1_1560_1460": {
-		"load_rate": 19.3685112,
-		"p": 2042.180908,
-		"tss": 5420860.0,
-		"n": 7112.105469
-	},
-	"N42097SW7_1410_1460": {
-		"load_rate": 31.76132774,
-		"p": 2359.438232,
-		"tss": 6462490.5,
-		"n": 11103.50488
-	},
-	"N51137JL2_6240_6520": {
-		"load_rate": 7.391440392,
-		"p": 602.6929321,
-		"tss": 1804280.25,
-		"n": 2403.478027
-	},
-	"N42099SL4_2370_2330": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N42023SW3_1091_1380": {
-		"load_rate": 22.22856712,
-		"p": 2503.578369,
-		"tss": 6205022.0,
-		"n": 7727.344727
-	},
-	"N54057PU3_4450_4440": {
-		"load_rate": 7.721719742,
-		"p": 812.0630493,
-		"tss": 2553492.5,
-		"n": 2974.914307
-	},
-	"N42081SW4_1110_1150": {
-		"load_rate": 21.99903679,
-		"p": 2054.191895,
-		"tss": 5894952.5,
-		"n": 7381.324707
-	},
-	"N10003DE0_3110_0000": {
-		"load_rate": 58.36138916,
-		"p": 5703.493164,
-		"tss": 10099694.0,
-		"n": 16230.53906
-	},
-	"H42027SW1_1560_1460": {
-		"load_rate": 8.386670113,
-		"p": 919.9838257,
-		"tss": 2388238.25,
-		"n": 2950.363281
-	},
-	"N51165PS2_5550_5560": {
-		"load_rate": 140.1880608,
-		"p": 17302.9707,
-		"tss": 44496152.0,
-		"n": 55549.91406
-	},
-	"N42081SW3_1060_1260": {
-		"load_rate": 64.28108978,
-		"p": 6925.867676,
-		"tss": 17527586.0,
-		"n": 22281.39063
-	},
-	"N42097SL1_1730_1700": {
-		"load_rate": 33.44805145,
-		"p": 3014.604248,
-		"tss": 14895464.0,
-		"n": 11338.19434
-	},
-	"N42097SU8_1610_1530": {
-		"load_rate": 19.08768272,
-		"p": 1430.471924,
-		"tss": 3455359.5,
-		"n": 6982.819824
-	},
-	"N10001EL0_4560_4562": {
-		"load_rate": 16.14907837,
-		"p": 913.9036255,
-		"tss": 2317170.25,
-		"n": 5403.914063
-	},
-	"N51119RL0_6500_0000": {
-		"load_rate": 53.57094574,
-		"p": 4055.985352,
-		"tss": 9040969.0,
-		"n": 18702.04688
-	},
-	"N24023GY0_4530_4532": {
-		"load_rate": 54.58787918,
-		"p": 4246.047852,
-		"tss": 28882782.0,
-		"n": 22353.24023
-	},
-	"H54071PU0_6080_5620": {
-		"load_rate": 17.61198187,
-		"p": 1678.93103,
-		"tss": 4779387.313,
-		"n": 6264.888489
-	},
-	"N51149JA5_7460_0000": {
-		"load_rate": 3.284269571,
-		"p": 399.4966164,
-		"tss": 1104239.109,
-		"n": 1225.482002
-	},
-	"N24047DE0_5170_0000": {
-		"load_rate": 46.42773819,
-		"p": 3606.11084,
-		"tss": 13705212.0,
-		"n": 21600.625
-	},
-	"N42015SU1_0940_0900": {
-		"load_rate": 92.46653748,
-		"p": 9891.308594,
-		"tss": 22379406.0,
-		"n": 32418.85547
-	},
-	"N51001DE0_6310_0000": {
-		"load_rate": 132.7329388,
-		"p": 9476.595276,
-		"tss": 19974955.5,
-		"n": 53801.88635
-	},
-	"N36077SU3_0010_0190": {
-		"load_rate": 27.67154884,
-		"p": 1634.859253,
-		"tss": 7034306.0,
-		"n": 7333.426758
-	},
-	"N42043SL9_2050_2270": {
-		"load_rate": 58.30970764,
-		"p": 5576.205078,
-		"tss": 19674870.0,
-		"n": 19420.51953
-	},
-	"N51580JU3_6950_7330": {
-		"load_rate": 1.700246385,
-		"p": 174.1487692,
-		"tss": 1134685.752,
-		"n": 614.6349425
-	},
-	"N42087SJ5_2320_2120": {
-		"load_rate": 10.70960331,
-		"p": 1017.546509,
-		"tss": 2822688.25,
-		"n": 3729.396729
-	},
-	"H51045JU2_7450_7360": {
-		"load_rate": 7.812644482,
-		"p": 835.4046021,
-		"tss": 2310301.063,
-		"n": 2858.599121
-	},
-	"N42099SL8_2030_2080": {
-		"load_rate": 25.35707283,
-		"p": 2399.119141,
-		"tss": 6467305.5,
-		"n": 9994.391602
-	},
-	"N11001PL2_4945_0000": {
-		"load_rate": 0.694032073,
-		"p": -176.5029755,
-		"tss": -628096.125,
-		"n": -40.5038147
-	},
-	"N51181ZZ0_9999_9999": {
-		"load_rate": 206.3551331,
-		"p": 11622.52051,
-		"tss": 53849404.0,
-		"n": 71471.71875
-	},
-	"N24027XU2_4070_4330": {
-		"load_rate": 54.49636841,
-		"p": 4173.527214,
-		"tss": 15027307.53,
-		"n": 17993.34137
-	},
-	"N24047EL3_5972_0000": {
-		"load_rate": 20.26320076,
-		"p": 1477.835083,
-		"tss": 3219145.25,
-		"n": 5123.599609
-	},
-	"N42081SW7_1300_1410": {
-		"load_rate": 51.59946823,
-		"p": 4087.141113,
-		"tss": 15126434.0,
-		"n": 15538.88281
-	},
-	"N51041JA5_7460_0000": {
-		"load_rate": 17.4014492,
-		"p": 2640.58667,
-		"tss": 7659936.5,
-		"n": 7745.151367
-	},
-	"N42097SL8_1880_2030": {
-		"load_rate": 25.64719772,
-		"p": 2591.435303,
-		"tss": 6850198.5,
-		"n": 8676.055664
-	},
-	"N51179RU4_5640_6030": {
-		"load_rate": 24.85393333,
-		"p": 2575.817139,
-		"tss": 7193146.5,
-		"n": 10036.78613
-	},
-	"N24025SL2_2910_3060": {
-		"load_rate": 75.58982818,
-		"p": 5063.637732,
-		"tss": 21026533.91,
-		"n": 25338.24115
-	},
-	"N51730JA5_7520_0000": {
-		"load_rate": 13.63906121,
-		"p": 1623.75769,
-		"tss": 6016372.813,
-		"n": 5025.339783
-	},
-	"N51137YP2_6390_6330": {
-		"load_rate": 141.9569092,
-		"p": 11056.00781,
-		"tss": 30727836.0,
-		"n": 45899.97266
-	},
-	"N24031PM1_4250_4500": {
-		"load_rate": 122.1934527,
-		"p": 9286.270616,
-		"tss": 42293904.95,
-		"n": 38175.33538
-	},
-	"N24043PU6_3750_3752": {
-		"load_rate": 3.410814507,
-		"p": 292.9136323,
-		"tss": 1102179.465,
-		"n": 1135.240699
-	},
-	"N24041EU0_4873_0000": {
-		"load_rate": 7.354698658,
-		"p": 413.2466125,
-		"tss": 1876383.5,
-		"n": 2167.349121
-	},
-	"N51810ZZ0_7663_0000": {
-		"load_rate": 11.49523133,
-		"p": 1345.671291,
-		"tss": 4246055.813,
-		"n": 3516.847275
-	},
-	"N10005EL2_5110_5270": {
-		"load_rate": 40.89521408,
-		"p": 2290.251465,
-		"tss": 6308378.5,
-		"n": 14195.64844
-	},
-	"N36043SU3_0010_0190": {
-		"load_rate": 57.34582901,
-		"p": 4249.104004,
-		"tss": 16793544.0,
-		"n": 17810.80859
-	},
-	"N51101YM0_6622_0000": {
-		"load_rate": 41.56681442,
-		"p": 3329.887695,
-		"tss": 7495933.0,
-		"n": 12837.72656
-	},
-	"N10001DE0_3790_0000": {
-		"load_rate": 65.89950025,
-		"p": 4465.142136,
-		"tss": 13920507.25,
-		"n": 28356.11774
-	},
-	"N42043SL4_2140_2240": {
-		"load_rate": 52.28406334,
-		"p": 5091.754883,
-		"tss": 16152363.0,
-		"n": 17675.73022
-	},
-	"N36065SU1_0050_0090": {
-		"load_rate": 15.24770927,
-		"p": 930.8491821,
-		"tss": 4292740.5,
-		"n": 4097.587891
-	},
-	"H54023PU4_5050_4310": {
-		"load_rate": 3.646002173,
-		"p": 407.9149933,
-		"tss": 1032969.75,
-		"n": 1302.083801
-	},
-	"N54065PU6_3610_3530": {
-		"load_rate": 10.22828293,
-		"p": 964.0060425,
-		"tss": 3703998.5,
-		"n": 3495.344482
-	},
-	"N36123SU3_0370_0490": {
-		"load_rate": 14.84749317,
-		"p": 1361.909546,
-		"tss": 4248397.5,
-		"n": 5749.981934
-	},
-	"N42027SJ3_2040_1980": {
-		"load_rate": 20.27327347,
-		"p": 1843.827393,
-		"tss": 4885398.0,
-		"n": 7016.07666
-	},
-	"N36109SU2_0160_0260": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"H42013SJ3_2250_2230": {
-		"load_rate": 44.09517729,
-		"p": 4542.313293,
-		"tss": 11073780.53,
-		"n": 15740.88019
-	},
-	"N42071SL2_2410_2700": {
-		"load_rate": 165.2298584,
-		"p": 16696.23438,
-		"tss": 50395196.0,
-		"n": 56582.84766
-	},
-	"N42015SU5_0600_0750": {
-		"load_rate": 37.57279587,
-		"p": 4230.554688,
-		"tss": 9276953.0,
-		"n": 13407.06445
-	},
-	"L54031PU4_5050_4310": {
-		"load_rate": 39.01942825,
-		"p": 4265.531738,
-		"tss": 9604940.0,
-		"n": 13126.01953
-	},
-	"N51153PL0_5496_0000": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N51181JB0_7072_0000": {
-		"load_rate": 52.52913284,
-		"p": 4773.88623,
-		"tss": 8481766.0,
-		"n": 17081.125
-	},
-	"N36015SU5_0610_0600": {
-		"load_rate": 79.74436188,
-		"p": 6433.09375,
-		"tss": 23748122.0,
-		"n": 27920.49609
-	},
-	"N51510PL7_4965_0000": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N42111SJ2_2900_2740": {
-		"load_rate": 27.50326157,
-		"p": 2626.65918,
-		"tss": 8533952.0,
-		"n": 9778.680664
-	},
-	"N24037PL0_5672_0000": {
-		"load_rate": 42.39957809,
-		"p": 3368.802734,
-		"tss": 11249595.0,
-		"n": 15586.00488
-	},
-	"N54031PU3_4280_3860": {
-		"load_rate": 195.2348137,
-		"p": 21396.63037,
-		"tss": 54606659.0,
-		"n": 69492.26367
-	},
-	"H54071PU3_5210_5050": {
-		"load_rate": 0.1412245631,
-		"p": 16.39104652,
-		"tss": 66943.66406,
-		"n": 51.79811859
-	},
-	"N51125JL1_7080_7190": {
-		"load_rate": 26.65467262,
-		"p": 2643.763062,
-		"tss": 7340117.75,
-		"n": 9518.792969
-	},
-	"N24009XL3_4951_0000": {
-		"load_rate": 15.70064068,
-		"p": 1615.193848,
-		"tss": 5454612.0,
-		"n": 6008.393066
-	},
-	"N51095YL0_6930_0000": {
-		"load_rate": 44.25594684,
-		"p": 6478.980854,
-		"tss": 12535958.59,
-		"n": 15069.8371
-	},
-	"N24043PU0_3611_3530": {
-		"load_rate": 22.71014727,
-		"p": 2216.663161,
-		"tss": 6833283.5,
-		"n": 7860.315182
-	},
-	"N24025WU0_3162_0000": {
-		"load_rate": 17.72208089,
-		"p": 2169.017891,
-		"tss": 5261754.922,
-		"n": 6614.365063
-	},
-	"N42069SU3_0970_1120": {
-		"load_rate": 181.3788147,
-		"p": 12711.71191,
-		"tss": 60504612.0,
-		"n": 60343.10547
-	},
-	"N42033SW4_1490_1400": {
-		"load_rate": 0.0819497332,
-		"p": 9.166031837,
-		"tss": 23713.95508,
-		"n": 29.19035912
-	},
-	"N54071PU1_5520_5210": {
-		"load_rate": 32.39561939,
-		"p": 3233.768677,
-		"tss": 9151069.0,
-		"n": 11758.68652
-	},
-	"N51109YP1_6570_6680": {
-		"load_rate": 91.02609253,
-		"p": 8808.412109,
-		"tss": 19521922.0,
-		"n": 31202.29102
-	},
-	"H42131SU2_0990_0950": {
-		"load_rate": 29.78671646,
-		"p": 3369.061768,
-		"tss": 8250275.0,
-		"n": 10212.19531
-	},
-	"N51103RL0_6530_0000": {
-		"load_rate": 90.68133545,
-		"p": 8445.479492,
-		"tss": 13819885.0,
-		"n": 30648.42188
-	},
-	"N24031PL1_4780_0001": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N24023GY0_4532_3951": {
-		"load_rate": 27.98758888,
-		"p": 2231.406494,
-		"tss": 10809777.0,
-		"n": 10810.47461
-	},
-	"N24023GY0_3801_0000": {
-		"load_rate": 32.20125198,
-		"p": 2777.430908,
-		"tss": 14297874.0,
-		"n": 12279.36621
-	},
-	"N51041JA2_7290_0001": {
-		"load_rate": 136.4820404,
-		"p": 20437.98047,
-		"tss": 51542716.0,
-		"n": 60695.82422
-	},
-	"N10001DE0_3410_0000": {
-		"load_rate": 195.2739906,
-		"p": 14028.67578,
-		"tss": 36498215.0,
-		"n": 71329.3125
-	},
-	"N42033ZZ0_9999_9999": {
-		"load_rate": 154.3440857,
-		"p": 15029.66211,
-		"tss": 90635112.0,
-		"n": 51636.51953
-	},
-	"N24047EL3_5971_0000": {
-		"load_rate": 1.243786097,
-		"p": 107.8246078,
-		"tss": 218800.2813,
-		"n": 355.5027771
-	},
-	"N24025WU2_3020_3320": {
-		"load_rate": 1.322511315,
-		"p": 78.74795532,
-		"tss": 323615.0625,
-		"n": 440.1998596
-	},
-	"N51061PL2_4970_5250": {
-		"load_rate": 1.613566995,
-		"p": 224.653595,
-		"tss": 663922.5625,
-		"n": 652.7943726
-	},
-	"N10003EU0_3011_0000": {
-		"load_rate": 3.175023556,
-		"p": 328.1673279,
-		"tss": 1025657.875,
-		"n": 1028.147705
-	},
-	"N51029JL6_6960_6970": {
-		"load_rate": 3.113668203,
-		"p": 353.2276611,
-		"tss": 952225.8125,
-		"n": 1145.98291
-	},
-	"N42001PU0_3000_3090": {
-		"load_rate": 6.437560081,
-		"p": 743.576416,
-		"tss": 1782275.375,
-		"n": 2330.562744
-	},
-	"N42021SJ3_2040_1980": {
-		"load_rate": 10.34803867,
-		"p": 1162.247314,
-		"tss": 2949321.0,
-		"n": 3714.686035
-	},
-	"H42117SW4_1110_1150": {
-		"load_rate": 24.71460915,
-		"p": 2861.107178,
-		"tss": 7202920.0,
-		"n": 8851.756836
-	},
-	"N36069ZZ0_9999_9999": {
-		"load_rate": 842.4058838,
-		"p": 111350.1016,
-		"tss": 370331744.0,
-		"n": 370342.25
-	},
-	"N24017PL0_5580_0000": {
-		"load_rate": 26.59409589,
-		"p": 2391.890751,
-		"tss": 8176727.117,
-		"n": 9650.899046
-	},
-	"N51065JL6_6970_6740": {
-		"load_rate": 34.21202087,
-		"p": 4924.753418,
-		"tss": 10455509.0,
-		"n": 11949.8418
-	},
-	"H42115SU3_0810_0970": {
-		"load_rate": 5.12626791,
-		"p": 522.3275146,
-		"tss": 1629952.0,
-		"n": 1735.668457
-	},
-	"N10001DE0_4231_0001": {
-		"load_rate": 2.383231163,
-		"p": 88.64920044,
-		"tss": 372625.8438,
-		"n": 1437.299805
-	},
-	"N36017SU2_0110_0240": {
-		"load_rate": 95.37114716,
-		"p": 6178.455078,
-		"tss": 25492578.0,
-		"n": 24144.50391
-	},
-	"N24009XL0_5348_0000": {
-		"load_rate": 35.49708939,
-		"p": 2917.193115,
-		"tss": 10690855.0,
-		"n": 13021.21875
-	},
-	"N24041EM0_4874_0000": {
-		"load_rate": 18.80340385,
-		"p": 1324.107056,
-		"tss": 5451279.5,
-		"n": 6095.947266
-	},
-	"N42061SJ3_2160_2170": {
-		"load_rate": 41.8661232,
-		"p": 3758.812012,
-		"tss": 9651802.0,
-		"n": 14768.85645
-	},
-	"N42107SL2_1850_1990": {
-		"load_rate": 115.1827316,
-		"p": 11082.03223,
-		"tss": 34964620.0,
-		"n": 41342.97266
-	},
-	"N24037WL0_5881_0000": {
-		"load_rate": 3.107552767,
-		"p": 229.1161804,
-		"tss": 720972.8125,
-		"n": 1026.25061
-	},
-	"N42087SL1_1790_1840": {
-		"load_rate": 1.359069705,
-		"p": 146.0260468,
-		"tss": 363310.1875,
-		"n": 499.6997986
-	},
-	"N42035SW3_1580_1440": {
-		"load_rate": 127.7267565,
-		"p": 8627.030376,
-		"tss": 40876538.04,
-		"n": 44120.57919
-	},
-	"N36107SU4_0260_0350": {
-		"load_rate": 11.09152222,
-		"p": 882.7949829,
-		"tss": 2776352.25,
-		"n": 3329.952637
-	},
-	"N42009PU1_3580_3780": {
-		"load_rate": 6.499128342,
-		"p": 730.5240479,
-		"tss": 1923637.625,
-		"n": 2458.647217
-	},
-	"N54063ZZ0_9999_9999": {
-		"load_rate": 434.1009519,
-		"p": 33137.79459,
-		"tss": 112618556.6,
-		"n": 146185.048
-	},
-	"N24037PL0_5750_0001": {
-		"load_rate": 21.70763588,
-		"p": 1637.379395,
-		"tss": 5671976.0,
-		"n": 7896.530273
-	},
-	"N11001PL2_4810_0000": {
-		"load_rate": 5.771344185,
-		"p": -862.354248,
-		"tss": 3035734.25,
-		"n": 290.1223755
-	},
-	"N51097YM0_6622_0000": {
-		"load_rate": 90.30831909,
-		"p": 8273.675781,
-		"tss": 14235668.0,
-		"n": 29173.5625
-	},
-	"N51810JB0_7661_0000": {
-		"load_rate": 11.93818045,
-		"p": 1696.831848,
-		"tss": 3741937.5,
-		"n": 4932.839355
-	},
-	"N42035SW3_1600_1580": {
-		"load_rate": 12.91009235,
-		"p": 1160.615845,
-		"tss": 3752099.5,
-		"n": 4100.113281
-	},
-	"N51740JB0_7382_0000": {
-		"load_rate": 1.29183929,
-		"p": 184.7602334,
-		"tss": 1155708.016,
-		"n": 517.227459
-	},
-	"N51029JL2_7120_6970": {
-		"load_rate": 15.76793194,
-		"p": 1945.563843,
-		"tss": 5439900.5,
-		"n": 5941.700684
-	},
-	"N24011EM2_3980_0001": {
-		"load_rate": 41.07051849,
-		"p": 3483.574463,
-		"tss": 8274378.5,
-		"n": 15502.0498
-	},
-	"N42071SL9_2430_2490": {
-		"load_rate": 28.85315704,
-		"p": 3053.048096,
-		"tss": 8249439.5,
-		"n": 9320.871094
-	},
-	"N51199YL0_7370_0000": {
-		"load_rate": 30.7156545,
-		"p": 1020.579669,
-		"tss": 2585679.41,
-		"n": 4521.598593
-	},
-	"N24001PU4_3780_3930": {
-		"load_rate": 19.02225623,
-		"p": 1786.470577,
-		"tss": 6226989.672,
-		"n": 6826.820892
-	},
-	"N51125JL2_7240_7350": {
-		"load_rate": 0.8428387046,
-		"p": 96.66309357,
-		"tss": 338388.0313,
-		"n": 314.7332764
-	},
-	"N24039EL0_5892_0000": {
-		"load_rate": 4.635185242,
-		"p": 540.9494019,
-		"tss": 1206455.25,
-		"n": 1562.012085
-	},
-	"N51810JB0_7662_0000": {
-		"load_rate": 3.021437347,
-		"p": 426.0219193,
-		"tss": 848104.2813,
-		"n": 1291.406342
-	},
-	"N42093SU8_1530_1760": {
-		"load_rate": 36.44791794,
-		"p": 2275.613037,
-		"tss": 9993341.0,
-		"n": 11952.39844
-	},
-	"N24035EU0_3720_0000": {
-		"load_rate": 7.695868015,
-		"p": 499.4659729,
-		"tss": 2017034.375,
-		"n": 2739.19043
-	},
-	"N51107PM1_4430_4200": {
-		"load_rate": 129.8783417,
-		"p": 13621.86133,
-		"tss": 38189496.0,
-		"n": 47568.58203
-	},
-	"N42015SU2_0700_0860": {
-		"load_rate": 90.3458252,
-		"p": 6052.38623,
-		"tss": 21086676.0,
-		"n": 22853.31836
-	},
-	"N51193RL5_6070_0000": {
-		"load_rate": 14.978405,
-		"p": 1022.686157,
-		"tss": 2565031.0,
-		"n": 4690.663086
-	},
-	"N24039EL0_5765_0000": {
-		"load_rate": 2.740652323,
-		"p": 299.8224792,
-		"tss": 754173.125,
-		"n": 890.1882935
-	},
-	"N51041JL7_7070_0001": {
-		"load_rate": 7.381736279,
-		"p": 939.1101685,
-		"tss": 4249861.5,
-		"n": 2869.470703
-	},
-	"N51137YM2_6120_6430": {
-		"load_rate": 8.000675201,
-		"p": 823.230957,
-		"tss": 1923755.0,
-		"n": 3153.311523
-	},
-	"N51163JU5_7300_7510": {
-		"load_rate": 0.9718203545,
-		"p": 112.9004288,
-		"tss": 279336.1875,
-		"n": 356.9562683
-	},
-	"N51017JU3_6950_7330": {
-		"load_rate": 56.27255726,
-		"p": 5516.503784,
-		"tss": 19636073.25,
-		"n": 20567.7749
-	},
-	"N42075SL1_2000_2090": {
-		"load_rate": 39.43671417,
-		"p": 4308.483887,
-		"tss": 13259278.0,
-		"n": 14229.90918
-	},
-	"N24029EU0_4014_0000": {
-		"load_rate": 4.50825882,
-		"p": 309.755249,
-		"tss": 1102992.875,
-		"n": 1343.908081
-	},
-	"N51041JA4_7340_7470": {
-		"load_rate": 16.55283165,
-		"p": 2099.655762,
-		"tss": 5492596.0,
-		"n": 6762.718262
-	},
-	"N24019EL0_5282_0000": {
-		"load_rate": 10.53413391,
-		"p": 1165.654053,
-		"tss": 2492171.75,
-		"n": 3184.103271
-	},
-	"H24021PM4_3340_3341": {
-		"load_rate": 33.75314689,
-		"p": 3165.469883,
-		"tss": 11067205.69,
-		"n": 11696.55395
-	},
-	"N42117SU2_0830_0831": {
-		"load_rate": 44.90011215,
-		"p": 3335.331787,
-		"tss": 13913092.0,
-		"n": 14142.78906
-	},
-	"N42009PU2_3370_4020": {
-		"load_rate": 33.67331696,
-		"p": 3282.109375,
-		"tss": 9117512.0,
-		"n": 11974.17676
-	},
-	"N10005EL0_4632_0000": {
-		"load_rate": 103.3302765,
-		"p": 5669.908691,
-		"tss": 15209394.0,
-		"n": 37286.16406
-	},
-	"N36015SU5_0530_0610": {
-		"load_rate": 203.6518312,
-		"p": 11232.00197,
-		"tss": 61750998.34,
-		"n": 65331.20133
-	},
-	"N51001EL0_6191_0000": {
-		"load_rate": 32.92258072,
-		"p": 2601.174316,
-		"tss": 4788218.0,
-		"n": 12875.36133
-	},
-	"N42015SU7_0850_0730": {
-		"load_rate": 4.40574646,
-		"p": 329.5088501,
-		"tss": 2484107.0,
-		"n": 598.6901245
-	},
-	"N36015ZZ0_9999_9999": {
-		"load_rate": 55.77000427,
-		"p": 4745.278809,
-		"tss": 21820544.0,
-		"n": 20198.19727
-	},
-	"N10005DE0_4350_0000": {
-		"load_rate": 74.70644379,
-		"p": 4148.02478,
-		"tss": 13227641.75,
-		"n": 40351.81299
-	},
-	"N24005WM0_3743_0000": {
-		"load_rate": 0.04614350945,
-		"p": 5.510113716,
-		"tss": 143446.7188,
-		"n": 17.4418602
-	},
-	"N51091JU1_6300_6650": {
-		"load_rate": 23.06003571,
-		"p": 2141.864746,
-		"tss": 7060152.5,
-		"n": 8331.881836
-	},
-	"N51085YP4_6720_6750": {
-		"load_rate": 38.96169281,
-		"p": 4696.536621,
-		"tss": 10832440.0,
-		"n": 15172.94434
-	},
-	"H24023PU3_4451_4450": {
-		"load_rate": 2.650597334,
-		"p": 230.233963,
-		"tss": 828895.0625,
-		"n": 918.0635986
-	},
-	"N10005DE0_4800_0000": {
-		"load_rate": 109.9832153,
-		"p": 4783.289551,
-		"tss": 18354084.0,
-		"n": 69040.11719
-	},
-	"N42023SW4_1490_1400": {
-		"load_rate": 46.11220551,
-		"p": 5169.90625,
-		"tss": 12706336.0,
-		"n": 16163.89355
-	},
-	"N51003JL1_6560_6440": {
-		"load_rate": 108.5200195,
-		"p": 9607.535156,
-		"tss": 30888348.0,
-		"n": 38671.61719
-	},
-	"N24019EM0_4885_0000": {
-		"load_rate": 8.582238197,
-		"p": 622.1940918,
-		"tss": 2028412.625,
-		"n": 2814.001709
-	},
-	"N54027PU4_4210_4170": {
-		"load_rate": 17.22077942,
-		"p": 1494.897705,
-		"tss": 4385613.0,
-		"n": 6326.106934
-	},
-	"N42023SW3_1130_1390": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N51107PM7_4290_4200": {
-		"load_rate": 2.449034452,
-		"p": 182.9627991,
-		"tss": 569903.1875,
-		"n": 822.2554932
-	},
-	"N42087SL3_1710_1740": {
-		"load_rate": 19.66884232,
-		"p": 2244.161377,
-		"tss": 5590446.0,
-		"n": 7055.592773
-	},
-	"N24029EU0_4011_0000": {
-		"load_rate": 3.395348072,
-		"p": 223.9972534,
-		"tss": 796325.25,
-		"n": 1092.564453
-	},
-	"N51013PL7_4911_0000": {
-		"load_rate": 4.147676408,
-		"p": 484.4533615,
-		"tss": 5909847.781,
-		"n": 1505.816101
-	},
-	"L51157RU2_5220_5640": {
-		"load_rate": 22.87089157,
-		"p": 2268.55127,
-		"tss": 6363168.5,
-		"n": 8238.892578
-	},
-	"L42079SU3_0970_1120": {
-		"load_rate": 7.028983116,
-		"p": 569.9328003,
-		"tss": 2265349.75,
-		"n": 2895.409912
-	},
-	"N51065JL6_6990_6960": {
-		"load_rate": 5.320542336,
-		"p": 570.9830933,
-		"tss": 1680471.0,
-		"n": 1710.873413
-	},
-	"N51115YL0_6870_0000": {
-		"load_rate": 27.8147316,
-		"p": 3681.850342,
-		"tss": 6317752.5,
-		"n": 11483.1748
-	},
-	"N51097YM4_6620_0001": {
-		"load_rate": 75.88652802,
-		"p": 6090.73291,
-		"tss": 10560231.0,
-		"n": 25081.3418
-	},
-	"N51013PL7_4941_0000": {
-		"load_rate": 0.4992936403,
-		"p": 35.68249321,
-		"tss": 1686078.969,
-		"n": 128.8945875
-	},
-	"N51149JB0_7270_0000": {
-		"load_rate": 75.00926113,
-		"p": 6282.229279,
-		"tss": 12228689.75,
-		"n": 25050.69495
-	},
-	"N42099SJ2_2150_2130": {
-		"load_rate": 93.04153442,
-		"p": 8970.381836,
-		"tss": 22116586.0,
-		"n": 37031.37891
-	},
-	"N10003DE0_2710_0000": {
-		"load_rate": 66.89363861,
-		"p": 8655.821289,
-		"tss": 22928654.0,
-		"n": 24683.54102
-	},
-	"N51036JB0_7050_0000": {
-		"load_rate": 58.64229965,
-		"p": 5056.108887,
-		"tss": 10890022.0,
-		"n": 21098.13086
-	},
-	"N42043SL3_2260_2050": {
-		"load_rate": 0.5399560928,
-		"p": 62.03395844,
-		"tss": 124597.3984,
-		"n": 136.7964935
-	},
-	"H42013SJ2_2530_2820": {
-		"load_rate": 9.264115334,
-		"p": 818.0831299,
-		"tss": 1930189.0,
-		"n": 3355.691406
-	},
-	"N42097SL2_1810_2030": {
-		"load_rate": 35.94707489,
-		"p": 2733.725098,
-		"tss": 7038416.0,
-		"n": 13167.04297
-	},
-	"N24037PL0_5981_0000": {
-		"load_rate": 23.28432846,
-		"p": 2335.985596,
-		"tss": 8142460.0,
-		"n": 9115.125977
-	},
-	"N24015EU0_2941_0000": {
-		"load_rate": 9.773315698,
-		"p": 726.7813377,
-		"tss": 3269530.031,
-		"n": 2947.52005
-	},
-	"N24025SL2_2750_2720": {
-		"load_rate": 0.08003902435,
-		"p": 6.365437508,
-		"tss": 218149.0469,
-		"n": 27.37146187
-	},
-	"N24025WU0_3160_0000": {
-		"load_rate": 17.53835487,
-		"p": 1717.289833,
-		"tss": 4916305.016,
-		"n": 6032.081223
-	},
-	"N54037PS5_4380_4370": {
-		"load_rate": 64.00194979,
-		"p": 3727.969978,
-		"tss": 18377572.04,
-		"n": 22437.09158
-	},
-	"N51125JL2_7250_7090": {
-		"load_rate": 17.76453972,
-		"p": 1517.997559,
-		"tss": 5169378.0,
-		"n": 6467.380371
-	},
-	"N51145JA4_7340_7470": {
-		"load_rate": 10.79486752,
-		"p": 1125.960815,
-		"tss": 2669929.0,
-		"n": 3825.306152
-	},
-	"N24029EU0_4122_0000": {
-		"load_rate": 2.870110691,
-		"p": 215.2364578,
-		"tss": 727419.5156,
-		"n": 947.3215637
-	},
-	"N42021SW2_2020_1940": {
-		"load_rate": 96.692276,
-		"p": 7235.734375,
-		"tss": 27967692.0,
-		"n": 31730.46484
-	},
-	"N42009SJ2_2820_2740": {
-		"load_rate": 27.78851509,
-		"p": 2560.467529,
-		"tss": 8274901.0,
-		"n": 10128.26367
-	},
-	"N51510PL0_5090_0000": {
-		"load_rate": 3.550425053,
-		"p": 621.0151367,
-		"tss": 2402705.5,
-		"n": 247.8143921
-	},
-	"N24019EL0_5285_0000": {
-		"load_rate": 4.350492954,
-		"p": 442.649353,
-		"tss": 1003027.375,
-		"n": 1317.295654
-	},
-	"N42015SU7_0730_0860": {
-		"load_rate": 233.8591156,
-		"p": 19050.60742,
-		"tss": 52350960.0,
-		"n": 74558.13281
-	},
-	"N51147JA2_7550_7280": {
-		"load_rate": 212.0111694,
-		"p": 16657.60352,
-		"tss": 52777452.0,
-		"n": 70409.25
-	},
-	"N42081SW7_1340_1320": {
-		"load_rate": 47.44564438,
-		"p": 4183.34082,
-		"tss": 21150502.0,
-		"n": 14005.49805
-	},
-	"N51650YL0_7371_0000": {
-		"load_rate": 4.452445805,
-		"p": 513.9796429,
-		"tss": 1276833.727,
-		"n": 1594.000801
-	},
-	"N36077SU2_0210_0300": {
-		"load_rate": 64.95182037,
-		"p": 4073.143555,
-		"tss": 16621314.0,
-		"n": 17807.39258
-	},
-	"N42015SU2_0680_0610": {
-		"load_rate": 62.19122314,
-		"p": 5074.044922,
-		"tss": 14870951.0,
-		"n": 19627.50195
-	},
-	"N24005WM0_3965_0000": {
-		"load_rate": 1.946142294,
-		"p": 66.45936108,
-		"tss": 559347.1465,
-		"n": 456.3655815
-	},
-	"N51036JB3_6820_7053": {
-		"load_rate": 20.18227005,
-		"p": 2296.506592,
-		"tss": 4962870.0,
-		"n": 7268.56543
-	},
-	"N51065JL1_6910_6960": {
-		"load_rate": 24.83136749,
-		"p": 2084.080322,
-		"tss": 6201082.0,
-		"n": 8309.484375
-	},
-	"N42097SL2_1670_1880": {
-		"load_rate": 50.02994156,
-		"p": 4065.973633,
-		"tss": 13955870.0,
-		"n": 18154.45898
-	},
-	"N11001PL7_4941_0000": {
-		"load_rate": 1.606674016,
-		"p": 177.4407654,
-		"tss": 461288.3125,
-		"n": 456.6783905
-	},
-	"N51149JA5_7520_0000": {
-		"load_rate": 9.261623919,
-		"p": 1009.145149,
-		"tss": 2423807.625,
-		"n": 3061.32663
-	},
-	"N36077SU5_0340_0310": {
-		"load_rate": 13.57666016,
-		"p": 972.6611938,
-		"tss": 3852770.25,
-		"n": 3920.008057
-	},
-	"L51157RU2_5500_5610": {
-		"load_rate": 13.96764469,
-		"p": 1257.45105,
-		"tss": 4053026.5,
-		"n": 4884.179199
-	},
-	"H51009JL2_7240_7350": {
-		"load_rate": 13.87324768,
-		"p": 1599.143303,
-		"tss": 3904088.875,
-		"n": 5015.033356
-	},
-	"N24011EM2_4101_0000": {
-		"load_rate": 19.38255119,
-		"p": 1405.67334,
-		"tss": 3874845.5,
-		"n": 7112.910645
-	},
-	"N51007JA1_7600_7570": {
-		"load_rate": 66.3573761,
-		"p": 7689.787109,
-		"tss": 15057390.0,
-		"n": 25657.43945
-	},
-	"N24003WL0_4390_0000": {
-		"load_rate": 15.85714608,
-		"p": 1746.159851,
-		"tss": 5646787.719,
-		"n": 6232.99408
-	},
-	"N54071PU2_5190_4310": {
-		"load_rate": 46.35894775,
-		"p": 4862.973755,
-		"tss": 12923097.5,
-		"n": 16850.31299
-	},
-	"N24015EU0_3131_0000": {
-		"load_rate": 0.3456555307,
-		"p": 29.99583817,
-		"tss": 399055.75,
-		"n": 125.5533829
-	},
-	"N24013PM1_3120_3400": {
-		"load_rate": 125.0062487,
-		"p": 7396.48465,
-		"tss": 32112416.06,
-		"n": 40029.67838
-	},
-	"N24019EM0_4891_0000": {
-		"load_rate": 2.091139078,
-		"p": 198.8677673,
-		"tss": 432496.7188,
-		"n": 650.8981934
-	},
-	"N51800JB0_7760_0000": {
-		"load_rate": 69.26633068,
-		"p": 7662.209221,
-		"tss": 17334406.35,
-		"n": 24083.18656
-	},
-	"N51007JA4_7280_7340": {
-		"load_rate": 87.05312347,
-		"p": 9402.68457,
-		"tss": 17429972.0,
-		"n": 32030.55273
-	},
-	"N42117SW4_1110_1150": {
-		"load_rate": 15.71427822,
-		"p": 1787.822144,
-		"tss": 4531757.0,
-		"n": 5657.806641
-	},
-	"N51177YP2_6390_6330": {
-		"load_rate": 56.80074692,
-		"p": 5869.655273,
-		"tss": 13340772.0,
-		"n": 18295.80273
-	},
-	"N51085JL7_6800_7070": {
-		"load_rate": 0.8333019614,
-		"p": 93.63253021,
-		"tss": 251607.6406,
-		"n": 330.0298767
-	},
-	"N24015EU0_3050_0000": {
-		"load_rate": 18.15618503,
-		"p": 1790.431858,
-		"tss": 6842426.719,
-		"n": 5439.836922
-	},
-	"N24039EL1_6000_0001": {
-		"load_rate": 18.64973068,
-		"p": 2142.017822,
-		"tss": 3915414.25,
-		"n": 6399.233398
-	},
-	"N51127JB0_7052_0001": {
-		"load_rate": 49.8998642,
-		"p": 7534.352051,
-		"tss": 16256895.0,
-		"n": 17954.75977
-	},
-	"N24005WM0_3740_0001": {
-		"load_rate": 13.4682884,
-		"p": 1402.213997,
-		"tss": 10109049.34,
-		"n": 4551.211882
-	},
-	"N24021PM1_3711_3710": {
-		"load_rate": 114.2501411,
-		"p": 7828.449661,
-		"tss": 32956298.0,
-		"n": 37381.0631
-	},
-	"N24035EU0_4471_0000": {
-		"load_rate": 8.624292374,
-		"p": 530.3475342,
-		"tss": 2242011.0,
-		"n": 2988.695801
-	},
-	"N42015SU2_0890_0900": {
-		"load_rate": 147.098587,
-		"p": 12060.18164,
-		"tss": 32940780.0,
-		"n": 46244.58203
-	},
-	"H54071PU1_5820_5380": {
-		"load_rate": 0.6972597241,
-		"p": 78.39951324,
-		"tss": 183059.2969,
-		"n": 243.378891
-	},
-	"N54057PU4_3970_3890": {
-		"load_rate": 73.04864812,
-		"p": 3439.199646,
-		"tss": 22496072.5,
-		"n": 21796.65204
-	},
-	"N42075SL0_2180_2220": {
-		"load_rate": 52.37213135,
-		"p": 5603.101563,
-		"tss": 20642412.0,
-		"n": 17826.75195
-	},
-	"N24033XU2_4480_4650": {
-		"load_rate": 51.71844089,
-		"p": 3973.219816,
-		"tss": 19537541.07,
-		"n": 13853.25974
-	},
-	"N51033YP4_6750_0001": {
-		"load_rate": 1.476482034,
-		"p": 143.5663605,
-		"tss": 429260.0625,
-		"n": 575.5616455
-	},
-	"N24005WU0_3820_0000": {
-		"load_rate": 0.08242886513,
-		"p": 8.32435894,
-		"tss": 1065657.875,
-		"n": 28.06898117
-	},
-	"N24027XU0_4091_4270": {
-		"load_rate": 76.69244921,
-		"p": 5861.793365,
-		"tss": 22433672.75,
-		"n": 24546.40784
-	},
-	"N42027SW5_1540_1400": {
-		"load_rate": 54.98155212,
-		"p": 5762.591797,
-		"tss": 13850298.0,
-		"n": 19311.72656
-	},
-	"N42105SW2_1050_0930": {
-		"load_rate": 83.00444794,
-		"p": 9154.367188,
-		"tss": 24989322.0,
-		"n": 30520.25977
-	},
-	"N51047RU2_5810_5610": {
-		"load_rate": 9.995908737,
-		"p": 868.9544678,
-		"tss": 3304711.25,
-		"n": 3279.692871
-	},
-	"N51550JB0_7383_0000": {
-		"load_rate": 21.67180061,
-		"p": 2819.335449,
-		"tss": 6719739.0,
-		"n": 8208.731445
-	},
-	"N51153PL0_5490_0001": {
-		"load_rate": 26.37838474,
-		"p": 3417.895462,
-		"tss": 10098819.88,
-		"n": 10565.50282
-	},
-	"N36007SU6_0500_0550": {
-		"load_rate": 89.47715759,
-		"p": 6887.092773,
-		"tss": 48857504.0,
-		"n": 23630.08398
-	},
-	"N51041JL7_6800_7070": {
-		"load_rate": 16.60298729,
-		"p": 2910.18457,
-		"tss": 7782883.0,
-		"n": 8638.125
-	},
-	"N42113SU2_0990_0950": {
-		"load_rate": 14.75723076,
-		"p": 1385.820557,
-		"tss": 3818536.5,
-		"n": 5113.123047
-	},
-	"N51017JU1_6590_6600": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N24025WU0_3254_0000": {
-		"load_rate": 2.160779431,
-		"p": 278.6550102,
-		"tss": 1872337.703,
-		"n": 864.8481827
-	},
-	"N42081SW1_1160_1260": {
-		"load_rate": 46.06744003,
-		"p": 4275.268066,
-		"tss": 11882017.0,
-		"n": 15568.58594
-	},
-	"N42079SU2_1290_1500": {
-		"load_rate": 94.13001251,
-		"p": 8728.208984,
-		"tss": 25922008.0,
-		"n": 29227.97852
-	},
-	"N11001PL7_4960_0000": {
-		"load_rate": 3.625032723,
-		"p": 436.9272385,
-		"tss": 3993996.125,
-		"n": 1202.347626
-	},
-	"N51165PS0_6150_6160": {
-		"load_rate": 0.2159736603,
-		"p": 26.89199638,
-		"tss": 173937.1563,
-		"n": 130.2717285
-	},
-	"N10001DE0_4140_0000": {
-		"load_rate": 99.12471008,
-		"p": 5224.107422,
-		"tss": 16590119.0,
-		"n": 47941.51172
-	},
-	"N42025SU2_1550_1620": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N24019EL0_5262_0000": {
-		"load_rate": 1.323995471,
-		"p": 126.9865799,
-		"tss": 291564.7188,
-		"n": 398.0891418
-	},
-	"N42041SL2_2540_2370": {
-		"load_rate": 0.9985643029,
-		"p": 114.1440659,
-		"tss": 279102.3438,
-		"n": 376.8937988
-	},
-	"N51099PL0_5902_0000": {
-		"load_rate": 3.258642197,
-		"p": 303.6898193,
-		"tss": 1066697.5,
-		"n": 1193.331177
-	},
-	"N51049JL1_7170_6800": {
-		"load_rate": 21.98859024,
-		"p": 2417.573486,
-		"tss": 5004279.0,
-		"n": 7845.027832
-	},
-	"N42041SL9_2270_2380": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N36043SU1_0060_0190": {
-		"load_rate": 0.2559993267,
-		"p": 18.62981796,
-		"tss": 69316.96875,
-		"n": 78.30587006
-	},
-	"N10005EL2_4590_0001": {
-		"load_rate": 54.80718994,
-		"p": 2995.85791,
-		"tss": 8411216.0,
-		"n": 19158.21484
-	},
-	"N42093SW7_1460_1640": {
-		"load_rate": 4.466252327,
-		"p": 298.590332,
-		"tss": 868373.75,
-		"n": 1607.942505
-	},
-	"N51007JA4_7470_7480": {
-		"load_rate": 29.32159996,
-		"p": 3672.293213,
-		"tss": 8266765.5,
-		"n": 12280.05469
-	},
-	"N51099PL0_5901_0000": {
-		"load_rate": 1.480220437,
-		"p": 192.3901062,
-		"tss": 443771.75,
-		"n": 584.0579224
-	},
-	"N42025ZZ0_9999_9999": {
-		"load_rate": 304.5404096,
-		"p": 31551.04456,
-		"tss": 123393104.1,
-		"n": 105022.7621
-	},
-	"N36017SU2_0280_0430": {
-		"load_rate": 124.3890839,
-		"p": 9113.186523,
-		"tss": 31455850.0,
-		"n": 35146.88672
-	},
-	"N42133SL9_2430_2490": {
-		"load_rate": 10.05220222,
-		"p": 267.8122559,
-		"tss": 3131561.5,
-		"n": 2799.322754
-	},
-	"N42009SJ3_2250_2230": {
-		"load_rate": 21.433218,
-		"p": 1971.037476,
-		"tss": 6777249.5,
-		"n": 7928.060059
-	},
-	"H42079SU2_1020_0980": {
-		"load_rate": 21.24951744,
-		"p": 2420.971924,
-		"tss": 5786294.0,
-		"n": 7316.59375
-	},
-	"N51049JL6_6740_7100": {
-		"load_rate": 3.385504961,
-		"p": 390.2193298,
-		"tss": 963503.75,
-		"n": 1129.081909
-	},
-	"N51001EL0_5895_0000": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N51099PL0_5904_0000": {
-		"load_rate": 14.95909786,
-		"p": 2105.173096,
-		"tss": 4559426.0,
-		"n": 5800.276855
-	},
-	"N51061PL2_5140_5360": {
-		"load_rate": 13.72810173,
-		"p": 1622.220947,
-		"tss": 4316297.0,
-		"n": 5480.121582
-	},
-	"N24041EU0_4470_0000": {
-		"load_rate": 4.947491646,
-		"p": 245.890152,
-		"tss": 931853.625,
-		"n": 1580.029297
-	},
-	"N51149JB0_7074_0000": {
-		"load_rate": 65.03310513,
-		"p": 6725.663681,
-		"tss": 16474321.25,
-		"n": 22471.47629
-	},
-	"N54003PU6_3640_3600": {
-		"load_rate": 4.165955544,
-		"p": 563.8870239,
-		"tss": 1040714.625,
-		"n": 1730.885254
-	},
-	"N24043PU6_3590_3640": {
-		"load_rate": 3.132827595,
-		"p": 303.8161564,
-		"tss": 888070.4531,
-		"n": 1025.591057
-	},
-	"N51061RU2_5220_5640": {
-		"load_rate": 225.0493751,
-		"p": 17031.46578,
-		"tss": 50290832.47,
-		"n": 68058.70168
-	},
-	"N24033PL1_5061_0000": {
-		"load_rate": 5.361929879,
-		"p": 617.5941525,
-		"tss": 1952706.734,
-		"n": 1861.770737
-	},
-	"N24037PL0_5670_0000": {
-		"load_rate": 17.3335247,
-		"p": 1145.551636,
-		"tss": 4231635.0,
-		"n": 6171.663086
-	},
-	"N51109YP3_6330_6700": {
-		"load_rate": 9.18954277,
-		"p": 919.0917969,
-		"tss": 1902240.875,
-		"n": 3010.968018
-	},
-	"N24015EU1_2982_0000": {
-		"load_rate": 4.971766353,
-		"p": 210.0325871,
-		"tss": 2296756.953,
-		"n": 674.618042
-	},
-	"N51101YP4_6720_6750": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N51047RU2_5940_6200": {
-		"load_rate": 14.00023937,
-		"p": 1318.30603,
-		"tss": 3376614.5,
-		"n": 5015.835449
-	},
-	"N51017JU3_6640_6790": {
-		"load_rate": 39.42477083,
-		"p": 3831.486755,
-		"tss": 11043999.13,
-		"n": 14533.25586
-	},
-	"N51131EL0_7220_0000": {
-		"load_rate": 8.526066035,
-		"p": 595.8581543,
-		"tss": 1599119.859,
-		"n": 2914.519547
-	},
-	"N42037SU3_1310_1280": {
-		"load_rate": 43.75153732,
-		"p": 3505.92041,
-		"tss": 11929616.0,
-		"n": 15584.71582
-	},
-	"N42127SU6_0480_0520": {
-		"load_rate": 32.92257309,
-		"p": 2812.624756,
-		"tss": 9455130.0,
-		"n": 9869.306641
-	},
-	"N51149ZZ0_9999_9999": {
-		"load_rate": 195.7239134,
-		"p": 18194.32986,
-		"tss": 61782762.88,
-		"n": 73789.54016
-	},
-	"N42069SU3_0710_0910": {
-		"load_rate": 93.83874512,
-		"p": 7664.981445,
-		"tss": 30473666.0,
-		"n": 30361.91992
-	},
-	"N24001PU2_3370_4020": {
-		"load_rate": 95.71374512,
-		"p": 7903.891602,
-		"tss": 29161278.0,
-		"n": 33395.78516
-	},
-	"N10001DE0_3380_0000": {
-		"load_rate": 39.03251266,
-		"p": 2266.088379,
-		"tss": 7022677.5,
-		"n": 15657.76172
-	},
-	"N24031PL1_4460_4780": {
-		"load_rate": 59.51903025,
-		"p": 6971.674096,
-		"tss": 30942384.46,
-		"n": 20679.12995
-	},
-	"N42111GY0_3800_3801": {
-		"load_rate": 4.055561543,
-		"p": 306.6041565,
-		"tss": 846565.875,
-		"n": 1420.201294
-	},
-	"N24015EU1_2650_0001": {
-		"load_rate": 10.73795331,
-		"p": 1035.620487,
-		"tss": 3342738.813,
-		"n": 3775.287846
-	},
-	"N51113RU2_6200_6170": {
-		"load_rate": 8.376666069,
-		"p": 538.1283569,
-		"tss": 1552108.75,
-		"n": 2683.575684
-	},
-	"N42043SL8_2080_2050": {
-		"load_rate": 99.5539093,
-		"p": 7734.220703,
-		"tss": 24472882.0,
-		"n": 31052.72266
-	},
-	"N42113SW2_1030_1060": {
-		"load_rate": 78.28359222,
-		"p": 6671.332031,
-		"tss": 19616116.0,
-		"n": 27302.34766
-	},
-	"H42043SL3_1960_2080": {
-		"load_rate": 15.93251324,
-		"p": 1813.037231,
-		"tss": 4305698.5,
-		"n": 5670.80957
-	},
-	"N51073YL0_6581_0000": {
-		"load_rate": 28.0113163,
-		"p": 3469.879395,
-		"tss": 4826689.0,
-		"n": 9842.817383
-	},
-	"N51057YL2_6580_0001": {
-		"load_rate": 41.09664917,
-		"p": 2729.310547,
-		"tss": 5600082.5,
-		"n": 14078.69824
-	},
-	"N36017SU1_0410_0480": {
-		"load_rate": 27.12749672,
-		"p": 1735.360596,
-		"tss": 6799414.0,
-		"n": 7432.341797
-	},
-	"N42081SW6_1230_1440": {
-		"load_rate": 1.867351413,
-		"p": 211.0915222,
-		"tss": 605397.1875,
-		"n": 663.7122803
-	},
-	"N36007SU5_0420_0500": {
-		"load_rate": 103.4298325,
-		"p": 9246.251953,
-		"tss": 45148668.0,
-		"n": 32138.86133
-	},
-	"N24035EU0_3700_0000": {
-		"load_rate": 6.1031847,
-		"p": 338.6470032,
-		"tss": 1578794.625,
-		"n": 2160.178223
-	},
-	"N24009XL3_4713_0000": {
-		"load_rate": 10.86033249,
-		"p": 956.8803101,
-		"tss": 3628430.0,
-		"n": 3800.051758
-	},
-	"N51700JB0_7390_0000": {
-		"load_rate": 49.12081909,
-		"p": 3048.459106,
-		"tss": 15279652.25,
-		"n": 12029.93848
-	},
-	"N51101YM3_6430_6620": {
-		"load_rate": 8.005761147,
-		"p": 712.6212158,
-		"tss": 1389396.875,
-		"n": 2444.915283
-	},
-	"N42021SJ3_2250_2230": {
-		"load_rate": 1.248184353,
-		"p": 136.7354088,
-		"tss": 483343.8203,
-		"n": 451.5492096
-	},
-	"N36067SU2_0160_0260": {
-		"load_rate": 15.38427162,
-		"p": 1167.220215,
-		"tss": 4177014.75,
-		"n": 5165.144043
-	},
-	"N54037PU2_3900_3750": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N24027XU0_4092_4090": {
-		"load_rate": 5.560925484,
-		"p": 363.0309448,
-		"tss": 1336144.25,
-		"n": 1698.970337
-	},
-	"N24019EM0_4890_0000": {
-		"load_rate": 4.900695324,
-		"p": 324.4997559,
-		"tss": 1057650.75,
-		"n": 1513.001465
-	},
-	"N51057RL0_6501_0000": {
-		"load_rate": 16.38082314,
-		"p": 1286.337646,
-		"tss": 3010126.25,
-		"n": 5805.57666
-	},
-	"L54071PU1_5820_5380": {
-		"load_rate": 6.68919301,
-		"p": 770.9960175,
-		"tss": 2001924.031,
-		"n": 2511.853394
-	},
-	"N36017SU5_0310_0400": {
-		"load_rate": 39.16026306,
-		"p": 2405.506836,
-		"tss": 11860526.0,
-		"n": 10762.37207
-	},
-	"N10005DE0_4990_0000": {
-		"load_rate": 20.13656807,
-		"p": 815.4707031,
-		"tss": 3279173.25,
-		"n": 11310.8623
-	},
-	"N42061SJ2_2500_2450": {
-		"load_rate": 15.41553879,
-		"p": 1337.471558,
-		"tss": 4135032.0,
-		"n": 5303.226563
-	},
-	"N42035SW3_1660_1580": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N42071SL2_2480_0001": {
-		"load_rate": 124.8996124,
-		"p": 12852.05664,
-		"tss": 33912312.0,
-		"n": 43045.33594
-	},
-	"N51510PL7_4962_0000": {
-		"load_rate": 1.32672441,
-		"p": 128.845993,
-		"tss": 1494780.625,
-		"n": 144.3000946
-	},
-	"N51740JB0_7399_0000": {
-		"load_rate": 0.1115767956,
-		"p": 0.6259630919,
-		"tss": 537857.4375,
-		"n": 5.876900673
-	},
-	"N42043SL3_1960_2080": {
-		"load_rate": 73.4258728,
-		"p": 5067.728027,
-		"tss": 21995816.0,
-		"n": 22826.26563
-	},
-	"N36025SU5_0310_0400": {
-		"load_rate": 1.110108852,
-		"p": 35.42617035,
-		"tss": 841025.0,
-		"n": 1076.589966
-	},
-	"N42093SW2_1190_1410": {
-		"load_rate": 0.787366271,
-		"p": 65.70215607,
-		"tss": 184372.1719,
-		"n": 281.7379761
-	},
-	"N42037SW1_1510_1680": {
-		"load_rate": 12.64871311,
-		"p": 1003.461914,
-		"tss": 2911845.25,
-		"n": 4593.760742
-	},
-	"N51045JU1_7630_7490": {
-		"load_rate": 148.9092941,
-		"p": 15406.15137,
-		"tss": 43783140.0,
-		"n": 54142.2168
-	},
-	"N51171PS1_4830_5080": {
-		"load_rate": 26.97866303,
-		"p": 1795.922955,
-		"tss": 8550175.188,
-		"n": 7893.8843
-	},
-	"H54057PU3_4451_4450": {
-		"load_rate": 34.57024288,
-		"p": 3421.465546,
-		"tss": 9485077.0,
-		"n": 12811.1059
-	},
-	"N42013SJ3_2040_1980": {
-		"load_rate": 174.1453552,
-		"p": 9971.369141,
-		"tss": 44796492.0,
-		"n": 56721.93359
-	},
-	"N42133SL9_2490_2520": {
-		"load_rate": 4.805095196,
-		"p": 442.5662842,
-		"tss": 1559871.25,
-		"n": 1810.962524
-	},
-	"N36017SU3_0190_0300": {
-		"load_rate": 63.45867157,
-		"p": 3988.741943,
-		"tss": 16870176.0,
-		"n": 17083.83203
-	},
-	"N42119SW1_1570_1640": {
-		"load_rate": 131.0363922,
-		"p": 12330.85059,
-		"tss": 28844472.0,
-		"n": 48901.44531
-	},
-	"N24021PM1_3450_3400": {
-		"load_rate": 37.27289236,
-		"p": 2472.198437,
-		"tss": 10571316.98,
-		"n": 12326.25071
-	},
-	"H42117SW2_1100_1130": {
-		"load_rate": 12.31115246,
-		"p": 1346.198853,
-		"tss": 3439643.0,
-		"n": 4553.023438
-	},
-	"N51127YP5_6780_0000": {
-		"load_rate": 58.49981689,
-		"p": 6428.088867,
-		"tss": 14611767.0,
-		"n": 21202.73242
-	},
-	"N42131SU3_0910_1010": {
-		"load_rate": 14.92615986,
-		"p": 1126.161865,
-		"tss": 5396264.0,
-		"n": 5061.760254
-	},
-	"N51135JA2_7410_7470": {
-		"load_rate": 43.00472641,
-		"p": 3732.96167,
-		"tss": 8728436.0,
-		"n": 14316.89453
-	},
-	"N51730ZZ0_9999_9999": {
-		"load_rate": 7.511184692,
-		"p": 888.5943604,
-		"tss": 5668867.5,
-		"n": 2954.414307
-	},
-	"N42081SW6_1440_1470": {
-		"load_rate": 0.9380965829,
-		"p": 101.6027908,
-		"tss": 338146.7188,
-		"n": 341.9844055
-	},
-	"N51043PU2_4730_4220": {
-		"load_rate": 13.76107788,
-		"p": 1065.2229,
-		"tss": 3210026.5,
-		"n": 4633.317383
-	},
-	"N42133SL9_2720_0001": {
-		"load_rate": 15.21076393,
-		"p": 1573.095581,
-		"tss": 4501918.0,
-		"n": 5647.914551
-	},
-	"N51059PL1_5130_0001": {
-		"load_rate": 32.94353628,
-		"p": 2194.330627,
-		"tss": 13824521.0,
-		"n": 9984.48584
-	},
-	"N51013PL7_4964_0000": {
-		"load_rate": 0.04306201637,
-		"p": 6.524624825,
-		"tss": 143429.0,
-		"n": 19.43702507
-	},
-	"N11001PL0_4510_0001": {
-		"load_rate": 0.0,
-		"p": -253.8666687,
-		"tss": -925866.625,
-		"n": -280.0
-	},
-	"N42087SJ2_2110_2170": {
-		"load_rate": 9.224538803,
-		"p": 1057.619873,
-		"tss": 2641632.0,
-		"n": 3366.597168
-	},
-	"N36077SU2_0030_0140": {
-		"load_rate": 86.62595367,
-		"p": 5314.907715,
-		"tss": 22767662.0,
-		"n": 23313.85938
-	},
-	"N51047RU4_6040_6030": {
-		"load_rate": 106.9199371,
-		"p": 9256.545898,
-		"tss": 23055118.0,
-		"n": 35834.23438
-	},
-	"N42027SW3_1920_1750": {
-		"load_rate": 47.50992203,
-		"p": 3040.720703,
-		"tss": 11019194.0,
-		"n": 15703.55664
-	},
-	"N24019EM0_4880_0000": {
-		"load_rate": 11.99607277,
-		"p": 844.4041138,
-		"tss": 2652617.25,
-		"n": 3686.741943
-	},
-	"N42035SW5_1350_1470": {
-		"load_rate": 4.935783863,
-		"p": 474.3594055,
-		"tss": 1609540.875,
-		"n": 1721.930054
-	},
-	"N24043PU0_3601_3602": {
-		"load_rate": 19.78304877,
-		"p": 1495.227516,
-		"tss": 5133186.436,
-		"n": 6739.824141
-	},
-	"N51029JL6_7150_6890": {
-		"load_rate": 65.7279129,
-		"p": 8403.345703,
-		"tss": 20230258.0,
-		"n": 25471.31445
-	},
-	"N51109JL4_6520_6710": {
-		"load_rate": 12.22743893,
-		"p": 1412.688599,
-		"tss": 3942314.5,
-		"n": 5188.602539
-	},
-	"N11001PL2_4811_0000": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N42023SW3_1370_1430": {
-		"load_rate": 19.56497574,
-		"p": 2077.971436,
-		"tss": 6179294.5,
-		"n": 6556.772949
-	},
-	"N42099SL8_2080_2050": {
-		"load_rate": 20.17347717,
-		"p": 2051.655029,
-		"tss": 5601132.0,
-		"n": 8141.632324
-	},
-	"N36017SU2_0360_0460": {
-		"load_rate": 51.50405502,
-		"p": 3073.171387,
-		"tss": 14047267.0,
-		"n": 14047.92285
-	},
-	"N24013PM1_3450_3400": {
-		"load_rate": 71.80157411,
-		"p": 3597.888748,
-		"tss": 19673880.06,
-		"n": 23745.79694
-	},
-	"N51099PL0_5923_0000": {
-		"load_rate": 1.293138027,
-		"p": 152.0762634,
-		"tss": 340906.2188,
-		"n": 475.3190918
-	},
-	"N42115SU3_0810_0970": {
-		"load_rate": 0.2947450578,
-		"p": 25.65767479,
-		"tss": 79792.14063,
-		"n": 137.3050232
-	},
-	"N42071SL3_2420_2700": {
-		"load_rate": 72.64919281,
-		"p": 6552.112793,
-		"tss": 30300652.0,
-		"n": 23012.91406
-	},
-	"N51181JB0_7392_0000": {
-		"load_rate": 0.3867612183,
-		"p": 49.73095322,
-		"tss": 129078.7188,
-		"n": 129.3472748
-	},
-	"N42087SJ6_1930_1970": {
-		"load_rate": 61.51935959,
-		"p": 3126.894531,
-		"tss": 16363790.0,
-		"n": 20532.49023
-	},
-	"L42079SU7_1140_1420": {
-		"load_rate": 15.28125572,
-		"p": 1074.962246,
-		"tss": 4036327.5,
-		"n": 3932.497604
-	},
-	"N10005EL0_4633_0000": {
-		"load_rate": 148.4800262,
-		"p": 7723.740234,
-		"tss": 22757350.0,
-		"n": 48570.97266
-	},
-	"N42087SJ5_2120_1930": {
-		"load_rate": 121.3098221,
-		"p": 11217.3125,
-		"tss": 32565928.0,
-		"n": 41606.82813
-	},
-	"N24011EM3_4320_0000": {
-		"load_rate": 49.92652512,
-		"p": 3768.853516,
-		"tss": 9723699.0,
-		"n": 18329.01563
-	},
-	"N42043SL8_1880_2030": {
-		"load_rate": 0.2656542361,
-		"p": 30.45514297,
-		"tss": 69229.52344,
-		"n": 71.53747559
-	},
-	"N24033XL1_4691_0000": {
-		"load_rate": 25.86812946,
-		"p": 1475.938974,
-		"tss": 9437520.594,
-		"n": 5308.915504
-	},
-	"N36107ZZ0_9999_9999": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N51125JL1_6560_6440": {
-		"load_rate": 1.149722457,
-		"p": 141.0827484,
-		"tss": 333305.4063,
-		"n": 441.710907
-	},
-	"N42097SW1_1450_1510": {
-		"load_rate": 10.7966404,
-		"p": 849.5872192,
-		"tss": 1882783.625,
-		"n": 3949.139404
-	},
-	"N51830YL0_6930_0000": {
-		"load_rate": 2.632058874,
-		"p": 344.0604153,
-		"tss": 1056664.172,
-		"n": 1046.827545
-	},
-	"N51003RU2_6220_6170": {
-		"load_rate": 3.822371483,
-		"p": 312.7039185,
-		"tss": 1191915.5,
-		"n": 1373.313477
-	},
-	"N42061SJ4_2660_2360": {
-		"load_rate": 0.6955967546,
-		"p": 76.20464325,
-		"tss": 179808.8125,
-		"n": 253.4397888
-	},
-	"N24009WL0_4925_0000": {
-		"load_rate": 2.656059265,
-		"p": 309.6012573,
-		"tss": 1387025.125,
-		"n": 1173.431885
-	},
-	"N42009SJ2_2900_2740": {
-		"load_rate": 184.4769592,
-		"p": 17165.46875,
-		"tss": 55361460.0,
-		"n": 63382.90234
-	},
-	"N51101YP0_6783_0000": {
-		"load_rate": 1.87398684,
-		"p": 97.59780884,
-		"tss": 545405.1875,
-		"n": 488.4291382
-	},
-	"N10003DE0_3380_0000": {
-		"load_rate": 39.99714661,
-		"p": 2420.251221,
-		"tss": 7035446.0,
-		"n": 14468.76465
-	},
-	"N51670JB0_7075_0000": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N51036JB3_7053_0001": {
-		"load_rate": 18.68563843,
-		"p": 2020.789551,
-		"tss": 4686498.0,
-		"n": 6958.13916
-	},
-	"N51125JL3_7090_7150": {
-		"load_rate": 87.60649109,
-		"p": 7199.881348,
-		"tss": 23258206.0,
-		"n": 30246.32031
-	},
-	"N51187PS5_5240_5200": {
-		"load_rate": 31.54289374,
-		"p": 2959.829628,
-		"tss": 12869372.03,
-		"n": 11641.82135
-	},
-	"N24025WU0_3161_0000": {
-		"load_rate": 30.58654875,
-		"p": 2031.292547,
-		"tss": 10908041.55,
-		"n": 7671.192295
-	},
-	"N24043PU6_4080_4180": {
-		"load_rate": 1.853336528,
-		"p": 103.023097,
-		"tss": 520915.6094,
-		"n": 517.2936211
-	},
-	"N42043SL2_1810_2030": {
-		"load_rate": 20.01026726,
-		"p": 1486.133423,
-		"tss": 5358420.0,
-		"n": 6403.947266
-	},
-	"N54023PU1_4840_4760": {
-		"load_rate": 1.102474451,
-		"p": 93.87589264,
-		"tss": 317590.6563,
-		"n": 385.3358765
-	},
-	"N42105SW2_0880_0930": {
-		"load_rate": 101.9541321,
-		"p": 10496.09277,
-		"tss": 29875490.0,
-		"n": 37987.5
-	},
-	"N24039EL0_5763_0000": {
-		"load_rate": 16.09182549,
-		"p": 1873.52124,
-		"tss": 3391774.5,
-		"n": 5543.619141
-	},
-	"N36017SU1_0050_0090": {
-		"load_rate": 2.986981392,
-		"p": 176.1109161,
-		"tss": 776503.75,
-		"n": 826.2906494
-	},
-	"N51065JL1_6760_6910": {
-		"load_rate": 4.823497772,
-		"p": 422.6290894,
-		"tss": 1232766.625,
-		"n": 1648.787109
-	},
-	"N42081SW2_1000_1110": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"L54071PU0_6080_5620": {
-		"load_rate": 1.038543582,
-		"p": 83.05404663,
-		"tss": 350319.4375,
-		"n": 357.190979
-	},
-	"N24039EL0_6003_0000": {
-		"load_rate": 12.64012337,
-		"p": 1384.896362,
-		"tss": 2836792.0,
-		"n": 4186.887207
-	},
-	"N42033SW5_1650_1540": {
-		"load_rate": 239.3553925,
-		"p": 24319.82813,
-		"tss": 69300248.0,
-		"n": 80006.69531
-	},
-	"N24035EU0_3721_0000": {
-		"load_rate": 5.016941071,
-		"p": 256.8554382,
-		"tss": 1227244.5,
-		"n": 1727.46167
-	},
-	"N24029EU0_4012_0000": {
-		"load_rate": 4.33175993,
-		"p": 263.1746826,
-		"tss": 953747.875,
-		"n": 1377.82373
-	},
-	"N42075SL9_2050_2270": {
-		"load_rate": 13.17887211,
-		"p": 1523.352539,
-		"tss": 3683319.0,
-		"n": 4774.486328
-	},
-	"N24037PL0_6020_0000": {
-		"load_rate": 4.555221558,
-		"p": 297.2755737,
-		"tss": 1091655.375,
-		"n": 1548.868774
-	},
-	"N51800JB2_7800_0001": {
-		"load_rate": 15.62043095,
-		"p": 1382.746948,
-		"tss": 2871718.75,
-		"n": 5057.68457
-	},
-	"N24017PL0_5930_0000": {
-		"load_rate": 3.440921679,
-		"p": 305.670414,
-		"tss": 1039130.367,
-		"n": 1231.963013
-	},
-	"N24031PM1_4500_4580": {
-		"load_rate": 32.89030246,
-		"p": 2276.216743,
-		"tss": 9503626.766,
-		"n": 11161.52548
-	},
-	"N51065JL6_6960_6970": {
-		"load_rate": 36.12088013,
-		"p": 3287.554932,
-		"tss": 9360892.0,
-		"n": 11547.92773
-	},
-	"N24035EU0_4610_0000": {
-		"load_rate": 11.55747604,
-		"p": 899.8016357,
-		"tss": 3286670.0,
-		"n": 4228.849609
-	},
-	"N24013WU0_3021_3020": {
-		"load_rate": 39.07874649,
-		"p": 2534.871824,
-		"tss": 12177078.58,
-		"n": 12331.98037
-	},
-	"N51079RU2_6090_6220": {
-		"load_rate": 19.91007423,
-		"p": 1502.35083,
-		"tss": 5412259.5,
-		"n": 6226.276855
-	},
-	"N24041EU0_4700_0000": {
-		"load_rate": 22.99930382,
-		"p": 1453.381104,
-		"tss": 4856895.0,
-		"n": 7529.313477
-	},
-	"N42057SJ2_2580_2500": {
-		"load_rate": 138.8800354,
-		"p": 15145.55664,
-		"tss": 40326456.0,
-		"n": 52724.82422
-	},
-	"N42061SJ3_1980_2060": {
-		"load_rate": 27.10622978,
-		"p": 2161.740723,
-		"tss": 7193205.5,
-		"n": 9604.825195
-	},
-	"N42075ZZ0_9999_9999": {
-		"load_rate": 33.06606674,
-		"p": 3897.377197,
-		"tss": 22405600.0,
-		"n": 12921.40234
-	},
-	"L54071PU4_5050_4310": {
-		"load_rate": 29.57069582,
-		"p": 2497.775314,
-		"tss": 7477551.188,
-		"n": 10250.1456
-	},
-	"H42027SW3_1580_1440": {
-		"load_rate": 0.7999270558,
-		"p": 87.66755676,
-		"tss": 309620.9063,
-		"n": 297.8124695
-	},
-	"N51115YL0_6872_0000": {
-		"load_rate": 29.19050598,
-		"p": 3295.918945,
-		"tss": 5777579.0,
-		"n": 10545.24023
-	},
-	"N42033SW2_1950_1940": {
-		"load_rate": 76.6399765,
-		"p": 7192.566895,
-		"tss": 22076522.0,
-		"n": 24505.85742
-	},
-	"N24033PL2_4811_0000": {
-		"load_rate": 1.69099804,
-		"p": 178.2093549,
-		"tss": 1781260.906,
-		"n": 540.6828375
-	},
-	"N24025WU0_3250_0001": {
-		"load_rate": 26.26670361,
-		"p": 2396.272949,
-		"tss": 14802283.06,
-		"n": 8848.915222
-	},
-	"N42009ZZ0_9999_9999": {
-		"load_rate": 0.2205322981,
-		"p": 22.90175056,
-		"tss": 101118.0625,
-		"n": 81.7257309
-	},
-	"N51015PS2_6420_6360": {
-		"load_rate": 3.747165322,
-		"p": 255.1445007,
-		"tss": 1110025.406,
-		"n": 1280.285583
-	},
-	"N51570JA2_7290_0001": {
-		"load_rate": 1.265207887,
-		"p": 164.2458344,
-		"tss": 730567.0,
-		"n": 470.52948
-	},
-	"N42055PU2_3080_3640": {
-		"load_rate": 36.54076004,
-		"p": 4400.664063,
-		"tss": 9767476.0,
-		"n": 14822.64551
-	},
-	"N54023PU4_5050_4310": {
-		"load_rate": 82.79529047,
-		"p": 7297.762695,
-		"tss": 20747748.5,
-		"n": 29562.26294
-	},
-	"N24033PL0_5070_0001": {
-		"load_rate": 40.6425952,
-		"p": 4247.581001,
-		"tss": 14871886.56,
-		"n": 14387.36388
-	},
-	"N10003DE0_3260_0000": {
-		"load_rate": 40.90868378,
-		"p": 2987.027588,
-		"tss": 7001827.0,
-		"n": 14482.17578
-	},
-	"N36003SU2_0620_0580": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N42117SU1_0840_0831": {
-		"load_rate": 117.4542389,
-		"p": 10408.91895,
-		"tss": 31712204.0,
-		"n": 41494.29688
-	},
-	"N54027PU6_4020_3870": {
-		"load_rate": 169.7938232,
-		"p": 13611.69922,
-		"tss": 33958820.0,
-		"n": 63752.67578
-	},
-	"N54023PU3_4451_4450": {
-		"load_rate": 25.19972992,
-		"p": 2074.31665,
-		"tss": 6542356.5,
-		"n": 8959.150391
-	},
-	"N24037PL0_5960_0000": {
-		"load_rate": 12.19734955,
-		"p": 874.5514526,
-		"tss": 4016745.0,
-		"n": 4267.023926
-	},
-	"N54065PU6_3440_3590": {
-		"load_rate": 8.688164711,
-		"p": 790.7053223,
-		"tss": 2353559.0,
-		"n": 2997.469238
-	},
-	"N42067SJ6_1970_2130": {
-		"load_rate": 127.5590591,
-		"p": 12517.79004,
-		"tss": 28410206.0,
-		"n": 47164.04688
-	},
-	"N51685PL2_4970_5250": {
-		"load_rate": 3.269759417,
-		"p": 526.331665,
-		"tss": 2344835.75,
-		"n": 1551.445801
-	},
-	"N24019EM0_4888_0000": {
-		"load_rate": 6.475651741,
-		"p": 463.4194946,
-		"tss": 1480758.75,
-		"n": 2036.572998
-	},
-	"N51193PL0_6140_0000": {
-		"load_rate": 32.80732727,
-		"p": 2497.3479,
-		"tss": 5356488.0,
-		"n": 10615.78223
-	},
-	"N42119SW7_1640_1680": {
-		"load_rate": 25.7402401,
-		"p": 1735.255981,
-		"tss": 6923524.0,
-		"n": 8833.307617
-	},
-	"N51820PS2_6730_6660": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N24039EL0_5762_0000": {
-		"load_rate": 16.45154762,
-		"p": 1921.329468,
-		"tss": 3698244.25,
-		"n": 5754.04248
-	},
-	"N24019EL0_4591_0000": {
-		"load_rate": 62.93723559,
-		"p": 3451.283447,
-		"tss": 13479167.81,
-		"n": 19102.93878
-	},
-	"H51113RU2_5940_6200": {
-		"load_rate": 5.495825261,
-		"p": 658.5386543,
-		"tss": 1885262.273,
-		"n": 2043.628731
-	},
-	"N51071JU1_7630_7490": {
-		"load_rate": 15.80511785,
-		"p": 1778.583328,
-		"tss": 4255417.828,
-		"n": 5447.80806
-	},
-	"N36023ZZ0_9999_9999": {
-		"load_rate": 50.7507515,
-		"p": 4414.599121,
-		"tss": 18820310.0,
-		"n": 16341.58984
-	},
-	"N24003WL0_4770_0000": {
-		"load_rate": 8.101560351,
-		"p": 717.8042068,
-		"tss": 2237040.332,
-		"n": 2676.69586
-	},
-	"N51153PL0_5540_5490": {
-		"load_rate": 11.32836094,
-		"p": 1362.862751,
-		"tss": 3675786.297,
-		"n": 4048.208588
-	},
-	"N51061PL0_5730_5690": {
-		"load_rate": 4.646807909,
-		"p": 546.3267975,
-		"tss": 1399428.813,
-		"n": 1776.083923
-	},
-	"N24043PU2_4050_4180": {
-		"load_rate": 10.11948614,
-		"p": 1344.001987,
-		"tss": 3001918.705,
-		"n": 4078.12683
-	},
-	"H51113RU2_5810_5610": {
-		"load_rate": 8.03396672,
-		"p": 932.5161514,
-		"tss": 2348643.266,
-		"n": 2872.002747
-	},
-	"N24037XL0_5347_0000": {
-		"load_rate": 13.39038372,
-		"p": 1244.234741,
-		"tss": 4423266.0,
-		"n": 4859.880859
-	},
-	"N42115SU2_0700_0860": {
-		"load_rate": 174.6300049,
-		"p": 12922.63281,
-		"tss": 44371692.0,
-		"n": 50870.65234
-	},
-	"N42113SW2_1190_1410": {
-		"load_rate": 46.6572876,
-		"p": 4522.77832,
-		"tss": 11519868.0,
-		"n": 16234.87012
-	},
-	"N54031PS2_5550_5560": {
-		"load_rate": 5.948374271,
-		"p": 660.1313477,
-		"tss": 1684574.0,
-		"n": 2090.279053
-	},
-	"N24043PU6_3440_3590": {
-		"load_rate": 15.77385351,
-		"p": 1506.075546,
-		"tss": 4543373.719,
-		"n": 5288.559677
-	},
-	"N42133SL9_2380_2310": {
-		"load_rate": 3.145169735,
-		"p": 26.05722046,
-		"tss": 1292746.875,
-		"n": 754.5591431
-	},
-	"N42133SL3_2400_2440": {
-		"load_rate": 37.71055222,
-		"p": 3217.605225,
-		"tss": 12493837.0,
-		"n": 13218.70703
-	},
-	"N51139PS5_5240_5200": {
-		"load_rate": 63.34960651,
-		"p": 7111.238708,
-		"tss": 25459135.75,
-		"n": 22148.05566
-	},
-	"N51009JL1_7190_7250": {
-		"load_rate": 18.06773949,
-		"p": 1504.498047,
-		"tss": 4327095.0,
-		"n": 6388.455566
-	},
-	"N42043SL9_2270_2380": {
-		"load_rate": 44.87105942,
-		"p": 4043.135254,
-		"tss": 16978268.0,
-		"n": 10444.91602
-	},
-	"N24033XL3_4712_0000": {
-		"load_rate": 3.382222176,
-		"p": 319.6252136,
-		"tss": 987902.4688,
-		"n": 1018.667694
-	},
-	"N24025SL2_3060_0001": {
-		"load_rate": 74.48543939,
-		"p": 5640.819307,
-		"tss": 24621710.19,
-		"n": 25591.73206
-	},
-	"N51057RL0_6540_0001": {
-		"load_rate": 37.65389252,
-		"p": 3079.330811,
-		"tss": 6376367.0,
-		"n": 13399.75879
-	},
-	"N42133SL2_2750_2720": {
-		"load_rate": 170.3694305,
-		"p": 12530.06348,
-		"tss": 44789860.0,
-		"n": 62442.80078
-	},
-	"N24031PL0_4510_0001": {
-		"load_rate": 42.57930613,
-		"p": 3743.556885,
-		"tss": 21415073.5,
-		"n": 14249.40222
-	},
-	"N51187PS3_5100_5080": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N24003XU2_4480_4650": {
-		"load_rate": 13.7014734,
-		"p": 1177.554368,
-		"tss": 4528569.949,
-		"n": 4257.007139
-	},
-	"H42115SU2_0670_0810": {
-		"load_rate": 30.2466526,
-		"p": 2548.844971,
-		"tss": 6931271.0,
-		"n": 8802.647461
-	},
-	"N11001PL7_4910_0000": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N24001PU5_3930_4170": {
-		"load_rate": 57.5343678,
-		"p": 4980.44165,
-		"tss": 17242962.75,
-		"n": 19598.84204
-	},
-	"N51069PU2_3770_3600": {
-		"load_rate": 224.1864777,
-		"p": 24376.66211,
-		"tss": 61844844.0,
-		"n": 87235.16406
-	},
-	"L51015PS3_5990_6161": {
-		"load_rate": 27.41726685,
-		"p": 2509.801025,
-		"tss": 6669788.5,
-		"n": 8955.561523
-	},
-	"N24029EU0_3573_0000": {
-		"load_rate": 14.52636909,
-		"p": 651.4185791,
-		"tss": 3281816.25,
-		"n": 4340.323242
-	},
-	"N36025SU5_0340_0310": {
-		"load_rate": 41.1097374,
-		"p": 2704.707031,
-		"tss": 13536315.0,
-		"n": 12105.33789
-	},
-	"L42079SU7_0980_1120": {
-		"load_rate": 6.432794094,
-		"p": 442.7006836,
-		"tss": 2186534.25,
-		"n": 1766.847534
-	},
-	"N42023SW1_1170_1270": {
-		"load_rate": 45.67308426,
-		"p": 4726.313965,
-		"tss": 12168302.0,
-		"n": 15280.2666
-	},
-	"H42079SU2_1200_1310": {
-		"load_rate": 11.9799118,
-		"p": 771.7241821,
-		"tss": 3134843.25,
-		"n": 3073.852539
-	},
-	"N24045EL0_4595_0000": {
-		"load_rate": 12.24602318,
-		"p": 1002.666931,
-		"tss": 2726888.25,
-		"n": 3810.331543
-	},
-	"N54063JU2_7140_7330": {
-		"load_rate": 42.33797884,
-		"p": 3152.389648,
-		"tss": 9779071.688,
-		"n": 14420.7583
-	},
-	"L42069SU3_0970_1120": {
-		"load_rate": 31.7950573,
-		"p": 1621.555786,
-		"tss": 11337098.0,
-		"n": 9985.387695
-	},
-	"N51760JL7_7070_0001": {
-		"load_rate": 22.75915665,
-		"p": 2748.294434,
-		"tss": 10253676.0,
-		"n": 8230.708008
-	},
-	"N24047EL1_5570_0001": {
-		"load_rate": 29.6439724,
-		"p": 2419.029785,
-		"tss": 4498770.5,
-		"n": 8173.468262
-	},
-	"N54071PU3_5210_5050": {
-		"load_rate": 23.82542157,
-		"p": 2785.887268,
-		"tss": 8088052.0,
-		"n": 9145.693665
-	},
-	"N24045EL0_4593_0000": {
-		"load_rate": 6.054032326,
-		"p": 515.7592163,
-		"tss": 1352084.875,
-		"n": 1868.562988
-	},
-	"N51003JL2_6441_6520": {
-		"load_rate": 39.53254318,
-		"p": 3967.373779,
-		"tss": 16346288.0,
-		"n": 14733.07227
-	},
-	"N51550JB0_7381_0000": {
-		"load_rate": 12.42521572,
-		"p": 1624.969849,
-		"tss": 3828538.75,
-		"n": 5033.976563
-	},
-	"H24023PU2_4720_4750": {
-		"load_rate": 39.38035583,
-		"p": 3506.023682,
-		"tss": 13578270.0,
-		"n": 13691.92773
-	},
-	"N42027SW1_1890_1830": {
-		"load_rate": 28.60464096,
-		"p": 2544.525635,
-		"tss": 9635182.0,
-		"n": 13235.77832
-	},
-	"N51093JB2_7800_0001": {
-		"load_rate": 43.94227219,
-		"p": 3664.953613,
-		"tss": 7249292.5,
-		"n": 14465.18555
-	},
-	"N24033PL0_5290_0000": {
-		"load_rate": 6.382857323,
-		"p": 729.6870422,
-		"tss": 2010821.813,
-		"n": 2438.916504
-	},
-	"N42081SW3_1580_1440": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N51015PS3_5990_6161": {
-		"load_rate": 50.65260792,
-		"p": 5611.733765,
-		"tss": 14702599.5,
-		"n": 18140.58154
-	},
-	"N51137RU2_6220_6170": {
-		"load_rate": 50.59548569,
-		"p": 3945.965088,
-		"tss": 12236003.0,
-		"n": 16159.90137
-	},
-	"N51107PM7_4620_4580": {
-		"load_rate": 124.3053493,
-		"p": 22355.58105,
-		"tss": 58493743.0,
-		"n": 63881.35986
-	},
-	"N24005WU0_3021_3020": {
-		"load_rate": 55.0724851,
-		"p": 3853.79714,
-		"tss": 15476714.77,
-		"n": 18719.32901
-	},
-	"N51199JB0_7391_0000": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N10001DE0_3791_0001": {
-		"load_rate": 41.21141434,
-		"p": 2956.671143,
-		"tss": 8781762.0,
-		"n": 18467.76367
-	},
-	"N42035SW6_1440_1470": {
-		"load_rate": 49.87049484,
-		"p": 3828.685059,
-		"tss": 16163896.0,
-		"n": 17661.16406
-	},
-	"N10001EL2_4590_0001": {
-		"load_rate": 29.64896202,
-		"p": 1513.419189,
-		"tss": 4098129.5,
-		"n": 9547.875
-	},
-	"N42119SL3_1740_1840": {
-		"load_rate": 18.32100677,
-		"p": 1696.247192,
-		"tss": 4381171.0,
-		"n": 6827.729492
-	},
-	"N42043SL9_2380_2310": {
-		"load_rate": 5.860221863,
-		"p": 406.4707336,
-		"tss": 4838369.5,
-		"n": 1443.818359
-	},
-	"N24031PL1_4540_0001": {
-		"load_rate": 25.80608904,
-		"p": 2371.778564,
-		"tss": 9759138.297,
-		"n": 8809.805939
-	},
-	"H54071PU1_5520_5210": {
-		"load_rate": 31.16378355,
-		"p": 3554.494019,
-		"tss": 10708479.5,
-		"n": 11848.02466
-	},
-	"N10005EL0_4561_4562": {
-		"load_rate": 47.57552719,
-		"p": 2605.686768,
-		"tss": 7222734.5,
-		"n": 16238.18066
-	},
-	"N36053ZZ0_9999_9999": {
-		"load_rate": 339.7626038,
-		"p": 27183.47656,
-		"tss": 173406256.0,
-		"n": 112397.5078
-	},
-	"N24037PL0_5510_0001": {
-		"load_rate": 2.799060345,
-		"p": 208.2120819,
-		"tss": 768004.4375,
-		"n": 1048.55603
-	},
-	"N42009SJ2_2570_2660": {
-		"load_rate": 113.8045349,
-		"p": 9877.630859,
-		"tss": 30067152.0,
-		"n": 41608.56641
-	},
-	"N24045EL0_4598_0000": {
-		"load_rate": 0.02084239572,
-		"p": 1.822795033,
-		"tss": 52138.32031,
-		"n": 6.914591789
-	},
-	"N51135JA2_7570_7480": {
-		"load_rate": 9.420075417,
-		"p": 1135.403442,
-		"tss": 2603107.5,
-		"n": 3695.574463
-	},
-	"N51735YL0_7370_0000": {
-		"load_rate": 38.90122005,
-		"p": 4831.015781,
-		"tss": 11127539.44,
-		"n": 13572.79234
-	},
-	"N42127SU3_0810_0970": {
-		"load_rate": 11.04559612,
-		"p": 1078.355957,
-		"tss": 3371423.0,
-		"n": 3974.854004
-	},
-	"N42023SW6_1400_1330": {
-		"load_rate": 1.575251579,
-		"p": 177.3813934,
-		"tss": 430110.4375,
-		"n": 560.5131226
-	},
-	"H51139PS4_5840_5240": {
-		"load_rate": 11.64072847,
-		"p": 1385.698944,
-		"tss": 5633976.5,
-		"n": 4285.532104
-	},
-	"N51790PS3_6460_6230": {
-		"load_rate": 7.68544054,
-		"p": 839.3042603,
-		"tss": 11070440.0,
-		"n": 3004.053223
-	},
-	"N51660PS0_6160_6161": {
-		"load_rate": 3.538945198,
-		"p": 450.4145203,
-		"tss": 3644881.75,
-		"n": 1249.823608
-	},
-	"N51171PS2_5550_5560": {
-		"load_rate": 1.269250035,
-		"p": 150.7647781,
-		"tss": 424222.6406,
-		"n": 468.396759
-	},
-	"N54037PU6_4180_4150": {
-		"load_rate": 33.29325384,
-		"p": 2425.210411,
-		"tss": 9406029.969,
-		"n": 12128.38342
-	},
-	"N24021PM4_3340_3341": {
-		"load_rate": 151.000349,
-		"p": 10315.0405,
-		"tss": 42855248.63,
-		"n": 49359.80896
-	},
-	"N42041SL3_2440_2380": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N51131DE0_7130_0000": {
-		"load_rate": 46.03353071,
-		"p": 3528.131165,
-		"tss": 7776312.375,
-		"n": 16521.77808
-	},
-	"N51085YP1_6570_6680": {
-		"load_rate": 66.39003754,
-		"p": 6094.921875,
-		"tss": 16731770.0,
-		"n": 25239.27734
-	},
-	"N24027XU0_4130_4070": {
-		"load_rate": 21.87007698,
-		"p": 1510.520077,
-		"tss": 5141010.496,
-		"n": 6963.796822
-	},
-	"N51760JL7_6800_7070": {
-		"load_rate": 4.023189545,
-		"p": 648.5304565,
-		"tss": 2396087.75,
-		"n": 1842.186279
-	},
-	"N51177YM2_6120_6430": {
-		"load_rate": 233.4743524,
-		"p": 27363.48474,
-		"tss": 64362248.75,
-		"n": 92270.34326
-	},
-	"H51113RU2_6090_6220": {
-		"load_rate": 16.51005459,
-		"p": 1888.817078,
-		"tss": 4937867.5,
-		"n": 5841.108398
-	},
-	"N54027PU5_4170_4020": {
-		"load_rate": 1.611324668,
-		"p": 110.7562103,
-		"tss": 316646.0938,
-		"n": 588.4180298
-	},
-	"N51135JA4_7280_7340": {
-		"load_rate": 5.199751377,
-		"p": 514.3168945,
-		"tss": 1184493.75,
-		"n": 1900.150269
-	},
-	"N42015SW3_1060_1260": {
-		"load_rate": 5.180774689,
-		"p": 539.9553833,
-		"tss": 1210706.625,
-		"n": 1814.448853
-	},
-	"N36007SU2_0280_0430": {
-		"load_rate": 1.31550622,
-		"p": 103.7649307,
-		"tss": 347533.3438,
-		"n": 392.3222046
-	},
-	"N42093SW1_1510_1680": {
-		"load_rate": 48.50140381,
-		"p": 3600.349609,
-		"tss": 10099764.0,
-		"n": 17308.91016
-	},
-	"N51193RL0_6501_0000": {
-		"load_rate": 2.999739885,
-		"p": 168.0920868,
-		"tss": 469038.8438,
-		"n": 984.7280884
-	},
-	"N24023PU2_4720_4750": {
-		"load_rate": 7.366201878,
-		"p": 612.3372192,
-		"tss": 2387501.25,
-		"n": 2512.265625
-	},
-	"N42037SU2_1210_1310": {
-		"load_rate": 69.88526154,
-		"p": 5812.94043,
-		"tss": 18550434.0,
-		"n": 24414.92773
-	},
-	"N51015PS3_6460_6230": {
-		"load_rate": 153.1461558,
-		"p": 12114.86328,
-		"tss": 48006254.0,
-		"n": 50568.46997
-	},
-	"N24017PL0_5391_0000": {
-		"load_rate": 13.96585402,
-		"p": 1369.435361,
-		"tss": 4275310.02,
-		"n": 4599.00074
-	},
-	"N51137YP3_6470_6690": {
-		"load_rate": 3.66035533,
-		"p": 346.3832397,
-		"tss": 1174875.375,
-		"n": 1284.821899
-	},
-	"N51131DE0_6630_0000": {
-		"load_rate": 50.85435104,
-		"p": 4337.76709,
-		"tss": 8548065.0,
-		"n": 17874.13477
-	},
-	"N51059PL0_5010_5130": {
-		"load_rate": 25.136446,
-		"p": 3014.498779,
-		"tss": 12630867.0,
-		"n": 9088.958008
-	},
-	"N51145JL7_6800_7070": {
-		"load_rate": 137.2285004,
-		"p": 13585.80176,
-		"tss": 35944772.0,
-		"n": 47407.42969
-	},
-	"N24017PL0_5582_0000": {
-		"load_rate": 16.17436688,
-		"p": 1654.483439,
-		"tss": 5145544.762,
-		"n": 5993.683483
-	},
-	"N51007JA2_7410_7470": {
-		"load_rate": 147.3195038,
-		"p": 16587.70508,
-		"tss": 29636232.0,
-		"n": 53262.28125
-	},
-	"N24029EU0_4015_0000": {
-		"load_rate": 3.471174002,
-		"p": 227.2296143,
-		"tss": 901265.1875,
-		"n": 1144.363281
-	},
-	"N24017PL0_5710_0001": {
-		"load_rate": 5.270354271,
-		"p": 421.9411011,
-		"tss": 1628182.125,
-		"n": 1906.48938
-	},
-	"N24031PM7_4620_4580": {
-		"load_rate": 30.53971952,
-		"p": 2824.918358,
-		"tss": 8099758.703,
-		"n": 9634.275269
-	},
-	"N42131SW2_1070_1060": {
-		"load_rate": 3.101323366,
-		"p": 303.1614075,
-		"tss": 730883.6875,
-		"n": 1035.954224
-	},
-	"N51670JA5_7460_0000": {
-		"load_rate": 4.79062596,
-		"p": 658.8911324,
-		"tss": 2171439.188,
-		"n": 1763.961487
-	},
-	"N42061SJ5_2320_2120": {
-		"load_rate": 38.1996727,
-		"p": 2809.3396,
-		"tss": 11818199.0,
-		"n": 12148.57129
-	},
-	"N51029JL6_6970_6740": {
-		"load_rate": 32.53111267,
-		"p": 4163.157227,
-		"tss": 11095555.0,
-		"n": 13483.43848
-	},
-	"N42071SL9_2490_2520": {
-		"load_rate": 7.883856297,
-		"p": 655.0987549,
-		"tss": 2340885.25,
-		"n": 2584.756836
-	},
-	"N51135JA5_7480_0001": {
-		"load_rate": 12.92914295,
-		"p": 1478.549683,
-		"tss": 3224296.0,
-		"n": 5063.924316
-	},
-	"N42055PU2_2790_3290": {
-		"load_rate": 280.1670513,
-		"p": 22030.45825,
-		"tss": 77732134.0,
-		"n": 103716.7158
-	},
-	"N51600PL2_4970_5250": {
-		"load_rate": 0.334680289,
-		"p": 40.51958847,
-		"tss": 177657.75,
-		"n": 128.7380524
-	},
-	"N51065YP3_6470_6690": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"H42131SW2_1070_1060": {
-		"load_rate": 0.3818495572,
-		"p": 34.20174789,
-		"tss": 93212.28125,
-		"n": 116.354744
-	},
-	"N24033PL1_4540_0001": {
-		"load_rate": 69.25113495,
-		"p": 6846.127708,
-		"tss": 26712598.88,
-		"n": 23278.88553
-	},
-	"N24011EL2_4590_0001": {
-		"load_rate": 49.86253738,
-		"p": 4139.147949,
-		"tss": 9950091.0,
-		"n": 19024.31836
-	},
-	"N42009PU2_3140_3680": {
-		"load_rate": 83.47773743,
-		"p": 7770.972168,
-		"tss": 24795690.0,
-		"n": 29435.57813
-	},
-	"N24033PL2_5300_5630": {
-		"load_rate": 9.300753593,
-		"p": 866.045166,
-		"tss": 2473832.0,
-		"n": 3152.668701
-	},
-	"N51041JB0_7073_0000": {
-		"load_rate": 4.149931192,
-		"p": 412.5265999,
-		"tss": 1727537.313,
-		"n": 1292.171967
-	},
-	"N24043PU6_3730_3750": {
-		"load_rate": 4.716103503,
-		"p": 166.0663389,
-		"tss": 1500421.094,
-		"n": 1044.267296
-	},
-	"N24043PU2_3090_4050": {
-		"load_rate": 167.0663302,
-		"p": 9954.742981,
-		"tss": 51483169.53,
-		"n": 48956.30029
-	},
-	"N51053JA5_7520_0000": {
-		"load_rate": 11.04352379,
-		"p": 1493.50415,
-		"tss": 4029874.0,
-		"n": 4536.766113
-	},
-	"N24029EU0_4123_0000": {
-		"load_rate": 2.726553917,
-		"p": 290.9269562,
-		"tss": 724395.9688,
-		"n": 872.8860168
-	},
-	"N24013WM0_3881_3880": {
-		"load_rate": 171.5496907,
-		"p": 11505.49284,
-		"tss": 54051753.75,
-		"n": 55750.22845
-	},
-	"N51015PS2_6660_6490": {
-		"load_rate": 0.07590193301,
-		"p": 8.103344917,
-		"tss": 541480.1875,
-		"n": 29.53100014
-	},
-	"N51137RU4_6040_6030": {
-		"load_rate": 127.60171,
-		"p": 12066.43365,
-		"tss": 33098550.06,
-		"n": 44417.2356
-	},
-	"N24019EM0_5261_0000": {
-		"load_rate": 6.816661358,
-		"p": 599.0189056,
-		"tss": 1609127.063,
-		"n": 2150.027313
-	},
-	"N36053SU3_0090_0170": {
-		"load_rate": 44.41014481,
-		"p": 2483.328613,
-		"tss": 11691068.0,
-		"n": 13093.70703
-	},
-	"H42113SW2_1190_1410": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N51003JL1_6760_6910": {
-		"load_rate": 136.5270996,
-		"p": 10065.36914,
-		"tss": 34810264.0,
-		"n": 46093.59375
-	},
-	"N36101SU2_0740_0741": {
-		"load_rate": 45.51735687,
-		"p": 3786.562988,
-		"tss": 16552129.0,
-		"n": 17226.97656
-	},
-	"N24045EL1_5570_0001": {
-		"load_rate": 2.561843395,
-		"p": 209.0824738,
-		"tss": 572940.375,
-		"n": 811.5343018
-	},
-	"N51171PS4_5080_4380": {
-		"load_rate": 47.49069214,
-		"p": 5162.952271,
-		"tss": 15710423.0,
-		"n": 17999.79248
-	},
-	"N51041JA0_7291_7290": {
-		"load_rate": 73.62870026,
-		"p": 14409.79004,
-		"tss": 37127936.0,
-		"n": 34600.65234
-	},
-	"N51680JL6_7440_7430": {
-		"load_rate": 69.57070923,
-		"p": 3784.865234,
-		"tss": 38308804.0,
-		"n": 24186.94531
-	},
-	"N36003SU2_0510_0570": {
-		"load_rate": 44.82279468,
-		"p": 3826.835207,
-		"tss": 18956645.66,
-		"n": 16014.71881
-	},
-	"N51101YP0_6781_0000": {
-		"load_rate": 48.73581696,
-		"p": 3176.209717,
-		"tss": 7508149.5,
-		"n": 14886.27832
-	},
-	"N51710JB0_7396_0000": {
-		"load_rate": 1.620708823,
-		"p": 194.5333099,
-		"tss": 1026625.813,
-		"n": 585.869873
-	},
-	"N51103RL0_6451_0000": {
-		"load_rate": 0.0650254935,
-		"p": 7.840251923,
-		"tss": 18313.39258,
-		"n": 20.66272926
-	},
-	"N24027WM3_4060_0001": {
-		"load_rate": 39.93596923,
-		"p": 3355.435013,
-		"tss": 17525588.08,
-		"n": 14292.32268
-	},
-	"N51145JL1_7170_6800": {
-		"load_rate": 87.97182465,
-		"p": 8775.083008,
-		"tss": 19026172.0,
-		"n": 29830.28906
-	},
-	"N24015EU0_3360_0000": {
-		"load_rate": 5.727036476,
-		"p": 319.7919312,
-		"tss": 1310428.625,
-		"n": 1793.723511
-	},
-	"N24039EL0_5893_0000": {
-		"load_rate": 0.5455431938,
-		"p": 58.68486023,
-		"tss": 161093.9063,
-		"n": 172.5277252
-	},
-	"N51023JU5_7300_7510": {
-		"load_rate": 83.0623703,
-		"p": 9180.384766,
-		"tss": 24288625.5,
-		"n": 30331.41211
-	},
-	"N10003EU0_3361_0000": {
-		"load_rate": 7.148239136,
-		"p": 271.4906921,
-		"tss": 1181454.625,
-		"n": 2391.630615
-	},
-	"N24005WU2_3320_3480": {
-		"load_rate": 23.66645432,
-		"p": 1726.316086,
-		"tss": 9382823.688,
-		"n": 8444.947357
-	},
-	"N36067SU2_0120_0260": {
-		"load_rate": 41.02202225,
-		"p": 3053.675049,
-		"tss": 11375192.0,
-		"n": 13826.27832
-	},
-	"N54057PU4_4440_3970": {
-		"load_rate": 2.26455164,
-		"p": 234.6054077,
-		"tss": 1012619.313,
-		"n": 874.7823486
-	},
-	"N24025WU1_3330_0001": {
-		"load_rate": 22.82003313,
-		"p": 2245.757523,
-		"tss": 10731524.83,
-		"n": 7893.625748
-	},
-	"N24005WU1_3482_0001": {
-		"load_rate": 34.72095512,
-		"p": 2703.59363,
-		"tss": 11523865.08,
-		"n": 12361.9631
-	},
-	"N51009JL6_7430_7320": {
-		"load_rate": 16.3743,
-		"p": 1740.608154,
-		"tss": 5417471.5,
-		"n": 6343.541016
-	},
-	"N24013WU1_3350_3490": {
-		"load_rate": 0.3151847124,
-		"p": 1771.470215,
-		"tss": 391087.125,
-		"n": 95.27772522
-	},
-	"N24031PM4_4040_4410": {
-		"load_rate": 49.38531563,
-		"p": 4404.775208,
-		"tss": 15339187.81,
-		"n": 17153.46939
-	},
-	"N42087SJ2_1900_1930": {
-		"load_rate": 187.1745105,
-		"p": 14491.66866,
-		"tss": 49033880.71,
-		"n": 61835.59753
-	},
-	"N51031JL1_7530_7430": {
-		"load_rate": 0.1130053103,
-		"p": 13.04971409,
-		"tss": 71022.40625,
-		"n": 45.47928619
-	},
-	"N42041PU2_2790_3290": {
-		"load_rate": 2.208423138,
-		"p": 264.775238,
-		"tss": 651487.25,
-		"n": 850.289917
-	},
-	"N24001PU0_3871_3690": {
-		"load_rate": 79.27983618,
-		"p": 7946.024321,
-		"tss": 25341557.95,
-		"n": 29016.05245
-	},
-	"N54027PU5_3930_4170": {
-		"load_rate": 18.23291397,
-		"p": 1461.150757,
-		"tss": 4338404.0,
-		"n": 6584.165527
-	},
-	"H51157RU2_5810_5610": {
-		"load_rate": 4.312583447,
-		"p": 502.0724392,
-		"tss": 1458719.359,
-		"n": 1547.295708
-	},
-	"N42055PU3_2510_3290": {
-		"load_rate": 204.5813904,
-		"p": 22314.76758,
-		"tss": 53888884.0,
-		"n": 81403.80469
-	},
-	"N24041EM0_4324_0000": {
-		"load_rate": 35.77377319,
-		"p": 1881.910278,
-		"tss": 6859485.0,
-		"n": 11420.50098
-	},
-	"N51700JB0_7580_0000": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N51015PS2_6490_6420": {
-		"load_rate": 29.33035868,
-		"p": 2910.54216,
-		"tss": 7201430.953,
-		"n": 11115.29871
-	},
-	"N24003WL0_4392_0000": {
-		"load_rate": 7.678704336,
-		"p": 835.5751553,
-		"tss": 4276722.281,
-		"n": 2800.248642
-	},
-	"N51059PL0_5131_0000": {
-		"load_rate": 51.49278522,
-		"p": 5702.559875,
-		"tss": 18823807.5,
-		"n": 4664.677917
-	},
-	"N36007SU2_0440_0550": {
-		"load_rate": 115.4702682,
-		"p": 8333.28418,
-		"tss": 41235264.0,
-		"n": 42152.00781
-	},
-	"N42035SW0_1520_1600": {
-		"load_rate": 34.47119904,
-		"p": 3721.685303,
-		"tss": 9132939.0,
-		"n": 12190.44531
-	},
-	"N24013SL0_2831_2830": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N42069SU7_0980_1120": {
-		"load_rate": 36.78665161,
-		"p": 2031.128174,
-		"tss": 12062551.0,
-		"n": 10450.74902
-	},
-	"N24015DE0_2710_0000": {
-		"load_rate": 10.066095,
-		"p": 756.0281868,
-		"tss": 3746412.992,
-		"n": 3289.64477
-	},
-	"N51165PS3_6280_6230": {
-		"load_rate": 8.782251358,
-		"p": 1125.633179,
-		"tss": 3395153.5,
-		"n": 3778.636963
-	},
-	"N54027PU3_4280_3860": {
-		"load_rate": 205.6681147,
-		"p": 17412.26349,
-		"tss": 41228355.0,
-		"n": 75602.65039
-	},
-	"N42033SW3_1920_1750": {
-		"load_rate": 32.08796692,
-		"p": 2556.031982,
-		"tss": 11180786.0,
-		"n": 9825.285156
-	},
-	"N24019EM0_4884_0000": {
-		"load_rate": 1.901759505,
-		"p": 135.4282074,
-		"tss": 431449.9063,
-		"n": 618.1607666
-	},
-	"H54023PU2_4360_4160": {
-		"load_rate": 0.5606948733,
-		"p": 56.53108978,
-		"tss": 346539.0313,
-		"n": 201.336319
-	},
-	"N24041EM0_4551_0000": {
-		"load_rate": 2.468163967,
-		"p": 276.9731445,
-		"tss": 539240.5,
-		"n": 1177.826416
-	},
-	"N51163JU5_7420_7160": {
-		"load_rate": 89.64603806,
-		"p": 9775.149902,
-		"tss": 28263477.0,
-		"n": 34231.78516
-	},
-	"N42109SL8_1780_1880": {
-		"load_rate": 0.7278215885,
-		"p": 28.49607849,
-		"tss": 133372.625,
-		"n": 228.2506561
-	},
-	"N42113SW3_1060_1260": {
-		"load_rate": 69.90174866,
-		"p": 6927.167969,
-		"tss": 17717954.0,
-		"n": 24614.32813
-	},
-	"N24003XU2_4270_4650": {
-		"load_rate": 54.96435881,
-		"p": 4405.530365,
-		"tss": 20270911.13,
-		"n": 16205.50446
-	},
-	"N51007JA5_7480_0001": {
-		"load_rate": 60.97818375,
-		"p": 7597.328613,
-		"tss": 15053810.0,
-		"n": 23784.17773
-	},
-	"N51113RU2_6090_6220": {
-		"load_rate": 43.03369141,
-		"p": 3171.781982,
-		"tss": 9918923.875,
-		"n": 14337.45538
-	},
-	"N51001EL0_5973_0000": {
-		"load_rate": 18.11131859,
-		"p": 1309.992188,
-		"tss": 2633162.5,
-		"n": 6484.871582
-	},
-	"N51041JB0_7074_0000": {
-		"load_rate": 0.8909493089,
-		"p": 9.842683792,
-		"tss": 677671.75,
-		"n": 112.822525
-	},
-	"N42109SL3_1840_1880": {
-		"load_rate": 2.252074957,
-		"p": 248.4089508,
-		"tss": 758003.0625,
-		"n": 912.1844482
-	},
-	"N42119SW7_1680_1760": {
-		"load_rate": 9.456349373,
-		"p": 922.09729,
-		"tss": 2870797.5,
-		"n": 3518.873535
-	},
-	"N24003WL0_4601_0000": {
-		"load_rate": 0.2071719319,
-		"p": 23.82105446,
-		"tss": 547776.8125,
-		"n": 77.13341522
-	},
-	"N36109SU2_0470_0590": {
-		"load_rate": 50.02353287,
-		"p": 5398.232422,
-		"tss": 14743695.0,
-		"n": 18209.125
-	},
-	"N36017SU3_0170_0270": {
-		"load_rate": 69.52435303,
-		"p": 4223.681641,
-		"tss": 19015448.0,
-		"n": 17806.29102
-	},
-	"N51001DE0_6210_0000": {
-		"load_rate": 25.22108459,
-		"p": 1443.823975,
-		"tss": 3776812.0,
-		"n": 13181.0459
-	},
-	"N36109SU1_0330_0560": {
-		"load_rate": 0.4244086146,
-		"p": 40.60834885,
-		"tss": 148157.3594,
-		"n": 145.2250671
-	},
-	"N24027XU0_4090_4270": {
-		"load_rate": 54.9185946,
-		"p": 2915.936188,
-		"tss": 13107282.88,
-		"n": 15747.22607
-	},
-	"N51163JU3_6640_6790": {
-		"load_rate": 102.1515617,
-		"p": 12447.68945,
-		"tss": 30786603.0,
-		"n": 36089.85596
-	},
-	"N24011EL0_4591_0000": {
-		"load_rate": 27.35767365,
-		"p": 2074.005859,
-		"tss": 5703553.0,
-		"n": 9938.734375
-	},
-	"N24017XL0_5340_0000": {
-		"load_rate": 31.98806407,
-		"p": 3325.92457,
-		"tss": 11732425.77,
-		"n": 13289.9675
-	},
-	"N51041JA5_7520_0000": {
-		"load_rate": 22.49540138,
-		"p": 1189.356323,
-		"tss": 4982075.0,
-		"n": 10462.02832
-	},
-	"N42057PU0_3611_3530": {
-		"load_rate": 12.56992531,
-		"p": 1352.455566,
-		"tss": 3658041.5,
-		"n": 4769.810547
-	},
-	"N24001PU3_3680_3890": {
-		"load_rate": 50.95892334,
-		"p": 4656.036133,
-		"tss": 20629822.0,
-		"n": 17526.09961
-	},
-	"N42009PU0_3871_3690": {
-		"load_rate": 16.54664993,
-		"p": 1609.213135,
-		"tss": 4602070.0,
-		"n": 5941.447754
-	},
-	"H51165PS3_5990_6161": {
-		"load_rate": 25.08291626,
-		"p": 2927.810181,
-		"tss": 7215523.125,
-		"n": 9123.636475
-	},
-	"N24045EL0_5040_0000": {
-		"load_rate": 13.17021942,
-		"p": 1139.539673,
-		"tss": 3055728.5,
-		"n": 4148.341797
-	},
-	"N24039EL0_6004_0000": {
-		"load_rate": 0.861271143,
-		"p": 98.39884949,
-		"tss": 215023.75,
-		"n": 265.3587646
-	},
-	"N24003WL0_4771_0000": {
-		"load_rate": 17.87324524,
-		"p": 1439.731724,
-		"tss": 4983031.188,
-		"n": 5739.219376
-	},
-	"N51005JU3_6900_6950": {
-		"load_rate": 19.96643639,
-		"p": 2313.57663,
-		"tss": 5915759.75,
-		"n": 6764.774658
-	},
-	"N24001PU6_3870_3690": {
-		"load_rate": 14.33616328,
-		"p": 1633.871765,
-		"tss": 4704235.313,
-		"n": 4190.635071
-	},
-	"N51650YL0_7372_0000": {
-		"load_rate": 0.7770878673,
-		"p": 90.89535522,
-		"tss": 218618.8438,
-		"n": 216.7648773
-	},
-	"N24023PU2_4750_4451": {
-		"load_rate": 1.060003161,
-		"p": 104.9659348,
-		"tss": 404999.0938,
-		"n": 352.3101501
-	},
-	"N24025SL0_2721_2720": {
-		"load_rate": 46.28296879,
-		"p": 3119.400089,
-		"tss": 12693986.69,
-		"n": 15289.38374
-	},
-	"N51091JU3_6380_6900": {
-		"load_rate": 25.85450363,
-		"p": 1812.880371,
-		"tss": 9324447.0,
-		"n": 9470.327148
-	},
-	"N24037PL0_5983_0000": {
-		"load_rate": 0.2175270617,
-		"p": 18.73466301,
-		"tss": 129711.9141,
-		"n": 78.50720978
-	},
-	"N42029EU1_2980_0000": {
-		"load_rate": 15.03986931,
-		"p": 1540.015137,
-		"tss": 5092484.5,
-		"n": 5492.5
-	},
-	"N42037SU8_1590_1620": {
-		"load_rate": 3.137643099,
-		"p": 259.3764343,
-		"tss": 1036239.188,
-		"n": 1103.714722
-	},
-	"N24033PL2_4810_0000": {
-		"load_rate": 19.38251925,
-		"p": 1715.029724,
-		"tss": 12791928.25,
-		"n": 6518.851898
-	},
-	"N24037XL0_4956_0000": {
-		"load_rate": 3.06114316,
-		"p": 205.8915424,
-		"tss": 1116497.203,
-		"n": 755.6078186
-	},
-	"L51079RU2_6090_6220": {
-		"load_rate": 9.213299751,
-		"p": 667.2176514,
-		"tss": 2245485.25,
-		"n": 2930.123047
-	},
-	"N24021PM1_4000_4290": {
-		"load_rate": 69.6444624,
-		"p": 5196.927525,
-		"tss": 18967713.53,
-		"n": 23534.61549
-	},
-	"N51085YP4_6750_0001": {
-		"load_rate": 49.73891206,
-		"p": 4108.985613,
-		"tss": 11536018.72,
-		"n": 18929.93343
-	},
-	"N11001PL1_4460_4780": {
-		"load_rate": 1.737825513,
-		"p": 186.4285126,
-		"tss": 523792.5,
-		"n": 558.8910522
-	},
-	"N51036JB0_7073_0000": {
-		"load_rate": 10.81359005,
-		"p": 1118.790039,
-		"tss": 2609984.25,
-		"n": 3643.166748
-	},
-	"N24037WL0_4924_0000": {
-		"load_rate": 10.48026848,
-		"p": 933.2912598,
-		"tss": 2991636.75,
-		"n": 3797.712402
-	},
-	"N51059PL0_5090_0000": {
-		"load_rate": 5.29690361,
-		"p": 615.2022095,
-		"tss": 2672921.75,
-		"n": 1845.889526
-	},
-	"N24027XU2_4330_4480": {
-		"load_rate": 7.88077661,
-		"p": 722.5336227,
-		"tss": 3376182.98,
-		"n": 2795.393971
-	},
-	"H51009JL6_7160_7440": {
-		"load_rate": 8.917580426,
-		"p": 954.1442719,
-		"tss": 2763352.688,
-		"n": 3136.473389
-	},
-	"N10001EU2_3520_0001": {
-		"load_rate": 39.1731987,
-		"p": 2506.937256,
-		"tss": 6389189.0,
-		"n": 13937.78027
-	},
-	"N51820PS2_6490_6420": {
-		"load_rate": 2.218355417,
-		"p": 244.4870758,
-		"tss": 1073279.125,
-		"n": 846.0601196
-	},
-	"N51085YP1_6680_6670": {
-		"load_rate": 8.960511208,
-		"p": 606.5717163,
-		"tss": 2544190.5,
-		"n": 3829.628174
-	},
-	"N24043PU6_3602_3730": {
-		"load_rate": 3.202112719,
-		"p": 267.8792114,
-		"tss": 1022879.469,
-		"n": 1053.813213
-	},
-	"L54023PU4_5050_4310": {
-		"load_rate": 158.1149206,
-		"p": 4951.457977,
-		"tss": 41254174.75,
-		"n": 40767.6568
-	},
-	"N51015JU2_6410_6640": {
-		"load_rate": 67.28605461,
-		"p": 7088.996094,
-		"tss": 17974390.0,
-		"n": 23705.3457
-	},
-	"N51053ZZ0_9999_9999": {
-		"load_rate": 553.5244839,
-		"p": 56082.05148,
-		"tss": 172167684.3,
-		"n": 222589.0396
-	},
-	"N36051SU3_0370_0490": {
-		"load_rate": 20.2270813,
-		"p": 1668.878662,
-		"tss": 6059915.5,
-		"n": 7363.420898
-	},
-	"N42079SU7_1140_1420": {
-		"load_rate": 280.7177734,
-		"p": 22447.20313,
-		"tss": 96344784.0,
-		"n": 92564.64844
-	},
-	"N42027SW3_1660_1580": {
-		"load_rate": 40.96108627,
-		"p": 2997.856201,
-		"tss": 11046694.0,
-		"n": 13944.26953
-	},
-	"N42037SW1_1450_1510": {
-		"load_rate": 11.50084305,
-		"p": 928.0778809,
-		"tss": 2646691.75,
-		"n": 4065.771484
-	},
-	"N24021PM1_3710_4040": {
-		"load_rate": 11.58660656,
-		"p": 750.428627,
-		"tss": 4804235.938,
-		"n": 3736.401337
-	},
-	"N42027SW1_1830_1690": {
-		"load_rate": 46.78801346,
-		"p": 2355.624268,
-		"tss": 15323547.0,
-		"n": 14442.45215
-	},
-	"N51177YP3_6330_6700": {
-		"load_rate": 62.82021332,
-		"p": 6501.994629,
-		"tss": 14000465.0,
-		"n": 23644.16602
-	},
-	"N24009XL3_4952_0000": {
-		"load_rate": 3.433596373,
-		"p": 279.8024902,
-		"tss": 856964.875,
-		"n": 1220.874756
-	},
-	"N42131SU2_0990_0950": {
-		"load_rate": 51.90903854,
-		"p": 4564.496094,
-		"tss": 14175610.0,
-		"n": 16500.80273
-	},
-	"N24015SL2_2480_0001": {
-		"load_rate": 34.05386883,
-		"p": 2577.128284,
-		"tss": 10796072.41,
-		"n": 10721.92757
-	},
-	"N51017JU3_6650_7300": {
-		"load_rate": 198.0373001,
-		"p": 21882.94727,
-		"tss": 56155400.0,
-		"n": 71901.67969
-	},
-	"N51059PM7_4820_0001": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N36077SU3_0180_0230": {
-		"load_rate": 31.86126518,
-		"p": 2192.265381,
-		"tss": 8481292.0,
-		"n": 8740.50293
-	},
-	"N51045JU2_7450_7360": {
-		"load_rate": 42.86273384,
-		"p": 4293.879639,
-		"tss": 12093274.0,
-		"n": 12256.4126
-	},
-	"N51800JB1_8090_0001": {
-		"load_rate": 45.88123703,
-		"p": 4430.518066,
-		"tss": 9842039.0,
-		"n": 16168.89063
-	},
-	"N24019EL1_5150_0001": {
-		"load_rate": 19.85608292,
-		"p": 1397.288086,
-		"tss": 4312260.0,
-		"n": 6588.094238
-	},
-	"N24033XL3_4713_0000": {
-		"load_rate": 33.1047491,
-		"p": 3038.307033,
-		"tss": 8892633.129,
-		"n": 10727.45063
-	},
-	"N24005WM0_3742_0000": {
-		"load_rate": 5.054306388,
-		"p": 363.8859959,
-		"tss": 2762522.047,
-		"n": 945.3311234
-	},
-	"N24005WU0_3540_0000": {
-		"load_rate": 2.297885276,
-		"p": 253.5184009,
-		"tss": 899190.6387,
-		"n": 791.1373405
-	},
-	"N24015EU0_2985_0000": {
-		"load_rate": 6.482634485,
-		"p": 720.420188,
-		"tss": 2294055.875,
-		"n": 2521.922832
-	},
-	"N24017PL0_5530_5710": {
-		"load_rate": 10.92500975,
-		"p": 1058.777366,
-		"tss": 4082739.002,
-		"n": 4111.585685
-	},
-	"N10003DE0_2960_0000": {
-		"load_rate": 7.927811146,
-		"p": 961.6206055,
-		"tss": 1870421.5,
-		"n": 2414.773193
-	},
-	"N42041SL3_2400_2440": {
-		"load_rate": 138.2969356,
-		"p": 15043.83446,
-		"tss": 43213765.94,
-		"n": 58276.87225
-	},
-	"N24035EU0_4121_0000": {
-		"load_rate": 0.7213866711,
-		"p": 54.71959305,
-		"tss": 313123.1563,
-		"n": 239.0794525
-	},
-	"N24025WU0_3163_0000": {
-		"load_rate": 9.259985924,
-		"p": 999.8469238,
-		"tss": 2629824.75,
-		"n": 3138.664551
-	},
-	"N24031XU0_4130_4070": {
-		"load_rate": 25.63104533,
-		"p": 2015.681802,
-		"tss": 7623772.602,
-		"n": 8804.413507
-	},
-	"N24035EU0_4122_0000": {
-		"load_rate": 5.394805431,
-		"p": 301.5726318,
-		"tss": 1454339.5,
-		"n": 1864.927368
-	},
-	"N51103RL0_6450_0000": {
-		"load_rate": 22.22021484,
-		"p": 2021.682129,
-		"tss": 4731102.5,
-		"n": 7782.541504
-	},
-	"N51061PS5_4380_4370": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N24045EL0_4594_0000": {
-		"load_rate": 13.92149734,
-		"p": 1091.721069,
-		"tss": 3089584.0,
-		"n": 4180.92334
-	},
-	"N24033PL0_4510_0001": {
-		"load_rate": 10.47269827,
-		"p": 1064.752493,
-		"tss": 6699908.156,
-		"n": 3606.653473
-	},
-	"N42001SL3_2460_2430": {
-		"load_rate": 338.1207886,
-		"p": 27728.08203,
-		"tss": 84153272.0,
-		"n": 117460.5859
-	},
-	"N51630RL5_6070_0000": {
-		"load_rate": 12.29525524,
-		"p": 652.4480896,
-		"tss": 5373084.641,
-		"n": 3478.138401
-	},
-	"N51820PS2_6660_6490": {
-		"load_rate": 6.930756569,
-		"p": 95.63700867,
-		"tss": 5626890.0,
-		"n": 598.6483765
-	},
-	"N24025WU0_3540_0000": {
-		"load_rate": 8.885055718,
-		"p": 820.7887716,
-		"tss": 3158119.658,
-		"n": 2597.732192
-	},
-	"N54003PU2_3630_3590": {
-		"load_rate": 15.05080795,
-		"p": 1721.634155,
-		"tss": 4153361.25,
-		"n": 5040.254395
-	},
-	"N24035EU0_3830_0001": {
-		"load_rate": 20.87162209,
-		"p": 1144.260498,
-		"tss": 5150150.5,
-		"n": 7194.896973
-	},
-	"N51159RL5_6071_0000": {
-		"load_rate": 22.11250639,
-		"p": 1928.148438,
-		"tss": 3812616.625,
-		"n": 7599.803833
-	},
-	"N24023GY0_4531_4532": {
-		"load_rate": 42.88690948,
-		"p": 3314.286621,
-		"tss": 18317186.0,
-		"n": 17737.8457
-	},
-	"N10003DE0_2850_0000": {
-		"load_rate": 7.667876244,
-		"p": 1040.681763,
-		"tss": 2621804.0,
-		"n": 2637.88208
-	},
-	"N10003DE0_2920_0000": {
-		"load_rate": 8.122344017,
-		"p": 1066.68689,
-		"tss": 1993046.625,
-		"n": 2642.986084
-	},
-	"N42099SJ6_1970_2130": {
-		"load_rate": 58.8769455,
-		"p": 5696.322266,
-		"tss": 13447017.0,
-		"n": 23241.85352
-	},
-	"N42119SW7_1410_1460": {
-		"load_rate": 12.52673435,
-		"p": 1156.945679,
-		"tss": 2644193.5,
-		"n": 4633.463867
-	},
-	"N24017PL2_5300_5630": {
-		"load_rate": 91.06015769,
-		"p": 8191.182337,
-		"tss": 29692726.03,
-		"n": 33944.70768
-	},
-	"L42079SU7_1120_1140": {
-		"load_rate": 19.63005447,
-		"p": 2244.939697,
-		"tss": 9493638.0,
-		"n": 6958.425781
-	},
-	"N24005WM0_3964_0000": {
-		"load_rate": 1.186585451,
-		"p": 15.33334529,
-		"tss": 2540185.609,
-		"n": 17.75412846
-	},
-	"N24031XU2_4070_4330": {
-		"load_rate": 4.432393585,
-		"p": 478.6937889,
-		"tss": 1454321.143,
-		"n": 1338.17239
-	},
-	"N24015EU0_3363_0000": {
-		"load_rate": 0.1036043316,
-		"p": 7.850418091,
-		"tss": 73018.53125,
-		"n": 34.37451172
-	},
-	"N54071PU0_5620_5380": {
-		"load_rate": 56.92976314,
-		"p": 4679.112778,
-		"tss": 14066548.13,
-		"n": 19789.36361
-	},
-	"N24023PU3_4451_4450": {
-		"load_rate": 44.24089813,
-		"p": 4494.358765,
-		"tss": 17001323.0,
-		"n": 14875.54834
-	},
-	"N42079SU7_0980_1120": {
-		"load_rate": 16.40249825,
-		"p": 1276.562622,
-		"tss": 5514272.0,
-		"n": 5000.002441
-	},
-	"L51163JU2_7180_7380": {
-		"load_rate": 65.72330582,
-		"p": 3722.577789,
-		"tss": 21057662.66,
-		"n": 22186.32727
-	},
-	"N51017JU3_6900_6950": {
-		"load_rate": 19.14405918,
-		"p": 2206.62085,
-		"tss": 5728402.25,
-		"n": 6306.727539
-	},
-	"L51079JL2_6240_6520": {
-		"load_rate": 42.06105423,
-		"p": 3822.633789,
-		"tss": 13316348.0,
-		"n": 16102.10059
-	},
-	"N54077PU2_4720_4750": {
-		"load_rate": 0.5452650189,
-		"p": 56.40606308,
-		"tss": 282387.875,
-		"n": 207.1725769
-	},
-	"N36017SU4_0350_0420": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N24019EL2_4630_0000": {
-		"load_rate": 0.5792015791,
-		"p": 39.35250854,
-		"tss": 126720.9063,
-		"n": 189.7178192
-	},
-	"N24021PM4_4040_4410": {
-		"load_rate": 183.9101334,
-		"p": 12204.56845,
-		"tss": 57003374.63,
-		"n": 57216.78003
-	},
-	"N24003XU3_4650_0001": {
-		"load_rate": 7.004724152,
-		"p": 705.0484676,
-		"tss": 1819836.723,
-		"n": 2603.685743
-	},
-	"L51091JU1_6300_6650": {
-		"load_rate": 16.94514465,
-		"p": 1394.92395,
-		"tss": 5173657.0,
-		"n": 6366.242676
-	},
-	"N51103RL0_6531_0000": {
-		"load_rate": 5.615015984,
-		"p": 641.28302,
-		"tss": 1417776.5,
-		"n": 1373.884155
-	},
-	"N42035SW2_1100_1130": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"H42119SW7_1410_1460": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N24045EL0_5764_0000": {
-		"load_rate": 0.4968037903,
-		"p": 50.7794075,
-		"tss": 141172.1094,
-		"n": 160.8831177
-	},
-	"N36017SU2_0070_0090": {
-		"load_rate": 0.05402031541,
-		"p": 3.065351486,
-		"tss": 42430.89063,
-		"n": 14.2540741
-	},
-	"N51075JL6_6740_7100": {
-		"load_rate": 84.32692719,
-		"p": 7394.615723,
-		"tss": 20621946.0,
-		"n": 31330.63281
-	},
-	"N24023PU1_3940_3970": {
-		"load_rate": 16.32474327,
-		"p": 1602.175903,
-		"tss": 6607661.5,
-		"n": 5622.129883
-	},
-	"N51510PL0_5000_0001": {
-		"load_rate": 5.669313431,
-		"p": 727.7368164,
-		"tss": 4104807.5,
-		"n": 2110.835205
-	},
-	"N24043PU6_3610_3530": {
-		"load_rate": 4.124645203,
-		"p": 422.7263145,
-		"tss": 1440641.078,
-		"n": 1335.794533
-	},
-	"N51001EL3_5972_0000": {
-		"load_rate": 37.65234375,
-		"p": 2816.088379,
-		"tss": 5505770.5,
-		"n": 13537.98633
-	},
-	"N51163JU2_6410_6640": {
-		"load_rate": 1.377545595,
-		"p": 113.00354,
-		"tss": 482549.3438,
-		"n": 461.6297913
-	},
-	"N42033SW4_1860_1720": {
-		"load_rate": 53.73924032,
-		"p": 5241.60808,
-		"tss": 17369524.07,
-		"n": 17585.89447
-	},
-	"N51015JU3_6790_7260": {
-		"load_rate": 17.32143021,
-		"p": 1550.015625,
-		"tss": 4644810.5,
-		"n": 6015.363281
-	},
-	"N42113SU3_1280_1590": {
-		"load_rate": 0.3144638538,
-		"p": 36.16461945,
-		"tss": 86766.94531,
-		"n": 112.0426941
-	},
-	"N36017SU4_0430_0420": {
-		"load_rate": 8.307813644,
-		"p": 552.1760864,
-		"tss": 2400670.25,
-		"n": 2287.979736
-	},
-	"N51133PL0_6140_0000": {
-		"load_rate": 25.34735489,
-		"p": 2035.450317,
-		"tss": 3814810.75,
-		"n": 8970.542969
-	},
-	"N51540JL4_6520_6710": {
-		"load_rate": 8.079586823,
-		"p": 978.5193574,
-		"tss": 9309511.86,
-		"n": 3014.58855
-	},
-	"H51045JU1_7630_7490": {
-		"load_rate": 5.677625179,
-		"p": 659.5935669,
-		"tss": 1727334.125,
-		"n": 2080.705078
-	},
-	"N42105SW2_1100_1130": {
-		"load_rate": 155.7024078,
-		"p": 16998.50586,
-		"tss": 46821936.0,
-		"n": 58135.78516
-	},
-	"N42011SL1_2000_2090": {
-		"load_rate": 59.86279587,
-		"p": 5920.587623,
-		"tss": 16873728.33,
-		"n": 22744.44672
-	},
-	"N24045EL2_4630_0000": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N42075SL1_2190_2350": {
-		"load_rate": 20.45943069,
-		"p": 2547.060059,
-		"tss": 6635997.5,
-		"n": 7995.822754
-	},
-	"N36101SU2_0620_0580": {
-		"load_rate": 61.59969711,
-		"p": 5389.06543,
-		"tss": 22040422.0,
-		"n": 23498.00391
-	},
-	"N42081SW3_1250_1340": {
-		"load_rate": 74.63871002,
-		"p": 6390.076172,
-		"tss": 20997138.0,
-		"n": 24596.76953
-	},
-	"N42055PU2_3090_4050": {
-		"load_rate": 13.73180485,
-		"p": 1363.407471,
-		"tss": 3704312.0,
-		"n": 5282.405762
-	},
-	"N51003JL6_6890_6990": {
-		"load_rate": 72.59059906,
-		"p": 5556.177246,
-		"tss": 16391594.0,
-		"n": 24165.85938
-	},
-	"N42021SW3_1870_1800": {
-		"load_rate": 195.10112,
-		"p": 16087.89063,
-		"tss": 49275348.0,
-		"n": 63433.65234
-	},
-	"N51107PM3_4660_4620": {
-		"load_rate": 61.91646957,
-		"p": 9439.808594,
-		"tss": 31699626.0,
-		"n": 28736.38672
-	},
-	"N42127SU2_0670_0810": {
-		"load_rate": 11.06136417,
-		"p": 948.4165039,
-		"tss": 2912554.5,
-		"n": 3308.158447
-	},
-	"N51125JL6_7320_7150": {
-		"load_rate": 19.66806793,
-		"p": 2107.292236,
-		"tss": 5961932.5,
-		"n": 6831.53418
-	},
-	"N51057RL0_6500_0000": {
-		"load_rate": 7.919886589,
-		"p": 739.9153442,
-		"tss": 1839341.375,
-		"n": 2790.783691
-	},
-	"N42043SL4_2240_2310": {
-		"load_rate": 86.54438019,
-		"p": 5476.26416,
-		"tss": 36910836.0,
-		"n": 27212.0332
-	},
-	"N24033PL0_5390_0000": {
-		"load_rate": 3.330254555,
-		"p": 818.4432373,
-		"tss": 1579915.75,
-		"n": 3089.023926
-	},
-	"N42075SL4_2100_2140": {
-		"load_rate": 18.31118584,
-		"p": 2266.677002,
-		"tss": 6554700.25,
-		"n": 6913.187012
-	},
-	"N24043PU0_3000_3090": {
-		"load_rate": 5.464573527,
-		"p": 244.9850534,
-		"tss": 2244254.883,
-		"n": 1576.079124
-	},
-	"N36077SU2_0290_0291": {
-		"load_rate": 0.07302708924,
-		"p": 4.53706646,
-		"tss": 24528.84375,
-		"n": 20.80778122
-	},
-	"N24039EL0_5890_0000": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N51740JB0_7395_0000": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"H51015PS2_6660_6490": {
-		"load_rate": 1.793326616,
-		"p": 195.3584595,
-		"tss": 1011384.125,
-		"n": 804.6177979
-	},
-	"N51057RL5_6070_0000": {
-		"load_rate": 37.95954114,
-		"p": 2049.163658,
-		"tss": 5754157.313,
-		"n": 13324.94125
-	},
-	"N24035EU0_4030_0000": {
-		"load_rate": 48.47523117,
-		"p": 2611.745117,
-		"tss": 11848565.0,
-		"n": 16518.39063
-	},
-	"N51101YM0_6623_0000": {
-		"load_rate": 11.22581005,
-		"p": 1012.284424,
-		"tss": 2391122.75,
-		"n": 3545.35791
-	},
-	"N54065PU6_4020_3870": {
-		"load_rate": 0.2820546329,
-		"p": 37.14110565,
-		"tss": 150544.7344,
-		"n": 121.7535324
-	},
-	"N51095JB0_7050_0000": {
-		"load_rate": 46.25305176,
-		"p": 6466.770508,
-		"tss": 13256401.0,
-		"n": 15289.8877
-	},
-	"N42071SL1_2390_2420": {
-		"load_rate": 61.63282013,
-		"p": 4716.675781,
-		"tss": 18329868.0,
-		"n": 19370.125
-	},
-	"N36067ZZ0_9999_9999": {
-		"load_rate": 679.2673231,
-		"p": 77876.25034,
-		"tss": 433197297.0,
-		"n": 260349.4159
-	},
-	"N42027SW3_1580_1440": {
-		"load_rate": 41.50376129,
-		"p": 3033.444824,
-		"tss": 8464499.0,
-		"n": 13977.63867
-	},
-	"N36053SU1_0050_0090": {
-		"load_rate": 60.7611084,
-		"p": 3233.172363,
-		"tss": 15966274.0,
-		"n": 17561.96289
-	},
-	"N51093JB1_8090_0001": {
-		"load_rate": 4.922890186,
-		"p": 419.7374268,
-		"tss": 886845.3125,
-		"n": 1821.670288
-	},
-	"N24013PM1_3711_3710": {
-		"load_rate": 8.123832978,
-		"p": 614.0110559,
-		"tss": 2914996.547,
-		"n": 2601.45319
-	},
-	"N51163JU4_7380_7160": {
-		"load_rate": 16.62303782,
-		"p": 921.8777161,
-		"tss": 4854307.0,
-		"n": 4250.256348
-	},
-	"N51085YP3_6690_6720": {
-		"load_rate": 87.29603577,
-		"p": 7399.270508,
-		"tss": 21906490.0,
-		"n": 35774.63281
-	},
-	"N42119SL1_1790_1840": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N24001PU6_4020_3870": {
-		"load_rate": 18.09846509,
-		"p": 1925.220055,
-		"tss": 5846908.75,
-		"n": 6273.151825
-	},
-	"N54077GY0_3952_0000": {
-		"load_rate": 3.119897127,
-		"p": 331.9809265,
-		"tss": 1288020.375,
-		"n": 1064.977173
-	},
-	"N51059PM7_4620_4580": {
-		"load_rate": 32.7306366,
-		"p": 3946.996552,
-		"tss": 12076095.69,
-		"n": 12769.36569
-	},
-	"N51153PL0_5251_0000": {
-		"load_rate": 41.24006748,
-		"p": 5560.546906,
-		"tss": 23783296.88,
-		"n": 7912.827698
-	},
-	"N42099PU3_2510_3290": {
-		"load_rate": 1.006721139,
-		"p": 116.5904694,
-		"tss": 279999.6875,
-		"n": 369.0785217
-	},
-	"N42061SJ4_2060_2010": {
-		"load_rate": 92.36374664,
-		"p": 8164.293457,
-		"tss": 22457708.0,
-		"n": 32419.50195
-	},
-	"H54057PU1_4760_4451": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N51840PU2_4730_4220": {
-		"load_rate": 0.3936453164,
-		"p": 46.76218414,
-		"tss": 405533.1563,
-		"n": 156.3471985
-	},
-	"N42015SU3_0831_0790": {
-		"load_rate": 10.30624485,
-		"p": 811.8007813,
-		"tss": 2296618.0,
-		"n": 3235.211426
-	},
-	"N24021PM4_3341_4040": {
-		"load_rate": 85.6686945,
-		"p": 3474.719788,
-		"tss": 31006064.31,
-		"n": 22897.29382
-	},
-	"N51017JU3_6380_6900": {
-		"load_rate": 25.02554703,
-		"p": 2504.376465,
-		"tss": 8824666.75,
-		"n": 9188.800049
-	},
-	"N36043ZZ0_9999_9999": {
-		"load_rate": 1667.455811,
-		"p": 134926.375,
-		"tss": 508393120.0,
-		"n": 512385.7188
-	},
-	"N54093PU2_4720_4750": {
-		"load_rate": 0.9862773418,
-		"p": 97.35361481,
-		"tss": 370813.4063,
-		"n": 337.2203369
-	},
-	"N51023JU5_7420_7160": {
-		"load_rate": 57.60656738,
-		"p": 6393.292236,
-		"tss": 20750706.0,
-		"n": 21677.96533
-	},
-	"N36107SU1_0330_0560": {
-		"load_rate": 100.2946854,
-		"p": 7920.603027,
-		"tss": 28098114.0,
-		"n": 30418.47266
-	},
-	"N36025SU2_0291_0320": {
-		"load_rate": 3.254726171,
-		"p": 306.806076,
-		"tss": 1186136.531,
-		"n": 968.2866821
-	},
-	"N42027SW3_1600_1580": {
-		"load_rate": 1.475305676,
-		"p": 123.2478256,
-		"tss": 524196.5625,
-		"n": 495.0975037
-	},
-	"N54037PU6_3750_3752": {
-		"load_rate": 10.92984474,
-		"p": 1040.837433,
-		"tss": 3158007.188,
-		"n": 4658.193115
-	},
-	"N24019EM0_4887_0000": {
-		"load_rate": 5.502188206,
-		"p": 557.0545044,
-		"tss": 1405837.5,
-		"n": 1789.462891
-	},
-	"N42067SJ6_1930_1970": {
-		"load_rate": 75.50474548,
-		"p": 6467.390137,
-		"tss": 18710480.0,
-		"n": 26422.60352
-	},
-	"N51097YL0_6930_0000": {
-		"load_rate": 38.5644722,
-		"p": 3450.881592,
-		"tss": 6097456.5,
-		"n": 12916.12305
-	},
-	"N51005JU4_7000_7300": {
-		"load_rate": 91.10135651,
-		"p": 8214.44873,
-		"tss": 32841386.0,
-		"n": 29844.9873
-	},
-	"N51059PL7_4982_0000": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N51113RU2_5810_5610": {
-		"load_rate": 9.715384483,
-		"p": 855.5591431,
-		"tss": 2885119.5,
-		"n": 3414.05957
-	},
-	"N42035SW3_1390_1330": {
-		"load_rate": 11.27727699,
-		"p": 1288.070068,
-		"tss": 3391804.0,
-		"n": 3993.052734
-	},
-	"N42035SW3_1130_1390": {
-		"load_rate": 50.21573062,
-		"p": 5510.916901,
-		"tss": 15541960.24,
-		"n": 17663.99877
-	},
-	"N51610PL7_4962_0000": {
-		"load_rate": 0.5785832405,
-		"p": 71.38785553,
-		"tss": 451195.1563,
-		"n": 201.6464844
-	},
-	"N42099SL2_2540_2370": {
-		"load_rate": 1.356377482,
-		"p": 156.7406464,
-		"tss": 379536.1563,
-		"n": 495.2215576
-	},
-	"N24021PM7_4290_4200": {
-		"load_rate": 2.995631363,
-		"p": 246.0403106,
-		"tss": 1173350.527,
-		"n": 970.2721891
-	},
-	"N51023JU1_7560_7500": {
-		"load_rate": 120.6384249,
-		"p": 13435.50073,
-		"tss": 37009527.0,
-		"n": 42415.35889
-	},
-	"N42037SU8_1530_1760": {
-		"load_rate": 0.9230909944,
-		"p": 71.29671478,
-		"tss": 362070.9375,
-		"n": 329.1573181
-	},
-	"N54027PU6_3870_3690": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"H51079RU2_6090_6220": {
-		"load_rate": 14.49031878,
-		"p": 1644.619202,
-		"tss": 4348830.0,
-		"n": 5432.893555
-	},
-	"N42037SU3_1280_1590": {
-		"load_rate": 114.0834503,
-		"p": 9363.277344,
-		"tss": 33915508.0,
-		"n": 40470.03906
-	},
-	"N24009WL0_4922_0000": {
-		"load_rate": 6.417562008,
-		"p": 657.2770386,
-		"tss": 2791806.0,
-		"n": 2212.665283
-	},
-	"N42037SU7_1140_1420": {
-		"load_rate": 3.939086437,
-		"p": 413.3092651,
-		"tss": 1189706.875,
-		"n": 1435.650269
-	},
-	"N51165PS3_5990_6161": {
-		"load_rate": 133.8567734,
-		"p": 13740.71924,
-		"tss": 44776848.0,
-		"n": 51929.05078
-	},
-	"N24015EU0_3201_0000": {
-		"load_rate": 8.999936104,
-		"p": 543.2632446,
-		"tss": 1916679.25,
-		"n": 2895.119873
-	},
-	"N42117SW2_1000_1110": {
-		"load_rate": 135.9563904,
-		"p": 13028.11816,
-		"tss": 33213272.0,
-		"n": 49612.44922
-	},
-	"N54057PU3_4451_4450": {
-		"load_rate": 7.813080132,
-		"p": 917.777832,
-		"tss": 2440681.813,
-		"n": 2448.103897
-	},
-	"N51125JL2_6850_6890": {
-		"load_rate": 164.9833374,
-		"p": 16609.51758,
-		"tss": 50299024.0,
-		"n": 59489.625
-	},
-	"N51001EL0_6190_0000": {
-		"load_rate": 115.6020508,
-		"p": 4861.844238,
-		"tss": 17125544.0,
-		"n": 27931.54297
-	},
-	"N36107SU7_0550_0540": {
-		"load_rate": 90.67891693,
-		"p": 4979.804199,
-		"tss": 28733654.0,
-		"n": 21652.43945
-	},
-	"N51045JU1_7690_7490": {
-		"load_rate": 142.9995804,
-		"p": 15165.44287,
-		"tss": 43520380.0,
-		"n": 52723.93945
-	},
-	"N42109SL1_1790_1840": {
-		"load_rate": 237.4151306,
-		"p": 24682.30469,
-		"tss": 64527160.0,
-		"n": 93948.25
-	},
-	"N10003DE0_3310_0000": {
-		"load_rate": 5.004693031,
-		"p": 278.772583,
-		"tss": 873336.375,
-		"n": 1346.465088
-	},
-	"N42071SL2_2200_2350": {
-		"load_rate": 111.0426254,
-		"p": 11225.38477,
-		"tss": 34499012.0,
-		"n": 37613.6875
-	},
-	"N51700YL0_7370_0000": {
-		"load_rate": 14.17092323,
-		"p": 1681.354126,
-		"tss": 3884616.25,
-		"n": 5254.115234
-	},
-	"N24037XL0_4953_0000": {
-		"load_rate": 15.18527889,
-		"p": 1373.97876,
-		"tss": 4825085.0,
-		"n": 5564.787598
-	},
-	"N51029JA2_7550_7280": {
-		"load_rate": 40.9809227,
-		"p": 4648.774902,
-		"tss": 12123327.0,
-		"n": 15367.04883
-	},
-	"N36023SU2_0160_0260": {
-		"load_rate": 89.15953827,
-		"p": 6564.647461,
-		"tss": 27155470.0,
-		"n": 24549.57031
-	},
-	"N24029EU0_4120_0000": {
-		"load_rate": 5.479270935,
-		"p": 366.3018799,
-		"tss": 1185604.125,
-		"n": 1762.446533
-	},
-	"N24037PL0_5830_0001": {
-		"load_rate": 41.26974487,
-		"p": 3583.94165,
-		"tss": 12251641.0,
-		"n": 15434.98926
-	},
-	"N24003XL3_4712_0000": {
-		"load_rate": 10.12153816,
-		"p": 1003.289299,
-		"tss": 2536676.484,
-		"n": 4352.476402
-	},
-	"N51097YM0_6621_0000": {
-		"load_rate": 79.75068665,
-		"p": 7046.396484,
-		"tss": 13298998.0,
-		"n": 27139.92383
-	},
-	"N42037SU8_1610_1530": {
-		"load_rate": 1.100701213,
-		"p": 88.52861786,
-		"tss": 331534.5625,
-		"n": 378.1471558
-	},
-	"N24013SL3_2460_2430": {
-		"load_rate": 4.050653458,
-		"p": 264.6648254,
-		"tss": 1232800.875,
-		"n": 1351.736938
-	},
-	"N24041EM0_4871_0000": {
-		"load_rate": 4.458691597,
-		"p": 289.1865845,
-		"tss": 1009223.75,
-		"n": 1457.985962
-	},
-	"N51800ZZ0_9999_9999": {
-		"load_rate": 188.2177963,
-		"p": 14306.4115,
-		"tss": 58649159.5,
-		"n": 72610.93481
-	},
-	"N24001PU1_3100_3690": {
-		"load_rate": 15.89830399,
-		"p": 1225.455444,
-		"tss": 4895021.5,
-		"n": 5364.450195
-	},
-	"N36007SU6_0480_0520": {
-		"load_rate": 167.5940247,
-		"p": 14390.8877,
-		"tss": 60562932.0,
-		"n": 49431.20313
-	},
-	"N42067SJ3_2160_2170": {
-		"load_rate": 153.4225311,
-		"p": 14003.48047,
-		"tss": 31720626.0,
-		"n": 54695.76563
-	},
-	"H54023PU3_5210_5050": {
-		"load_rate": 1.058377922,
-		"p": 115.7733192,
-		"tss": 363477.6875,
-		"n": 376.7131348
-	},
-	"N42117SW3_1080_1350": {
-		"load_rate": 40.96139908,
-		"p": 3719.407471,
-		"tss": 10916840.0,
-		"n": 14788.73242
-	},
-	"N51001DE0_6630_0000": {
-		"load_rate": 86.59770203,
-		"p": 8885.96875,
-		"tss": 13352498.0,
-		"n": 29918.36523
-	},
-	"N42099SJ3_2160_2170": {
-		"load_rate": 19.13554192,
-		"p": 2114.861816,
-		"tss": 5404831.0,
-		"n": 7132.105469
-	},
-	"N54065PU2_3770_3600": {
-		"load_rate": 1.766825676,
-		"p": 164.042511,
-		"tss": 433666.75,
-		"n": 623.2219238
-	},
-	"N54031PU4_4310_4210": {
-		"load_rate": 131.2098083,
-		"p": 14527.15039,
-		"tss": 34243728.0,
-		"n": 46554.89453
-	},
-	"N42117SU2_0920_0830": {
-		"load_rate": 176.2568207,
-		"p": 16616.74219,
-		"tss": 49779156.0,
-		"n": 64077.09375
-	},
-	"N42067SJ2_2150_2130": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N42027SJ2_1900_1930": {
-		"load_rate": 4.047647476,
-		"p": 437.3773193,
-		"tss": 1143120.625,
-		"n": 1430.360474
-	},
-	"N24033XL3_4711_0000": {
-		"load_rate": 7.088249683,
-		"p": 504.9416809,
-		"tss": 2206344.063,
-		"n": 1926.464478
-	},
-	"N36077SU2_0150_0220": {
-		"load_rate": 43.89286423,
-		"p": 2958.775391,
-		"tss": 10289753.0,
-		"n": 12451.4668
-	},
-	"N36017SU5_0420_0500": {
-		"load_rate": 27.68219948,
-		"p": 1708.537109,
-		"tss": 6932505.0,
-		"n": 7451.117188
-	},
-	"N54071PU4_5050_4310": {
-		"load_rate": 3.949747562,
-		"p": 362.6411591,
-		"tss": 1125445.906,
-		"n": 1424.010864
-	},
-	"N24035EU2_3520_0001": {
-		"load_rate": 22.47211266,
-		"p": 1182.432739,
-		"tss": 5477171.5,
-		"n": 7811.367188
-	},
-	"N51165PS3_6161_6280": {
-		"load_rate": 6.315149307,
-		"p": 227.1338348,
-		"tss": 2611489.5,
-		"n": 1296.028809
-	},
-	"N24015EU0_3302_0000": {
-		"load_rate": 1.03502655,
-		"p": 103.045311,
-		"tss": 393966.625,
-		"n": 433.0789795
-	},
-	"N51550ZZ0_9999_9999": {
-		"load_rate": 99.73680377,
-		"p": 7084.840515,
-		"tss": 32525492.25,
-		"n": 36433.79474
-	},
-	"N51193RL1_6180_0001": {
-		"load_rate": 39.07623291,
-		"p": 2974.625488,
-		"tss": 6625216.5,
-		"n": 13001.35742
-	},
-	"N24003WL0_4393_0000": {
-		"load_rate": 0.4316418171,
-		"p": 7.995794296,
-		"tss": 128553.0313,
-		"n": 119.1933212
-	},
-	"N36065SU3_0010_0190": {
-		"load_rate": 30.40071297,
-		"p": 1921.731201,
-		"tss": 7903737.5,
-		"n": 8024.82666
-	},
-	"N51061PM3_4670_4660": {
-		"load_rate": 60.99608612,
-		"p": 5271.46582,
-		"tss": 13127655.0,
-		"n": 20366.08789
-	},
-	"N42023SW3_1380_1490": {
-		"load_rate": 17.18595695,
-		"p": 1863.694092,
-		"tss": 4615598.0,
-		"n": 5846.540527
-	},
-	"N24037PL1_5910_0001": {
-		"load_rate": 34.21665573,
-		"p": 3908.131104,
-		"tss": 12890664.0,
-		"n": 13928.87207
-	},
-	"N24043PU6_3640_3600": {
-		"load_rate": 6.660013109,
-		"p": 655.2554131,
-		"tss": 2041166.344,
-		"n": 2140.765602
-	},
-	"N24025SL9_2970_0000": {
-		"load_rate": 9.796415418,
-		"p": 1397.298992,
-		"tss": 5087876.875,
-		"n": 3750.767418
-	},
-	"N51059PL0_5000_0001": {
-		"load_rate": 26.68458748,
-		"p": 2997.515137,
-		"tss": 13581996.0,
-		"n": 9211.232422
-	},
-	"N24043PU6_4180_4150": {
-		"load_rate": 7.805294096,
-		"p": 797.1380577,
-		"tss": 2557439.359,
-		"n": 2558.253983
-	},
-	"N51009JL6_7440_7430": {
-		"load_rate": 197.7798462,
-		"p": 9656.62207,
-		"tss": 62786728.0,
-		"n": 65756.74219
-	},
-	"N42105SW3_1270_1370": {
-		"load_rate": 2.95544982,
-		"p": 340.4846497,
-		"tss": 874340.875,
-		"n": 1079.821899
-	},
-	"N51005JU3_7400_7510": {
-		"load_rate": 3.240388408,
-		"p": 318.7507524,
-		"tss": 992752.2637,
-		"n": 1242.04689
-	},
-	"N24015EU0_3362_0000": {
-		"load_rate": 4.67484045,
-		"p": 243.050293,
-		"tss": 924400.5,
-		"n": 1474.354248
-	},
-	"N42107SU1_1480_1500": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N42033SW3_1750_1540": {
-		"load_rate": 53.2244072,
-		"p": 5313.84668,
-		"tss": 17429234.0,
-		"n": 17645.50391
-	},
-	"N24025WU0_3252_0000": {
-		"load_rate": 4.911292076,
-		"p": 555.5238647,
-		"tss": 1778459.25,
-		"n": 1250.211151
-	},
-	"H42119SW1_1560_1460": {
-		"load_rate": 11.75451469,
-		"p": 1290.887329,
-		"tss": 3967468.5,
-		"n": 4238.730957
-	},
-	"H51079JL2_6240_6520": {
-		"load_rate": 13.98858404,
-		"p": 1570.180908,
-		"tss": 6694082.25,
-		"n": 5438.897949
-	},
-	"N42133SL1_2830_2760": {
-		"load_rate": 64.39167023,
-		"p": 4075.553711,
-		"tss": 19062516.0,
-		"n": 22369.21289
-	},
-	"N51179PL0_5850_0000": {
-		"load_rate": 24.98283266,
-		"p": 3656.133472,
-		"tss": 13936058.38,
-		"n": 8148.902557
-	},
-	"H51157RU2_5500_5610": {
-		"load_rate": 16.60564613,
-		"p": 1833.709351,
-		"tss": 6493131.5,
-		"n": 6006.52417
-	},
-	"N51147JA2_7410_7470": {
-		"load_rate": 0.5114030838,
-		"p": 51.0630188,
-		"tss": 151188.3438,
-		"n": 207.5908966
-	},
-	"N51153PL2_5140_5360": {
-		"load_rate": 61.28954315,
-		"p": 8066.381348,
-		"tss": 20597436.0,
-		"n": 26513.45117
-	},
-	"N36023SU1_0330_0560": {
-		"load_rate": 47.74141693,
-		"p": 3796.915039,
-		"tss": 12835757.0,
-		"n": 14036.92871
-	},
-	"N51193RL1_6322_0000": {
-		"load_rate": 3.498552561,
-		"p": 206.2502747,
-		"tss": 515902.2188,
-		"n": 1167.524292
-	},
-	"N51193PL0_6130_0000": {
-		"load_rate": 73.89437866,
-		"p": 5679.380371,
-		"tss": 12623322.0,
-		"n": 24013.9043
-	},
-	"N24005WU2_3020_3320": {
-		"load_rate": 83.37433031,
-		"p": 5843.468407,
-		"tss": 27674067.06,
-		"n": 29632.97127
-	},
-	"N24011EM3_4321_0000": {
-		"load_rate": 31.1818676,
-		"p": 2397.765137,
-		"tss": 6501264.5,
-		"n": 11578.12305
-	},
-	"N24035EU0_4475_0000": {
-		"load_rate": 0.1230532229,
-		"p": 5.710120201,
-		"tss": 32866.44531,
-		"n": 41.31181717
-	},
-	"N51610PL0_5000_0001": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N42075SL4_2240_2310": {
-		"load_rate": 2.924873829,
-		"p": 329.7030334,
-		"tss": 1500958.625,
-		"n": 1097.796387
-	},
-	"N24011EM0_4322_0000": {
-		"load_rate": 15.4698925,
-		"p": 1137.146118,
-		"tss": 2969478.25,
-		"n": 5743.313477
-	},
-	"N42023SW2_1360_1430": {
-		"load_rate": 66.29290771,
-		"p": 7227.542969,
-		"tss": 19166852.0,
-		"n": 22776.32422
-	},
-	"N42027SW0_1520_1600": {
-		"load_rate": 115.6409225,
-		"p": 10878.44531,
-		"tss": 30783144.0,
-		"n": 41031.67188
-	},
-	"N51033YM1_6370_6620": {
-		"load_rate": 174.8447571,
-		"p": 16503.05615,
-		"tss": 55120333.0,
-		"n": 70768.36426
-	},
-	"N51187PS5_4380_4370": {
-		"load_rate": 45.77930747,
-		"p": 4603.248524,
-		"tss": 22775869.74,
-		"n": 18343.57459
-	},
-	"H54057PU4_4440_3970": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N51127YP0_6782_0000": {
-		"load_rate": 39.47094345,
-		"p": 3912.545898,
-		"tss": 9915100.0,
-		"n": 13285.43848
-	},
-	"N51033YM3_6430_6620": {
-		"load_rate": 254.0189819,
-		"p": 33095.52344,
-		"tss": 80145512.0,
-		"n": 104522.4766
-	},
-	"N42105SW3_1091_1380": {
-		"load_rate": 4.938735962,
-		"p": 571.0882568,
-		"tss": 1468753.25,
-		"n": 1819.97229
-	},
-	"N51011JL6_7320_7150": {
-		"load_rate": 35.85762787,
-		"p": 3308.782959,
-		"tss": 9162933.0,
-		"n": 13170.82324
-	},
-	"N36097SU5_0530_0610": {
-		"load_rate": 7.221576214,
-		"p": 703.5598145,
-		"tss": 2205687.25,
-		"n": 2857.920654
-	},
-	"N36101ZZ0_9999_9999": {
-		"load_rate": 151.1217041,
-		"p": 17071.58398,
-		"tss": 69341936.0,
-		"n": 61453.42188
-	},
-	"N42133SL0_2721_2720": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N24029EU0_3571_0000": {
-		"load_rate": 6.868787766,
-		"p": 448.0827942,
-		"tss": 1616599.875,
-		"n": 2187.906006
-	},
-	"N36077SU4_0300_0310": {
-		"load_rate": 20.02675056,
-		"p": 1219.208374,
-		"tss": 5073979.0,
-		"n": 5460.862793
-	},
-	"N42081SW3_1080_1350": {
-		"load_rate": 120.6276245,
-		"p": 11130.47168,
-		"tss": 31777608.0,
-		"n": 40704.73438
-	},
-	"N24003WL0_4422_0000": {
-		"load_rate": 2.86319375,
-		"p": 175.2385712,
-		"tss": 1464644.875,
-		"n": 1128.605835
-	},
-	"N24019EL0_5284_0000": {
-		"load_rate": 7.824645549,
-		"p": 815.3151598,
-		"tss": 2071235.758,
-		"n": 2378.251511
-	},
-	"L51015PS3_6280_6230": {
-		"load_rate": 25.56716156,
-		"p": 2366.465576,
-		"tss": 7422815.0,
-		"n": 8826.428711
-	},
-	"N51019JL6_7160_7440": {
-		"load_rate": 107.6702843,
-		"p": 5660.948608,
-		"tss": 30719023.25,
-		"n": 31906.46558
-	},
-	"N24031PM7_4580_4820": {
-		"load_rate": 64.60018227,
-		"p": 7547.409864,
-		"tss": 32943422.52,
-		"n": 23962.83389
-	},
-	"N42015SU2_0900_0870": {
-		"load_rate": 5.14684248,
-		"p": 415.8871765,
-		"tss": 1208518.75,
-		"n": 1632.367554
-	},
-	"N42105SU1_0820_0740": {
-		"load_rate": 51.99369049,
-		"p": 4947.432129,
-		"tss": 16036992.0,
-		"n": 19248.55273
-	},
-	"N10005EL0_4597_0000": {
-		"load_rate": 2.93845129,
-		"p": 143.1521606,
-		"tss": 428125.0313,
-		"n": 918.49823
-	},
-	"N51760JB0_7071_0000": {
-		"load_rate": 17.61039352,
-		"p": 409.0968323,
-		"tss": 5785639.5,
-		"n": 1889.099976
-	},
-	"L51015PS3_6460_6230": {
-		"load_rate": 33.24784088,
-		"p": 2345.274902,
-		"tss": 12148449.0,
-		"n": 10490.82129
-	},
-	"N36077SU4_0230_0220": {
-		"load_rate": 4.385297775,
-		"p": 328.0389404,
-		"tss": 1370355.75,
-		"n": 1280.78418
-	},
-	"N10005DE0_5021_0000": {
-		"load_rate": 5.977077961,
-		"p": 313.166687,
-		"tss": 995789.4375,
-		"n": 3244.637207
-	},
-	"H42079SU2_0990_0950": {
-		"load_rate": 3.129624128,
-		"p": 350.9840393,
-		"tss": 802320.0625,
-		"n": 1082.955078
-	},
-	"N42133SL3_2550_2490": {
-		"load_rate": 41.7669487,
-		"p": 4163.080566,
-		"tss": 31272800.0,
-		"n": 15314.82715
-	},
-	"N24001PU4_4440_3970": {
-		"load_rate": 0.008629094809,
-		"p": 14.4600687,
-		"tss": 283145.0313,
-		"n": 13.67111015
-	},
-	"N24025WU0_3255_0000": {
-		"load_rate": 1.60808444,
-		"p": 163.5329742,
-		"tss": 450018.9375,
-		"n": 506.790741
-	},
-	"N51157RU2_5500_5610": {
-		"load_rate": 48.03838435,
-		"p": 4438.709789,
-		"tss": 14940768.22,
-		"n": 16981.28139
-	},
-	"N42047SW3_1270_1370": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N42127SU3_0970_1120": {
-		"load_rate": 1.261486053,
-		"p": 139.5929871,
-		"tss": 327032.125,
-		"n": 440.3700562
-	},
-	"N51133PL0_6272_0000": {
-		"load_rate": 0.364179194,
-		"p": 27.16086578,
-		"tss": 110322.0391,
-		"n": 123.5869598
-	},
-	"N51099PL0_5900_0000": {
-		"load_rate": 16.2892189,
-		"p": 2543.050781,
-		"tss": 5850762.0,
-		"n": 7249.75
-	},
-	"N24035EU0_4472_0000": {
-		"load_rate": 3.628132105,
-		"p": 190.5247345,
-		"tss": 933886.9375,
-		"n": 1263.59314
-	},
-	"N24039EL0_5894_0000": {
-		"load_rate": 1.654222727,
-		"p": 182.0236969,
-		"tss": 464738.1875,
-		"n": 513.116333
-	},
-	"N51091JU1_6340_6650": {
-		"load_rate": 38.5620203,
-		"p": 3856.952026,
-		"tss": 10994156.75,
-		"n": 13933.65771
-	},
-	"N54003PU2_3770_3600": {
-		"load_rate": 125.2446136,
-		"p": 10100.11719,
-		"tss": 31182154.0,
-		"n": 47108.70703
-	},
-	"N24009XL0_5350_0000": {
-		"load_rate": 24.13667488,
-		"p": 2184.105957,
-		"tss": 8726800.0,
-		"n": 8817.022461
-	},
-	"N42117SU2_0740_0741": {
-		"load_rate": 118.9501815,
-		"p": 10646.93829,
-		"tss": 32078643.88,
-		"n": 41861.38049
-	},
-	"N24037PL0_5961_0000": {
-		"load_rate": 6.491419792,
-		"p": 509.7440796,
-		"tss": 1788538.5,
-		"n": 2338.306396
-	},
-	"N24021PM3_3040_3340": {
-		"load_rate": 43.81439705,
-		"p": 2875.744959,
-		"tss": 12946299.5,
-		"n": 14567.26154
-	},
-	"N51009JL6_7160_7440": {
-		"load_rate": 214.2798138,
-		"p": 22676.62549,
-		"tss": 60539478.5,
-		"n": 76408.63965
-	},
-	"N24031PM7_4410_4620": {
-		"load_rate": 60.48094,
-		"p": 4371.180285,
-		"tss": 17404127.27,
-		"n": 18229.82876
-	},
-	"N24029EU0_3572_0000": {
-		"load_rate": 6.718316555,
-		"p": 401.6398315,
-		"tss": 1418854.875,
-		"n": 2023.375732
-	},
-	"N51059PL0_5252_0000": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N51053JA5_7480_0001": {
-		"load_rate": 92.97583008,
-		"p": 10505.49707,
-		"tss": 21221464.0,
-		"n": 32093.68164
-	},
-	"N24047EL3_5870_0000": {
-		"load_rate": 36.74027252,
-		"p": 2676.86377,
-		"tss": 5698817.5,
-		"n": 9199.892578
-	},
-	"N10003DE0_2640_0000": {
-		"load_rate": 24.96305084,
-		"p": 2277.217285,
-		"tss": 7299857.0,
-		"n": 10326.63281
-	},
-	"N42115SU1_0660_0710": {
-		"load_rate": 145.0394592,
-		"p": 11012.45117,
-		"tss": 36087632.0,
-		"n": 42216.74219
-	},
-	"N42117SU2_0741_0690": {
-		"load_rate": 12.47947717,
-		"p": 1053.554901,
-		"tss": 3716005.938,
-		"n": 4359.7276
-	},
-	"N54057PU4_3780_3930": {
-		"load_rate": 6.347559929,
-		"p": 474.550293,
-		"tss": 2449245.25,
-		"n": 2272.486328
-	},
-	"N51161JU1_7690_7490": {
-		"load_rate": 10.31476968,
-		"p": 985.0657082,
-		"tss": 2778507.906,
-		"n": 3603.700785
-	},
-	"N51047RU2_5220_5640": {
-		"load_rate": 17.3344593,
-		"p": 1812.147095,
-		"tss": 4678240.5,
-		"n": 6376.197266
-	},
-	"N51165PS4_6230_6360": {
-		"load_rate": 20.86437988,
-		"p": 2562.990234,
-		"tss": 8106395.0,
-		"n": 8408.335938
-	},
-	"N42027SW3_1690_1660": {
-		"load_rate": 65.66229987,
-		"p": 5922.917206,
-		"tss": 18654125.13,
-		"n": 22624.42163
-	},
-	"N24037XL0_5349_0000": {
-		"load_rate": 0.1958310455,
-		"p": 15.71151352,
-		"tss": 80961.77344,
-		"n": 67.79891205
-	},
-	"N51107PM3_4670_4660": {
-		"load_rate": 203.684845,
-		"p": 17919.47656,
-		"tss": 58507504.0,
-		"n": 71011.0625
-	},
-	"N42127ZZ0_9999_9999": {
-		"load_rate": 755.2980147,
-		"p": 62807.1758,
-		"tss": 313562199.0,
-		"n": 236312.6006
-	},
-	"N24047EL2_5270_0001": {
-		"load_rate": 49.29816055,
-		"p": 3438.641602,
-		"tss": 7505026.5,
-		"n": 12502.68066
-	},
-	"N42011ZZ0_9999_9999": {
-		"load_rate": 692.5748695,
-		"p": 73485.76035,
-		"tss": 440715185.8,
-		"n": 268915.9756
-	},
-	"N24017PL0_5440_0000": {
-		"load_rate": 29.59728235,
-		"p": 2338.959412,
-		"tss": 11941296.56,
-		"n": 10403.39555
-	},
-	"N36025SU2_0320_0340": {
-		"load_rate": 3.546073675,
-		"p": 251.8031921,
-		"tss": 1316579.375,
-		"n": 972.6998901
-	},
-	"N54027PU2_4340_3860": {
-		"load_rate": 201.602005,
-		"p": 14736.05371,
-		"tss": 41233044.0,
-		"n": 74172.46875
-	},
-	"N24035EM2_4101_0000": {
-		"load_rate": 6.93487072,
-		"p": 367.6307373,
-		"tss": 1726015.0,
-		"n": 2385.664551
-	},
-	"N24035EU0_4490_0000": {
-		"load_rate": 1.008085966,
-		"p": 76.07922363,
-		"tss": 344248.375,
-		"n": 342.8126831
-	},
-	"N51165PS0_6160_6161": {
-		"load_rate": 15.39041805,
-		"p": 1807.034668,
-		"tss": 8340310.5,
-		"n": 6107.080078
-	},
-	"N24045EL1_5430_0001": {
-		"load_rate": 26.96882439,
-		"p": 2248.504639,
-		"tss": 6381582.0,
-		"n": 8536.038086
-	},
-	"N42041SL4_2330_2270": {
-		"load_rate": 31.42178254,
-		"p": 2400.161583,
-		"tss": 14176415.41,
-		"n": 10571.35504
-	},
-	"N36023SU2_0280_0430": {
-		"load_rate": 5.339435101,
-		"p": 380.7906189,
-		"tss": 1368368.125,
-		"n": 1504.160645
-	},
-	"N24029EU0_3363_0000": {
-		"load_rate": 10.51326656,
-		"p": 663.4512329,
-		"tss": 2504670.5,
-		"n": 3320.685791
-	},
-	"N42037SL1_1730_1700": {
-		"load_rate": 1.415448666,
-		"p": 98.25902557,
-		"tss": 522561.6875,
-		"n": 377.7971802
-	},
-	"N24019EM0_4883_0000": {
-		"load_rate": 3.234195709,
-		"p": 246.9336395,
-		"tss": 812989.0,
-		"n": 1039.203735
-	},
-	"N42131SU7_0950_1010": {
-		"load_rate": 16.4505024,
-		"p": 1490.284668,
-		"tss": 6316387.5,
-		"n": 5167.351074
-	},
-	"N42081SU1_0940_0900": {
-		"load_rate": 0.3425945044,
-		"p": 37.35677719,
-		"tss": 74797.65625,
-		"n": 118.6389389
-	},
-	"N42119SL3_1710_1740": {
-		"load_rate": 74.79814148,
-		"p": 6954.055176,
-		"tss": 16574343.0,
-		"n": 26735.81055
-	},
-	"N51071JU2_7450_7360": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N10003DE0_2600_0000": {
-		"load_rate": 16.33559614,
-		"p": 1707.503586,
-		"tss": 5634178.797,
-		"n": 6458.54953
-	},
-	"N10001EL2_4400_4590": {
-		"load_rate": 73.40586853,
-		"p": 3765.356934,
-		"tss": 9880222.0,
-		"n": 23835.5957
-	},
-	"N51199JB0_7390_0000": {
-		"load_rate": 13.12291026,
-		"p": 1793.42569,
-		"tss": 4254090.0,
-		"n": 5196.95813
-	},
-	"N42079SU7_1420_1590": {
-		"load_rate": 1.860202432,
-		"p": 101.1470718,
-		"tss": 474350.5313,
-		"n": 439.5335999
-	},
-	"N51075YP3_6470_6690": {
-		"load_rate": 10.42594814,
-		"p": 900.7294312,
-		"tss": 2468056.25,
-		"n": 3961.256592
-	},
-	"N42069ZZ0_9999_9999": {
-		"load_rate": 81.62300873,
-		"p": 8433.107422,
-		"tss": 34068200.0,
-		"n": 29529.55273
-	},
-	"N10003EU0_3010_0000": {
-		"load_rate": 8.669788361,
-		"p": 740.2572021,
-		"tss": 1945262.75,
-		"n": 2682.532715
-	},
-	"N51107PM7_4200_4410": {
-		"load_rate": 17.38923645,
-		"p": 1799.246216,
-		"tss": 5915148.0,
-		"n": 6519.545898
-	},
-	"N51041JA4_7470_7480": {
-		"load_rate": 35.7180481,
-		"p": 4547.27832,
-		"tss": 10838026.0,
-		"n": 13854.52344
-	},
-	"N42081SU2_0890_0900": {
-		"load_rate": 0.003628787119,
-		"p": 0.3508483768,
-		"tss": 22735.92969,
-		"n": 1.229868174
-	},
-	"N42015SU3_0870_0730": {
-		"load_rate": 71.8562851,
-		"p": 6023.513184,
-		"tss": 16270224.0,
-		"n": 23193.98633
-	},
-	"N24037XL0_5344_0000": {
-		"load_rate": 7.403842449,
-		"p": 562.7619019,
-		"tss": 2130850.25,
-		"n": 2593.84668
-	},
-	"N24021PM7_4200_4410": {
-		"load_rate": 45.07615161,
-		"p": 3311.499039,
-		"tss": 11415107.19,
-		"n": 15033.26163
-	},
-	"N42133SL3_2460_2430": {
-		"load_rate": 254.3832397,
-		"p": 21494.01367,
-		"tss": 72074488.0,
-		"n": 92709.94531
-	},
-	"N42107SL3_1960_2080": {
-		"load_rate": 10.8273344,
-		"p": 557.7566528,
-		"tss": 4138173.25,
-		"n": 3719.898682
-	},
-	"N24043PU3_3390_3730": {
-		"load_rate": 64.51344079,
-		"p": 5369.343899,
-		"tss": 19501549.7,
-		"n": 22026.52544
-	},
-	"L51023JU5_7300_7510": {
-		"load_rate": 42.06441021,
-		"p": 4335.067261,
-		"tss": 12051914.25,
-		"n": 15158.92432
-	},
-	"N51023JU5_7510_7500": {
-		"load_rate": 30.13212013,
-		"p": 3200.902588,
-		"tss": 10082788.0,
-		"n": 11277.80469
-	},
-	"N24017PL0_5585_0000": {
-		"load_rate": 8.808984011,
-		"p": 751.4102716,
-		"tss": 2657348.793,
-		"n": 3260.398193
-	},
-	"N42037SU7_1420_1590": {
-		"load_rate": 57.26681519,
-		"p": 2708.980225,
-		"tss": 18482926.0,
-		"n": 17696.37305
-	},
-	"N42033SW2_1360_1430": {
-		"load_rate": 127.5812378,
-		"p": 13561.95313,
-		"tss": 36530116.0,
-		"n": 44035.42969
-	},
-	"N24009XL0_5342_0000": {
-		"load_rate": 12.76201057,
-		"p": 1169.614258,
-		"tss": 3947503.5,
-		"n": 4509.666992
-	},
-	"N42113SW3_1040_1220": {
-		"load_rate": 3.526096106,
-		"p": 327.5591736,
-		"tss": 826388.125,
-		"n": 1214.381592
-	},
-	"N51125JL1_7190_7250": {
-		"load_rate": 11.90377998,
-		"p": 953.9880981,
-		"tss": 2884180.5,
-		"n": 4168.671875
-	},
-	"N24015SL9_2970_0000": {
-		"load_rate": 11.25056273,
-		"p": 773.5985489,
-		"tss": 4304626.188,
-		"n": 3510.143936
-	},
-	"N24029EU0_3725_0000": {
-		"load_rate": 7.987779617,
-		"p": 528.7181396,
-		"tss": 2176921.75,
-		"n": 2513.953857
-	},
-	"N42079SU2_1200_1310": {
-		"load_rate": 88.90171051,
-		"p": 6119.558105,
-		"tss": 20742864.0,
-		"n": 25968.60352
-	},
-	"H51125JL1_6940_7200": {
-		"load_rate": 17.77259076,
-		"p": 1876.582794,
-		"tss": 5681820.0,
-		"n": 6414.890015
-	},
-	"N24041EM0_4876_0000": {
-		"load_rate": 5.35351181,
-		"p": 301.8140869,
-		"tss": 1059185.25,
-		"n": 1752.835571
-	},
-	"N54071PU2_6050_5190": {
-		"load_rate": 96.99358124,
-		"p": 9826.737005,
-		"tss": 27014049.77,
-		"n": 35036.27412
-	},
-	"N42133SL1_2760_2730": {
-		"load_rate": 19.92812729,
-		"p": 2027.515259,
-		"tss": 5832855.0,
-		"n": 7246.946777
-	},
-	"N51133PL0_6271_0000": {
-		"load_rate": 6.865787029,
-		"p": 612.1109619,
-		"tss": 1243272.0,
-		"n": 2482.861572
-	},
-	"N51107PM7_4410_4620": {
-		"load_rate": 44.24365997,
-		"p": 4689.651855,
-		"tss": 14814400.0,
-		"n": 16600.88867
-	},
-	"N24043PU6_3530_3440": {
-		"load_rate": 2.44647444,
-		"p": 274.8997812,
-		"tss": 1142466.371,
-		"n": 823.2506523
-	},
-	"N36015SU2_0450_0720": {
-		"load_rate": 63.23339081,
-		"p": 5377.599121,
-		"tss": 19130340.0,
-		"n": 22264.83984
-	},
-	"N51153PL0_5491_0000": {
-		"load_rate": 34.82828236,
-		"p": 1215.917114,
-		"tss": 19458780.5,
-		"n": 15323.28082
-	},
-	"N42099SL9_2050_2270": {
-		"load_rate": 22.28234863,
-		"p": 2561.992188,
-		"tss": 7897465.0,
-		"n": 8380.451172
-	},
-	"N42063SW2_1950_1940": {
-		"load_rate": 84.91739655,
-		"p": 7725.046875,
-		"tss": 28764270.0,
-		"n": 32049.34961
-	},
-	"N42071SL9_2310_2430": {
-		"load_rate": 15.68453026,
-		"p": 1519.134888,
-		"tss": 4267675.0,
-		"n": 5022.45459
-	},
-	"N51119YL2_6580_0001": {
-		"load_rate": 28.1045475,
-		"p": 3021.721436,
-		"tss": 4026072.5,
-		"n": 9870.791992
-	},
-	"N42115SU7_0550_0540": {
-		"load_rate": 19.37451553,
-		"p": 1621.388428,
-		"tss": 4798802.5,
-		"n": 5928.915527
-	},
-	"N42113SW2_1070_1060": {
-		"load_rate": 102.4691162,
-		"p": 10399.08105,
-		"tss": 25270648.0,
-		"n": 36045.26172
-	},
-	"N24510WM1_3910_0001": {
-		"load_rate": 13.8240211,
-		"p": 1409.058109,
-		"tss": 15996771.75,
-		"n": 4664.577164
-	},
-	"H54031PU4_4310_4210": {
-		"load_rate": 12.4783783,
-		"p": 1469.814087,
-		"tss": 3854222.75,
-		"n": 4635.991211
-	},
-	"N42099SL8_1880_2030": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N42105SW3_1130_1390": {
-		"load_rate": 38.70822906,
-		"p": 4406.879883,
-		"tss": 10578707.0,
-		"n": 13920.36426
-	},
-	"N42117SU3_0831_0790": {
-		"load_rate": 93.55728638,
-		"p": 8315.986969,
-		"tss": 25964344.34,
-		"n": 32986.11353
-	},
-	"H42113SU2_1200_1310": {
-		"load_rate": 2.687465668,
-		"p": 292.7920837,
-		"tss": 710182.625,
-		"n": 826.3105469
-	},
-	"N24003XL3_4950_0000": {
-		"load_rate": 6.254140407,
-		"p": 480.5879316,
-		"tss": 1645338.57,
-		"n": 2040.866737
-	},
-	"N51165PS4_5840_5240": {
-		"load_rate": 119.4029188,
-		"p": 9845.3125,
-		"tss": 40935959.5,
-		"n": 39358.37793
-	},
-	"N42009PU1_3170_3580": {
-		"load_rate": 79.70213318,
-		"p": 7608.870117,
-		"tss": 21764940.0,
-		"n": 28342.4082
-	},
-	"N51153PL0_5141_5140": {
-		"load_rate": 29.82679558,
-		"p": 4076.940674,
-		"tss": 10954580.0,
-		"n": 11240.9502
-	},
-	"N24029EU0_4010_0000": {
-		"load_rate": 11.64844227,
-		"p": 466.7972412,
-		"tss": 2558297.0,
-		"n": 3390.931152
-	},
-	"N24009XL0_5320_0001": {
-		"load_rate": 9.782976151,
-		"p": 1004.796387,
-		"tss": 3707997.25,
-		"n": 3860.029541
-	},
-	"N51059PL7_4983_0000": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N42081SW7_1460_1640": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N42133SL3_2440_2380": {
-		"load_rate": 2.56017828,
-		"p": 243.3911362,
-		"tss": 2302016.063,
-		"n": 900.7519531
-	},
-	"N42047SW2_1360_1430": {
-		"load_rate": 251.0530243,
-		"p": 28011.61133,
-		"tss": 74096904.0,
-		"n": 88683.375
-	},
-	"N42061SJ5_2120_1930": {
-		"load_rate": 3.804253578,
-		"p": 407.7128601,
-		"tss": 1137055.0,
-		"n": 1363.509766
-	},
-	"N24019EL0_5280_0000": {
-		"load_rate": 156.9043884,
-		"p": 14127.15967,
-		"tss": 38140545.0,
-		"n": 49009.37891
-	},
-	"N24003WM3_4060_0001": {
-		"load_rate": 29.20802021,
-		"p": 3233.089127,
-		"tss": 13625432.06,
-		"n": 12542.47382
-	},
-	"N24003XL3_4713_0000": {
-		"load_rate": 25.23034689,
-		"p": 1902.744831,
-		"tss": 5635235.016,
-		"n": 8056.491905
-	},
-	"N51005JU2_7450_7360": {
-		"load_rate": 120.0594559,
-		"p": 12663.34082,
-		"tss": 36925865.0,
-		"n": 45311.95313
-	},
-	"N51153PL3_5250_0001": {
-		"load_rate": 16.65452957,
-		"p": 1981.696167,
-		"tss": 5858616.0,
-		"n": 6064.445313
-	},
-	"N42075SL2_1990_2070": {
-		"load_rate": 22.48027587,
-		"p": 2366.275822,
-		"tss": 7002928.395,
-		"n": 8456.458145
-	},
-	"N24009WL0_4923_0000": {
-		"load_rate": 4.393834114,
-		"p": 516.1524048,
-		"tss": 1558270.25,
-		"n": 1551.796387
-	},
-	"N42071ZZ0_9999_9999": {
-		"load_rate": 2.311892033,
-		"p": 243.6921692,
-		"tss": 1211460.0,
-		"n": 863.6351318
-	},
-	"N51710JB0_7394_0000": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N24009XL0_5341_0000": {
-		"load_rate": 7.44881773,
-		"p": 599.1903076,
-		"tss": 1878874.875,
-		"n": 2614.019287
-	},
-	"N51059PL7_4984_0000": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N24029EU0_3362_0000": {
-		"load_rate": 10.09118176,
-		"p": 626.394165,
-		"tss": 2527684.0,
-		"n": 3237.757324
-	},
-	"N42029EU1_2810_0001": {
-		"load_rate": 7.750982285,
-		"p": 824.7674561,
-		"tss": 2627844.75,
-		"n": 2985.227051
-	},
-	"N51115YL0_6871_0000": {
-		"load_rate": 38.43722916,
-		"p": 4571.108398,
-		"tss": 9307450.0,
-		"n": 13686.51758
-	},
-	"N42061SJ4_2340_2210": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N24039EL3_5970_0000": {
-		"load_rate": 8.737401962,
-		"p": 923.9235229,
-		"tss": 1999590.125,
-		"n": 2812.061279
-	},
-	"N51036JB0_7074_0000": {
-		"load_rate": 77.96513486,
-		"p": 6845.629822,
-		"tss": 13956118.38,
-		"n": 27612.23572
-	},
-	"N36077SU4_0220_0250": {
-		"load_rate": 18.15018272,
-		"p": 745.7287598,
-		"tss": 7625850.5,
-		"n": 6155.194824
-	},
-	"N42117SU3_0770_0690": {
-		"load_rate": 14.57945824,
-		"p": 1512.890381,
-		"tss": 3660434.75,
-		"n": 5760.817383
-	},
-	"N42041SL3_2460_2430": {
-		"load_rate": 0.8629814386,
-		"p": 90.556427,
-		"tss": 268384.375,
-		"n": 372.1513672
-	},
-	"H54023PU3_4451_4450": {
-		"load_rate": 3.239269972,
-		"p": 297.0079041,
-		"tss": 1391288.375,
-		"n": 1140.75354
-	},
-	"N51047RU3_6170_6040": {
-		"load_rate": 1.436795712,
-		"p": 110.2173309,
-		"tss": 350690.9375,
-		"n": 436.3358154
-	},
-	"N24003WL0_4602_0000": {
-		"load_rate": 15.32532435,
-		"p": 1039.62551,
-		"tss": 4259445.555,
-		"n": 3884.824846
-	},
-	"N51009JL1_7080_7190": {
-		"load_rate": 22.25944519,
-		"p": 1716.542114,
-		"tss": 2821515.25,
-		"n": 7539.709961
-	},
-	"N51087JB3_6820_7053": {
-		"load_rate": 173.8683153,
-		"p": 24263.93681,
-		"tss": 57293258.56,
-		"n": 70774.52757
-	},
-	"N24017PL0_5290_0000": {
-		"load_rate": 3.10518384,
-		"p": 314.3432465,
-		"tss": 846389.7813,
-		"n": 1148.792786
-	},
-	"N51073YL2_6580_0001": {
-		"load_rate": 12.0170927,
-		"p": 1324.606567,
-		"tss": 2418437.25,
-		"n": 4256.842285
-	},
-	"N51570JA5_7520_0000": {
-		"load_rate": 3.757080793,
-		"p": 459.6436462,
-		"tss": 1707213.375,
-		"n": 1392.939819
-	},
-	"N54077GY0_4531_4532": {
-		"load_rate": 43.41485977,
-		"p": 3712.792236,
-		"tss": 16876676.0,
-		"n": 18035.41406
-	},
-	"N51710JB0_7382_0000": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N42033SW3_1800_1650": {
-		"load_rate": 21.1330452,
-		"p": 2697.253174,
-		"tss": 8835790.0,
-		"n": 7412.598633
-	},
-	"N51125JL1_7200_7250": {
-		"load_rate": 18.95210648,
-		"p": 1508.500244,
-		"tss": 4056781.0,
-		"n": 6589.950684
-	},
-	"N10003EU0_3201_0000": {
-		"load_rate": 8.061506271,
-		"p": 530.5286865,
-		"tss": 1521325.875,
-		"n": 2648.019775
-	},
-	"N51171PS1_4790_4830": {
-		"load_rate": 49.71162701,
-		"p": 4052.911133,
-		"tss": 14081687.5,
-		"n": 19852.4458
-	},
-	"N24015SL9_2971_0000": {
-		"load_rate": 3.842540527,
-		"p": 365.1801798,
-		"tss": 1051358.307,
-		"n": 1156.68054
-	},
-	"N36043SU2_0030_0140": {
-		"load_rate": 5.928317547,
-		"p": 430.3086548,
-		"tss": 1943375.875,
-		"n": 1789.914917
-	},
-	"N42047SW5_1540_1400": {
-		"load_rate": 14.08077526,
-		"p": 1516.123657,
-		"tss": 3615929.25,
-		"n": 4919.645996
-	},
-	"N24023GY0_4240_3951": {
-		"load_rate": 47.4783783,
-		"p": 4034.94751,
-		"tss": 28698398.0,
-		"n": 17332.16797
-	},
-	"N24045EL2_5270_0001": {
-		"load_rate": 25.97115326,
-		"p": 2069.811279,
-		"tss": 5815468.0,
-		"n": 7805.594727
-	},
-	"N42109SL8_1760_1780": {
-		"load_rate": 10.98259449,
-		"p": 604.2346802,
-		"tss": 4520092.0,
-		"n": 1706.881592
-	},
-	"N10001DE0_4230_0000": {
-		"load_rate": 55.86013412,
-		"p": 3009.91333,
-		"tss": 9804661.0,
-		"n": 30211.42383
-	},
-	"N36015SU2_0470_0590": {
-		"load_rate": 1.621765733,
-		"p": 167.0265656,
-		"tss": 529553.5625,
-		"n": 598.1709595
-	},
-	"N24005WM0_3650_0001": {
-		"load_rate": 47.24534214,
-		"p": 4559.865913,
-		"tss": 24535495.56,
-		"n": 16718.40283
-	},
-	"N51033YM4_6620_0001": {
-		"load_rate": 11.79640007,
-		"p": 1090.873047,
-		"tss": 3619611.25,
-		"n": 4745.396973
-	},
-	"N42035SW1_1560_1460": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N42117SW3_1040_1220": {
-		"load_rate": 58.18498993,
-		"p": 5210.055664,
-		"tss": 14536756.0,
-		"n": 21008.12695
-	},
-	"N51580JU4_7000_7300": {
-		"load_rate": 2.72467804,
-		"p": 73.59901428,
-		"tss": 1007142.125,
-		"n": 753.9967041
-	},
-	"N24023PU1_3850_4190": {
-		"load_rate": 59.11328888,
-		"p": 5403.960449,
-		"tss": 18305662.0,
-		"n": 20284.58203
-	},
-	"N24037XL0_4955_0000": {
-		"load_rate": 3.221241856,
-		"p": 321.9234302,
-		"tss": 2167353.188,
-		"n": 1181.470425
-	},
-	"H42115SU1_0660_0710": {
-		"load_rate": 2.659176826,
-		"p": 221.358963,
-		"tss": 656064.0,
-		"n": 787.4545898
-	},
-	"N51059PL7_4981_0000": {
-		"load_rate": 31.10771525,
-		"p": 2994.657867,
-		"tss": 10943120.66,
-		"n": 6327.707458
-	},
-	"N51165PS2_6420_6360": {
-		"load_rate": 4.559424162,
-		"p": 559.2312164,
-		"tss": 1495080.828,
-		"n": 2154.40184
-	},
-	"N51710JB0_7381_0000": {
-		"load_rate": 5.02521662,
-		"p": 784.7274384,
-		"tss": 2288769.006,
-		"n": 1452.520626
-	},
-	"N24025WU1_3240_3331": {
-		"load_rate": 44.23082736,
-		"p": 3835.862507,
-		"tss": 16696903.06,
-		"n": 15542.4222
-	},
-	"N51079JL2_6240_6520": {
-		"load_rate": 35.40424728,
-		"p": 3122.080811,
-		"tss": 11973700.0,
-		"n": 12342.04297
-	},
-	"N42015SU7_0720_0750": {
-		"load_rate": 12.42488766,
-		"p": 716.9772949,
-		"tss": 3303819.0,
-		"n": 2883.340332
-	},
-	"N24043PU1_3030_3440": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N51550JB0_7382_0000": {
-		"load_rate": 18.09180727,
-		"p": 1643.490878,
-		"tss": 5858530.369,
-		"n": 5892.793127
-	},
-	"N51097YM1_6370_6620": {
-		"load_rate": 21.6374054,
-		"p": 2101.052734,
-		"tss": 3190856.75,
-		"n": 7480.603027
-	},
-	"N51073YL0_6872_0000": {
-		"load_rate": 6.930252552,
-		"p": 637.0752563,
-		"tss": 1382158.25,
-		"n": 2511.268066
-	},
-	"N42131SU2_1020_0980": {
-		"load_rate": 53.99601746,
-		"p": 4611.743652,
-		"tss": 16168305.0,
-		"n": 16843.26563
-	},
-	"N42035SW6_1330_1230": {
-		"load_rate": 40.2290802,
-		"p": 2038.743896,
-		"tss": 12176874.0,
-		"n": 13138.25195
-	},
-	"N51159RL0_6501_0000": {
-		"load_rate": 102.4897995,
-		"p": 6374.138184,
-		"tss": 16637980.0,
-		"n": 34145.21484
-	},
-	"N51181JB0_7271_0000": {
-		"load_rate": 7.164521694,
-		"p": 734.8065186,
-		"tss": 1822655.0,
-		"n": 2471.967529
-	},
-	"N24041EM2_4101_0000": {
-		"load_rate": 24.58125496,
-		"p": 1214.132568,
-		"tss": 4649368.5,
-		"n": 7847.48877
-	},
-	"N42079SU2_1210_1310": {
-		"load_rate": 0.5902839303,
-		"p": 42.58629608,
-		"tss": 167118.0781,
-		"n": 171.0986328
-	},
-	"N24037PL0_5951_0000": {
-		"load_rate": 2.400882244,
-		"p": 184.9082947,
-		"tss": 659710.4375,
-		"n": 844.4486084
-	},
-	"N24021PM2_2860_3040": {
-		"load_rate": 0.009826079942,
-		"p": 0.642334044,
-		"tss": 23733.44727,
-		"n": 3.250086069
-	},
-	"N11001PL1_4780_0001": {
-		"load_rate": 8.501846313,
-		"p": 863.0255661,
-		"tss": 6742322.969,
-		"n": 2703.854752
-	},
-	"N24025SL9_2720_0001": {
-		"load_rate": 9.070670778,
-		"p": 762.5522659,
-		"tss": 2762959.953,
-		"n": 2812.018378
-	},
-	"N36025SU2_0100_0230": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N36007SU4_0350_0420": {
-		"load_rate": 52.28725052,
-		"p": 4166.774902,
-		"tss": 17879170.0,
-		"n": 15207.81348
-	},
-	"N42047SW2_1240_1270": {
-		"load_rate": 74.44849396,
-		"p": 7852.788574,
-		"tss": 22432886.0,
-		"n": 26219.90234
-	},
-	"N51085YP3_6470_6690": {
-		"load_rate": 119.9616013,
-		"p": 11919.69434,
-		"tss": 29609686.0,
-		"n": 45112.01563
-	},
-	"N36023SU2_0120_0260": {
-		"load_rate": 133.148056,
-		"p": 9743.696289,
-		"tss": 36271668.0,
-		"n": 36388.88672
-	},
-	"N24005WM0_3741_0000": {
-		"load_rate": 11.24918112,
-		"p": 1192.841988,
-		"tss": 7329502.0,
-		"n": 3941.92981
-	},
-	"N36077SU3_0140_0180": {
-		"load_rate": 35.34371567,
-		"p": 2413.826172,
-		"tss": 9098858.0,
-		"n": 9859.607422
-	},
-	"N42013SJ2_2570_2660": {
-		"load_rate": 2.607024193,
-		"p": 190.5058746,
-		"tss": 522334.0,
-		"n": 962.3787231
-	},
-	"L51023JU4_7000_7300": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N42109SJ6_1930_1970": {
-		"load_rate": 7.294341087,
-		"p": 796.9624023,
-		"tss": 2026055.375,
-		"n": 2935.593994
-	},
-	"N54057PU5_3930_4170": {
-		"load_rate": 13.8559866,
-		"p": 1240.139282,
-		"tss": 3809179.0,
-		"n": 5265.056641
-	},
-	"N54065PU6_3640_3600": {
-		"load_rate": 11.87266064,
-		"p": 1123.623779,
-		"tss": 3466980.75,
-		"n": 4520.371582
-	},
-	"N24013PM3_3040_3340": {
-		"load_rate": 33.36988197,
-		"p": 2044.663776,
-		"tss": 8147333.359,
-		"n": 11130.16771
-	},
-	"N51101YP0_6782_0000": {
-		"load_rate": 25.23195612,
-		"p": 1870.915161,
-		"tss": 2544951.625,
-		"n": 6761.846695
-	},
-	"N51135ZZ0_9999_9999": {
-		"load_rate": 200.5428925,
-		"p": 20380.875,
-		"tss": 70667000.0,
-		"n": 73762.35938
-	},
-	"N51007JA4_7340_7470": {
-		"load_rate": 0.08631552756,
-		"p": 10.42000961,
-		"tss": 56414.25781,
-		"n": 36.26858139
-	},
-	"N42099SL3_2290_2260": {
-		"load_rate": 237.7553101,
-		"p": 23321.47266,
-		"tss": 59392068.0,
-		"n": 92097.03906
-	},
-	"N42099SJ6_2130_2050": {
-		"load_rate": 50.45714951,
-		"p": 5047.668945,
-		"tss": 14723340.0,
-		"n": 19395.13281
-	},
-	"N42021ZZ0_9999_9999": {
-		"load_rate": 462.6085048,
-		"p": 44076.27514,
-		"tss": 299271630.1,
-		"n": 162677.029
-	},
-	"N24003WM0_3961_0000": {
-		"load_rate": 40.10242558,
-		"p": 4512.877342,
-		"tss": 15824889.48,
-		"n": 8287.229774
-	},
-	"N36107SU1_0390_0560": {
-		"load_rate": 82.485466,
-		"p": 6466.01709,
-		"tss": 21898748.0,
-		"n": 24582.17969
-	},
-	"N24510WM0_3960_0000": {
-		"load_rate": 0.583609581,
-		"p": 66.14335632,
-		"tss": 6936962.5,
-		"n": 198.1663666
-	},
-	"N51131DE0_6980_0000": {
-		"load_rate": 37.29706192,
-		"p": 2990.821533,
-		"tss": 5386356.0,
-		"n": 13460.0791
-	},
-	"N24005WM0_3881_3880": {
-		"load_rate": 30.91636363,
-		"p": 2746.229385,
-		"tss": 10743560.94,
-		"n": 10726.1053
-	},
-	"N51163JU1_6880_7260": {
-		"load_rate": 108.3332586,
-		"p": 10600.22853,
-		"tss": 34952855.75,
-		"n": 39089.39726
-	},
-	"N51099PL0_5903_0000": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"L54071PU2_6050_5190": {
-		"load_rate": 12.55104071,
-		"p": 1068.604304,
-		"tss": 3124450.117,
-		"n": 4325.59938
-	},
-	"N54027PU3_3860_3610": {
-		"load_rate": 26.81893349,
-		"p": 2452.432129,
-		"tss": 5990819.5,
-		"n": 9842.260742
-	},
-	"N51069PU2_3630_3590": {
-		"load_rate": 29.10886383,
-		"p": 3133.94873,
-		"tss": 8626177.0,
-		"n": 11299.0332
-	},
-	"N24009XL0_5346_0000": {
-		"load_rate": 10.2745142,
-		"p": 851.7521973,
-		"tss": 2812219.25,
-		"n": 3707.583984
-	},
-	"N42115SU2_0780_0710": {
-		"load_rate": 52.90010834,
-		"p": 4157.784668,
-		"tss": 13768430.0,
-		"n": 15753.10449
-	},
-	"N51115YL0_6581_0000": {
-		"load_rate": 0.8943228722,
-		"p": 106.9404373,
-		"tss": 223347.1094,
-		"n": 330.9118652
-	},
-	"N51045ZZ0_9999_9999": {
-		"load_rate": 62.23434925,
-		"p": 5920.215302,
-		"tss": 22279313.69,
-		"n": 23255.54614
-	},
-	"N36017SU4_0270_0430": {
-		"load_rate": 210.1955719,
-		"p": 12983.80566,
-		"tss": 57632852.0,
-		"n": 60175.78125
-	},
-	"N51107PM2_4860_4670": {
-		"load_rate": 28.91137314,
-		"p": 2157.821777,
-		"tss": 7658718.0,
-		"n": 9859.746094
-	},
-	"N42033SW4_1940_1860": {
-		"load_rate": 17.68815613,
-		"p": 2694.739502,
-		"tss": 5897011.0,
-		"n": 6884.60498
-	},
-	"N24019EL0_5890_0000": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N42015SU7_0860_0960": {
-		"load_rate": 113.8385086,
-		"p": 9337.017578,
-		"tss": 26386082.0,
-		"n": 36235.39453
-	},
-	"H51023JU5_7420_7160": {
-		"load_rate": 40.61170936,
-		"p": 4760.300095,
-		"tss": 12550311.75,
-		"n": 14717.91858
-	},
-	"N51095JB0_7391_0000": {
-		"load_rate": 2.324597836,
-		"p": 74.37160492,
-		"tss": 426807.7813,
-		"n": 202.2993011
-	},
-	"N42133SL9_2310_2430": {
-		"load_rate": 23.79857063,
-		"p": 1990.737061,
-		"tss": 10279608.0,
-		"n": 8642.139648
-	},
-	"N42117SU2_0890_0900": {
-		"load_rate": 10.4213953,
-		"p": 935.0639038,
-		"tss": 2892510.5,
-		"n": 3782.106689
-	},
-	"N24041EM4_4740_0000": {
-		"load_rate": 21.44818306,
-		"p": 681.2537231,
-		"tss": 4021377.5,
-		"n": 6178.130371
-	},
-	"N42097SU1_1630_1610": {
-		"load_rate": 8.155822754,
-		"p": 955.1608887,
-		"tss": 2321577.5,
-		"n": 3167.444336
-	},
-	"N24009XL0_5345_0000": {
-		"load_rate": 8.760434151,
-		"p": 855.3259277,
-		"tss": 2792710.0,
-		"n": 3259.856934
-	},
-	"N24017PL0_5581_0000": {
-		"load_rate": 13.54481775,
-		"p": 415.1321487,
-		"tss": 4568816.008,
-		"n": 1111.260086
-	},
-	"N42061SJ5_2210_2320": {
-		"load_rate": 52.4201355,
-		"p": 5486.948242,
-		"tss": 14412880.0,
-		"n": 18978.41992
-	},
-	"N24033PL1_5060_0000": {
-		"load_rate": 27.12143236,
-		"p": 2717.354126,
-		"tss": 10222400.47,
-		"n": 9330.409698
-	},
-	"N51179PL0_5494_0000": {
-		"load_rate": 1.201966686,
-		"p": 143.8381643,
-		"tss": 395347.6631,
-		"n": 435.2351875
-	},
-	"N42097SW7_1680_1760": {
-		"load_rate": 6.893960953,
-		"p": 6262.930176,
-		"tss": 2570049.0,
-		"n": 3856.314941
-	},
-	"N42071SL9_2720_0001": {
-		"load_rate": 104.6282578,
-		"p": 12773.07129,
-		"tss": 27508962.0,
-		"n": 37108.48438
-	},
-	"N24047DE0_5420_0000": {
-		"load_rate": 27.79713631,
-		"p": 1071.965332,
-		"tss": 7494134.625,
-		"n": 6064.40979
-	},
-	"L42113SW3_1060_1260": {
-		"load_rate": 48.09191513,
-		"p": 4234.279785,
-		"tss": 11800505.0,
-		"n": 16731.43164
-	},
-	"N54071PU0_6080_5620": {
-		"load_rate": 86.40287122,
-		"p": 7045.110348,
-		"tss": 21815247.11,
-		"n": 30031.32005
-	},
-	"N36077SU1_0060_0190": {
-		"load_rate": 114.4756851,
-		"p": 6781.348145,
-		"tss": 26407388.0,
-		"n": 31127.38086
-	},
-	"N24013WM1_3882_3880": {
-		"load_rate": 78.49007756,
-		"p": 4226.814079,
-		"tss": 24336663.69,
-		"n": 24280.89325
-	},
-	"N51015PS2_6730_6660": {
-		"load_rate": 126.8998642,
-		"p": 11580.29175,
-		"tss": 30452278.0,
-		"n": 42974.17676
-	},
-	"N24017PL0_5720_0001": {
-		"load_rate": 18.63395408,
-		"p": 1809.328569,
-		"tss": 5648671.148,
-		"n": 7123.989513
-	},
-	"N42055SJ3_2160_2170": {
-		"load_rate": 34.34779739,
-		"p": 4036.654541,
-		"tss": 9035838.0,
-		"n": 13936.17578
-	},
-	"N42023SW3_1090_1091": {
-		"load_rate": 14.95196056,
-		"p": 1690.393677,
-		"tss": 4173513.25,
-		"n": 5228.574707
-	},
-	"N51145JA0_7291_7290": {
-		"load_rate": 12.80467987,
-		"p": 1915.371094,
-		"tss": 5647556.0,
-		"n": 5279.737793
-	},
-	"N51005JU4_7330_7000": {
-		"load_rate": 11.79747391,
-		"p": 1380.848083,
-		"tss": 3954358.25,
-		"n": 4471.730469
-	},
-	"N51003YP3_6470_6690": {
-		"load_rate": 10.08303261,
-		"p": 656.4744263,
-		"tss": 2137366.75,
-		"n": 3364.999268
-	},
-	"N10005EL0_4562_0001": {
-		"load_rate": 9.42747879,
-		"p": 487.6571045,
-		"tss": 1286994.125,
-		"n": 2935.041992
-	},
-	"N24005WM1_3910_0001": {
-		"load_rate": 16.36606461,
-		"p": 1776.343105,
-		"tss": 8582546.531,
-		"n": 5725.688354
-	},
-	"N42079SU2_1020_0980": {
-		"load_rate": 8.683494568,
-		"p": 744.8432007,
-		"tss": 3336526.25,
-		"n": 2657.167725
-	},
-	"N36101SU4_0690_0650": {
-		"load_rate": 33.83108902,
-		"p": 2978.915527,
-		"tss": 12390670.0,
-		"n": 12982.0498
-	},
-	"N24035EM2_4100_0001": {
-		"load_rate": 88.03384399,
-		"p": 4580.57666,
-		"tss": 21228966.0,
-		"n": 30201.85938
-	},
-	"N42057SJ4_2740_2660": {
-		"load_rate": 43.93434906,
-		"p": 4687.632324,
-		"tss": 12718019.0,
-		"n": 16407.86523
-	},
-	"N24037PL0_5982_0000": {
-		"load_rate": 14.23027635,
-		"p": 1208.574051,
-		"tss": 4051575.578,
-		"n": 5405.922668
-	},
-	"N24043PU0_3751_3752": {
-		"load_rate": 15.42423413,
-		"p": 1417.010217,
-		"tss": 4755381.848,
-		"n": 5475.754623
-	},
-	"N36017SU3_0090_0170": {
-		"load_rate": 59.24966812,
-		"p": 3535.70752,
-		"tss": 15574434.0,
-		"n": 15699.29395
-	},
-	"N24031PM7_4820_0001": {
-		"load_rate": 7.437625802,
-		"p": 611.6300278,
-		"tss": 5807378.309,
-		"n": 2365.309965
-	},
-	"N51005JU3_6650_7300": {
-		"load_rate": 70.50010681,
-		"p": 7978.271729,
-		"tss": 22179644.0,
-		"n": 26421.18555
-	},
-	"N42093SU8_1610_1530": {
-		"load_rate": 25.78869057,
-		"p": 2153.661621,
-		"tss": 7332098.5,
-		"n": 8990.671875
-	},
-	"N42133SL2_2910_3060": {
-		"load_rate": 29.38793564,
-		"p": 2150.224365,
-		"tss": 9604398.0,
-		"n": 10514.62695
-	},
-	"N36107SU5_0600_0750": {
-		"load_rate": 3.784367323,
-		"p": 1399.758423,
-		"tss": 1260421.875,
-		"n": 935.4073486
-	},
-	"N51650JB0_7390_0000": {
-		"load_rate": 4.135288239,
-		"p": 545.3914185,
-		"tss": 1244299.0,
-		"n": 1600.955566
-	},
-	"N42075SL4_2090_2100": {
-		"load_rate": 33.15268469,
-		"p": 3382.859314,
-		"tss": 11376363.63,
-		"n": 12079.8811
-	},
-	"N42069SU2_0780_0710": {
-		"load_rate": 10.51479912,
-		"p": 1144.505005,
-		"tss": 3078397.75,
-		"n": 3803.252197
-	},
-	"N51171PS3_5100_5080": {
-		"load_rate": 137.6780539,
-		"p": 10777.71875,
-		"tss": 49367231.5,
-		"n": 45861.2583
-	},
-	"N24017PL0_5860_0000": {
-		"load_rate": 1.282803601,
-		"p": 143.117314,
-		"tss": 381731.6685,
-		"n": 452.0844978
-	},
-	"N51131EL0_6920_0000": {
-		"load_rate": 13.62944508,
-		"p": 804.0910645,
-		"tss": 2065160.5,
-		"n": 4760.429199
-	},
-	"N42081SW3_1040_1220": {
-		"load_rate": 133.029541,
-		"p": 13020.30176,
-		"tss": 32055428.0,
-		"n": 44727.85547
-	},
-	"N24031XU2_4330_4480": {
-		"load_rate": 45.65382914,
-		"p": 4438.038342,
-		"tss": 16170197.38,
-		"n": 15425.89153
-	},
-	"N24005WM3_3880_4060": {
-		"load_rate": 26.81524083,
-		"p": 2546.001584,
-		"tss": 11144787.11,
-		"n": 9951.565478
-	},
-	"N24029EU0_3700_0000": {
-		"load_rate": 3.889458418,
-		"p": 314.9981995,
-		"tss": 1244969.125,
-		"n": 1257.64978
-	},
-	"N36077SU2_0040_0180": {
-		"load_rate": 122.4665833,
-		"p": 8735.785156,
-		"tss": 30435756.0,
-		"n": 34464.28125
-	},
-	"N42027SJ4_2010_2210": {
-		"load_rate": 6.847062111,
-		"p": 662.3726807,
-		"tss": 1333027.375,
-		"n": 2279.02417
-	},
-	"N51073YL0_6930_0000": {
-		"load_rate": 51.44697571,
-		"p": 5089.614258,
-		"tss": 10128531.0,
-		"n": 18403.9375
-	},
-	"N36107SU2_0560_0590": {
-		"load_rate": 13.45216942,
-		"p": 1115.462036,
-		"tss": 3680110.5,
-		"n": 4086.92627
-	},
-	"N51800JB0_7390_0000": {
-		"load_rate": 13.73235989,
-		"p": 913.5231934,
-		"tss": 2713538.75,
-		"n": 2079.295898
-	},
-	"N51159RL5_6321_0000": {
-		"load_rate": 31.06703162,
-		"p": 2146.383606,
-		"tss": 5253569.0,
-		"n": 10103.73584
-	},
-	"N42009PU1_3100_3690": {
-		"load_rate": 80.64225006,
-		"p": 7490.085938,
-		"tss": 22177380.0,
-		"n": 28607.18945
-	},
-	"N51710JB0_7398_0000": {
-		"load_rate": 0.1342049241,
-		"p": 9.579131126,
-		"tss": 294453.7188,
-		"n": 13.47301769
-	},
-	"N42015SU7_0550_0540": {
-		"load_rate": 4.526268005,
-		"p": 414.9020996,
-		"tss": 1013280.438,
-		"n": 1519.265625
-	},
-	"N24035EU0_4260_0000": {
-		"load_rate": 23.40326881,
-		"p": 1120.750488,
-		"tss": 5943329.0,
-		"n": 7654.770508
-	},
-	"N51061RU4_5640_6030": {
-		"load_rate": 143.6904099,
-		"p": 12566.06396,
-		"tss": 28536673.0,
-		"n": 46741.32738
-	},
-	"N51065JL4_6710_6740": {
-		"load_rate": 89.24469757,
-		"p": 7633.393066,
-		"tss": 23303984.0,
-		"n": 31095.02148
-	},
-	"N24017PL1_5230_0001": {
-		"load_rate": 41.85999417,
-		"p": 4798.393372,
-		"tss": 17351713.92,
-		"n": 17551.80098
-	},
-	"N42029SL2_2480_0001": {
-		"load_rate": 84.62459564,
-		"p": 8227.267578,
-		"tss": 29001600.0,
-		"n": 31239.53906
-	},
-	"N54057PU2_4360_4160": {
-		"load_rate": 172.3863831,
-		"p": 14841.11621,
-		"tss": 48752168.0,
-		"n": 64974.625
-	},
-	"N24025WU0_3164_0000": {
-		"load_rate": 8.734270096,
-		"p": 889.3690186,
-		"tss": 2391686.75,
-		"n": 2735.335205
-	},
-	"N42083SW2_1240_1270": {
-		"load_rate": 5.327492237,
-		"p": 621.5418091,
-		"tss": 1564699.5,
-		"n": 1939.539795
-	},
-	"N51069PS1_4790_4830": {
-		"load_rate": 87.23013306,
-		"p": 8281.407745,
-		"tss": 23595088.06,
-		"n": 34891.99414
-	},
-	"N51001EL0_5896_0000": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N54031PU2_4340_3860": {
-		"load_rate": 50.47625351,
-		"p": 5571.414551,
-		"tss": 12600583.0,
-		"n": 17512.7207
-	},
-	"N42055SL2_2540_2370": {
-		"load_rate": 114.1951141,
-		"p": 12560.21802,
-		"tss": 31158176.0,
-		"n": 44581.24609
-	},
-	"N51177YM3_6430_6620": {
-		"load_rate": 16.00267792,
-		"p": 1683.465332,
-		"tss": 3543474.0,
-		"n": 5786.543945
-	},
-	"H42013SW3_1870_1800": {
-		"load_rate": 0.5992900729,
-		"p": 64.93585205,
-		"tss": 155229.0,
-		"n": 209.5144501
-	},
-	"N42133SL3_2730_2550": {
-		"load_rate": 5.343129158,
-		"p": 215.9441376,
-		"tss": 2790403.75,
-		"n": 1689.778198
-	},
-	"N24005WM1_3660_3910": {
-		"load_rate": 37.52429271,
-		"p": 4082.747713,
-		"tss": 20905787.64,
-		"n": 14147.27561
-	},
-	"N51057RL5_6072_0000": {
-		"load_rate": 0.9915925264,
-		"p": 74.47212982,
-		"tss": 199249.2031,
-		"n": 350.9595337
-	},
-	"H42115SU2_0780_0710": {
-		"load_rate": 7.560651302,
-		"p": 683.9143066,
-		"tss": 2050921.375,
-		"n": 2328.432129
-	},
-	"N10005EL0_4631_0000": {
-		"load_rate": 63.78329849,
-		"p": 4036.429932,
-		"tss": 10523035.0,
-		"n": 23376.89063
-	},
-	"N24015EU1_2984_0000": {
-		"load_rate": 8.714151943,
-		"p": 834.3599235,
-		"tss": 3313660.262,
-		"n": 3294.136087
-	},
-	"N54065PU6_3530_3440": {
-		"load_rate": 19.92944336,
-		"p": 1028.411133,
-		"tss": 7023796.5,
-		"n": 5657.35791
-	},
-	"N51017JU4_7000_7300": {
-		"load_rate": 36.81156445,
-		"p": 4270.549561,
-		"tss": 10445007.5,
-		"n": 13443.53906
-	},
-	"N51109JL7_6800_7070": {
-		"load_rate": 3.189558983,
-		"p": 363.7399902,
-		"tss": 906798.5,
-		"n": 1242.895142
-	},
-	"N42117SU3_0790_0770": {
-		"load_rate": 42.06722116,
-		"p": 3929.14447,
-		"tss": 11519954.0,
-		"n": 15150.83142
-	},
-	"N42023SW2_1240_1270": {
-		"load_rate": 120.5152359,
-		"p": 10177.0293,
-		"tss": 29448240.0,
-		"n": 37475.61328
-	},
-	"N24023GY0_3952_0000": {
-		"load_rate": 54.02641225,
-		"p": 5798.887756,
-		"tss": 22502081.88,
-		"n": 19081.21838
-	},
-	"N36023SU3_0240_0350": {
-		"load_rate": 80.71551514,
-		"p": 5840.605957,
-		"tss": 22756928.0,
-		"n": 22694.36523
-	},
-	"N42027SJ3_1980_2060": {
-		"load_rate": 46.12869644,
-		"p": 3084.208252,
-		"tss": 9135036.0,
-		"n": 15598.46777
-	},
-	"N42067SL8_1880_2030": {
-		"load_rate": 37.72393799,
-		"p": 3260.315674,
-		"tss": 8420335.0,
-		"n": 13481.33984
-	},
-	"N51029JL6_6990_6960": {
-		"load_rate": 23.33953667,
-		"p": 2841.775146,
-		"tss": 7492574.0,
-		"n": 9201.139648
-	},
-	"N51163JU4_7260_7380": {
-		"load_rate": 36.87109566,
-		"p": 4018.343262,
-		"tss": 12386553.0,
-		"n": 13678.69189
-	},
-	"L51023JU3_7400_7510": {
-		"load_rate": 9.550685167,
-		"p": 1052.095734,
-		"tss": 2887158.188,
-		"n": 3494.358032
-	},
-	"N51059PL3_5250_0001": {
-		"load_rate": 26.55978012,
-		"p": 3195.716797,
-		"tss": 8684046.0,
-		"n": 9786.974609
-	},
-	"N24015EU0_3202_0000": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N42071SL3_2470_2420": {
-		"load_rate": 1.522192717,
-		"p": 108.7282562,
-		"tss": 4344109.0,
-		"n": 678.9438477
-	},
-	"N24019EL0_5590_0000": {
-		"load_rate": 11.38018048,
-		"p": 1051.382309,
-		"tss": 2903129.938,
-		"n": 3562.795319
-	},
-	"N24045EL0_5762_0000": {
-		"load_rate": 10.38285923,
-		"p": 846.157959,
-		"tss": 2418040.0,
-		"n": 3228.493408
-	},
-	"N42131SU3_0710_0910": {
-		"load_rate": 34.93340683,
-		"p": 2915.465576,
-		"tss": 12501124.0,
-		"n": 10819.62695
-	},
-	"N42133WU0_3021_3020": {
-		"load_rate": 3.927890062,
-		"p": 296.7173462,
-		"tss": 1303697.875,
-		"n": 1432.252441
-	},
-	"N24005WM0_3745_0000": {
-		"load_rate": 3.528782606,
-		"p": 344.3040771,
-		"tss": 1040985.875,
-		"n": 1240.108643
-	},
-	"N24001PU2_3140_3680": {
-		"load_rate": 6.003689289,
-		"p": 569.2766113,
-		"tss": 1914169.125,
-		"n": 2099.039795
-	},
-	"N24035EU0_3722_0000": {
-		"load_rate": 23.27466202,
-		"p": 1152.061768,
-		"tss": 5772080.5,
-		"n": 8081.423828
-	},
-	"N51153PL0_5492_0000": {
-		"load_rate": 3.835263476,
-		"p": 461.2888584,
-		"tss": 2073145.297,
-		"n": 1388.624786
-	},
-	"N24015EU1_2981_0000": {
-		"load_rate": 7.289494053,
-		"p": 716.3952923,
-		"tss": 2905747.313,
-		"n": 2611.565933
-	},
-	"N24023GY0_3950_3952": {
-		"load_rate": 55.70332718,
-		"p": 4407.647949,
-		"tss": 23171778.0,
-		"n": 22338.00195
-	},
-	"N42093SW1_1450_1510": {
-		"load_rate": 51.22809601,
-		"p": 2871.100586,
-		"tss": 9719883.0,
-		"n": 17168.39063
-	},
-	"N42083SW1_1170_1270": {
-		"load_rate": 25.59747314,
-		"p": 2779.928955,
-		"tss": 7343841.5,
-		"n": 9029.800781
-	},
-	"L54023PU1_5380_5050": {
-		"load_rate": 5.495126247,
-		"p": 642.0923462,
-		"tss": 1680365.125,
-		"n": 1986.430908
-	},
-	"N24029EU0_3570_0000": {
-		"load_rate": 21.63991928,
-		"p": 1436.18396,
-		"tss": 5062262.0,
-		"n": 6939.096191
-	},
-	"N36077SU4_0250_0340": {
-		"load_rate": 67.71094513,
-		"p": 4291.875488,
-		"tss": 16241391.0,
-		"n": 18563.75391
-	},
-	"N51099PL0_5920_0000": {
-		"load_rate": 52.36357808,
-		"p": 4406.049957,
-		"tss": 15203560.88,
-		"n": 17299.84937
-	},
-	"N51015JU1_6880_7260": {
-		"load_rate": 16.84244657,
-		"p": 1632.99118,
-		"tss": 4136151.813,
-		"n": 5832.144165
-	},
-	"N24025WU1_3482_0001": {
-		"load_rate": 43.15267232,
-		"p": 2569.158619,
-		"tss": 15030147.31,
-		"n": 13921.13995
-	},
-	"N51091JU1_6290_6590": {
-		"load_rate": 31.66739178,
-		"p": 3006.313599,
-		"tss": 10013966.5,
-		"n": 11483.87891
-	},
-	"N36107SU7_0540_0720": {
-		"load_rate": 172.7327118,
-		"p": 13540.60938,
-		"tss": 48507888.0,
-		"n": 51282.00391
-	},
-	"N51085YP3_6330_6700": {
-		"load_rate": 34.47545904,
-		"p": 3018.847794,
-		"tss": 9016259.75,
-		"n": 13210.75201
-	},
-	"N24043PU3_2510_3290": {
-		"load_rate": 0.4995152354,
-		"p": 59.30204391,
-		"tss": 149912.875,
-		"n": 191.3760681
-	},
-	"N36017SU5_0400_0460": {
-		"load_rate": 9.726571083,
-		"p": 688.7939453,
-		"tss": 3025622.5,
-		"n": 2727.241211
-	},
-	"N51001EL0_6610_0000": {
-		"load_rate": 38.93689346,
-		"p": 2646.194824,
-		"tss": 5919837.5,
-		"n": 13978.99609
-	},
-	"N42087SJ5_2210_2320": {
-		"load_rate": 5.646029949,
-		"p": 498.5272522,
-		"tss": 1453481.0,
-		"n": 1865.603271
-	},
-	"N51145JA4_7280_7340": {
-		"load_rate": 71.40394592,
-		"p": 7920.050781,
-		"tss": 17969612.0,
-		"n": 25677.79297
-	},
-	"N24035EM2_3980_0001": {
-		"load_rate": 2.520580053,
-		"p": 138.0108948,
-		"tss": 617962.75,
-		"n": 910.5783081
-	},
-	"N42033SW3_1870_1800": {
-		"load_rate": 200.3500977,
-		"p": 20929.26563,
-		"tss": 60703160.0,
-		"n": 67409.83594
-	},
-	"N42075SL2_2070_2090": {
-		"load_rate": 23.23933722,
-		"p": 2455.179089,
-		"tss": 7718418.555,
-		"n": 8533.28476
-	},
-	"N24045EL0_5761_0000": {
-		"load_rate": 16.09228134,
-		"p": 1355.70813,
-		"tss": 4043924.75,
-		"n": 5145.092773
-	},
-	"N51109YP3_6690_6720": {
-		"load_rate": 1.579208612,
-		"p": 201.9049683,
-		"tss": 483996.9375,
-		"n": 628.418396
-	},
-	"N42061SL3_1710_1740": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N51029JL6_7320_7150": {
-		"load_rate": 48.93508911,
-		"p": 5829.899902,
-		"tss": 14654715.0,
-		"n": 18441.89063
-	},
-	"N51137RU3_6170_6040": {
-		"load_rate": 13.98666382,
-		"p": 1191.213257,
-		"tss": 3423380.75,
-		"n": 4503.116211
-	},
-	"N51075JL7_6800_7070": {
-		"load_rate": 279.9602661,
-		"p": 28164.08984,
-		"tss": 77352392.0,
-		"n": 108961.6797
-	},
-	"N51061PM2_4860_4670": {
-		"load_rate": 124.0303063,
-		"p": 10124.19661,
-		"tss": 26983981.75,
-		"n": 40244.22177
-	},
-	"N54077GY0_3951_3952": {
-		"load_rate": 13.1891613,
-		"p": 1177.945557,
-		"tss": 4975934.0,
-		"n": 5607.644531
-	},
-	"N24047EL1_5430_0001": {
-		"load_rate": 11.13642693,
-		"p": 1032.824829,
-		"tss": 2125774.75,
-		"n": 3449.590088
-	},
-	"N24043PU6_3690_3610": {
-		"load_rate": 12.65701595,
-		"p": 1275.782421,
-		"tss": 3409170.195,
-		"n": 4258.707932
-	},
-	"N51127YP0_6783_0000": {
-		"load_rate": 2.826946259,
-		"p": 382.8286743,
-		"tss": 663007.4375,
-		"n": 855.354187
-	},
-	"N51097YL2_6580_0001": {
-		"load_rate": 96.88234711,
-		"p": 8744.391602,
-		"tss": 15524326.0,
-		"n": 33445.35938
-	},
-	"N51678JU3_6790_7260": {
-		"load_rate": 3.704913855,
-		"p": 146.5485229,
-		"tss": 2510624.0,
-		"n": 1007.651062
-	},
-	"N42057PU6_3440_3590": {
-		"load_rate": 2.372912884,
-		"p": 239.9884186,
-		"tss": 644688.125,
-		"n": 894.9404297
-	},
-	"N36007SU4_0260_0350": {
-		"load_rate": 49.61740875,
-		"p": 3490.054443,
-		"tss": 17625982.0,
-		"n": 14058.04297
-	},
-	"N51163JU3_6790_7260": {
-		"load_rate": 230.2145708,
-		"p": 19411.8355,
-		"tss": 80786027.0,
-		"n": 76933.14723
-	},
-	"N51041JB0_7076_0000": {
-		"load_rate": 14.88979149,
-		"p": 2666.059814,
-		"tss": 5663501.5,
-		"n": 7733.270508
-	},
-	"N24510WM0_3962_0000": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N36107SU2_0440_0550": {
-		"load_rate": 42.9238739,
-		"p": 3418.877686,
-		"tss": 12036772.0,
-		"n": 13113.57422
-	},
-	"N51193PL0_6131_0000": {
-		"load_rate": 1.340768576,
-		"p": 122.3436584,
-		"tss": 420730.625,
-		"n": 422.0368347
-	},
-	"N24041EM0_4875_0000": {
-		"load_rate": 3.241144419,
-		"p": 222.9318848,
-		"tss": 791556.5625,
-		"n": 1041.844116
-	},
-	"N36025ZZ0_9999_9999": {
-		"load_rate": 794.5551734,
-		"p": 64394.96161,
-		"tss": 380255941.3,
-		"n": 246580.2607
-	},
-	"N54023PU1_4760_4451": {
-		"load_rate": 3.818674803,
-		"p": 365.0066528,
-		"tss": 1084273.0,
-		"n": 1357.161133
-	},
-	"N36023SU4_0260_0350": {
-		"load_rate": 142.8300476,
-		"p": 11191.67188,
-		"tss": 44967888.0,
-		"n": 43361.53906
-	},
-	"N42071SL2_2300_2520": {
-		"load_rate": 126.1694107,
-		"p": 12066.64453,
-		"tss": 36070472.0,
-		"n": 41162.92578
-	},
-	"N24025SL9_2971_0000": {
-		"load_rate": 0.04339766875,
-		"p": 4.270062447,
-		"tss": 64384.05859,
-		"n": 11.85079384
-	},
-	"N51017JU1_6290_6590": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N51101YP5_6780_0000": {
-		"load_rate": 107.9605255,
-		"p": 8497.396484,
-		"tss": 18314350.0,
-		"n": 34383.27344
-	},
-	"N24003WM0_3962_0000": {
-		"load_rate": 3.425107267,
-		"p": 105.9146895,
-		"tss": 2177066.984,
-		"n": 801.3055565
-	},
-	"N24031PM1_4251_4250": {
-		"load_rate": 31.24506825,
-		"p": 3062.318275,
-		"tss": 7694566.227,
-		"n": 9582.252655
-	},
-	"L54023PU3_5210_5050": {
-		"load_rate": 1.646243334,
-		"p": 194.6583099,
-		"tss": 572726.5625,
-		"n": 619.8262329
-	},
-	"N51199JB0_7072_0000": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N24001PU1_3850_4190": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N51047RU3_5610_5640": {
-		"load_rate": 65.4603653,
-		"p": 6344.938965,
-		"tss": 16138576.0,
-		"n": 22261.30273
-	},
-	"H54031PU2_5190_4310": {
-		"load_rate": 1.478400111,
-		"p": 172.2107544,
-		"tss": 409442.3438,
-		"n": 547.7381592
-	},
-	"N51049JL7_7030_6800": {
-		"load_rate": 37.1281395,
-		"p": 4266.751465,
-		"tss": 9377536.0,
-		"n": 13521.89746
-	},
-	"N24001PU5_4170_4020": {
-		"load_rate": 2.883274078,
-		"p": 373.8245697,
-		"tss": 893346.2813,
-		"n": 874.7551575
-	},
-	"N51003JL2_6850_6890": {
-		"load_rate": 52.31225204,
-		"p": 5298.074707,
-		"tss": 13178831.0,
-		"n": 19330.18359
-	},
-	"N42001SL3_2400_2440": {
-		"load_rate": 6.950273514,
-		"p": 782.2601318,
-		"tss": 2192397.0,
-		"n": 2617.639648
-	},
-	"N36043SU2_0020_0140": {
-		"load_rate": 26.90237617,
-		"p": 1937.600708,
-		"tss": 8423171.0,
-		"n": 8236.421875
-	},
-	"N42081SW7_1470_1340": {
-		"load_rate": 29.11528397,
-		"p": 1756.999023,
-		"tss": 8950061.0,
-		"n": 8843.396484
-	},
-	"L54023PU2_4360_4160": {
-		"load_rate": 59.22309875,
-		"p": 4597.329102,
-		"tss": 14398908.0,
-		"n": 20920.10547
-	},
-	"N24019EL0_4593_0000": {
-		"load_rate": 5.331255913,
-		"p": 429.1331177,
-		"tss": 1208411.25,
-		"n": 1784.794922
-	},
-	"N24027XU2_4270_4650": {
-		"load_rate": 19.07076705,
-		"p": 1191.907913,
-		"tss": 9898834.0,
-		"n": 3137.33548
-	},
-	"N51177RU4_6040_6030": {
-		"load_rate": 25.11506987,
-		"p": 2881.730774,
-		"tss": 7222080.0,
-		"n": 11196.45508
-	},
-	"N24015EU0_3200_0000": {
-		"load_rate": 11.35064411,
-		"p": 679.2935181,
-		"tss": 2280243.5,
-		"n": 3554.826172
-	},
-	"N42029SL2_2410_2700": {
-		"load_rate": 8.556569099,
-		"p": 931.3415527,
-		"tss": 3217117.25,
-		"n": 3355.501221
-	},
-	"N54057PU4_3990_3780": {
-		"load_rate": 0.04419680685,
-		"p": 4.537901878,
-		"tss": 188018.7344,
-		"n": 16.35019875
-	},
-	"N51059PL7_4962_0000": {
-		"load_rate": 1.636773467,
-		"p": 195.137558,
-		"tss": 1312420.625,
-		"n": 580.3532715
-	},
-	"N24003WL0_4423_0000": {
-		"load_rate": 6.012193453,
-		"p": 268.8575613,
-		"tss": 5480336.539,
-		"n": 1232.579247
-	},
-	"N24019EL2_4634_0000": {
-		"load_rate": 23.29730415,
-		"p": 1590.58728,
-		"tss": 4991880.5,
-		"n": 7579.273438
-	},
-	"N42133SL9_2520_2700": {
-		"load_rate": 102.044014,
-		"p": 7929.922852,
-		"tss": 35634784.0,
-		"n": 40241.49609
-	},
-	"N24013WM3_3880_4060": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"H42131SU2_1020_0980": {
-		"load_rate": 24.13299942,
-		"p": 2687.392578,
-		"tss": 6867191.0,
-		"n": 8381.0
-	},
-	"N10005DE0_4520_0000": {
-		"load_rate": 122.9140873,
-		"p": 7442.335693,
-		"tss": 22886963.0,
-		"n": 63950.09375
-	},
-	"H54023PU1_4840_4760": {
-		"load_rate": 45.0861702,
-		"p": 4745.703613,
-		"tss": 15132917.0,
-		"n": 19530.47461
-	},
-	"N24003WL0_4420_0000": {
-		"load_rate": 37.91597259,
-		"p": 4295.807816,
-		"tss": 13502655.69,
-		"n": 16128.26401
-	},
-	"N24045EL2_5110_5270": {
-		"load_rate": 14.38403511,
-		"p": 1129.115479,
-		"tss": 3138777.75,
-		"n": 4336.653809
-	},
-	"N24019EL0_5283_0000": {
-		"load_rate": 9.380109012,
-		"p": 907.7822399,
-		"tss": 2432683.77,
-		"n": 2854.166615
-	},
-	"N51043PU2_4220_3900": {
-		"load_rate": 22.63942146,
-		"p": 1763.052124,
-		"tss": 5819790.0,
-		"n": 7835.205078
-	},
-	"N24045EL0_5400_0001": {
-		"load_rate": 40.54045486,
-		"p": 4150.679688,
-		"tss": 10454718.0,
-		"n": 12669.85449
-	},
-	"N24011EM3_4325_0000": {
-		"load_rate": 42.38892365,
-		"p": 2882.187988,
-		"tss": 8359795.0,
-		"n": 15324.4375
-	},
-	"N42057SJ4_2360_2340": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N42043SL8_2030_2080": {
-		"load_rate": 9.101831436,
-		"p": 783.2528687,
-		"tss": 2444045.5,
-		"n": 2644.407959
-	},
-	"N36095SU2_0150_0220": {
-		"load_rate": 46.27910614,
-		"p": 3965.36377,
-		"tss": 13733026.0,
-		"n": 15324.44922
-	},
-	"N42009SJ4_2740_2660": {
-		"load_rate": 274.9618225,
-		"p": 24761.7207,
-		"tss": 79140848.0,
-		"n": 100327.1328
-	},
-	"N51177RL5_6070_0000": {
-		"load_rate": 52.58506489,
-		"p": 5057.757248,
-		"tss": 24668848.59,
-		"n": 20331.37798
-	},
-	"N51153PL0_5493_0000": {
-		"load_rate": 14.23751711,
-		"p": 1495.785267,
-		"tss": 5241785.703,
-		"n": 3575.505264
-	},
-	"N42071SL9_2520_2700": {
-		"load_rate": 26.7526722,
-		"p": 3270.425537,
-		"tss": 10101356.0,
-		"n": 10811.12695
-	},
-	"N24041EU0_4475_0000": {
-		"load_rate": 23.10757065,
-		"p": 1238.719238,
-		"tss": 4397269.0,
-		"n": 7380.743652
-	},
-	"N51147JA4_7280_7340": {
-		"load_rate": 30.04104614,
-		"p": 2614.947266,
-		"tss": 6724725.0,
-		"n": 10919.97656
-	},
-	"H51015JU1_6880_7260": {
-		"load_rate": 20.312475,
-		"p": 2354.757818,
-		"tss": 5806439.434,
-		"n": 7307.213387
-	},
-	"N54003PU6_3750_3752": {
-		"load_rate": 4.282504082,
-		"p": 312.7717896,
-		"tss": 982424.0,
-		"n": 1619.996094
-	},
-	"N36077ZZ0_9999_9999": {
-		"load_rate": 29.08169746,
-		"p": 1798.827026,
-		"tss": 9605576.0,
-		"n": 8030.521973
-	},
-	"H42027SL3_1710_1740": {
-		"load_rate": 38.74771118,
-		"p": 3925.964355,
-		"tss": 10603794.0,
-		"n": 13615.84863
-	},
-	"N51023JU5_7500_7420": {
-		"load_rate": 156.7314424,
-		"p": 15857.63988,
-		"tss": 50146580.23,
-		"n": 58080.99039
-	},
-	"N42093SU1_1630_1610": {
-		"load_rate": 2.738587141,
-		"p": 212.5841217,
-		"tss": 613183.9375,
-		"n": 972.328186
-	},
-	"N51127YP0_6781_0000": {
-		"load_rate": 22.08703113,
-		"p": 2282.735855,
-		"tss": 5280498.656,
-		"n": 7423.01709
-	},
-	"N24015EU0_2940_0000": {
-		"load_rate": 25.92711557,
-		"p": 1959.892929,
-		"tss": 7568141.656,
-		"n": 8614.819962
-	},
-	"N42117SU2_0680_0610": {
-		"load_rate": 39.06029892,
-		"p": 3567.786865,
-		"tss": 10335003.0,
-		"n": 13990.24414
-	},
-	"N42079SU2_1550_1620": {
-		"load_rate": 12.26149464,
-		"p": 384.5942993,
-		"tss": 4137434.75,
-		"n": 2817.87915
-	},
-	"H54057PU4_3970_3890": {
-		"load_rate": 2.946013212,
-		"p": 304.6380005,
-		"tss": 1071691.625,
-		"n": 1113.165039
-	},
-	"N36017SU3_0240_0350": {
-		"load_rate": 23.85852623,
-		"p": 1417.583984,
-		"tss": 6341971.5,
-		"n": 6368.454102
-	},
-	"N51093JB0_7390_0000": {
-		"load_rate": 92.77908325,
-		"p": 1769.976807,
-		"tss": 18910534.0,
-		"n": 21167.95313
-	},
-	"N51121ZZ0_9999_9999": {
-		"load_rate": 489.5640683,
-		"p": 51432.61203,
-		"tss": 257858274.0,
-		"n": 184630.8906
-	},
-	"N42097SU8_1530_1760": {
-		"load_rate": 40.72750854,
-		"p": 1779.753418,
-		"tss": 8941627.0,
-		"n": 11796.41504
-	},
-	"N51187PS4_5080_4380": {
-		"load_rate": 7.78889285,
-		"p": 802.9725742,
-		"tss": 3329495.121,
-		"n": 3009.098167
-	},
-	"N51087JL7_7070_0001": {
-		"load_rate": 4.544099331,
-		"p": 554.6390381,
-		"tss": 2631146.25,
-		"n": 1631.866577
-	},
-	"N51193PL0_6101_0000": {
-		"load_rate": 6.292540364,
-		"p": 569.6719561,
-		"tss": 1203293.314,
-		"n": 2072.337463
-	},
-	"H42115SU6_0480_0520": {
-		"load_rate": 6.868441582,
-		"p": 595.2573242,
-		"tss": 1615509.125,
-		"n": 2025.428223
-	},
-	"H51015PS2_6730_6660": {
-		"load_rate": 48.36409211,
-		"p": 5460.834946,
-		"tss": 14682943.0,
-		"n": 22799.08502
-	},
-	"N24037XL0_5340_0000": {
-		"load_rate": 30.63978195,
-		"p": 2573.234375,
-		"tss": 9853553.0,
-		"n": 11215.24707
-	},
-	"N51840PU2_4220_3900": {
-		"load_rate": 2.902338505,
-		"p": 360.9567871,
-		"tss": 4617927.5,
-		"n": 1168.630615
-	},
-	"N36017SU5_0460_0480": {
-		"load_rate": 18.96704102,
-		"p": 1209.948608,
-		"tss": 5798521.0,
-		"n": 5035.189453
-	},
-	"N51179PL0_5900_0000": {
-		"load_rate": 110.686409,
-		"p": 13088.1377,
-		"tss": 35980116.0,
-		"n": 47205.375
-	},
-	"N42067SJ3_2170_1970": {
-		"load_rate": 15.37013626,
-		"p": 1295.395142,
-		"tss": 3226686.5,
-		"n": 5478.462402
-	},
-	"N51057RL5_6320_0000": {
-		"load_rate": 33.33648926,
-		"p": 3348.425385,
-		"tss": 7355789.797,
-		"n": 11894.91156
-	},
-	"N36003ZZ0_9999_9999": {
-		"load_rate": 749.5422449,
-		"p": 75266.33048,
-		"tss": 373323033.7,
-		"n": 262447.7379
-	},
-	"N51085YP3_6670_6720": {
-		"load_rate": 2.776405096,
-		"p": 205.5377808,
-		"tss": 692273.375,
-		"n": 985.1416016
-	},
-	"N51085YP3_6700_6670": {
-		"load_rate": 4.705435753,
-		"p": 93.19792175,
-		"tss": 1119035.875,
-		"n": 1325.515991
-	},
-	"N42109SJ6_1970_2130": {
-		"load_rate": 3.956784964,
-		"p": 450.9947205,
-		"tss": 1144767.5,
-		"n": 1514.760132
-	},
-	"N10005DE0_5170_0000": {
-		"load_rate": 10.19878483,
-		"p": 538.0119019,
-		"tss": 1745283.125,
-		"n": 5211.775391
-	},
-	"N42023SW4_1430_1490": {
-		"load_rate": 7.859251976,
-		"p": 815.7277832,
-		"tss": 2406825.0,
-		"n": 2550.892822
-	},
-	"N24033XL3_4951_0000": {
-		"load_rate": 21.58730555,
-		"p": 1835.309782,
-		"tss": 5072470.045,
-		"n": 6748.502565
-	},
-	"N51059PL0_5251_0000": {
-		"load_rate": 20.39020705,
-		"p": 1725.783997,
-		"tss": 6700992.188,
-		"n": 6499.255554
-	},
-	"N51005JU2_7360_7000": {
-		"load_rate": 32.45313835,
-		"p": 3533.201904,
-		"tss": 9445388.5,
-		"n": 12077.92627
-	},
-	"N24003XL3_4710_0000": {
-		"load_rate": 23.34108925,
-		"p": 1840.031006,
-		"tss": 6384305.5,
-		"n": 7675.596191
-	},
-	"N24033XL3_4710_0000": {
-		"load_rate": 11.39891538,
-		"p": 1061.000719,
-		"tss": 4246663.906,
-		"n": 3878.589714
-	},
-	"N36109SU1_0390_0560": {
-		"load_rate": 34.87358093,
-		"p": 3236.58252,
-		"tss": 10184147.0,
-		"n": 11872.56055
-	},
-	"H42013SJ3_2040_1980": {
-		"load_rate": 7.298696995,
-		"p": 754.1574707,
-		"tss": 1617749.625,
-		"n": 2563.288086
-	},
-	"N42027SW3_1750_1540": {
-		"load_rate": 134.6249695,
-		"p": 11374.61914,
-		"tss": 34515492.0,
-		"n": 46049.27344
-	},
-	"N54071PU2_5700_5210": {
-		"load_rate": 93.92294502,
-		"p": 8238.316895,
-		"tss": 27307932.0,
-		"n": 32888.65381
-	},
-	"N24029EU0_3361_0000": {
-		"load_rate": 6.580749035,
-		"p": 438.2080688,
-		"tss": 1500105.75,
-		"n": 2164.55835
-	},
-	"N24005WU1_3490_3480": {
-		"load_rate": 28.59036219,
-		"p": 2789.682854,
-		"tss": 15421905.36,
-		"n": 10581.55107
-	},
-	"N42035SW7_1470_1340": {
-		"load_rate": 18.91175842,
-		"p": 1837.255615,
-		"tss": 5288942.0,
-		"n": 6631.711914
-	},
-	"N51009JL2_7250_7090": {
-		"load_rate": 5.776957989,
-		"p": 487.2045898,
-		"tss": 1621933.375,
-		"n": 2055.561279
-	},
-	"N24005WM3_4060_0001": {
-		"load_rate": 35.31142807,
-		"p": 3799.271759,
-		"tss": 21052502.25,
-		"n": 12447.86731
-	},
-	"N51119RL0_6531_0000": {
-		"load_rate": 13.10604,
-		"p": 1624.661255,
-		"tss": 2596244.0,
-		"n": 5117.75
-	},
-	"N24005WU0_3821_0000": {
-		"load_rate": 3.408584595,
-		"p": 297.9750977,
-		"tss": 1000503.563,
-		"n": 1123.891479
-	},
-	"N24035EU0_4491_0000": {
-		"load_rate": 11.84313679,
-		"p": 599.5179443,
-		"tss": 3402844.25,
-		"n": 2544.767822
-	},
-	"N24011EM2_4100_0001": {
-		"load_rate": 44.96652222,
-		"p": 3637.098145,
-		"tss": 8692963.0,
-		"n": 16712.81641
-	},
-	"N51031JL6_7440_7430": {
-		"load_rate": 96.56237793,
-		"p": 11553.3418,
-		"tss": 34454336.0,
-		"n": 27746.96289
-	},
-	"N24045EL0_4597_0000": {
-		"load_rate": 14.37139416,
-		"p": 1247.275391,
-		"tss": 3444387.0,
-		"n": 4708.209473
-	},
-	"N51029JL3_7020_7100": {
-		"load_rate": 228.7573395,
-		"p": 25875.51172,
-		"tss": 68575472.0,
-		"n": 85896.35938
-	},
-	"N51600PL0_5131_0000": {
-		"load_rate": 0.229927972,
-		"p": 22.80399895,
-		"tss": 115171.2109,
-		"n": 72.58411407
-	},
-	"H42117SW4_1150_1350": {
-		"load_rate": 20.54105759,
-		"p": 2405.457275,
-		"tss": 6497312.0,
-		"n": 7458.620117
-	},
-	"H51165PS4_6360_5840": {
-		"load_rate": 6.85348177,
-		"p": 796.2485352,
-		"tss": 2070277.0,
-		"n": 2474.052246
-	},
-	"N42113SU1_0940_0900": {
-		"load_rate": 5.084442616,
-		"p": 508.5921936,
-		"tss": 1154146.875,
-		"n": 1822.609009
-	},
-	"N51009JL2_7240_7350": {
-		"load_rate": 198.482269,
-		"p": 19073.50853,
-		"tss": 56150346.97,
-		"n": 69011.00162
-	},
-	"N36095ZZ0_9999_9999": {
-		"load_rate": 581.390564,
-		"p": 47299.90625,
-		"tss": 258237440.0,
-		"n": 189561.3906
-	},
-	"H42119SW1_1570_1640": {
-		"load_rate": 24.36818314,
-		"p": 2762.203857,
-		"tss": 7236095.5,
-		"n": 8704.535156
-	},
-	"N51057RL5_6071_0000": {
-		"load_rate": 73.20999908,
-		"p": 4107.75,
-		"tss": 10588227.0,
-		"n": 25705.70117
-	},
-	"N36023SU2_0110_0240": {
-		"load_rate": 26.92257309,
-		"p": 1972.895142,
-		"tss": 7991931.5,
-		"n": 7551.576172
-	},
-	"N42133SL1_2770_2730": {
-		"load_rate": 132.8776703,
-		"p": 9279.383789,
-		"tss": 40781500.0,
-		"n": 47765.5
-	},
-	"N42037SU1_1630_1610": {
-		"load_rate": 82.9524765,
-		"p": 6743.830078,
-		"tss": 20307752.0,
-		"n": 29846.28906
-	},
-	"N51017JU2_6600_6810": {
-		"load_rate": 20.48015451,
-		"p": 2178.838318,
-		"tss": 6443985.25,
-		"n": 7521.039551
-	},
-	"N36101SU3_0490_0530": {
-		"load_rate": 64.26840973,
-		"p": 1725.004272,
-		"tss": 21738846.0,
-		"n": 22918.12695
-	},
-	"N24027WM1_3882_3880": {
-		"load_rate": 38.72604275,
-		"p": 2898.913933,
-		"tss": 11100368.19,
-		"n": 12367.50439
-	},
-	"N42109SL3_1740_1840": {
-		"load_rate": 53.87827301,
-		"p": 5786.861328,
-		"tss": 17499000.0,
-		"n": 21488.71094
-	},
-	"N42079SU1_1480_1500": {
-		"load_rate": 27.02406693,
-		"p": 1350.901001,
-		"tss": 8489192.0,
-		"n": 7703.978516
-	},
-	"N10003EU1_2981_0000": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N42011SL2_2070_2090": {
-		"load_rate": 0.01886950433,
-		"p": 2.18057847,
-		"tss": 16943.76172,
-		"n": 6.972581387
-	},
-	"N42119SL8_1760_1780": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N10005DE0_4850_0000": {
-		"load_rate": 97.30834198,
-		"p": 5386.974121,
-		"tss": 17040590.0,
-		"n": 55010.53516
-	},
-	"N54037PU6_4080_4180": {
-		"load_rate": 2.559239149,
-		"p": 92.93160248,
-		"tss": 992374.25,
-		"n": 785.1647949
-	},
-	"N51159RL1_6322_0000": {
-		"load_rate": 27.62999773,
-		"p": 2057.226089,
-		"tss": 3986756.875,
-		"n": 9358.997284
-	},
-	"N51153PL2_4970_5250": {
-		"load_rate": 105.0126314,
-		"p": 12018.08228,
-		"tss": 36363398.5,
-		"n": 38223.5083
-	},
-	"H51015PS2_6420_6360": {
-		"load_rate": 0.3006719649,
-		"p": 34.92568588,
-		"tss": 85722.01563,
-		"n": 108.7505951
-	},
-	"N24039EL0_6010_0000": {
-		"load_rate": 4.382234573,
-		"p": 502.2011719,
-		"tss": 1038657.938,
-		"n": 1494.285889
-	},
-	"N24023GY0_3800_3801": {
-		"load_rate": 49.14751434,
-		"p": 3755.991211,
-		"tss": 21672666.0,
-		"n": 18064.88672
-	},
-	"N24510WM0_3741_0000": {
-		"load_rate": 0.1056737974,
-		"p": 11.4403038,
-		"tss": 86779.85938,
-		"n": 38.2298317
-	},
-	"N51107PM7_4150_4290": {
-		"load_rate": 36.53783107,
-		"p": 3528.657745,
-		"tss": 9417431.969,
-		"n": 13504.20673
-	},
-	"N24019EM0_4881_0000": {
-		"load_rate": 7.035704613,
-		"p": 161.8731232,
-		"tss": 2711032.0,
-		"n": 1684.593384
-	},
-	"N42041SL1_2670_2370": {
-		"load_rate": 26.75759888,
-		"p": 2596.368652,
-		"tss": 8072762.0,
-		"n": 10361.42188
-	},
-	"N54003PU6_3600_3602": {
-		"load_rate": 14.47576809,
-		"p": 1018.101624,
-		"tss": 2983130.25,
-		"n": 5325.956543
-	},
-	"N51125JL2_7350_7090": {
-		"load_rate": 4.169678211,
-		"p": 436.1684875,
-		"tss": 1300515.25,
-		"n": 1566.339966
-	},
-	"N24013PM2_3400_3340": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N36101SU3_0370_0490": {
-		"load_rate": 312.6708069,
-		"p": 27239.05078,
-		"tss": 108272760.0,
-		"n": 121814.875
-	},
-	"N42117SU2_0800_0850": {
-		"load_rate": 0.2201326787,
-		"p": 21.07736588,
-		"tss": 103826.1484,
-		"n": 81.05715942
-	},
-	"N24029EU0_3724_0000": {
-		"load_rate": 29.75111771,
-		"p": 1915.509155,
-		"tss": 6525017.5,
-		"n": 9470.116211
-	},
-	"N42097SL8_1780_1880": {
-		"load_rate": 20.45354843,
-		"p": 1714.161987,
-		"tss": 4456090.5,
-		"n": 7145.233398
-	},
-	"N24025WU1_3331_3330": {
-		"load_rate": 13.33044934,
-		"p": 1223.576057,
-		"tss": 6954915.125,
-		"n": 4427.376221
-	},
-	"N11001PM7_4820_0001": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N51165PS2_5560_5100": {
-		"load_rate": 104.4840238,
-		"p": 11687.7981,
-		"tss": 45652231.44,
-		"n": 42121.49963
-	},
-	"N24043PU1_3100_3690": {
-		"load_rate": 7.26958397,
-		"p": 720.0976906,
-		"tss": 2303149.75,
-		"n": 2520.099396
-	},
-	"N24025WU0_3251_0000": {
-		"load_rate": 1.155709982,
-		"p": 113.0212936,
-		"tss": 412512.875,
-		"n": 377.612915
-	},
-	"N42075SL4_2140_2240": {
-		"load_rate": 18.17441404,
-		"p": 2190.385727,
-		"tss": 5786740.0,
-		"n": 7060.569489
-	},
-	"N24033PL0_4961_0000": {
-		"load_rate": 25.27746806,
-		"p": 2593.049871,
-		"tss": 13619334.7,
-		"n": 8811.081436
-	},
-	"N51095JB0_7051_0001": {
-		"load_rate": 0.3074404597,
-		"p": 39.61776352,
-		"tss": 139914.1563,
-		"n": 89.47149658
-	},
-	"N51133RL0_6450_0000": {
-		"load_rate": 120.1401596,
-		"p": 9104.969727,
-		"tss": 19734796.0,
-		"n": 39777.80469
-	},
-	"N24035EU0_4124_0000": {
-		"load_rate": 0.5898651481,
-		"p": 36.89487457,
-		"tss": 179979.1719,
-		"n": 202.5722809
-	},
-	"N36109ZZ0_9999_9999": {
-		"load_rate": 671.5386353,
-		"p": 67018.25781,
-		"tss": 271638784.0,
-		"n": 235164.0469
-	},
-	"N24005WU1_3350_3490": {
-		"load_rate": 75.22743873,
-		"p": 4974.009418,
-		"tss": 23288020.91,
-		"n": 26525.27195
-	},
-	"N24013PM2_2860_3040": {
-		"load_rate": 8.160644531,
-		"p": 525.8534546,
-		"tss": 1873794.375,
-		"n": 2648.428467
-	},
-	"H51125JL1_6770_6850": {
-		"load_rate": 34.16001391,
-		"p": 4063.516418,
-		"tss": 16910984.75,
-		"n": 13534.55841
-	},
-	"L54071PU2_5190_4310": {
-		"load_rate": 50.11857462,
-		"p": 4483.117371,
-		"tss": 12243597.13,
-		"n": 17551.7998
-	},
-	"N51650JB0_7580_0000": {
-		"load_rate": 14.84230959,
-		"p": 1978.712673,
-		"tss": 5132915.516,
-		"n": 5703.16095
-	},
-	"N24039EL0_5891_0000": {
-		"load_rate": 1.775686026,
-		"p": 201.702179,
-		"tss": 404305.5313,
-		"n": 549.5904541
-	},
-	"N42055SL3_2290_2260": {
-		"load_rate": 0.345225513,
-		"p": 37.43644333,
-		"tss": 88579.32031,
-		"n": 121.9022446
-	},
-	"N51073YL0_6932_0000": {
-		"load_rate": 13.88171196,
-		"p": 1787.750732,
-		"tss": 3365758.5,
-		"n": 5435.299805
-	},
-	"N42037SU3_1500_1420": {
-		"load_rate": 1.893620491,
-		"p": 140.0158081,
-		"tss": 707148.25,
-		"n": 649.1432495
-	},
-	"N51003JL2_6240_6520": {
-		"load_rate": 62.91158295,
-		"p": 5472.838379,
-		"tss": 18991852.0,
-		"n": 23100.77148
-	},
-	"N51033YP3_6700_6670": {
-		"load_rate": 0.005851328839,
-		"p": 0.6655268073,
-		"tss": 19342.51563,
-		"n": 2.140774012
-	},
-	"N24043PU6_3600_3602": {
-		"load_rate": 11.33477066,
-		"p": 1270.56032,
-		"tss": 3646726.242,
-		"n": 4011.059692
-	},
-	"N42013SJ3_2230_2060": {
-		"load_rate": 67.21716309,
-		"p": 5148.352051,
-		"tss": 14202742.0,
-		"n": 24260.37109
-	},
-	"N42011SL1_2190_2350": {
-		"load_rate": 3.280495644,
-		"p": 351.6714783,
-		"tss": 1481774.0,
-		"n": 1269.956177
-	},
-	"N42037SL2_1670_1880": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N42097SW7_1640_1680": {
-		"load_rate": 2.820048809,
-		"p": 216.4690552,
-		"tss": 656791.125,
-		"n": 1023.569458
-	},
-	"N51059PL0_5253_0000": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N42081SW3_1220_1320": {
-		"load_rate": 82.09102631,
-		"p": 6581.078613,
-		"tss": 34672624.0,
-		"n": 27222.72656
-	},
-	"N42079SU3_1500_1420": {
-		"load_rate": 3.895740747,
-		"p": 245.2077942,
-		"tss": 1675154.75,
-		"n": 1145.639526
-	},
-	"N24005WU0_3542_0000": {
-		"load_rate": 0.2033196688,
-		"p": 21.84497452,
-		"tss": 57889.53516,
-		"n": 57.61762238
-	},
-	"L54031PU2_5190_4310": {
-		"load_rate": 12.23548889,
-		"p": 52.82097244,
-		"tss": 2831551.25,
-		"n": 1344.066284
-	},
-	"N51109JL6_6740_7100": {
-		"load_rate": 0.8985019326,
-		"p": 87.36051941,
-		"tss": 267589.9688,
-		"n": 306.5795288
-	},
-	"H51003JL1_6560_6440": {
-		"load_rate": 3.964715898,
-		"p": 416.3955269,
-		"tss": 1483218.969,
-		"n": 1431.940456
-	},
-	"N42081SW4_1150_1350": {
-		"load_rate": 105.3330612,
-		"p": 11624.22559,
-		"tss": 29171038.0,
-		"n": 36684.96484
-	},
-	"H42119SW3_1580_1440": {
-		"load_rate": 0.3486855626,
-		"p": 38.9262886,
-		"tss": 139140.6563,
-		"n": 122.2390671
-	},
-	"N36107SU2_0450_0720": {
-		"load_rate": 27.4505806,
-		"p": 1266.304932,
-		"tss": 8759266.0,
-		"n": 7699.024902
-	},
-	"L51023JU3_7490_7400": {
-		"load_rate": 4.256042004,
-		"p": 441.6284943,
-		"tss": 1343844.188,
-		"n": 1533.085876
-	},
-	"N51580JU4_7330_7000": {
-		"load_rate": 0.9907952547,
-		"p": 30.80438995,
-		"tss": 1486495.125,
-		"n": 572.6106567
-	},
-	"N42107SL2_1670_1880": {
-		"load_rate": 50.60376358,
-		"p": 4304.874512,
-		"tss": 24207450.0,
-		"n": 16711.23828
-	},
-	"N24047DE0_5020_0000": {
-		"load_rate": 26.07554245,
-		"p": 2093.415039,
-		"tss": 7287568.5,
-		"n": 12465.53418
-	},
-	"N54023PU3_5210_5050": {
-		"load_rate": 42.55053711,
-		"p": 4594.182373,
-		"tss": 13198868.5,
-		"n": 15607.68555
-	},
-	"N24023PU1_4190_4300": {
-		"load_rate": 62.48791504,
-		"p": 6015.276855,
-		"tss": 20371592.0,
-		"n": 21383.21484
-	},
-	"N36025SU1_0380_0400": {
-		"load_rate": 34.78762054,
-		"p": 2393.435791,
-		"tss": 10459786.0,
-		"n": 9411.452148
-	},
-	"N42097SL8_1760_1780": {
-		"load_rate": 0.2626893818,
-		"p": 29.7748661,
-		"tss": 84847.70313,
-		"n": 78.63496399
-	},
-	"N24029EU0_4016_0000": {
-		"load_rate": 1.40260148,
-		"p": 4.233252525,
-		"tss": 279131.5938,
-		"n": 43.11240005
-	},
-	"N51683PL2_4970_5250": {
-		"load_rate": 5.395969868,
-		"p": 620.7332153,
-		"tss": 2510198.25,
-		"n": 1972.15686
-	},
-	"N51011ZZ0_9999_9999": {
-		"load_rate": 142.233902,
-		"p": 13538.0,
-		"tss": 46279036.0,
-		"n": 50613.40625
-	},
-	"N42115SU7_0540_0720": {
-		"load_rate": 1.013522029,
-		"p": 95.383255,
-		"tss": 250326.8594,
-		"n": 311.9847107
-	},
-	"N24019EM0_4886_0000": {
-		"load_rate": 10.43230999,
-		"p": 804.7943268,
-		"tss": 2375221.906,
-		"n": 3371.395935
-	},
-	"N24009XL0_4954_0000": {
-		"load_rate": 5.584990978,
-		"p": 689.5056763,
-		"tss": 3380902.75,
-		"n": 2495.247803
-	},
-	"N51127YL0_6930_0000": {
-		"load_rate": 16.00653458,
-		"p": 1594.92395,
-		"tss": 3723586.5,
-		"n": 5514.588379
-	},
-	"H54057PU3_4450_4440": {
-		"load_rate": 1.656157374,
-		"p": 174.7521667,
-		"tss": 468551.7813,
-		"n": 653.8764038
-	},
-	"N51059PL2_4970_5250": {
-		"load_rate": 109.0421409,
-		"p": 10947.86613,
-		"tss": 27140316.88,
-		"n": 42284.97562
-	},
-	"N42061SJ4_2010_2210": {
-		"load_rate": 183.4293671,
-		"p": 14942.3877,
-		"tss": 46063788.0,
-		"n": 62519.88672
-	},
-	"N24017PL2_5800_0000": {
-		"load_rate": 9.586929321,
-		"p": 819.9353027,
-		"tss": 2981348.25,
-		"n": 3462.799316
-	},
-	"N24003WM0_3966_0000": {
-		"load_rate": 0.7227914333,
-		"p": 0.8983756304,
-		"tss": 157327.75,
-		"n": 19.56082726
-	},
-	"N51049JL7_7100_7030": {
-		"load_rate": 1.495746136,
-		"p": 160.5589142,
-		"tss": 380735.4063,
-		"n": 495.3798828
-	},
-	"N51069PS4_5080_4380": {
-		"load_rate": 3.373318825,
-		"p": 396.7391291,
-		"tss": 1225473.883,
-		"n": 1316.24379
-	},
-	"H51015PS2_6490_6420": {
-		"load_rate": 11.71810389,
-		"p": 1311.897278,
-		"tss": 3605144.125,
-		"n": 4977.448242
-	},
-	"H51009JL1_7080_7190": {
-		"load_rate": 25.87387753,
-		"p": 2918.983337,
-		"tss": 8029253.5,
-		"n": 9245.537598
-	},
-	"N51181JB0_7390_0000": {
-		"load_rate": 14.26914406,
-		"p": 1265.315063,
-		"tss": 2369434.75,
-		"n": 4747.382324
-	},
-	"N51199YL0_6930_0000": {
-		"load_rate": 27.48524171,
-		"p": 3688.013748,
-		"tss": 9922922.422,
-		"n": 10810.50517
-	},
-	"N51159RL5_6072_0000": {
-		"load_rate": 10.17887285,
-		"p": 604.324522,
-		"tss": 1379483.988,
-		"n": 3425.405293
-	},
-	"N24001PU4_3890_3990": {
-		"load_rate": 0.2607092559,
-		"p": 22.79258537,
-		"tss": 68206.85938,
-		"n": 99.88907623
-	},
-	"N36101SU5_0650_0530": {
-		"load_rate": 8.563204765,
-		"p": 931.633606,
-		"tss": 2977039.25,
-		"n": 3121.787598
-	},
-	"N36101SU4_0630_0650": {
-		"load_rate": 12.44059563,
-		"p": 1083.385986,
-		"tss": 4667784.0,
-		"n": 4806.869141
-	},
-	"N42021SJ2_2530_2820": {
-		"load_rate": 1.217071176,
-		"p": 122.1948853,
-		"tss": 311951.75,
-		"n": 429.8600464
-	},
-	"N54071PU1_5380_5050": {
-		"load_rate": 10.28999519,
-		"p": 1226.551025,
-		"tss": 4202172.5,
-		"n": 3894.258789
-	},
-	"N54023PU1_5380_5050": {
-		"load_rate": 9.484422684,
-		"p": 1130.089966,
-		"tss": 3172657.0,
-		"n": 3522.633301
-	},
-	"H42113SU2_0990_0950": {
-		"load_rate": 7.280402184,
-		"p": 587.4362793,
-		"tss": 2387097.5,
-		"n": 2078.435059
-	},
-	"H54031PU2_4340_3860": {
-		"load_rate": 12.80558872,
-		"p": 1508.657227,
-		"tss": 3638312.5,
-		"n": 4751.488281
-	},
-	"N24039EL0_6001_0000": {
-		"load_rate": 46.08023071,
-		"p": 4994.953125,
-		"tss": 10278471.0,
-		"n": 15137.55469
-	},
-	"L54071PU1_5380_5050": {
-		"load_rate": 14.11191568,
-		"p": 1656.125694,
-		"tss": 4647379.656,
-		"n": 5302.792847
-	},
-	"N42109SL8_1880_2030": {
-		"load_rate": 115.73703,
-		"p": 12383.89844,
-		"tss": 32582902.0,
-		"n": 46472.16797
-	},
-	"N36101SU5_0530_0610": {
-		"load_rate": 78.09914398,
-		"p": 5193.551758,
-		"tss": 28490268.0,
-		"n": 23595.10742
-	},
-	"N24023PU1_4300_4440": {
-		"load_rate": 6.831731796,
-		"p": 695.6912842,
-		"tss": 3425464.0,
-		"n": 2328.995605
-	},
-	"N51087JL7_6800_7070": {
-		"load_rate": 41.64286423,
-		"p": 5807.999023,
-		"tss": 16826964.0,
-		"n": 16789.88281
-	},
-	"N24029EU0_3726_0001": {
-		"load_rate": 11.97085571,
-		"p": 673.3247681,
-		"tss": 2571941.5,
-		"n": 3721.916504
-	},
-	"N51099PL0_5922_0000": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N24029EU0_3360_0000": {
-		"load_rate": 8.227675438,
-		"p": 529.4569702,
-		"tss": 1930592.5,
-		"n": 2556.058105
-	},
-	"N24047EL0_5271_0000": {
-		"load_rate": 6.202981472,
-		"p": 355.36026,
-		"tss": 1231094.5,
-		"n": 1554.41272
-	},
-	"N10001EM2_3980_0001": {
-		"load_rate": 121.2547836,
-		"p": 7890.172363,
-		"tss": 20050734.0,
-		"n": 44749.82813
-	},
-	"N51133RL0_6501_0000": {
-		"load_rate": 1.147578239,
-		"p": 64.63846588,
-		"tss": 157942.7031,
-		"n": 410.5123596
-	},
-	"N24003WL0_4603_0000": {
-		"load_rate": 7.910060488,
-		"p": 580.563653,
-		"tss": 3874025.688,
-		"n": 2756.020667
-	},
-	"N42131SU7_1010_0980": {
-		"load_rate": 0.0,
-		"p": 0.0,
-		"tss": 0.0,
-		"n": 0.0
-	},
-	"N51099RL5_6070_0000": {
-		"load_rate": 82.21377563,
-		"p": 6053.600586,
-		"tss": 19392864.0,
-		"n": 25885.97656
-	},
-	"N51600PL0_5010_5130": {
-		"load_rate": 9.271912575,
-		"p": 603.7608032,
-		"tss": 4307658.0,
-		"n": 3028.678711
-	},
-	"N51165PS4_6360_5840": {
-		"load_rate": 15.21006393,
-		"p": 1875.196777,
-		"tss": 4521284.875,
-		"n": 6192.901733
-	},
-	"N10005EL0_4560_4562": {
-		"load_rate": 40.08153534,
-		"p": 1654.344482,
-		"tss": 4632572.0,
-		"n": 13744.0459
-	},
-	"N51683PL2_5140_5360": {
-		"load_rate": 5.308783531,
-		"p": 1041.035889,
-		"tss": 3008798.25,
-		"n": 2985.520752
-	},
-	"N24041EM0_4870_0000": {
-		"load_rate": 2.580289602,
-		"p": 181.2380371,
-		"tss": 826150.25,
-		"n": 845.3780518
-	},
-	"N24003WL0_4600_0000": {
-		"load_rate": 39.77000248,
-		"p": 3223.613876,
-		"tss": 12133021.56,
-		"n": 14153.28653
-	},
-	"N24011EM0_4324_0000": {
-		"load_rate": 12.62439823,
-		"p": 937.987915,
-		"tss": 2494153.75,
-		"n": 4712.663574
-	},
-	"N24017PL0_5392_0000": {
-		"load_rate": 10.29529279,
-		"p": 1121.475904,
-		"tss": 3250483.266,
-		"n": 3827.121994
-	},
-	"N51179RL5_6070_0000": {
-		"load_rate": 56.77965927,
-		"p": 4909.325684,
-		"tss": 20612288.0,
-		"n": 21599.41016
-	},
-	"N51031ZZ0_9999_9999": {
-		"load_rate": 598.0178223,
-		"p": 66999.99219,
-		"tss": 260168272.0,
-		"n": 226174.4531
-	},
-	"N42105SW3_1090_1091": {
-		"load_rate": 267.3605347,
-		"p": 29304.38867,
-		"tss": 79390512.0,
-		"n": 99173.42188
-	},
-	"N51125JL1_6940_7200": {
-		"load_rate": 117.5481038,
-		"p": 10846.81856,
-		"tss": 33426898.04,
-		"n": 44121.56423
-	},
-	"N42115SU7_0860_0960": {
-		"load_rate": 18.57976913,
-		"p": 1431.525513,
-		"tss": 5011025.0,
-		"n": 5484.950195
-	}
-}
@@ -3,24 +3,13 @@
 
 def reduction(data):
 
-    existing_treated_discharge = data.get('existing_treated_discharge')
+    existing_treated_discharge = data['existing_treated_discharge']
 
-    proposed_treated_discharge = data.get('proposed_treated_discharge')
+    proposed_treated_discharge = data['proposed_treated_discharge']
 
-    existing_total_discharge = data.get('existing_total_discharge')
+    existing_total_discharge = data['existing_total_discharge']
 
-    proposed_total_discharge = data.get('proposed_total_discharge')
-
-    values = [
-        existing_treated_discharge,
-        proposed_treated_discharge,
-        existing_total_discharge,
-        proposed_total_discharge,
-    ]
-
-    if not all(isinstance(x, (float, int)) for x in values):
-
-        return {}
+    proposed_total_discharge = data['proposed_total_discharge']
 
     existing_percent_flow_treated = (
         float(existing_treated_discharge) /
@@ -2,6 +2,9 @@
 
 from flask import Blueprint
 
+from app import registry
+from app.registry import Input
+
 
 module = Blueprint(**{
     'name': __name__,
@@ -16,4 +19,17 @@ module = Blueprint(**{
 
 if module:
     """Verify module Blueprint is instantiated."""
-    from . import utilities
+    registry.register('floodplain_reconnection_2', '%s.utilities' % __name__, **{
+        'inputs': [
+            Input('upstream_miles', required=True),
+            Input('treatable_flow_credit', required=True)
+        ],
+        'outputs': [
+            'tn_load',
+            'tp_load',
+            'tss_load',
+            'tn_treatable_load',
+            'tp_treatable_load',
+            'tss_treatable_load'
+        ]
+    })
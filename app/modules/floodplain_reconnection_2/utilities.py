@@ -1,23 +1,17 @@
 #!/usr/bin/env python
 
-from .constants import LR_LOADS
+from app.segments import lr_loads
 
 
 def reduction(data):
 
     segments = data.get('segments')
 
-    upstream_miles = data.get('upstream_miles')
+    upstream_miles = data['upstream_miles']
 
-    treatable_flow_credit = data.get('treatable_flow_credit')
+    treatable_flow_credit = data['treatable_flow_credit']
 
-    values = [
-        upstream_miles,
-        treatable_flow_credit,
-    ]
-
-    if (not isinstance(segments, list) or
-            not all(isinstance(x, (float, int)) for x in values)):
+    if not isinstance(segments, list):
 
         return {}
 
@@ -27,27 +21,17 @@ def reduction(data):
 
     for segment in segments:
 
-        rates = LR_LOADS.get(segment)
-
-        try:
-
-            load_rate = rates.get('load_rate')
+        ratios = lr_loads.ratios(segment)
 
-            n_loads.append(
-                rates['n'] / load_rate
-            )
+        if ratios is None:
 
-            p_loads.append(
-                rates['p'] / load_rate
-            )
+            continue
 
-            s_loads.append(
-                rates['tss'] / load_rate
-            )
+        n_loads.append(ratios[0])
 
-        except (AttributeError, KeyError):
+        p_loads.append(ratios[1])
 
-            pass
+        s_loads.append(ratios[2])
 
     tn_load = (sum(n_loads) / float(len(n_loads))) * upstream_miles
 
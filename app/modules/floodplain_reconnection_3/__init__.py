@@ -2,6 +2,9 @@
 
 from flask import Blueprint
 
+from app import registry
+from app.registry import Input
+
 
 module = Blueprint(**{
     'name': __name__,
@@ -16,4 +19,18 @@ module = Blueprint(**{
 
 if module:
     """Verify module Blueprint is instantiated."""
-    from . import utilities
+    registry.register('floodplain_reconnection_3', '%s.utilities' % __name__, **{
+        'inputs': [
+            Input('tn_treatable_load', required=True),
+            Input('tp_treatable_load', required=True),
+            Input('tss_treatable_load', required=True),
+            Input('wetland_restoration', default=0),
+            Input('wetland_creation', default=0),
+            Input('wetland_rehab', default=0)
+        ],
+        'outputs': [
+            'tn_lbs_reduced',
+            'tp_lbs_reduced',
+            'tss_lbs_reduced'
+        ]
+    })
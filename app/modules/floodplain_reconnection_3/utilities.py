@@ -21,34 +21,11 @@ EFF = {
 
 def reduction(data):
 
-    tn_treatable_load = data.get('tn_treatable_load')
+    tn_treatable_load = data['tn_treatable_load']
 
-    tp_treatable_load = data.get('tp_treatable_load')
+    tp_treatable_load = data['tp_treatable_load']
 
-    tss_treatable_load = data.get('tss_treatable_load')
-
-    wetland_restoration = data.get('wetland_restoration', 0)
-
-    wetland_creation = data.get('wetland_creation', 0)
-
-    wetland_rehab = data.get('wetland_rehab', 0)
-
-    values = [
-        tn_treatable_load,
-        tp_treatable_load,
-        tss_treatable_load,
-        wetland_restoration,
-        wetland_creation,
-        wetland_rehab,
-    ]
-
-    if not all(isinstance(x, (float, int)) for x in values):
-
-        return {
-            'tn_lbs_reduced': 0,
-            'tp_lbs_reduced': 0,
-            'tss_lbs_reduced': 0
-        }
+    tss_treatable_load = data['tss_treatable_load']
 
     tn = []
     tp = []
@@ -2,6 +2,9 @@
 
 from flask import Blueprint
 
+from app import registry
+from app.registry import Input
+
 
 module = Blueprint(**{
     'name': __name__,
@@ -16,4 +19,21 @@ module = Blueprint(**{
 
 if module:
     """Verify module Blueprint is instantiated."""
-    from . import utilities
+    registry.register('instream_processing', '%s.utilities' % __name__, **{
+        'inputs': [
+            Input('linear_feet', default=0),
+            Input('project_left_bank_height', default=0),
+            Input('left_bank_bankfull_height', default=0),
+            Input('project_right_bank_height', default=0),
+            Input('right_bank_bankfull_height', default=0),
+            Input('hyporheic_box_depth', default=0),
+            Input('length_of_left_bank_with_improved_connectivity', default=0),
+            Input('length_of_right_bank_with_improved_connectivity', default=0),
+            Input('stream_width_at_mean_base_flow', default=0)
+        ],
+        'outputs': [
+            'tn_lbs_reduced',
+            'tp_lbs_reduced',
+            'tss_tons_reduced'
+        ]
+    })
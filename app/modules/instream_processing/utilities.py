@@ -57,13 +57,13 @@ def bank_height_ratio(bank_height, bankfull_height):
 
 def nitrogen_protocol_2(data):
 
-    project_left_bank_height = data.get('project_left_bank_height', 0)
-    left_bank_bankfull_height = data.get('left_bank_bankfull_height', 0)
+    project_left_bank_height = data['project_left_bank_height']
+    left_bank_bankfull_height = data['left_bank_bankfull_height']
 
-    project_right_bank_height = data.get('project_right_bank_height', 0)
-    right_bank_bankfull_height = data.get('right_bank_bankfull_height', 0)
+    project_right_bank_height = data['project_right_bank_height']
+    right_bank_bankfull_height = data['right_bank_bankfull_height']
 
-    hyporheic_box_depth = data.get('hyporheic_box_depth', 0)
+    hyporheic_box_depth = data['hyporheic_box_depth']
 
     if hyporheic_box_depth > 5:
 
@@ -90,9 +90,9 @@ def nitrogen_protocol_2(data):
 
     # '=stream length * (stream width + 10) * hyporheic box ft depth * bulk density / 2000 lbs/ton * 0.000195 lbs/ton/day * 365 days/yr
 
-    length_of_left_bank_with_improved_connectivity = data.get('length_of_left_bank_with_improved_connectivity', 0)
-    length_of_right_bank_with_improved_connectivity = data.get('length_of_right_bank_with_improved_connectivity', 0)
-    stream_width_at_mean_base_flow = data.get('stream_width_at_mean_base_flow', 0)
+    length_of_left_bank_with_improved_connectivity = data['length_of_left_bank_with_improved_connectivity']
+    length_of_right_bank_with_improved_connectivity = data['length_of_right_bank_with_improved_connectivity']
+    stream_width_at_mean_base_flow = data['stream_width_at_mean_base_flow']
 
     if left_behi < 1.1:
 
@@ -136,38 +136,14 @@ def sediment_protocol_1(data):
 
 def nitrogen(data):
 
-    reduction_ = 0
-
-    linear_feet = data.get('linear_feet')
-
-    if isinstance(linear_feet, (float, int)):
-
-        reduction_ = linear_feet * 0.075
-
-    return reduction_
+    return data['linear_feet'] * 0.075
 
 
 def phosphorus(data):
 
-    reduction_ = 0
-
-    linear_feet = data.get('linear_feet')
-
-    if isinstance(linear_feet, (float, int)):
-
-        reduction_ = linear_feet * 0.068
-
-    return reduction_
+    return data['linear_feet'] * 0.068
 
 
 def sediment(data):
 
-    reduction_ = 0
-
-    linear_feet = data.get('linear_feet')
-
-    if isinstance(linear_feet, (float, int)):
-
-        reduction_ = linear_feet * 248.0
-
-    return reduction_ / 2000.0
+    return (data['linear_feet'] * 248.0) / 2000.0
@@ -2,6 +2,8 @@
 
 from flask import Blueprint
 
+from app import registry
+
 
 module = Blueprint(**{
     'name': __name__,
@@ -16,4 +18,7 @@ module = Blueprint(**{
 
 if module:
     """Verify module Blueprint is instantiated."""
-    from . import utilities
+    registry.register('outfall_and_gully_stabilization', '%s.utilities' % __name__, **{
+        'inputs': [],
+        'outputs': []
+    })
@@ -2,6 +2,9 @@
 
 from flask import Blueprint
 
+from app import registry
+from app.registry import Input
+
 
 module = Blueprint(**{
     'name': __name__,
@@ -16,4 +19,16 @@ module = Blueprint(**{
 
 if module:
     """Verify module Blueprint is instantiated."""
-    from . import utilities
+    registry.register('outfall_stabilization', '%s.utilities' % __name__, **{
+        'inputs': [
+            Input('linear_feet', default=0),
+            Input('tn_lbs_reduced', default=0),
+            Input('tp_lbs_reduced', default=0),
+            Input('tss_tons_reduced', default=0)
+        ],
+        'outputs': [
+            'tn_lbs_reduced',
+            'tp_lbs_reduced',
+            'tss_tons_reduced'
+        ]
+    })
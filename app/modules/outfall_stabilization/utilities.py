@@ -19,9 +19,9 @@ def reduction(data):
     if data.get('has_majority_design_completion', False):
 
         return {
-            'tn_lbs_reduced': data.get('tn_lbs_reduced', 0),
-            'tp_lbs_reduced': data.get('tp_lbs_reduced', 0),
-            'tss_tons_reduced': data.get('tss_tons_reduced', 0)
+            'tn_lbs_reduced': data['tn_lbs_reduced'],
+            'tp_lbs_reduced': data['tp_lbs_reduced'],
+            'tss_tons_reduced': data['tss_tons_reduced']
         }
 
     else:
@@ -35,38 +35,14 @@ def reduction(data):
 
 def nitrogen(data):
 
-    reduction_ = 0
-
-    linear_feet = data.get('linear_feet')
-
-    if isinstance(linear_feet, (float, int)):
-
-        reduction_ = linear_feet * 0.075
-
-    return reduction_
+    return data['linear_feet'] * 0.075
 
 
 def phosphorus(data):
 
-    reduction_ = 0
-
-    linear_feet = data.get('linear_feet')
-
-    if isinstance(linear_feet, (float, int)):
-
-        reduction_ = linear_feet * 0.068
-
-    return reduction_
+    return data['linear_feet'] * 0.068
 
 
 def sediment(data):
 
-    reduction_ = 0
-
-    linear_feet = data.get('linear_feet')
-
-    if isinstance(linear_feet, (float, int)):
-
-        reduction_ = linear_feet * 248.0
-
-    return reduction_
+    return data['linear_feet'] * 248.0
@@ -2,6 +2,8 @@
 
 from flask import Blueprint
 
+from app import registry
+
 
 module = Blueprint(**{
     'name': __name__,
@@ -16,4 +18,11 @@ module = Blueprint(**{
 
 if module:
     """Verify module Blueprint is instantiated."""
-    from . import utilities
+    registry.register('prevented_sediment', '%s.utilities' % __name__, **{
+        'inputs': [],
+        'outputs': [
+            'tn_lbs_reduced',
+            'tp_lbs_reduced',
+            'tss_lbs_reduced'
+        ]
+    })
@@ -2,6 +2,9 @@
 
 from flask import Blueprint
 
+from app import registry
+from app.registry import Input
+
 
 module = Blueprint(**{
     'name': __name__,
@@ -16,4 +19,27 @@ module = Blueprint(**{
 
 if module:
     """Verify module Blueprint is instantiated."""
-    from . import utilities
+    registry.register('shoreline_management', '%s.utilities' % __name__, **{
+        'inputs': [
+            Input('length_of_living_shoreline', default=1000.0),
+            Input('existing_avg_bank_height', default=4.0),
+            Input('existing_shoreline_recession_rate', default=1.0),
+            Input('soil_bulk_density', default=93.6),
+            Input('sand_reduction_factor', default=0.551),
+            Input('bank_instability_reduction_factor', default=1.0),
+            Input('planted_tidal_wetland_area', default=0.25)
+        ],
+        'outputs': [
+            'tn_lbs_reduced',
+            'tp_lbs_reduced',
+            'tss_tons_reduced',
+            'tn_lbs_reduced_1',
+            'tn_lbs_reduced_2',
+            'tn_lbs_reduced_4',
+            'tp_lbs_reduced_1',
+            'tp_lbs_reduced_3',
+            'tp_lbs_reduced_4',
+            'tss_tons_reduced_1',
+            'tss_tons_reduced_3'
+        ]
+    })
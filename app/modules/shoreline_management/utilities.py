@@ -158,37 +158,19 @@ def reduction(data):
 
     has_majority_design_completion = data.get('has_majority_design_completion', False)
 
-    length_of_living_shoreline = data.get('length_of_living_shoreline', 1000.0)
+    length_of_living_shoreline = data['length_of_living_shoreline']
 
-    existing_avg_bank_height = data.get('existing_avg_bank_height', 4.0)
+    existing_avg_bank_height = data['existing_avg_bank_height']
 
-    existing_shoreline_recession_rate = data.get('existing_shoreline_recession_rate', 1.0)
+    existing_shoreline_recession_rate = data['existing_shoreline_recession_rate']
 
-    soil_bulk_density = data.get('soil_bulk_density', 93.6)
+    soil_bulk_density = data['soil_bulk_density']
 
-    sand_reduction_factor = data.get('sand_reduction_factor', 0.551)
+    sand_reduction_factor = data['sand_reduction_factor']
 
-    bank_instability_reduction_factor = data.get('bank_instability_reduction_factor', 1.0)
+    bank_instability_reduction_factor = data['bank_instability_reduction_factor']
 
-    planted_tidal_wetland_area = data.get('planted_tidal_wetland_area', 0.25)
-
-    values = [
-        length_of_living_shoreline,
-        existing_avg_bank_height,
-        existing_shoreline_recession_rate,
-        soil_bulk_density,
-        sand_reduction_factor,
-        bank_instability_reduction_factor,
-        planted_tidal_wetland_area,
-    ]
-
-    if not all(isinstance(x, (float, int)) for x in values):
-
-        return {
-            'tn_lbs_reduced': 0,
-            'tp_lbs_reduced': 0,
-            'tss_lbs_reduced': 0
-        }
+    planted_tidal_wetland_area = data['planted_tidal_wetland_area']
 
     if has_majority_design_completion:
 
@@ -2,6 +2,9 @@
 
 from flask import Blueprint
 
+from app import registry
+from app.registry import Input
+
 
 module = Blueprint(**{
     'name': __name__,
@@ -16,4 +19,18 @@ module = Blueprint(**{
 
 if module:
     """Verify module Blueprint is instantiated."""
-    from . import utilities
+    registry.register('stormwater', '%s.utilities' % __name__, **{
+        'inputs': [
+            Input('runoff_volume_captured', default=0),
+            Input('impervious_area', default=0),
+            Input('total_drainage_area', default=0)
+        ],
+        'outputs': [
+            'tn_lbs_reduced',
+            'tss_tons_reduced',
+            'n_curve',
+            'p_curve',
+            'tss_curve'
+        ],
+        'curve_tables': True
+    })
@@ -12,3 +12,12 @@ URBAN_STATE_UAL = {
         "tss_ual": 0.07128629
     }
 }
+
+# Pollutant removal adjustor curves, as polynomial coefficients from the
+# fifth power of runoff depth treated (inches) down to the constant term.
+
+ADJUSTOR_CURVES = {
+    "tn": (0.0308, -0.2562, 0.8634, -1.5285, 1.501, -0.013),
+    "tp": (0.0304, -0.2619, 0.9161, -1.6837, 1.7072, -0.0091),
+    "tss": (0.0326, -0.2806, 0.9816, -1.8039, 1.8292, -0.0098)
+}
@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+
+"""Vectorized stormwater calculations.
+
+Evaluates the same formulas as `utilities.nitrogen`, `utilities.phosphorus`
+and `utilities.sediment` for N practices at once. The adjustor curves are
+evaluated with `app.utilities.horner` from `constants.ADJUSTOR_CURVES`
+rather than term by term, so each element agrees with the scalar result
+to within `TOLERANCE`, relative or absolute (see `math.isclose`). With
+`tables` both paths read the same lookup tables.
+"""
+
+import numpy
+
+from app.utilities import horner
+from .constants import ADJUSTOR_CURVES
+from .constants import URBAN_STATE_UAL as load_data
+from .utilities import curve_tables
+
+
+#: Agreement with `utilities`, relative or absolute.
+
+TOLERANCE = 1e-9
+
+
+def runoff_depth_treated(runoff_volume_captured, impervious_area):
+
+    """Runoff depth treated (inches) for every practice.
+
+    Practices with no captured volume or impervious area default to a
+    depth of 1.0, as in `utilities.runoff_depth_treated`.
+    """
+
+    captured, impervious = numpy.broadcast_arrays(
+        numpy.asarray(runoff_volume_captured, dtype=float),
+        numpy.asarray(impervious_area, dtype=float))
+
+    depth_treated = numpy.ones(captured.shape)
+
+    mask = (captured != 0) & (impervious != 0)
+
+    depth_treated[mask] = (
+        (captured[mask] * 12) / (impervious[mask] / 43560)
+    )
+
+    return depth_treated
+
+
+def reductions(runoff_volume_captured, impervious_area, total_drainage_area,
+               preinstallation=False, tables=False):
+
+    """Compute depth, adjustor curves and load reductions for N practices.
+
+    :param runoff_volume_captured: Array of captured runoff volumes.
+    :param impervious_area: Array of impervious areas (square feet).
+    :param total_drainage_area: Array of drainage areas (square feet).
+    :param preinstallation: Use a curve multiplier of 1.0.
+    :param tables: Use the interpolated curve lookup tables.
+    :return: A dictionary of arrays: `depth_treated`, `tn_curve`,
+    `tp_curve`, `tss_curve`, `tn_reduction`, `tp_reduction` and
+    `tss_reduction`.
+    """
+
+    impervious = numpy.asarray(impervious_area, dtype=float)
+
+    total = numpy.asarray(total_drainage_area, dtype=float)
+
+    depth_treated = runoff_depth_treated(runoff_volume_captured, impervious)
+
+    result = {
+        'depth_treated': depth_treated
+    }
+
+    for key in ('tn', 'tp', 'tss'):
+
+        if preinstallation:
+
+            curve = numpy.ones(depth_treated.shape)
+
+        elif tables:
+
+            curve = curve_tables()[key].evaluate(depth_treated)
+
+        else:
+
+            curve = horner(ADJUSTOR_CURVES[key], depth_treated)
+
+        ual = load_data['impervious']['%s_ual' % key]
+
+        result['%s_curve' % key] = curve
+
+        result['%s_reduction' % key] = (
+            ((impervious * ual) + ((total - impervious) * ual)) * curve
+        ) / 43560
+
+    return result
@@ -2,11 +2,17 @@
 
 import math
 
-from app import logger
+from app import log
+from .constants import ADJUSTOR_CURVES
 from .constants import URBAN_STATE_UAL as load_data
 
 
-def reduction(data, preinstallation=False):
+#: Per-practice debug events, sampled per `LOG_SAMPLE_EVERY`.
+
+hot_logger = log.SampledLogger(log.get_logger(__name__))
+
+
+def reduction(data, preinstallation=False, tables=False):
 
     """If the measurement_period is Pre-Installation the LER will use the
     raw installation_lateral_erosion_rate provided by the user.
@@ -22,9 +28,11 @@ def reduction(data, preinstallation=False):
         Engineering Department Virginia Tech
     """
 
-    n_result = nitrogen(data)
-    p_result = phosphorus(data)
-    tss_result = sediment(data)
+    depth_treated = runoff_depth_treated(data)
+
+    n_result = nitrogen(data, depth_treated=depth_treated, tables=tables)
+    p_result = phosphorus(data, depth_treated=depth_treated, tables=tables)
+    tss_result = sediment(data, depth_treated=depth_treated, tables=tables)
 
     return {
         'tn_lbs_reduced': n_result.get('reduction'),
@@ -36,9 +44,39 @@ def reduction(data, preinstallation=False):
     }
 
 
-def adjustor_curve_nitrogen(data):
+TABLES = {}
+
+
+def curve_tables():
+    """Build the adjustor curve lookup tables on first use.
+
+    Runoff depth treated is not clamped here, so depths outside the
+    table range fall back to the exact polynomial.
+    """
+
+    if not TABLES:
+
+        # Imported here so NumPy only loads when the tables are used.
+
+        from app.curves import CurveTable
+
+        TABLES.update({
+            key: CurveTable(coefficients)
+            for key, coefficients in ADJUSTOR_CURVES.items()
+        })
+
+    return TABLES
 
-    depth_treated = runoff_depth_treated(data)
+
+def adjustor_curve_nitrogen(data, depth_treated=None, tables=False):
+
+    if depth_treated is None:
+
+        depth_treated = runoff_depth_treated(data)
+
+    if tables:
+
+        return curve_tables()['tn'](depth_treated)
 
     # runoff_volume_captured = runoff_volume_captured(data)
 
@@ -59,9 +97,15 @@ def adjustor_curve_nitrogen(data):
     return reduction
 
 
-def adjustor_curve_phosphorus(data):
+def adjustor_curve_phosphorus(data, depth_treated=None, tables=False):
 
-    depth_treated = runoff_depth_treated(data)
+    if depth_treated is None:
+
+        depth_treated = runoff_depth_treated(data)
+
+    if tables:
+
+        return curve_tables()['tp'](depth_treated)
 
     # runoff_volume_captured = runoff_volume_captured(data)
 
@@ -78,14 +122,20 @@ def adjustor_curve_phosphorus(data):
     return reduction
 
 
-def adjustor_curve_sediment(data):
+def adjustor_curve_sediment(data, depth_treated=None, tables=False):
 
-    depth_treated = runoff_depth_treated(data)
+    if depth_treated is None:
+
+        depth_treated = runoff_depth_treated(data)
+
+    if tables:
+
+        return curve_tables()['tss'](depth_treated)
 
     # runoff_volume_captured = runoff_volume_captured(data)
 
     reduction = 0.0
-        
+
     first = 0.0326 * math.pow(depth_treated, 5)
     second = 0.2806 * math.pow(depth_treated, 4)
     third = 0.9816 * math.pow(depth_treated, 3)
@@ -97,17 +147,17 @@ def adjustor_curve_sediment(data):
     return reduction
 
 
-def nitrogen(data, preinstallation=False):
+def nitrogen(data, preinstallation=False, depth_treated=None, tables=False):
 
     multiplier = 1.0
 
     if not preinstallation:
 
-        multiplier = adjustor_curve_nitrogen(data)
+        multiplier = adjustor_curve_nitrogen(data, depth_treated, tables)
 
-    impervious_area = data.get('impervious_area', 0)
+    impervious_area = data['impervious_area']
     impervious_tn_ual = load_data['impervious']['tn_ual']
-    total_drainage_area = data.get('total_drainage_area', 0)
+    total_drainage_area = data['total_drainage_area']
 
     return {
         "reduction": (((impervious_area * impervious_tn_ual) + ((total_drainage_area - impervious_area) * impervious_tn_ual)) * multiplier) / 43560,
@@ -115,17 +165,17 @@ def nitrogen(data, preinstallation=False):
     }
 
 
-def phosphorus(data, preinstallation=False):
+def phosphorus(data, preinstallation=False, depth_treated=None, tables=False):
 
     multiplier = 1.0
 
     if not preinstallation:
 
-        multiplier = adjustor_curve_phosphorus(data)
+        multiplier = adjustor_curve_phosphorus(data, depth_treated, tables)
 
-    impervious_area = data.get('impervious_area', 0)
+    impervious_area = data['impervious_area']
     impervious_tp_ual = load_data['impervious']['tp_ual']
-    total_drainage_area = data.get('total_drainage_area', 0)
+    total_drainage_area = data['total_drainage_area']
 
     return {
         "reduction": (((impervious_area * impervious_tp_ual) + ((total_drainage_area - impervious_area) * impervious_tp_ual)) * multiplier) / 43560,
@@ -133,17 +183,17 @@ def phosphorus(data, preinstallation=False):
     }
 
 
-def sediment(data, preinstallation=False):
+def sediment(data, preinstallation=False, depth_treated=None, tables=False):
 
     multiplier = 1.0
 
     if not preinstallation:
 
-        multiplier = adjustor_curve_sediment(data)
+        multiplier = adjustor_curve_sediment(data, depth_treated, tables)
 
-    impervious_area = data.get('impervious_area', 0)
+    impervious_area = data['impervious_area']
     impervious_tss_ual = load_data['impervious']['tss_ual']
-    total_drainage_area = data.get('total_drainage_area', 0)
+    total_drainage_area = data['total_drainage_area']
 
     return {
         "reduction": (((impervious_area * impervious_tss_ual) + ((total_drainage_area - impervious_area) * impervious_tss_ual)) * multiplier) / 43560,
@@ -153,21 +203,21 @@ def sediment(data, preinstallation=False):
 
 def runoff_depth_treated(data):
 
-    logger.debug(
+    hot_logger.debug(
         'stormwater.utilities.runoff_depth_treated.data: %s',
         data)
 
     depth_treated = 1.0
 
-    runoff_volume_captured = float(data.get('runoff_volume_captured', 0))
+    runoff_volume_captured = float(data['runoff_volume_captured'])
 
-    logger.debug(
+    hot_logger.debug(
         'stormwater.utilities.runoff_depth_treated.runoff_volume_captured: %s',
         runoff_volume_captured)
 
-    impervious_area = float(data.get('impervious_area', 0))
+    impervious_area = float(data['impervious_area'])
 
-    logger.debug(
+    hot_logger.debug(
         'stormwater.utilities.runoff_depth_treated.impervious_area: %s',
         impervious_area)
 
@@ -182,7 +232,7 @@ def rainfall_depth_treated(data):
 
     depth_treated = runoff_depth_treated(data)
 
-    impervious_area = float(data.get('impervious_area', 0))
+    impervious_area = float(data['impervious_area'])
 
     return (depth_treated / (impervious_area / 43560)) * 12
 
@@ -191,14 +241,14 @@ def runoff_volume_captured(data):
 
     depth_treated = runoff_depth_treated(data)
 
-    impervious_area = float(data.get('impervious_area', 0))
+    impervious_area = float(data['impervious_area'])
 
     return (depth_treated * impervious_area) / (float(12) * 43560)
 
 
 def acres_of_protected_bmps_to_reduce_stormwater_runoff(data):
 
-    total_drainage_area = float(data.get('total_drainage_area', 0))
+    total_drainage_area = float(data['total_drainage_area'])
 
     return (total_drainage_area / 43560)
 
@@ -212,7 +262,7 @@ def gallons_per_year_of_stormwater_detained_or_infiltrated(data):
 
     gallons_ = 0
 
-    runoff_volume_captured = float(data.get('runoff_volume_captured', 0))
+    runoff_volume_captured = float(data['runoff_volume_captured'])
 
     if runoff_volume_captured:
 
@@ -2,6 +2,9 @@
 
 from flask import Blueprint
 
+from app import registry
+from app.registry import Input
+
 
 module = Blueprint(**{
     'name': __name__,
@@ -16,4 +19,17 @@ module = Blueprint(**{
 
 if module:
     """Verify module Blueprint is instantiated."""
-    from . import utilities
+    registry.register('swp', '%s.utilities' % __name__, **{
+        'inputs': [
+            Input('footprint_area'),
+            Input('impervious_acres'),
+            Input('ponding_depth')
+        ],
+        'outputs': [
+            'load_sources',
+            'tn_lbs_reduced',
+            'tp_lbs_reduced',
+            'tss_lbs_reduced'
+        ],
+        'curve_tables': True
+    })
@@ -0,0 +1,443 @@
+#!/usr/bin/env python
+
+import collections
+import os
+import threading
+import time
+
+from flask import current_app
+from sqlalchemy import func
+from sqlalchemy.exc import SQLAlchemyError
+
+from app import db
+from app import logger
+from app import results
+from app.schema.load_rates import LoadRateRatios
+from app.schema.load_rates import LoadRates
+
+
+LoadRatio = collections.namedtuple('LoadRatio', [
+    'n',
+    'p',
+    'tss'
+])
+
+
+def calc_ratios(load_rate, n, p, tss):
+    """Divide each load by the load rate.
+
+    :return LoadRatio: The ratios, or None if the load rate is zero or
+        any value is missing.
+    """
+
+    if not load_rate or None in (n, p, tss):
+
+        return None
+
+    return LoadRatio(n / load_rate, p / load_rate, tss / load_rate)
+
+
+def query_rates(segments=None, source_keys=None):
+    """Yield load ratios for every segment and source in one query.
+
+    Ratios precomputed in `load_rate_ratios` are used where present and
+    computed from `load_rates` otherwise.
+
+    :param list segments: Land river segment keys, or None for all rows.
+    :param list source_keys: Normalized load source keys.
+    """
+
+    rate_q = db.session.query(
+        LoadRates.key,
+        LoadRates.normalized_source,
+        LoadRates.load_rate,
+        LoadRates.n,
+        LoadRates.p,
+        LoadRates.tss,
+        LoadRateRatios.load_rate_id,
+        LoadRateRatios.n_ratio,
+        LoadRateRatios.p_ratio,
+        LoadRateRatios.tss_ratio
+    ).outerjoin(
+        LoadRateRatios,
+        LoadRateRatios.load_rate_id == LoadRates.id
+    )
+
+    if segments is not None:
+
+        rate_q = rate_q.filter(
+            LoadRates.key.in_(segments),
+            LoadRates.normalized_source.in_(source_keys)
+        )
+
+    for row in rate_q.order_by(LoadRates.id):
+
+        if row.load_rate_id is None:
+
+            ratios = calc_ratios(row.load_rate, row.n, row.p, row.tss)
+
+        elif row.n_ratio is None:
+
+            ratios = None
+
+        else:
+
+            ratios = LoadRatio(row.n_ratio, row.p_ratio, row.tss_ratio)
+
+        yield (row.key, row.normalized_source), ratios
+
+
+def query_version():
+    """Summarize `load_rates` and `load_rate_ratios` in one query.
+
+    Row counts, the highest id and the sums of the numeric columns
+    change with any insert or delete, and with edits to the loads unless
+    they cancel out.
+
+    :return tuple: The summary, comparable between calls.
+    """
+
+    row = db.session.query(
+        func.count(LoadRates.id),
+        func.max(LoadRates.id),
+        func.sum(LoadRates.load_rate),
+        func.sum(LoadRates.n),
+        func.sum(LoadRates.p),
+        func.sum(LoadRates.tss),
+        func.count(LoadRateRatios.load_rate_id),
+        func.sum(LoadRateRatios.n_ratio),
+        func.sum(LoadRateRatios.p_ratio),
+        func.sum(LoadRateRatios.tss_ratio)
+    ).outerjoin(
+        LoadRateRatios,
+        LoadRateRatios.load_rate_id == LoadRates.id
+    ).one()
+
+    return tuple(str(value) for value in row)
+
+
+def rebuild_ratios():
+    """Recompute `load_rate_ratios` from `load_rates`.
+
+    :return int: The number of rows written.
+    """
+
+    rows = []
+
+    for row in db.session.query(LoadRates).order_by(LoadRates.id):
+
+        ratios = calc_ratios(row.load_rate, row.n, row.p, row.tss)
+
+        rows.append({
+            'load_rate_id': row.id,
+            'n_ratio': ratios.n if ratios else None,
+            'p_ratio': ratios.p if ratios else None,
+            'tss_ratio': ratios.tss if ratios else None
+        })
+
+    db.session.query(LoadRateRatios).delete()
+
+    if rows:
+
+        db.session.execute(LoadRateRatios.__table__.insert(), rows)
+
+    db.session.commit()
+
+    load_rates.invalidate()
+
+    logger.info(
+        'swp.cache.rebuild_ratios: %s rows',
+        len(rows))
+
+    return len(rows)
+
+
+def prefetch(segments, source_keys):
+    """Build a request-scoped lookup without touching the shared index.
+
+    :return dict: `LoadRatio` tuples keyed by `(segment, source_key)`.
+        Pairs with no usable row are absent or None.
+    """
+
+    rates = {}
+
+    if segments and source_keys:
+
+        for pair, ratios in query_rates(segments, source_keys):
+
+            rates.setdefault(pair, ratios)
+
+    return rates
+
+
+class LoadRateCache(object):
+    """In-memory index of `load_rates` rows keyed by segment and source.
+
+    Pairs of `(key, normalized_source)` that are not yet indexed are
+    loaded with a single bulk query, so a request costs at most one round
+    trip however many segments and input groups it contains. Pairs with
+    no matching row are remembered as well, so they are not queried again.
+
+    The index is controlled by the application configuration:
+
+    `LOAD_RATE_CACHE_ENABLED`
+        Set to False to skip the shared index. Each request then runs its
+        own bulk query through `prefetch()`.
+    `LOAD_RATE_CACHE_TTL`
+        Seconds to keep the index before it is discarded and reloaded on
+        demand. `None` (the default) keeps it until `invalidate()`.
+    `LOAD_RATE_CACHE_PRELOAD`
+        Load the whole table on first use instead of the requested
+        subset. Afterwards no lookup queries the database.
+    `LOAD_RATE_VERSION_INTERVAL`
+        Seconds between checks of `query_version()` by a background
+        thread, started in each process on first use. When the tables
+        changed, the index is discarded and a new generation starts, so
+        cached results and ETags follow the data even if nobody calls
+        `invalidate()`. Requests never wait for the check. Defaults to
+        5; `None` never checks.
+
+    The generation is part of the result cache version and of every
+    ETag (see `app.results`), whether or not the index is enabled.
+    """
+
+    def __init__(self):
+        """Initialize top level variables."""
+        self.lock = threading.Lock()
+        self.configured = False
+        self.enabled = True
+        self.ttl = None
+        self.preload = False
+        self.interval = 5
+        self.generation = 0
+        self.data_version = None
+        self.pid = None
+        self.reset()
+
+    def __repr__(self):
+        """Display of LoadRateCache when inspected."""
+        return '<LoadRateCache %s>' % len(self.rows)
+
+    def configure(self, config):
+
+        self.enabled = config.get('LOAD_RATE_CACHE_ENABLED', True)
+
+        self.ttl = config.get('LOAD_RATE_CACHE_TTL')
+
+        self.preload = config.get('LOAD_RATE_CACHE_PRELOAD', False)
+
+        self.interval = config.get('LOAD_RATE_VERSION_INTERVAL', 5)
+
+        self.configured = True
+
+    def reset(self):
+
+        self.rows = {}
+
+        self.complete = False
+
+        self.loaded_at = time.time()
+
+    def invalidate(self):
+        """Discard every indexed row, e.g. after `load_rates` changes."""
+
+        with self.lock:
+
+            self.reset()
+
+            self.generation += 1
+
+        logger.info(
+            'swp.cache.invalidate: generation %s',
+            self.generation)
+
+    def setup(self):
+        """Configure the index and start watching the load rate tables.
+
+        Runs on first use in every process, including forked ones, whose
+        copy of the index has no watcher thread.
+        """
+
+        app = current_app._get_current_object()
+
+        with self.lock:
+
+            if self.configured and self.pid == os.getpid():
+
+                return
+
+            self.configure(app.config)
+
+            self.pid = os.getpid()
+
+        if self.interval is not None:
+
+            threading.Thread(
+                target=self.watch,
+                args=(app,),
+                name='load-rates-version',
+                daemon=True).start()
+
+    def watch(self, app):
+        """Check the load rate tables every `interval` seconds."""
+
+        while True:
+
+            with app.app_context():
+
+                self.check_data()
+
+            time.sleep(self.interval)
+
+    def check_data(self):
+        """Start a new generation if the load rate tables changed.
+
+        If `query_version()` fails the last known version is kept, so an
+        unreachable database does not discard cached results.
+        """
+
+        try:
+
+            version = query_version()
+
+        except SQLAlchemyError as error:
+
+            db.session.rollback()
+
+            logger.error(
+                'swp.cache.check_data: %s',
+                error)
+
+            return
+
+        with self.lock:
+
+            if (self.data_version is not None and
+                    version != self.data_version):
+
+                self.reset()
+
+                self.generation += 1
+
+                logger.info(
+                    'swp.cache.check_data: load rates changed; generation %s',
+                    self.generation)
+
+            self.data_version = version
+
+    def expired(self):
+
+        return (self.ttl is not None and
+                time.time() - self.loaded_at > self.ttl)
+
+    def current_generation(self):
+        """Return the generation, starting a new one if the index expired.
+
+        A new generation also starts when the load rate tables change.
+        """
+
+        if self.pid != os.getpid():
+
+            self.setup()
+
+        with self.lock:
+
+            if self.expired():
+
+                self.reset()
+
+                self.generation += 1
+
+            return self.generation
+
+    def fetch(self, segments, source_keys):
+        """Return the rows for every requested segment and source.
+
+        :param list segments: Land river segment keys.
+        :param list source_keys: Normalized load source keys.
+
+        :return dict: `LoadRatio` tuples (or None where no usable row
+            exists) keyed by `(segment, source_key)`.
+        """
+
+        if self.pid != os.getpid():
+
+            self.setup()
+
+        if not self.enabled:
+
+            return prefetch(segments, source_keys)
+
+        pairs = [
+            (segment, source_key)
+            for segment in segments
+            for source_key in source_keys
+        ]
+
+        with self.lock:
+
+            if self.expired():
+
+                self.reset()
+
+                self.generation += 1
+
+            missing = [pair for pair in pairs if pair not in self.rows]
+
+            if missing and not self.complete:
+
+                if self.preload:
+
+                    self.load()
+
+                    self.complete = True
+
+                else:
+
+                    self.load(
+                        set(segment for segment, _ in missing),
+                        set(source_key for _, source_key in missing))
+
+            for pair in missing:
+
+                self.rows.setdefault(pair, None)
+
+            return {pair: self.rows[pair] for pair in pairs}
+
+    def warm(self):
+        """Index the whole table now, unless the index is disabled."""
+
+        if self.pid != os.getpid():
+
+            self.setup()
+
+        if not self.enabled:
+
+            return
+
+        with self.lock:
+
+            if not self.complete:
+
+                self.load()
+
+                self.complete = True
+
+    def load(self, segments=None, source_keys=None):
+
+        count = 0
+
+        for pair, ratios in query_rates(segments, source_keys):
+
+            self.rows.setdefault(pair, ratios)
+
+            count += 1
+
+        logger.debug(
+            'swp.cache.load: %s rows',
+            count)
+
+
+load_rates = LoadRateCache()
+
+results.cache.register_version('load_rates', load_rates.current_generation)
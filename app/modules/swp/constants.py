@@ -0,0 +1,24 @@
+#!/usr/bin/env python
+
+# Inches treated are clamped to the range covered by the curves.
+
+MIN_INCHES_TREATED = 0.05
+
+MAX_INCHES_TREATED = 2.5
+
+# Percent reduced performance curves for runoff reduction (rr) and
+# stormwater treatment (st) practices, as polynomial coefficients from
+# the fifth power of inches treated down to the constant term.
+
+PERFORMANCE_CURVES = {
+    "rr": {
+        "tn": (0.0308, -0.2562, 0.8634, -1.5285, 1.501, -0.013),
+        "tp": (0.0304, -0.2619, 0.9161, -1.6837, 1.7072, -0.0091),
+        "tss": (0.0326, -0.2806, 0.9816, -1.8039, 1.8292, -0.0091)
+    },
+    "st": {
+        "tn": (0.0152, -0.1310, 0.4581, -0.8418, 0.8536, -0.0046),
+        "tp": (0.0239, -0.2058, 0.7198, -1.3229, 1.3414, -0.0072),
+        "tss": (0.0304, -0.2619, 0.9161, -1.6837, 1.7072, -0.0091)
+    }
+}
@@ -0,0 +1,332 @@
+#!/usr/bin/env python
+
+"""Columnar SWP calculations.
+
+Evaluates inches treated, percent reduced and pounds reduced for many
+input groups at once as NumPy arrays, for scenario runs that cover a
+whole jurisdiction. The engine is a library for such runs; analyze
+requests, portfolios and jobs always use `utilities.reduction`.
+
+The performance curves are the ones `utilities.CALCS` uses, evaluated
+with `app.utilities.horner` from `constants.PERFORMANCE_CURVES`, and
+pounds reduced are computed in float64 rather than `Decimal`. Percent
+and pounds reduced agree with the scalar path to within `TOLERANCE`,
+relative or absolute (see `math.isclose`).
+"""
+
+import numpy
+
+from app.utilities import horner
+from .cache import LoadRatio
+from .cache import load_rates
+from .constants import MAX_INCHES_TREATED
+from .constants import MIN_INCHES_TREATED
+from .constants import PERFORMANCE_CURVES
+from . import utilities
+from .utilities import curve_tables
+
+
+#: Agreement with `utilities`, relative or absolute.
+
+TOLERANCE = 1e-9
+
+KEYS = ('tn', 'tp', 'tss')
+
+
+def inches_treated(footprint_area, ponding_depth, impervious_acres):
+
+    """Runoff depth treated per impervious acre, clamped to the curves.
+
+    Groups with no impervious acres are NaN.
+    """
+
+    footprint_area = numpy.asarray(footprint_area, dtype=float)
+
+    ponding_depth = numpy.asarray(ponding_depth, dtype=float)
+
+    impervious_acres = numpy.asarray(impervious_acres, dtype=float)
+
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+
+        depth = (footprint_area * ponding_depth * 12) / impervious_acres
+
+    depth[~numpy.isfinite(depth)] = numpy.nan
+
+    return numpy.clip(depth, MIN_INCHES_TREATED, MAX_INCHES_TREATED)
+
+
+def curve(mode, key, inches, tables=False):
+
+    if tables:
+
+        return curve_tables()[mode][key].evaluate(inches)
+
+    return horner(PERFORMANCE_CURVES[mode][key], inches)
+
+
+def percent_reduced(inches, mode='rr', tables=False):
+
+    """Evaluate the performance curves for every group.
+
+    :param inches: Array of clamped inches treated.
+    :param mode: `'rr'`, `'st'`, or an array of either per group.
+    :param tables: Use the interpolated lookup tables from
+    `app.curves` instead of the exact polynomials.
+    :return: A dictionary of arrays keyed by `tn`, `tp` and `tss`.
+    """
+
+    mode = numpy.asarray(mode)
+
+    result = {}
+
+    for key in KEYS:
+
+        if mode.ndim == 0:
+
+            result[key] = curve(str(mode), key, inches, tables)
+
+        else:
+
+            result[key] = numpy.where(
+                mode == 'st',
+                curve('st', key, inches, tables),
+                curve('rr', key, inches, tables))
+
+    return result
+
+
+def reductions(footprint_area, ponding_depth, impervious_acres, source_acres,
+               segment_loads, mode='rr', tables=False):
+
+    """Compute percent and pounds reduced for N input groups.
+
+    :param footprint_area: Practice footprint area (acres) per group.
+    :param ponding_depth: Ponding depth (feet) per group.
+    :param impervious_acres: Impervious acres in the drainage area per group.
+    :param source_acres: Load source acres per group.
+    :param segment_loads: Dictionary of arrays keyed by `tn`, `tp` and
+    `tss` holding the segment-averaged load (pounds/acre) per group.
+    Groups without a load are NaN and reduce nothing.
+    :param mode: `'rr'`, `'st'`, or an array of either per group.
+    :param tables: Use the interpolated curve lookup tables.
+    :return: A dictionary of arrays: `inches_treated` and, for each key,
+    `<key>_pct_reduced` and `<key>_lbs_reduced`.
+    """
+
+    inches = inches_treated(footprint_area, ponding_depth, impervious_acres)
+
+    source_acres = numpy.asarray(source_acres, dtype=float)
+
+    percents = percent_reduced(inches, mode, tables)
+
+    result = {
+        'inches_treated': inches
+    }
+
+    for key in KEYS:
+
+        pounds = (
+            numpy.asarray(segment_loads[key], dtype=float) *
+            source_acres *
+            percents[key]
+        )
+
+        result['%s_pct_reduced' % key] = percents[key]
+
+        result['%s_lbs_reduced' % key] = numpy.nan_to_num(pounds)
+
+    return result
+
+
+def is_number(value):
+
+    return isinstance(value, (float, int)) and not isinstance(value, bool)
+
+
+def segment_averages(segments, source_key, rates):
+
+    """Average the load ratios of the segments that have one."""
+
+    ratios = [rates.get((segment, source_key)) for segment in segments]
+
+    ratios = [item for item in ratios if item is not None]
+
+    if not ratios:
+
+        return (numpy.nan,) * len(KEYS)
+
+    return tuple(
+        sum(float(getattr(item, field)) for item in ratios) / len(ratios)
+        for field in LoadRatio._fields
+    )
+
+
+def is_vectorized(data):
+
+    """Whether `utilities.reduction` would total every group of `data`.
+
+    That is the case when the practice has its segments, load sources
+    and input groups, numeric inputs with impervious acres, a known
+    mode, and every group has a source key and numeric source acres.
+    """
+
+    if not isinstance(data.get('segments'), list):
+
+        return False
+
+    if not isinstance(data.get('load_sources'), list):
+
+        return False
+
+    input_groups = data.get('input_groups', [])
+
+    if not isinstance(input_groups, list):
+
+        return False
+
+    values = [
+        data.get('footprint_area'),
+        data.get('ponding_depth'),
+        data.get('impervious_acres')
+    ]
+
+    if not all(map(is_number, values)) or not values[2]:
+
+        return False
+
+    if data.get('mode', 'rr') not in PERFORMANCE_CURVES:
+
+        return False
+
+    return all(
+        isinstance(group, dict) and
+        isinstance(group.get('source_key'), str) and
+        is_number(group.get('source_acres'))
+        for group in input_groups
+    )
+
+
+def evaluate(practices, tables=False):
+
+    """Evaluate the input groups of many SWP practice payloads at once.
+
+    Load ratios for every segment and source in the batch are fetched
+    with a single `load_rates.fetch()` call. Like `utilities.reduction`,
+    each payload is updated in place with the percent and pounds reduced
+    of its groups and the pound totals, and returned.
+
+    Payloads that `utilities.reduction` would not total, e.g. without
+    `load_sources` or with a group it skips, are passed to it instead,
+    so they return or raise exactly as on the scalar path.
+
+    :param list practices: Validated SWP payloads.
+    :param tables: Use the interpolated curve lookup tables.
+    :return list: The result of every payload, in order.
+    """
+
+    columns = {
+        'practice': [],
+        'footprint_area': [],
+        'ponding_depth': [],
+        'impervious_acres': [],
+        'source_acres': [],
+        'mode': [],
+        'tn': [],
+        'tp': [],
+        'tss': []
+    }
+
+    results = []
+
+    vectorized = []
+
+    groups = []
+
+    all_segments = set()
+
+    all_sources = set()
+
+    for index, data in enumerate(practices):
+
+        if not is_vectorized(data):
+
+            results.append(utilities.reduction(data, tables=tables))
+
+            continue
+
+        results.append(data)
+
+        vectorized.append(index)
+
+        segments = data['segments']
+
+        for group in data.get('input_groups', []):
+
+            groups.append((index, segments, group))
+
+            all_segments.update(segments)
+
+            all_sources.add(group['source_key'])
+
+    rates = load_rates.fetch(sorted(all_segments), sorted(all_sources))
+
+    averages = {}
+
+    for index, segments, group in groups:
+
+        data = practices[index]
+
+        memo_key = (tuple(segments), group['source_key'])
+
+        if memo_key not in averages:
+
+            averages[memo_key] = segment_averages(
+                segments,
+                group['source_key'],
+                rates)
+
+        tn, tp, tss = averages[memo_key]
+
+        columns['practice'].append(index)
+        columns['footprint_area'].append(data['footprint_area'])
+        columns['ponding_depth'].append(data['ponding_depth'])
+        columns['impervious_acres'].append(data['impervious_acres'])
+        columns['source_acres'].append(group['source_acres'])
+        columns['mode'].append(data.get('mode', 'rr'))
+        columns['tn'].append(tn)
+        columns['tp'].append(tp)
+        columns['tss'].append(tss)
+
+    result = reductions(
+        columns['footprint_area'],
+        columns['ponding_depth'],
+        columns['impervious_acres'],
+        columns['source_acres'],
+        {key: columns[key] for key in KEYS},
+        mode=numpy.asarray(columns['mode'], dtype=str),
+        tables=tables)
+
+    for row, (index, segments, group) in enumerate(groups):
+
+        group.update({
+            name: float(result[name][row])
+            for key in KEYS
+            for name in ('%s_pct_reduced' % key, '%s_lbs_reduced' % key)
+        })
+
+    totals = {
+        key: numpy.bincount(
+            numpy.asarray(columns['practice'], dtype=int),
+            weights=result['%s_lbs_reduced' % key],
+            minlength=len(practices))
+        for key in KEYS
+    }
+
+    for index in vectorized:
+
+        practices[index].update({
+            '%s_lbs_reduced' % key: float(totals[key][index])
+            for key in KEYS
+        })
+
+    return results
@@ -4,9 +4,18 @@ from decimal import Decimal
 from decimal import InvalidOperation
 
 from app import db
-from app import logger
+from app import log
 from app.schema.load_rates import LoadRates
 
+from .cache import load_rates
+from .constants import MAX_INCHES_TREATED
+from .constants import MIN_INCHES_TREATED
+from .constants import PERFORMANCE_CURVES
+
+
+#: Per-group debug events, sampled per `LOG_SAMPLE_EVERY`.
+
+hot_logger = log.SampledLogger(log.get_logger(__name__))
 
 CALCS = {
     'rr': {
@@ -27,16 +36,52 @@ CALCS = {
     }
 }
 
+TABLES = {}
+
+
+def curve_tables():
+    """Build the performance curve lookup tables on first use."""
+
+    if not TABLES:
+
+        # Imported here so NumPy only loads when the tables are used.
+
+        from app.curves import CurveTable
+
+        TABLES.update({
+            mode: {
+                key: CurveTable(
+                    coefficients,
+                    MIN_INCHES_TREATED,
+                    MAX_INCHES_TREATED
+                )
+                for key, coefficients in curves.items()
+            }
+            for mode, curves in PERFORMANCE_CURVES.items()
+        })
+
+    return TABLES
+
+
+def performance_curves(tables=False):
+    """Return the curve lookup tables if `tables` is set."""
+
+    if tables:
+
+        return curve_tables()
+
+    return CALCS
+
 
 def adjust_inches_treated(value):
 
-    if value < 0.05:
+    if value < MIN_INCHES_TREATED:
 
-        return 0.05
+        return MIN_INCHES_TREATED
 
-    if value > 2.5:
+    if value > MAX_INCHES_TREATED:
 
-        return 2.5
+        return MAX_INCHES_TREATED
 
     return value
 
@@ -65,7 +110,15 @@ def tss(value):
             1.8292 * value) - 0.0091
 
 
-def reduction(data):
+def warm(tables=False):
+    """Index every load rate and build the selected performance curves."""
+
+    load_rates.warm()
+
+    performance_curves(tables)
+
+
+def reduction(data, tables=False):
 
     # Land river segment list.
 
@@ -85,11 +138,25 @@ def reduction(data):
 
         return {}
 
+    # Fetch the load rates for every input group up front so the
+    # request costs at most one query.
+
+    source_keys = set(
+        group.get('source_key')
+        for group in input_groups
+        if isinstance(group, dict) and
+        isinstance(group.get('source_key'), str)
+    )
+
+    rates = load_rates.fetch(segments, source_keys)
+
+    curves = performance_curves(tables)
+
     for group in input_groups:
 
         try:
 
-            process_input_group(segments, group, data)
+            process_input_group(segments, group, data, rates, curves)
 
         except ValueError:
 
@@ -108,7 +175,7 @@ def reduction(data):
     return data
 
 
-def process_input_group(segments, group, data):
+def process_input_group(segments, group, data, rates, curves=CALCS):
 
     # Load source key.
 
@@ -134,19 +201,16 @@ def process_input_group(segments, group, data):
 
     ponding_depth = data.get('ponding_depth')
 
-    values = [
-        source_acres,
-        footprint_area,
-        impervious_acres,
-        ponding_depth,
-    ]
-
     # Calculation mode.
 
     mode = data.get('mode', 'rr')
 
+    # The practice inputs were validated at dispatch; only their
+    # presence and the group's own inputs are checked here.
+
     if (mode not in ['rr', 'st'] or
-            not all(isinstance(x, (float, int)) for x in values)):
+            not isinstance(source_acres, (float, int)) or
+            None in (footprint_area, impervious_acres, ponding_depth)):
 
         raise ValueError('Invalid mode or numeric inputs.')
 
@@ -154,7 +218,7 @@ def process_input_group(segments, group, data):
 
     runoff_storage_volume = footprint_area * ponding_depth
 
-    logger.warning(
+    hot_logger.debug(
         'swp.utilities.process_input_group:runoff_storage_volume: %s.',
         runoff_storage_volume
     )
@@ -174,18 +238,18 @@ def process_input_group(segments, group, data):
             treatment_depth / impervious_acres
         )
 
-        logger.warning(
+        hot_logger.debug(
             'swp.utilities.process_input_group:inches_treated: %s.',
             inches_treated
         )
 
         group.update({
-            'tn_pct_reduced': CALCS[mode]['tn'](inches_treated),
-            'tp_pct_reduced': CALCS[mode]['tp'](inches_treated),
-            'tss_pct_reduced': CALCS[mode]['tss'](inches_treated)
+            'tn_pct_reduced': curves[mode]['tn'](inches_treated),
+            'tp_pct_reduced': curves[mode]['tp'](inches_treated),
+            'tss_pct_reduced': curves[mode]['tss'](inches_treated)
         })
 
-        logger.warning(
+        hot_logger.debug(
             'swp.utilities.process_input_group:reductions: %s.',
             group
         )
@@ -194,7 +258,8 @@ def process_input_group(segments, group, data):
             segments,
             source_key,
             group,
-            data
+            data,
+            rates
         )
 
     except ZeroDivisionError as error:
@@ -202,7 +267,7 @@ def process_input_group(segments, group, data):
         raise ValueError(error.message)
 
 
-def calc_reduced_loads(segments, source_key, group, data):
+def calc_reduced_loads(segments, source_key, group, data, rates):
 
     s_loads = []
     n_loads = []
@@ -210,32 +275,20 @@ def calc_reduced_loads(segments, source_key, group, data):
 
     for segment in segments:
 
-        rate_q = db.session.query(
-            LoadRates
-        ).filter(
-            LoadRates.key == segment,
-            LoadRates.normalized_source == source_key
-        ).first()
-
-        try:
+        ratios = rates.get((segment, source_key))
 
-            load_rate = rate_q.load_rate
+        # Segments without a (non-zero) load rate for this source
+        # do not contribute to the average.
 
-            n_loads.append(
-                rate_q.n / load_rate
-            )
+        if ratios is None:
 
-            p_loads.append(
-                rate_q.p / load_rate
-            )
+            continue
 
-            s_loads.append(
-                rate_q.tss / load_rate
-            )
+        n_loads.append(ratios.n)
 
-        except (AttributeError, KeyError):
+        p_loads.append(ratios.p)
 
-            pass
+        s_loads.append(ratios.tss)
 
     red_credits = {
         'tn': calc_load_reduction(
@@ -0,0 +1,412 @@
+#!/usr/bin/env python
+
+"""Read, run and write practice portfolios outside the web stack.
+
+Used by `runbatch.py`. Portfolios are read from:
+
+* CSV, one practice per row. Each cell is decoded as JSON where it can
+  be, so numbers and nested lists such as `segments` or `input_groups`
+  survive, and left as text otherwise. `TRUE` and `FALSE` are read as
+  booleans in any case, and empty cells are omitted.
+* JSON Lines (`.jsonl`, `.ndjson`), one practice object per line.
+* JSON (`.json`), an array of practice objects.
+* Parquet (`.parquet`), one practice per row. Requires `pyarrow`.
+
+Results are written one row per practice, in input order, to Parquet,
+CSV, JSON Lines or JSON. Each row holds `index`, `practice_code`, `error_code`
+and `error_message`, followed by the result fields in name order. Nested
+result values are written as JSON text.
+"""
+
+import csv
+import importlib
+import json
+import os
+import time
+
+from decimal import Decimal
+
+from . import executor
+
+
+FORMATS = {
+    '.csv': 'csv',
+    '.json': 'json',
+    '.jsonl': 'jsonl',
+    '.ndjson': 'jsonl',
+    '.parquet': 'parquet',
+    '.pq': 'parquet'
+}
+
+BOOLEANS = {
+    'true': True,
+    'false': False
+}
+
+LEADING_COLUMNS = (
+    'index',
+    'practice_code',
+    'error_code',
+    'error_message'
+)
+
+
+class FormatError(ValueError):
+
+    """An unsupported or unreadable portfolio file."""
+
+
+def detect_format(path, file_format=None):
+
+    file_format = file_format or FORMATS.get(
+        os.path.splitext(path)[1].lower())
+
+    if file_format not in FORMATS.values():
+
+        raise FormatError(
+            'Cannot tell the format of %s; pass it explicitly.' % path)
+
+    return file_format
+
+
+def import_parquet():
+    """Return `(pyarrow, pyarrow.parquet)`, which are optional."""
+
+    try:
+
+        import pyarrow
+        import pyarrow.parquet
+
+    except ImportError:
+
+        raise FormatError('Parquet files require pyarrow.')
+
+    return pyarrow, pyarrow.parquet
+
+
+def parse_cell(text):
+
+    if text.lower() in BOOLEANS:
+
+        return BOOLEANS[text.lower()]
+
+    try:
+
+        return json.loads(text)
+
+    except ValueError:
+
+        return text
+
+
+def read_csv(path):
+
+    with open(path, newline='') as source:
+
+        return [
+            {
+                key: parse_cell(value)
+                for key, value in row.items()
+                if key and value != ''
+            }
+            for row in csv.DictReader(source)
+        ]
+
+
+def read_jsonl(path):
+
+    items = []
+
+    with open(path) as source:
+
+        for number, line in enumerate(source, 1):
+
+            line = line.strip()
+
+            if not line:
+
+                continue
+
+            try:
+
+                items.append(json.loads(line))
+
+            except ValueError:
+
+                raise FormatError('Invalid JSON on line %s of %s.' % (
+                    number,
+                    path))
+
+    return items
+
+
+def read_json(path):
+
+    with open(path) as source:
+
+        try:
+
+            items = json.load(source)
+
+        except ValueError:
+
+            raise FormatError('Invalid JSON in %s.' % path)
+
+    if not isinstance(items, list):
+
+        raise FormatError('%s must hold an array of practices.' % path)
+
+    return items
+
+
+def read_parquet(path):
+
+    _, parquet = import_parquet()
+
+    return [
+        {
+            key: value
+            for key, value in row.items()
+            if value is not None
+        }
+        for row in parquet.read_table(path).to_pylist()
+    ]
+
+
+READERS = {
+    'csv': read_csv,
+    'json': read_json,
+    'jsonl': read_jsonl,
+    'parquet': read_parquet
+}
+
+
+def read(path, file_format=None):
+    """Read the practice payloads in `path`.
+
+    :return list: One payload per practice, in file order.
+    """
+
+    return READERS[detect_format(path, file_format)](path)
+
+
+def encode(value):
+
+    if isinstance(value, (dict, list, tuple)):
+
+        return json.dumps(value, sort_keys=True, default=str)
+
+    return value
+
+
+def flatten(item, data):
+    """Return the output row for the result `item` of payload `data`."""
+
+    row = {
+        'index': item['index'],
+        'practice_code': (
+            data.get('practice_code') if isinstance(data, dict) else None),
+        'error_code': None,
+        'error_message': None
+    }
+
+    error = item.get('error')
+
+    if error is not None:
+
+        row['error_code'] = error['code']
+
+        row['error_message'] = error['message']
+
+        return row
+
+    result = item.get('result')
+
+    if not isinstance(result, dict):
+
+        result = {
+            'result': result
+        }
+
+    for key, value in result.items():
+
+        if key not in LEADING_COLUMNS:
+
+            row[key] = encode(value)
+
+    return row
+
+
+def columns(rows):
+    """Return `{column: values}` with one value per row.
+
+    Integer columns stay integers, other numeric columns (including
+    `Decimal` results) become floats, and columns mixing text with other
+    values are written as JSON text, so every column has a single type.
+    """
+
+    names = set()
+
+    for row in rows:
+
+        names.update(row)
+
+    names = list(LEADING_COLUMNS) + sorted(names - set(LEADING_COLUMNS))
+
+    table = {}
+
+    for name in names:
+
+        values = [row.get(name) for row in rows]
+
+        kinds = set(
+            type(value) if isinstance(value, (str, bool, int)) else
+            float if isinstance(value, (float, Decimal)) else
+            object
+            for value in values
+            if value is not None
+        )
+
+        if kinds == set([float]) or kinds == set([int, float]):
+
+            values = [
+                None if value is None else float(value)
+                for value in values
+            ]
+
+        elif len(kinds) > 1:
+
+            values = [
+                None if value is None else
+                value if isinstance(value, str) else
+                json.dumps(value, default=str)
+                for value in values
+            ]
+
+        table[name] = values
+
+    return table
+
+
+def write_csv(path, table):
+
+    names = list(table)
+
+    with open(path, 'w', newline='') as target:
+
+        writer = csv.writer(target)
+
+        writer.writerow(names)
+
+        writer.writerows(zip(*(table[name] for name in names)))
+
+
+def write_jsonl(path, table):
+
+    names = list(table)
+
+    with open(path, 'w') as target:
+
+        for values in zip(*(table[name] for name in names)):
+
+            target.write(json.dumps(dict(zip(names, values)), default=str))
+
+            target.write('\n')
+
+
+def write_json(path, table):
+
+    names = list(table)
+
+    with open(path, 'w') as target:
+
+        json.dump([
+            dict(zip(names, values))
+            for values in zip(*(table[name] for name in names))
+        ], target, default=str)
+
+
+def write_parquet(path, table):
+
+    pyarrow, parquet = import_parquet()
+
+    parquet.write_table(pyarrow.table(table), path)
+
+
+WRITERS = {
+    'csv': write_csv,
+    'json': write_json,
+    'jsonl': write_jsonl,
+    'parquet': write_parquet
+}
+
+
+def write(path, items, results, file_format=None):
+    """Write one row per result to `path`.
+
+    :param list items: The practice payloads, as read.
+    :param list results: The batch result items, in input order.
+    """
+
+    file_format = detect_format(path, file_format)
+
+    rows = [
+        flatten(item, data)
+        for item, data in zip(results, items)
+    ]
+
+    WRITERS[file_format](path, columns(rows))
+
+
+def run(app, items, workers=1, chunk_size=None):
+    """Dispatch every payload in `items` with the `reduction()` functions.
+
+    :param object app: The application to compute with.
+    :param int workers: Worker processes. 1 computes in this process,
+        and 0 uses one worker per CPU.
+
+    :return dict: Batch results in input order, as returned by
+        `/v1/analyze/batch`.
+    """
+
+    started = time.perf_counter()
+
+    if workers == 1:
+
+        handle_item = importlib.import_module('core.utilities').handle_item
+
+        with app.app_context():
+
+            results = [
+                handle_item(index, data)
+                for index, data in enumerate(items)
+            ]
+
+        batch = {
+            'meta': {
+                'count': len(results),
+                'errors': sum(1 for item in results if 'error' in item),
+                'workers': 1
+            },
+            'results': results
+        }
+
+    else:
+
+        pool = executor.PortfolioExecutor(
+            app.config['ENVIRONMENT'],
+            config=app.config.get('CONFIG_OVERRIDES'),
+            workers=workers or None,
+            chunk_size=chunk_size)
+
+        try:
+
+            batch = pool.run(items)
+
+        finally:
+
+            pool.shutdown()
+
+    batch['meta']['elapsed_ms'] = (time.perf_counter() - started) * 1000
+
+    return batch
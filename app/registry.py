@@ -0,0 +1,269 @@
+#!/usr/bin/env python
+
+import importlib
+import math
+import time
+
+
+class Input(object):
+    """Declare a numeric practice input.
+
+    :param str name: The payload key holding the value.
+    :param bool required: Reject payloads that omit the value.
+    :param float default: Value assigned when the key is missing or null.
+    """
+
+    def __init__(self, name, required=False, default=None):
+        """Initialize top level variables."""
+        self.name = name
+        self.required = required
+        self.default = default
+
+    def __repr__(self):
+        """Display of Input when inspected."""
+        return '<Input %s>' % self.name
+
+    def describe(self):
+        return {
+            'name': self.name,
+            'required': self.required,
+            'default': self.default
+        }
+
+
+def coerce_number(value):
+    """Return `value` as an int or float, or None if it is not numeric.
+
+    Numeric strings are converted to floats. Booleans are rejected even
+    though they subclass int, and so are NaN and infinities, which JSON
+    cannot represent.
+    """
+
+    if isinstance(value, bool):
+
+        return None
+
+    if isinstance(value, int):
+
+        return value
+
+    if isinstance(value, str):
+
+        try:
+
+            value = float(value)
+
+        except ValueError:
+
+            return None
+
+    if isinstance(value, float):
+
+        return value if math.isfinite(value) else None
+
+    return None
+
+
+class Practice(object):
+    """A registered practice and its declared inputs and outputs.
+
+    Inputs are compiled into a flat tuple when the practice is registered
+    so that validating a payload is a single pass over the declared keys.
+    Keys that are not declared are passed through to `reduction()`
+    untouched.
+
+    Practices registered with `curve_tables` evaluate their curves from
+    the interpolated lookup tables when `reduction()` or `warm()` is
+    called with `tables=True`; the flag is passed explicitly so the
+    utilities never read it from the application config.
+
+    `reduction()` receives validated payloads only: required inputs and
+    inputs with a default are always numbers, so the utilities index
+    them directly instead of checking each one. A null input counts as
+    missing.
+    """
+
+    def __init__(self, code, utilities, inputs=None, outputs=None,
+                 curve_tables=False):
+        """Initialize top level variables."""
+        self.code = code
+        self.inputs = tuple(inputs or ())
+        self.outputs = tuple(outputs or ())
+        self.curve_tables = curve_tables
+
+        self.fields = tuple(
+            (field.name, field.required, field.default)
+            for field in self.inputs
+        )
+
+        self.import_time = None
+
+        if isinstance(utilities, str):
+
+            self.utilities_name = utilities
+            self.module = None
+
+        else:
+
+            self.utilities_name = utilities.__name__
+            self.module = utilities
+
+    def __repr__(self):
+        """Display of Practice when inspected."""
+        return '<Practice %s>' % self.code
+
+    @property
+    def utilities(self):
+        return self.module or self.load()
+
+    def load(self):
+        """Import the practice utilities if they are not loaded yet."""
+
+        if self.module is None:
+
+            started = time.time()
+
+            module = importlib.import_module(self.utilities_name)
+
+            self.import_time = time.time() - started
+
+            self.module = module
+
+            from app import logger
+
+            logger.info(
+                'Practice `%s` imported %s in %.1f ms.',
+                self.code,
+                self.utilities_name,
+                self.import_time * 1000)
+
+        return self.module
+
+    def warm(self, tables=False):
+        """Import the utilities and let them preload their data.
+
+        Utilities may define `warm()` to fill the caches that the first
+        request would otherwise load, e.g. the load rate index.
+        """
+
+        utilities = self.load()
+
+        warm = getattr(utilities, 'warm', None)
+
+        if warm is None:
+
+            return
+
+        if self.curve_tables:
+
+            warm(tables=tables)
+
+        else:
+
+            warm()
+
+    def validate(self, data):
+        """Coerce declared inputs in place and apply defaults.
+
+        :param dict data: The practice payload.
+
+        :return list: Names of declared inputs that are missing or invalid.
+        """
+
+        invalid = []
+
+        for name, required, default in self.fields:
+
+            value = data.get(name)
+
+            if value is None:
+
+                if required:
+
+                    invalid.append(name)
+
+                elif default is not None:
+
+                    data[name] = default
+
+                continue
+
+            number = coerce_number(value)
+
+            if number is None:
+
+                invalid.append(name)
+
+            else:
+
+                data[name] = number
+
+        return invalid
+
+    def reduction(self, data, tables=False):
+
+        if self.curve_tables:
+
+            return self.utilities.reduction(data, tables=tables)
+
+        return self.utilities.reduction(data)
+
+    def describe(self):
+        return {
+            'code': self.code,
+            'inputs': [field.describe() for field in self.inputs],
+            'outputs': list(self.outputs)
+        }
+
+
+class PracticeRegistry(object):
+    """Index of practice calculation modules keyed by `practice_code`.
+
+    Each practice module registers itself once, while the module package
+    is loaded at startup (see `Application.load_modules`), so dispatching
+    an analyze request is a single dictionary lookup. Registering by
+    dotted path defers importing the practice utilities to first use.
+    """
+
+    def __init__(self):
+        """Initialize top level variables."""
+        self.practices = {}
+
+    def __repr__(self):
+        """Display of PracticeRegistry when inspected."""
+        return '<PracticeRegistry %s>' % len(self.practices)
+
+    def __contains__(self, code):
+        return code in self.practices
+
+    def register(self, code, utilities, inputs=None, outputs=None,
+                 curve_tables=False):
+        """Register the `utilities` module that computes `code`.
+
+        :param str code: The primary `practice_code` segment.
+        :param object utilities: A module exposing `reduction(data)`, or
+            its dotted import path.
+        :param list inputs: `Input` declarations validated before dispatch.
+        :param list outputs: Names of the result fields.
+        :param bool curve_tables: `reduction()` and `warm()` accept a
+            `tables` flag selecting the curve lookup tables.
+        """
+        self.practices[code] = Practice(
+            code,
+            utilities,
+            inputs=inputs,
+            outputs=outputs,
+            curve_tables=curve_tables
+        )
+
+    def get(self, code):
+        return self.practices.get(code)
+
+    def codes(self):
+        return sorted(self.practices)
+
+    def describe(self):
+        return [
+            self.practices[code].describe()
+            for code in self.codes()
+        ]
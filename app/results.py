@@ -0,0 +1,325 @@
+#!/usr/bin/env python
+
+"""Memoize practice results by a canonical hash of their inputs.
+
+Clients often submit identical payloads (form autosave, report
+regeneration). `dispatch` looks each validated payload up here before
+calling the practice's `reduction()`. The key is the SHA-256 of the
+payload serialized with sorted keys, after validation has coerced
+numeric inputs and filled in defaults, so equivalent payloads share an
+entry.
+
+Cached results depend on the model code and the data it reads. The
+cache is cleared whenever the combined version changes. That version
+covers the practice module sources, `app/curves.py`, `app/utilities.py`
+and `__version__`, plus every data provider registered with
+`register_version()` (e.g. the load rate cache generation, which
+follows the contents of the load rate tables, and the segment table
+digest).
+
+Settings, read from the application config on first use:
+
+`RESULT_CACHE_ENABLED`
+    Off by default.
+`RESULT_CACHE_SIZE`
+    Maximum number of entries, evicted least recently used first.
+`RESULT_CACHE_TTL`
+    Seconds an entry stays valid. `None` keeps entries until evicted.
+`RESULT_CACHE_MAX_PAYLOAD`
+    Payloads whose canonical form is longer than this many bytes are
+    not cached.
+
+`etag()` digests the same version with a raw request payload, for HTTP
+conditional requests.
+"""
+
+import collections
+import copy
+import glob
+import hashlib
+import json
+import os
+import threading
+import time
+
+from flask import current_app
+
+from . import __version__
+from . import metrics
+
+
+APP_PATH = os.path.dirname(os.path.abspath(__file__))
+
+#: Returned by `ResultCache.get` when there is no usable entry.
+
+MISS = object()
+
+
+def source_version(paths):
+    """Digest the contents of `paths`."""
+
+    digest = hashlib.sha256(__version__.encode('utf-8'))
+
+    for path in sorted(paths):
+
+        digest.update(os.path.basename(path).encode('utf-8'))
+
+        with open(path, 'rb') as source:
+
+            digest.update(source.read())
+
+    return digest.hexdigest()
+
+
+def model_sources(module_path):
+
+    return glob.glob(os.path.join(module_path, '*', '*.py')) + [
+        os.path.join(APP_PATH, 'curves.py'),
+        os.path.join(APP_PATH, 'utilities.py')
+    ]
+
+
+def canonical(data):
+    """Serialize `data` with sorted keys and no insignificant whitespace.
+
+    :raise TypeError, ValueError: If `data` is not plain JSON.
+    """
+
+    return json.dumps(
+        data,
+        sort_keys=True,
+        separators=(',', ':'),
+        allow_nan=False
+    ).encode('utf-8')
+
+
+def etag(path, data):
+    """Return a strong entity tag for the response to `data` at `path`.
+
+    The tag digests the request payload and the current model/data
+    version, so it changes whenever the result could.
+
+    :return str: The tag, or None if `data` is not plain JSON.
+    """
+
+    try:
+
+        payload = canonical(data)
+
+    except (TypeError, ValueError):
+
+        return None
+
+    digest = hashlib.sha256(path.encode('utf-8'))
+
+    digest.update(repr(cache.current_version()).encode('utf-8'))
+
+    digest.update(payload)
+
+    return digest.hexdigest()
+
+
+class ResultCache(object):
+
+    def __init__(self):
+        """Initialize top level variables."""
+        self.lock = threading.Lock()
+        self.configured = False
+        self.enabled = False
+        self.size = 10000
+        self.ttl = None
+        self.max_payload = 65536
+        self.model_version = None
+        self.providers = {}
+        self.version = None
+        self.entries = collections.OrderedDict()
+        self.counters = collections.Counter()
+
+    def __repr__(self):
+        """Display of ResultCache when inspected."""
+        return '<ResultCache %s>' % len(self.entries)
+
+    def configure(self, config):
+
+        self.enabled = config.get('RESULT_CACHE_ENABLED', False)
+
+        self.size = config.get('RESULT_CACHE_SIZE', 10000)
+
+        self.ttl = config.get('RESULT_CACHE_TTL')
+
+        self.max_payload = config.get('RESULT_CACHE_MAX_PAYLOAD', 65536)
+
+        self.model_version = source_version(
+            model_sources(config['MODULE_PATH']))
+
+        self.configured = True
+
+    def register_version(self, name, func):
+        """Invalidate the cache whenever `func()` returns a new value."""
+
+        self.providers[name] = func
+
+    def current_version(self):
+
+        if not self.configured:
+
+            self.configure(current_app.config)
+
+        return (self.model_version,) + tuple(
+            (name, func())
+            for name, func in sorted(self.providers.items())
+        )
+
+    def key(self, data):
+        """Return the cache key for a validated payload.
+
+        :return str: The key, or None if the cache is disabled or the
+            payload cannot or should not be cached.
+        """
+
+        if not self.configured:
+
+            self.configure(current_app.config)
+
+        if not self.enabled:
+
+            return None
+
+        try:
+
+            payload = canonical(data)
+
+        except (TypeError, ValueError):
+
+            return None
+
+        if len(payload) > self.max_payload:
+
+            self.counters['skipped'] += 1
+
+            return None
+
+        return hashlib.sha256(payload).hexdigest()
+
+    def check_version(self):
+
+        version = self.current_version()
+
+        if version != self.version:
+
+            if self.entries:
+
+                self.counters['invalidations'] += 1
+
+            self.entries.clear()
+
+            self.version = version
+
+    def get(self, key):
+
+        if key is None:
+
+            return MISS
+
+        with self.lock:
+
+            self.check_version()
+
+            entry = self.entries.get(key)
+
+            if entry is None:
+
+                self.counters['misses'] += 1
+
+                return MISS
+
+            stored_at, result = entry
+
+            if self.ttl is not None and time.time() - stored_at > self.ttl:
+
+                del self.entries[key]
+
+                self.counters['expirations'] += 1
+
+                self.counters['misses'] += 1
+
+                return MISS
+
+            self.entries.move_to_end(key)
+
+            self.counters['hits'] += 1
+
+        return copy.deepcopy(result)
+
+    def set(self, key, result):
+
+        if key is None:
+
+            return
+
+        result = copy.deepcopy(result)
+
+        with self.lock:
+
+            self.entries[key] = (time.time(), result)
+
+            self.entries.move_to_end(key)
+
+            while len(self.entries) > self.size:
+
+                self.entries.popitem(last=False)
+
+                self.counters['evictions'] += 1
+
+    def clear(self):
+
+        with self.lock:
+
+            self.entries.clear()
+
+            self.counters.clear()
+
+    def stats(self):
+
+        with self.lock:
+
+            stats = dict.fromkeys((
+                'hits',
+                'misses',
+                'evictions',
+                'expirations',
+                'invalidations',
+                'skipped'
+            ), 0)
+
+            stats.update(self.counters)
+
+            stats['entries'] = len(self.entries)
+
+        return stats
+
+    def metric_lines(self):
+
+        stats = self.stats()
+
+        lines = [
+            '# HELP srm_result_cache_entries Memoized practice results.',
+            '# TYPE srm_result_cache_entries gauge',
+            'srm_result_cache_entries %d' % stats.pop('entries'),
+            '# HELP srm_result_cache_events_total Result cache events.',
+            '# TYPE srm_result_cache_events_total counter'
+        ]
+
+        for event, count in sorted(stats.items()):
+
+            lines.append(
+                'srm_result_cache_events_total{event="%s"} %d' % (
+                    event,
+                    count))
+
+        return lines
+
+
+cache = ResultCache()
+
+metrics.register_collector(cache.metric_lines)
@@ -26,3 +26,29 @@ class LoadRates(db.Model):
     p = db.Column(db.Numeric)
 
     tss = db.Column(db.Numeric)
+
+
+class LoadRateRatios(db.Model):
+
+    """Nutrient and sediment loads per unit load rate.
+
+    Derived from `load_rates` by `manage.py rebuild-ratios`. Ratios are
+    null where the load rate is zero.
+    """
+
+    __tablename__ = 'load_rate_ratios'
+
+    __table_args__ = {
+        'extend_existing': True,
+    }
+
+    load_rate_id = db.Column(
+        db.Integer,
+        db.ForeignKey('load_rates.id', ondelete='CASCADE'),
+        primary_key=True)
+
+    n_ratio = db.Column(db.Numeric)
+
+    p_ratio = db.Column(db.Numeric)
+
+    tss_ratio = db.Column(db.Numeric)
@@ -0,0 +1,356 @@
+#!/usr/bin/env python
+
+import array
+import bisect
+import csv
+import hashlib
+import mmap
+import os
+import struct
+
+from . import logger
+from . import results
+
+
+DATA_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    'static',
+    'data',
+    'lr_loads.csv'
+)
+
+BINARY_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    'static',
+    'data',
+    'lr_loads.bin'
+)
+
+#: Compiled file layout: a header, `count` NUL-padded segment keys of
+#: `width` bytes in ascending order, then one record of seven doubles
+#: (load_rate, n, p, tss, n_ratio, p_ratio, tss_ratio) per key in the
+#: same order. The header stores the SHA-256 digest of the CSV the file
+#: was built from.
+
+MAGIC = b'LRSEGTBL'
+
+FORMAT_VERSION = 1
+
+HEADER = struct.Struct('<8sHHI32s')
+
+RECORD = struct.Struct('<7d')
+
+
+def data_version(path=DATA_PATH):
+    """Return the SHA-256 hex digest of the segment CSV file."""
+
+    with open(path, 'rb') as file_:
+
+        return hashlib.sha256(file_.read()).hexdigest()
+
+
+class SegmentTable(object):
+    """Land river segment load rates held in contiguous float arrays.
+
+    Row `i` of every array belongs to `keys[i]`, and `index` maps a
+    segment key to its row. Nitrogen, phosphorus and sediment loads per
+    unit load rate are computed once when the table is built; they are
+    NaN where the load rate is zero.
+    """
+
+    columns = ('load_rate', 'n', 'p', 'tss')
+
+    def __init__(self, keys, load_rate, n, p, tss, version=None):
+        """Initialize top level variables."""
+        self.version = version
+        self.keys = list(keys)
+        self.index = {key: row for row, key in enumerate(self.keys)}
+
+        self.load_rate = array.array('d', load_rate)
+        self.n = array.array('d', n)
+        self.p = array.array('d', p)
+        self.tss = array.array('d', tss)
+
+        self.n_ratio = self.divide(self.n)
+        self.p_ratio = self.divide(self.p)
+        self.tss_ratio = self.divide(self.tss)
+
+    def __repr__(self):
+        """Display of SegmentTable when inspected."""
+        return '<SegmentTable %s>' % len(self.keys)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __contains__(self, key):
+        return key in self.index
+
+    def divide(self, values):
+
+        return array.array('d', (
+            value / load_rate if load_rate else float('nan')
+            for value, load_rate in zip(values, self.load_rate)
+        ))
+
+    @classmethod
+    def from_csv(cls, path=DATA_PATH, version=None):
+        """Build a table from a `key,load_rate,n,p,tss` CSV file."""
+
+        keys = []
+        values = tuple([] for _ in cls.columns)
+
+        with open(path, newline='') as file_:
+
+            for record in csv.DictReader(file_):
+
+                keys.append(record['key'])
+
+                for column, column_values in zip(cls.columns, values):
+
+                    column_values.append(float(record[column]))
+
+        return cls(keys, *values, version=version or data_version(path))
+
+    def get(self, key):
+        """Return `(load_rate, n, p, tss)` for `key`, or None."""
+
+        row = self.index.get(key)
+
+        if row is None:
+
+            return None
+
+        return (
+            self.load_rate[row],
+            self.n[row],
+            self.p[row],
+            self.tss[row]
+        )
+
+    def ratios(self, key):
+        """Return `(n, p, tss)` per unit load rate for `key`.
+
+        :return tuple: The ratios, or None if the segment is unknown or its
+            load rate is zero.
+        """
+
+        row = self.index.get(key)
+
+        if row is None or not self.load_rate[row]:
+
+            return None
+
+        return (
+            self.n_ratio[row],
+            self.p_ratio[row],
+            self.tss_ratio[row]
+        )
+
+    def build(self, path=BINARY_PATH):
+        """Compile the table into a memory-mappable file at `path`.
+
+        The file is written next to `path` and renamed into place, so
+        processes that already mapped the previous file are unaffected.
+        """
+
+        width = max(len(key.encode('ascii')) for key in self.keys)
+
+        order = sorted(
+            range(len(self.keys)),
+            key=lambda row: self.keys[row].encode('ascii'))
+
+        temp_path = '%s.tmp' % path
+
+        with open(temp_path, 'wb') as file_:
+
+            file_.write(HEADER.pack(
+                MAGIC,
+                FORMAT_VERSION,
+                width,
+                len(order),
+                bytes.fromhex(self.version)))
+
+            for row in order:
+
+                file_.write(self.keys[row].encode('ascii').ljust(width, b'\0'))
+
+            for row in order:
+
+                file_.write(RECORD.pack(
+                    self.load_rate[row],
+                    self.n[row],
+                    self.p[row],
+                    self.tss[row],
+                    self.n_ratio[row],
+                    self.p_ratio[row],
+                    self.tss_ratio[row]))
+
+        os.replace(temp_path, path)
+
+        return len(order)
+
+
+class KeyIndex(object):
+    """Sequence view over the sorted keys of a compiled table.
+
+    Lets `bisect` search the mapped keys without building a list.
+    """
+
+    def __init__(self, buffer, offset, width, count):
+        """Initialize top level variables."""
+        self.buffer = buffer
+        self.offset = offset
+        self.width = width
+        self.count = count
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, row):
+
+        start = self.offset + row * self.width
+
+        return self.buffer[start:start + self.width]
+
+
+class MappedSegmentTable(object):
+    """Read-only segment table backed by a memory-mapped compiled file.
+
+    Every process that maps the same file shares its physical pages, and
+    lookups binary-search the sorted key index in place. Exposes the same
+    `get` and `ratios` lookups as `SegmentTable`.
+    """
+
+    def __init__(self, path=BINARY_PATH):
+        """Initialize top level variables."""
+        with open(path, 'rb') as file_:
+
+            self.buffer = mmap.mmap(
+                file_.fileno(),
+                0,
+                access=mmap.ACCESS_READ)
+
+        magic, format_version, width, count, digest = HEADER.unpack_from(
+            self.buffer, 0)
+
+        if magic != MAGIC or format_version != FORMAT_VERSION:
+
+            raise ValueError('Unsupported segment table file: %s' % path)
+
+        self.path = path
+        self.width = width
+        self.count = count
+        self.version = digest.hex()
+        self.index = KeyIndex(self.buffer, HEADER.size, width, count)
+        self.records = HEADER.size + width * count
+
+    def __repr__(self):
+        """Display of MappedSegmentTable when inspected."""
+        return '<MappedSegmentTable %s>' % self.count
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, key):
+        return self.find(key) is not None
+
+    def find(self, key):
+
+        try:
+
+            needle = key.encode('ascii').ljust(self.width, b'\0')
+
+        except (AttributeError, UnicodeEncodeError):
+
+            return None
+
+        if len(needle) > self.width:
+
+            return None
+
+        row = bisect.bisect_left(self.index, needle)
+
+        if row < self.count and self.index[row] == needle:
+
+            return row
+
+        return None
+
+    def record(self, row):
+
+        return RECORD.unpack_from(
+            self.buffer,
+            self.records + row * RECORD.size)
+
+    def get(self, key):
+        """Return `(load_rate, n, p, tss)` for `key`, or None."""
+
+        row = self.find(key)
+
+        if row is None:
+
+            return None
+
+        return self.record(row)[:4]
+
+    def ratios(self, key):
+        """Return `(n, p, tss)` per unit load rate for `key`.
+
+        :return tuple: The ratios, or None if the segment is unknown or its
+            load rate is zero.
+        """
+
+        row = self.find(key)
+
+        if row is None:
+
+            return None
+
+        record = self.record(row)
+
+        if not record[0]:
+
+            return None
+
+        return record[4:]
+
+
+def load():
+    """Return the shared segment table.
+
+    The compiled file is memory-mapped when it exists and was built from
+    the current CSV; otherwise the CSV is parsed into a `SegmentTable`.
+    """
+
+    version = data_version()
+
+    if os.path.exists(BINARY_PATH):
+
+        try:
+
+            table = MappedSegmentTable(BINARY_PATH)
+
+        except (OSError, ValueError, struct.error) as error:
+
+            logger.warning(
+                'segments.load: unable to map %s: %s',
+                BINARY_PATH,
+                error)
+
+        else:
+
+            if table.version == version:
+
+                return table
+
+            logger.warning(
+                'segments.load: %s is out of date, run '
+                '`manage.py build-segments`',
+                BINARY_PATH)
+
+    return SegmentTable.from_csv(version=version)
+
+
+lr_loads = load()
+
+results.cache.register_version('segments', lambda: lr_loads.version)
@@ -109,3 +109,26 @@ def product(seq):
     """
 
     return functools.reduce(operator.mul, seq)
+
+
+def horner(coefficients, value):
+    """
+    Evaluate a polynomial using Horner's method.
+
+    Works element-wise when `value` is a NumPy array and performs the same
+    sequence of floating point operations either way, so scalar and array
+    evaluations agree exactly.
+
+    :param coefficients: Coefficients ordered from the highest power
+    down to the constant term.
+    :param value: A numeric value or NumPy array.
+    :return: The polynomial evaluated at `value`.
+    """
+
+    result = coefficients[0]
+
+    for coefficient in coefficients[1:]:
+
+        result = result * value + coefficient
+
+    return result
@@ -0,0 +1,26 @@
+#!/usr/bin/env python
+
+"""Standalone benchmarks, run from the repository root, e.g.
+
+    python -m benchmarks.curves
+"""
+
+import timeit
+
+
+def measure(func, number, repeat=5):
+    """Time `func` and return the best seconds per call over `repeat` runs."""
+
+    timer = timeit.Timer(func)
+
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def report(name, seconds, items=1):
+    """Print the latency of one call and the throughput of `items` per call."""
+
+    print('%-40s %12.3f us/op %14.0f items/s' % (
+        name,
+        seconds * 1e6,
+        items / seconds
+    ))
@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+
+"""Compare curve lookup tables with direct polynomial evaluation.
+
+    python -m benchmarks.curves [--size 4096] [--count 100000]
+
+Reports the measured maximum interpolation error of every table and the
+throughput of scalar and array evaluation both ways.
+"""
+
+import argparse
+import functools
+import random
+
+import numpy
+
+from app.curves import CurveTable
+from app.curves import DEFAULT_LOWER
+from app.curves import DEFAULT_UPPER
+from app.curves import DEFAULT_SIZE
+from app.modules.stormwater.constants import ADJUSTOR_CURVES
+from app.modules.swp.constants import PERFORMANCE_CURVES
+from app.utilities import horner
+
+from . import measure
+from . import report
+
+
+def curves():
+
+    for mode, items in sorted(PERFORMANCE_CURVES.items()):
+
+        for key, coefficients in sorted(items.items()):
+
+            yield 'swp.%s.%s' % (mode, key), coefficients
+
+    for key, coefficients in sorted(ADJUSTOR_CURVES.items()):
+
+        yield 'stormwater.%s' % key, coefficients
+
+
+def scalar_loop(func, values):
+
+    for value in values:
+
+        func(value)
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+
+    parser.add_argument('--size', type=int, default=DEFAULT_SIZE)
+
+    parser.add_argument('--count', type=int, default=100000)
+
+    args = parser.parse_args()
+
+    random.seed(0)
+
+    values = [
+        random.uniform(DEFAULT_LOWER, DEFAULT_UPPER)
+        for _ in range(args.count)
+    ]
+
+    array = numpy.array(values)
+
+    tables = []
+
+    print('Max interpolation error (%d intervals):' % args.size)
+
+    for name, coefficients in curves():
+
+        table = CurveTable(coefficients, size=args.size)
+
+        tables.append((name, coefficients, table))
+
+        print('%-40s %12.3e' % (name, table.max_error))
+
+    print('')
+
+    name, coefficients, table = tables[0]
+
+    direct = functools.partial(horner, coefficients)
+
+    print('Throughput for %s, %d values:' % (name, args.count))
+
+    report('scalar polynomial', measure(
+        lambda: scalar_loop(direct, values), 1), args.count)
+
+    report('scalar table', measure(
+        lambda: scalar_loop(table, values), 1), args.count)
+
+    report('array polynomial', measure(
+        lambda: horner(coefficients, array), 10), args.count)
+
+    report('array table', measure(
+        lambda: table.evaluate(array), 10), args.count)
+
+
+if __name__ == '__main__':
+
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+
+"""Application and load rate fixtures shared by the benchmarks."""
+
+import importlib
+import json
+import os
+
+from app import create_application
+from app import db
+from app import registry
+from app.schema.load_rates import LoadRates
+
+
+ROOT_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DATA_PATH = os.path.join(ROOT_PATH, 'app', 'static', 'data', 'load_rate.json')
+
+DEFAULT_ENVIRONMENT = 'benchmark.BenchmarkConfig'
+
+
+def read_load_rates(path=DATA_PATH):
+    """Read load rates as `{segment: {source_key: values}}`."""
+
+    with open(path) as data:
+
+        return json.load(data)
+
+
+def seed_load_rates(load_rates):
+    """Populate an empty `load_rates` table.
+
+    :return int: The number of rows inserted.
+    """
+
+    if db.session.query(LoadRates.id).first() is not None:
+
+        return 0
+
+    rows = []
+
+    for segment, sources in sorted(load_rates.items()):
+
+        for source_key, values in sorted(sources.items()):
+
+            rows.append({
+                'id': len(rows) + 1,
+                'key': segment,
+                'source': source_key.replace('_', ' ').capitalize(),
+                'normalized_source': source_key,
+                'load_rate': values['load_rate'],
+                'n': values['n'],
+                'p': values['p'],
+                'tss': values['tss']
+            })
+
+    db.session.bulk_insert_mappings(LoadRates, rows)
+
+    db.session.commit()
+
+    return len(rows)
+
+
+def sources_with_loads(load_rates):
+    """Map each segment to the sources that have a non-zero load rate."""
+
+    return {
+        segment: sorted(
+            key for key, values in sources.items()
+            if values['load_rate']
+        )
+        for segment, sources in load_rates.items()
+        if any(values['load_rate'] for values in sources.values())
+    }
+
+
+def setup(environment=DEFAULT_ENVIRONMENT):
+    """Create a seeded application.
+
+    :return tuple: The Flask application and the segment sources from
+        `sources_with_loads`.
+    """
+
+    app = create_application(environment)
+
+    load_rates = read_load_rates()
+
+    with app.app_context():
+
+        if seed_load_rates(load_rates):
+
+            # Practices warmed at startup indexed the empty table.
+
+            importlib.import_module('swp.cache').load_rates.invalidate()
+
+            for code in registry.codes():
+
+                registry.get(code).warm()
+
+    return app, sources_with_loads(load_rates)
@@ -0,0 +1,279 @@
+#!/usr/bin/env python
+
+"""Load test `/v1/analyze` over HTTP.
+
+    python -m benchmarks.http_load [--requests 2000] [--concurrency 8]
+        [--practices swp,stormwater] [--url http://host:port]
+
+Replays a shuffled corpus of generated payloads (see
+`benchmarks.payloads`) for every registered practice at the requested
+concurrency. It reports throughput, p50/p95/p99 latency, and the mean
+number of database queries per practice, read from the `X-Query-Count`
+response header.
+
+Without `--url` the application is started in-process on a threaded
+Werkzeug server, against the benchmark configuration with seeded
+`load_rates`. The client threads then share the interpreter with the
+server, so for per-worker capacity numbers point `--url` at a worker
+started separately.
+"""
+
+import argparse
+import collections
+import json
+import logging
+import random
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from werkzeug.serving import make_server
+
+from app import registry
+
+from . import fixtures
+from . import payloads
+
+
+Sample = collections.namedtuple('Sample', [
+    'practice_code',
+    'status',
+    'seconds',
+    'queries'
+])
+
+
+def build_corpus(codes, segments, count, seed):
+    """Generate `count` payloads spread evenly over `codes`, shuffled."""
+
+    rng = random.Random(seed)
+
+    corpus = []
+
+    for index in range(count):
+
+        code = codes[index % len(codes)]
+
+        payload = payloads.GENERATORS[code](rng, segments)
+
+        payload['practice_code'] = code
+
+        corpus.append(payload)
+
+    rng.shuffle(corpus)
+
+    return corpus
+
+
+def post(url, payload):
+    """POST one payload and time the full round trip."""
+
+    body = json.dumps(payload).encode('utf-8')
+
+    req = urllib.request.Request(url, data=body, headers={
+        'Content-Type': 'application/json'
+    })
+
+    started = time.perf_counter()
+
+    try:
+
+        with urllib.request.urlopen(req) as response:
+
+            response.read()
+
+            status = response.status
+
+            queries = response.headers.get('X-Query-Count')
+
+    except urllib.error.HTTPError as error:
+
+        error.read()
+
+        status = error.code
+
+        queries = error.headers.get('X-Query-Count')
+
+    return Sample(
+        payload['practice_code'],
+        status,
+        time.perf_counter() - started,
+        int(queries) if queries is not None else None
+    )
+
+
+def percentile(values, rank):
+    """Nearest-rank percentile of sorted `values`."""
+
+    if not values:
+
+        return float('nan')
+
+    index = max(0, int(round(rank / 100.0 * len(values) + 0.5)) - 1)
+
+    return values[min(index, len(values) - 1)]
+
+
+def summarize(name, samples):
+
+    latencies = sorted(sample.seconds for sample in samples)
+
+    queries = [
+        sample.queries for sample in samples
+        if sample.queries is not None
+    ]
+
+    errors = sum(1 for sample in samples if sample.status != 200)
+
+    print('%-34s %7d %6d %9.2f %9.2f %9.2f %8s' % (
+        name,
+        len(samples),
+        errors,
+        percentile(latencies, 50) * 1000,
+        percentile(latencies, 95) * 1000,
+        percentile(latencies, 99) * 1000,
+        '%.2f' % (sum(queries) / float(len(queries))) if queries else '-'
+    ))
+
+
+def practice_codes(base_url, server):
+    """Registered practice codes, asking `/v1/practices` if remote."""
+
+    if server is not None:
+
+        return registry.codes()
+
+    with urllib.request.urlopen('%s/v1/practices' % base_url) as response:
+
+        data = json.loads(response.read().decode('utf-8'))
+
+    return [item['code'] for item in data['practices']]
+
+
+def serve(app):
+    """Start `app` on a free local port in a daemon thread."""
+
+    logging.getLogger('werkzeug').setLevel(logging.WARNING)
+
+    server = make_server('127.0.0.1', 0, app, threaded=True)
+
+    thread = threading.Thread(target=server.serve_forever)
+
+    thread.daemon = True
+
+    thread.start()
+
+    return server
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+
+    parser.add_argument('--requests', type=int, default=2000)
+
+    parser.add_argument('--concurrency', type=int, default=8)
+
+    parser.add_argument('--warmup', type=int, default=50)
+
+    parser.add_argument('--practices')
+
+    parser.add_argument('--url')
+
+    parser.add_argument('--seed', type=int, default=0)
+
+    parser.add_argument(
+        '--environment',
+        default=fixtures.DEFAULT_ENVIRONMENT
+    )
+
+    args = parser.parse_args()
+
+    server = None
+
+    if args.url:
+
+        base_url = args.url.rstrip('/')
+
+        segments = fixtures.sources_with_loads(fixtures.read_load_rates())
+
+    else:
+
+        app, segments = fixtures.setup(args.environment)
+
+        server = serve(app)
+
+        base_url = 'http://127.0.0.1:%d' % server.server_port
+
+    if args.practices:
+
+        codes = args.practices.split(',')
+
+    else:
+
+        codes = [
+            code for code in practice_codes(base_url, server)
+            if code in payloads.GENERATORS
+        ]
+
+    url = '%s/v1/analyze' % base_url
+
+    corpus = build_corpus(codes, segments, args.requests, args.seed)
+
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+
+        list(executor.map(
+            lambda payload: post(url, payload),
+            corpus[:args.warmup]
+        ))
+
+        started = time.perf_counter()
+
+        samples = list(executor.map(
+            lambda payload: post(url, payload),
+            corpus
+        ))
+
+        elapsed = time.perf_counter() - started
+
+    if server is not None:
+
+        server.shutdown()
+
+    print('%d requests to %s, concurrency %d: %.1f requests/s' % (
+        len(samples),
+        url,
+        args.concurrency,
+        len(samples) / elapsed
+    ))
+
+    print('')
+
+    print('%-34s %7s %6s %9s %9s %9s %8s' % (
+        'practice',
+        'count',
+        'errors',
+        'p50 ms',
+        'p95 ms',
+        'p99 ms',
+        'queries'
+    ))
+
+    by_code = collections.defaultdict(list)
+
+    for sample in samples:
+
+        by_code[sample.practice_code].append(sample)
+
+    for code in sorted(by_code):
+
+        summarize(code, by_code[code])
+
+    summarize('all', samples)
+
+
+if __name__ == '__main__':
+
+    main()
@@ -0,0 +1,216 @@
+#!/usr/bin/env python
+
+"""Generate realistic practice payloads for the benchmarks.
+
+Each generator takes a `random.Random` instance and the segment sources
+from `fixtures.sources_with_loads`, and returns the payload for one
+practice in the shape posted to `/v1/analyze`, less `practice_code`.
+"""
+
+from app.segments import lr_loads
+
+
+def bank_stabilization(rng, segments):
+
+    return {
+        'has_majority_design_completion': rng.random() < 0.5,
+        'length_of_streambank': rng.uniform(100, 5000),
+        'lateral_erosion_rate': rng.uniform(0.01, 0.5),
+        'soil_bulk_density': rng.uniform(70, 110),
+        'eroding_bank_height': rng.uniform(1, 12),
+        'soil_n_content': rng.uniform(0.5, 3),
+        'soil_p_content': rng.uniform(0.2, 1.5)
+    }
+
+
+def denitrification(rng, segments):
+
+    return {
+        'floodplain_sq_ft': rng.uniform(1000, 200000),
+        'channel_sq_ft': rng.uniform(500, 50000),
+        'brf': rng.uniform(0.1, 1),
+        'fhf': rng.uniform(0.1, 1),
+        'acrf': rng.uniform(0.1, 1)
+    }
+
+
+def floodplain_reconnection_1(rng, segments):
+
+    existing_total = rng.uniform(100, 1000)
+
+    proposed_total = rng.uniform(100, 1000)
+
+    return {
+        'existing_treated_discharge': existing_total * rng.uniform(0, 0.5),
+        'proposed_treated_discharge': proposed_total * rng.uniform(0.3, 1),
+        'existing_total_discharge': existing_total,
+        'proposed_total_discharge': proposed_total
+    }
+
+
+def floodplain_reconnection_2(rng, segments):
+
+    # Segments whose lr_loads load rate is zero would leave no loads to
+    # average, which the module does not guard against.
+
+    candidates = sorted(
+        segment for segment in segments
+        if lr_loads.ratios(segment) is not None
+    )
+
+    return {
+        'segments': rng.sample(candidates, rng.randint(1, 5)),
+        'upstream_miles': rng.uniform(0.5, 50),
+        'treatable_flow_credit': rng.uniform(0.05, 0.6)
+    }
+
+
+def floodplain_reconnection_3(rng, segments):
+
+    return {
+        'tn_treatable_load': rng.uniform(10, 2000),
+        'tp_treatable_load': rng.uniform(1, 200),
+        'tss_treatable_load': rng.uniform(1000, 500000),
+        'wetland_restoration': rng.uniform(0, 5),
+        'wetland_creation': rng.uniform(0, 5),
+        'wetland_rehab': rng.uniform(0, 5)
+    }
+
+
+def instream_processing(rng, segments):
+
+    return {
+        'has_majority_design_completion': rng.random() < 0.5,
+        'linear_feet': rng.uniform(100, 5000),
+        'project_left_bank_height': rng.uniform(1, 8),
+        'left_bank_bankfull_height': rng.uniform(1, 6),
+        'project_right_bank_height': rng.uniform(1, 8),
+        'right_bank_bankfull_height': rng.uniform(1, 6),
+        'hyporheic_box_depth': rng.uniform(1, 5),
+        'length_of_left_bank_with_improved_connectivity': (
+            rng.uniform(0, 5000)
+        ),
+        'length_of_right_bank_with_improved_connectivity': (
+            rng.uniform(0, 5000)
+        ),
+        'stream_width_at_mean_base_flow': rng.uniform(2, 40)
+    }
+
+
+def outfall_and_gully_stabilization(rng, segments):
+
+    return {
+        'linear_feet': rng.uniform(50, 2000)
+    }
+
+
+def outfall_stabilization(rng, segments):
+
+    return {
+        'has_majority_design_completion': rng.random() < 0.5,
+        'linear_feet': rng.uniform(50, 2000),
+        'tn_lbs_reduced': rng.uniform(0, 100),
+        'tp_lbs_reduced': rng.uniform(0, 50),
+        'tss_tons_reduced': rng.uniform(0, 20)
+    }
+
+
+def prevented_sediment(rng, segments):
+
+    return {
+        'banks': [
+            {
+                'bulk_density_of_soil': rng.uniform(70, 110),
+                'bank_erosion_rate': rng.uniform(0.01, 0.5),
+                'eroding_bank_length': rng.uniform(50, 2000),
+                'eroding_bank_height': rng.uniform(1, 12),
+                'nitrogen_concentration': rng.uniform(0.5, 3),
+                'phosphorus_concentration': rng.uniform(0.2, 1.5)
+            }
+            for _ in range(rng.randint(1, 6))
+        ]
+    }
+
+
+def shoreline_management(rng, segments):
+
+    return {
+        'has_majority_design_completion': rng.random() < 0.5,
+        'state_code': rng.choice(['dc', 'de', 'md', 'va']),
+        'length_of_living_shoreline': rng.uniform(100, 5000),
+        'existing_avg_bank_height': rng.uniform(1, 10),
+        'existing_shoreline_recession_rate': rng.uniform(0.1, 3),
+        'planted_tidal_wetland_area': rng.uniform(0, 2)
+    }
+
+
+def stormwater(rng, segments):
+
+    impervious_area = rng.uniform(5000, 400000)
+
+    return {
+        'runoff_volume_captured': rng.uniform(0.01, 3),
+        'impervious_area': impervious_area,
+        'total_drainage_area': impervious_area * rng.uniform(1, 4)
+    }
+
+
+def swp(rng, segments, group_count=None):
+
+    selected = rng.sample(sorted(segments), rng.randint(1, 3))
+
+    sources = sorted(set(
+        source for segment in selected for source in segments[segment]
+    ))
+
+    if group_count is None:
+
+        group_count = rng.randint(1, 4)
+
+    return {
+        'segments': selected,
+        'load_sources': [],
+        'footprint_area': rng.uniform(0.05, 2),
+        'ponding_depth': rng.uniform(0.5, 3),
+        'impervious_acres': rng.uniform(0.5, 30),
+        'mode': rng.choice(['rr', 'st']),
+        'input_groups': [
+            {
+                'source_key': rng.choice(sources),
+                'source_acres': rng.uniform(0.5, 50)
+            }
+            for _ in range(group_count)
+        ]
+    }
+
+
+def st(rng, segments):
+
+    return {
+        'footprint_area': rng.uniform(0.05, 2),
+        'ponding_depth': rng.uniform(0.5, 3),
+        'impervious_acres': rng.uniform(0.5, 30)
+    }
+
+
+GENERATORS = {
+    'bank_stabilization': bank_stabilization,
+    'denitrification': denitrification,
+    'floodplain_reconnection_1': floodplain_reconnection_1,
+    'floodplain_reconnection_2': floodplain_reconnection_2,
+    'floodplain_reconnection_3': floodplain_reconnection_3,
+    'instream_processing': instream_processing,
+    'outfall_and_gully_stabilization': outfall_and_gully_stabilization,
+    'outfall_stabilization': outfall_stabilization,
+    'prevented_sediment': prevented_sediment,
+    'shoreline_management': shoreline_management,
+    'stormwater': stormwater,
+    'swp': swp,
+    'st': st
+}
+
+
+def generate(code, rng, segments, count):
+    """Generate `count` payloads for the practice `code`."""
+
+    return [GENERATORS[code](rng, segments) for _ in range(count)]
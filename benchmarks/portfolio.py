@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+
+"""Compare portfolio throughput in-process and on the process pool.
+
+    python -m benchmarks.portfolio [--count 5000] [--workers 1 2 4]
+
+Builds a mixed portfolio of every practice with a payload generator and
+dispatches it with `core.utilities.handle_item` in this process, then
+with `executor.PortfolioExecutor` at each `--workers` count. Pools are
+started and warmed before they are timed. Reports the best wall time of
+`--repeat` runs and the slowest shard of the last run.
+"""
+
+import argparse
+import copy
+import importlib
+import os
+import time
+
+from app import executor
+from app import registry
+
+from . import fixtures
+from . import payloads
+from . import report
+from .http_load import build_corpus
+
+
+def best_of(repeat, func, items):
+    """Return the best wall time and the last result of `func(items)`."""
+
+    best = None
+
+    for _ in range(repeat):
+
+        batch = copy.deepcopy(items)
+
+        started = time.perf_counter()
+
+        result = func(batch)
+
+        elapsed = time.perf_counter() - started
+
+        best = elapsed if best is None else min(best, elapsed)
+
+    return best, result
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+
+    parser.add_argument('--count', type=int, default=5000)
+
+    parser.add_argument(
+        '--workers',
+        type=int,
+        nargs='+',
+        default=sorted(set([1, 2, os.cpu_count() or 1]))
+    )
+
+    parser.add_argument('--chunk-size', type=int, default=None)
+
+    parser.add_argument('--repeat', type=int, default=3)
+
+    parser.add_argument('--seed', type=int, default=0)
+
+    parser.add_argument(
+        '--environment',
+        default=fixtures.DEFAULT_ENVIRONMENT
+    )
+
+    args = parser.parse_args()
+
+    app, segments = fixtures.setup(args.environment)
+
+    codes = [
+        code for code in registry.codes()
+        if code in payloads.GENERATORS
+    ]
+
+    items = build_corpus(codes, segments, args.count, args.seed)
+
+    print('%d practices (%s), best of %d runs:' % (
+        args.count,
+        ', '.join(codes),
+        args.repeat
+    ))
+
+    handle_item = importlib.import_module('core.utilities').handle_item
+
+    def in_process(batch):
+
+        return [
+            handle_item(index, data)
+            for index, data in enumerate(batch)
+        ]
+
+    with app.app_context():
+
+        in_process(copy.deepcopy(items))
+
+        seconds, _ = best_of(args.repeat, in_process, items)
+
+    report('in-process', seconds / args.count)
+
+    for workers in args.workers:
+
+        pool = executor.PortfolioExecutor(
+            args.environment,
+            workers=workers,
+            chunk_size=args.chunk_size)
+
+        try:
+
+            pool.run(items[:workers * 4])
+
+            seconds, result = best_of(args.repeat, pool.run, items)
+
+        finally:
+
+            pool.shutdown()
+
+        slowest = max(
+            result['meta']['shards'],
+            key=lambda timing: timing['compute_ms'])
+
+        report('%d workers' % workers, seconds / args.count)
+
+        print('%-40s %d shards, slowest %.1f ms (%d items)' % (
+            '',
+            len(result['meta']['shards']),
+            slowest['compute_ms'],
+            slowest['count']))
+
+
+if __name__ == '__main__':
+
+    main()
@@ -0,0 +1,309 @@
+#!/usr/bin/env python
+
+"""Micro-benchmark the `reduction()` of every practice module.
+
+    python -m benchmarks.reductions [--count 1000] [--repeat 5] [module ...]
+
+Every module directory under `MODULE_PATH` is benchmarked with generated
+payloads (see `benchmarks.payloads`). Registered practices are validated
+once and then timed through `Practice.reduction`. Unregistered modules
+that still have a `utilities.reduction` are called directly. Modules
+without one are listed as skipped. Reports the best per-call latency and
+throughput over `--repeat` runs.
+
+Modules in `ENGINES` are also timed through their vectorized engine,
+on the same payloads, after checking that it matches the scalar
+`utilities` functions to within the engine's `TOLERANCE`. A mismatch
+stops the run with an `AssertionError`.
+"""
+
+import argparse
+import copy
+import functools
+import importlib
+import math
+import os
+import random
+import sys
+
+from app import registry
+
+from . import fixtures
+from . import measure
+from . import payloads
+from . import report
+
+
+def find_reduction(name, tables=False):
+    """Return the reduction function and payload preparation for `name`."""
+
+    practice = registry.get(name)
+
+    if practice is not None:
+
+        def prepare(payload):
+
+            practice.validate(payload)
+
+            return payload
+
+        return functools.partial(practice.reduction, tables=tables), prepare
+
+    module = sys.modules.get(name)
+
+    utilities = getattr(module, 'utilities', None)
+
+    reduction = getattr(utilities, 'reduction', None)
+
+    return reduction, None
+
+
+def run_all(reduction, items):
+
+    for payload in items:
+
+        reduction(payload)
+
+
+def assert_close(name, index, key, expected, actual, tolerance):
+
+    if not math.isclose(float(expected), float(actual), **{
+        'rel_tol': tolerance,
+        'abs_tol': tolerance
+    }):
+
+        raise AssertionError(
+            '%s engine: payload %s `%s` is %r, utilities give %r' % (
+                name,
+                index,
+                key,
+                float(actual),
+                expected))
+
+
+def stormwater_engine(items, tables):
+    """Check `stormwater.engine` against `stormwater.utilities`.
+
+    The engine is documented to agree with the scalar path to within
+    `stormwater.engine.TOLERANCE`.
+
+    :return function: Computes every payload of `items` at once.
+    """
+
+    engine = importlib.import_module('stormwater.engine')
+
+    utilities = importlib.import_module('stormwater.utilities')
+
+    columns = [
+        [payload[key] for payload in items]
+        for key in (
+            'runoff_volume_captured',
+            'impervious_area',
+            'total_drainage_area'
+        )
+    ]
+
+    result = engine.reductions(*columns, tables=tables)
+
+    functions = {
+        'tn': utilities.nitrogen,
+        'tp': utilities.phosphorus,
+        'tss': utilities.sediment
+    }
+
+    for index, payload in enumerate(items):
+
+        depth_treated = utilities.runoff_depth_treated(payload)
+
+        assert_close(
+            'stormwater',
+            index,
+            'depth_treated',
+            depth_treated,
+            result['depth_treated'][index],
+            engine.TOLERANCE)
+
+        for key, function in functions.items():
+
+            expected = function(payload, **{
+                'depth_treated': depth_treated,
+                'tables': tables
+            })
+
+            assert_close(
+                'stormwater',
+                index,
+                '%s_curve' % key,
+                expected['curve'],
+                result['%s_curve' % key][index],
+                engine.TOLERANCE)
+
+            assert_close(
+                'stormwater',
+                index,
+                '%s_reduction' % key,
+                expected['reduction'],
+                result['%s_reduction' % key][index],
+                engine.TOLERANCE)
+
+    return lambda: engine.reductions(*columns, tables=tables)
+
+
+def swp_engine(items, tables):
+    """Check `swp.engine.evaluate` against `swp.utilities.reduction`.
+
+    The pound totals and the percent and pounds reduced of every group
+    are compared to within `swp.engine.TOLERANCE`.
+
+    :return function: Computes every payload of `items` at once.
+    """
+
+    engine = importlib.import_module('swp.engine')
+
+    utilities = importlib.import_module('swp.utilities')
+
+    result = engine.evaluate(copy.deepcopy(items), tables=tables)
+
+    keys = ['%s_lbs_reduced' % key for key in engine.KEYS]
+
+    for index, payload in enumerate(items):
+
+        expected = utilities.reduction(copy.deepcopy(payload), tables=tables)
+
+        for key in keys:
+
+            assert_close(
+                'swp',
+                index,
+                key,
+                expected[key],
+                result[index][key],
+                engine.TOLERANCE)
+
+        groups = zip(expected['input_groups'], result[index]['input_groups'])
+
+        for group, (expected_group, actual_group) in enumerate(groups):
+
+            for key in engine.KEYS:
+
+                for name in ('%s_pct_reduced' % key, '%s_lbs_reduced' % key):
+
+                    assert_close(
+                        'swp',
+                        index,
+                        'input_groups[%s].%s' % (group, name),
+                        expected_group[name],
+                        actual_group[name],
+                        engine.TOLERANCE)
+
+    return lambda: engine.evaluate(items, tables=tables)
+
+
+#: Vectorized engines, checked and timed alongside `reduction()`.
+
+ENGINES = {
+    'stormwater': stormwater_engine,
+    'swp': swp_engine
+}
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+
+    parser.add_argument('modules', nargs='*')
+
+    parser.add_argument('--count', type=int, default=1000)
+
+    parser.add_argument('--repeat', type=int, default=5)
+
+    parser.add_argument('--seed', type=int, default=0)
+
+    parser.add_argument(
+        '--environment',
+        default=fixtures.DEFAULT_ENVIRONMENT
+    )
+
+    args = parser.parse_args()
+
+    app, segments = fixtures.setup(args.environment)
+
+    modules_path = app.config['MODULE_PATH']
+
+    names = args.modules or sorted(
+        name for name in os.listdir(modules_path)
+        if not name.startswith(('_', '.')) and
+        os.path.isdir(os.path.join(modules_path, name))
+    )
+
+    skipped = []
+
+    print('%d payloads per module, best of %d runs:' % (
+        args.count,
+        args.repeat
+    ))
+
+    with app.app_context():
+
+        for name in names:
+
+            reduction, prepare = find_reduction(
+                name,
+                app.config.get('CURVE_TABLES', False))
+
+            if reduction is None:
+
+                skipped.append((name, 'no reduction()'))
+
+                continue
+
+            if name not in payloads.GENERATORS:
+
+                skipped.append((name, 'no payload generator'))
+
+                continue
+
+            rng = random.Random(args.seed)
+
+            items = payloads.generate(name, rng, segments, args.count)
+
+            if prepare is not None:
+
+                items = [prepare(payload) for payload in items]
+
+            try:
+
+                run_all(reduction, items)
+
+            except Exception as error:
+
+                skipped.append((name, 'raised %r' % error))
+
+                continue
+
+            seconds = measure(
+                lambda: run_all(reduction, items),
+                1,
+                args.repeat
+            )
+
+            report(name, seconds / args.count)
+
+            if name in ENGINES:
+
+                compute = ENGINES[name](
+                    items,
+                    app.config.get('CURVE_TABLES', False))
+
+                seconds = measure(compute, 1, args.repeat)
+
+                report('%s (engine)' % name, seconds / args.count)
+
+    for name, reason in skipped:
+
+        print('%-40s skipped: %s' % (name, reason))
+
+
+if __name__ == '__main__':
+
+    main()
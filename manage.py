@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+
+"""Run maintenance commands against the application database.
+
+For license and copyright information please see the LICENSE document (the
+"License") included with this software package. This file may not be used
+in any manner except in compliance with the License unless required by
+applicable law or agreed to in writing, software distributed under the
+License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR
+CONDITIONS OF ANY KIND, either express or implied.
+
+See the License for the specific language governing permissions and
+limitations under the License.
+
+"""
+
+
+import argparse
+
+from app import application
+from app import log
+from app import logger
+
+
+def rebuild_ratios(arguments):
+    """Recompute the `load_rate_ratios` table from `load_rates`."""
+
+    from app.modules.swp import cache
+
+    count = cache.rebuild_ratios()
+
+    logger.info('Rebuilt %s load rate ratios.', count)
+
+
+def build_segments(arguments):
+    """Compile the segment load-rate CSV into its memory-mapped form."""
+
+    from app import segments
+
+    table = segments.SegmentTable.from_csv()
+
+    count = table.build()
+
+    logger.info(
+        'Compiled %s segments into %s (version %s).',
+        count,
+        segments.BINARY_PATH,
+        table.version)
+
+
+def create_tables(arguments):
+    """Create any missing tables, for databases not managed by Alembic."""
+
+    from app import db
+
+    db.create_all()
+
+    logger.info('Created missing tables.')
+
+
+COMMANDS = {
+    'build-segments': build_segments,
+    'create-tables': create_tables,
+    'rebuild-ratios': rebuild_ratios
+}
+
+#: Commands that do not need a configured application or database.
+
+OFFLINE_COMMANDS = set([
+    'build-segments'
+])
+
+
+if __name__ == "__main__":
+    """Parse the command line.
+
+    @param (str) command
+        The maintenance command to run
+    @param (str) environment
+        The desired environment configuration to run the command against
+    """
+    parser = argparse.ArgumentParser(**{
+        'prog': 'FieldDoc',
+        'description': 'FieldDoc maintenance commands'
+    })
+
+    parser.add_argument('command', **{
+        'choices': sorted(COMMANDS),
+        'help': 'maintenance command to run'
+    })
+
+    parser.add_argument('--environment', **{
+        'type': str,
+        'help': 'set application environment (default: production.ProductionConfig)',
+        'default': 'production.ProductionConfig'
+    })
+
+    arguments = parser.parse_args()
+
+    if arguments.command in OFFLINE_COMMANDS:
+
+        log.configure({
+            'LOG_FORMAT': 'text'
+        })
+
+        COMMANDS[arguments.command](arguments)
+
+        raise SystemExit(0)
+
+    """Instantiate the Application
+
+    Setup the basic Application class so the command can reach the
+    database configured for the given environment.
+    """
+    instance = application.Application(
+        name=__name__,
+        environment=arguments.environment
+    )
+
+    with instance.app.app_context():
+
+        COMMANDS[arguments.command](arguments)
@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+
+"""Compute a portfolio of practices without the web server.
+
+    python runbatch.py portfolio.csv results.parquet --workers 0
+
+Reads practices from a CSV, JSON Lines, JSON or Parquet file, runs them
+through the same `reduction()` functions as `/v1/analyze/batch`, and
+writes one result row per practice, in input order. See `app/portfolio.py`
+for the file layouts. Parquet requires `pyarrow`.
+
+For license and copyright information please see the LICENSE document (the
+"License") included with this software package. This file may not be used
+in any manner except in compliance with the License unless required by
+applicable law or agreed to in writing, software distributed under the
+License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR
+CONDITIONS OF ANY KIND, either express or implied.
+
+See the License for the specific language governing permissions and
+limitations under the License.
+
+"""
+
+
+import argparse
+
+from app import application
+from app import logger
+from app import portfolio
+
+
+FORMATS = sorted(set(portfolio.FORMATS.values()))
+
+
+if __name__ == "__main__":
+    """Parse the command line.
+
+    @param (str) input
+        The portfolio file to read
+    @param (str) output
+        The results file to write
+    @param (str) environment
+        The desired environment configuration to compute with
+    @param (int) workers
+        Worker processes; 1 computes in this process, 0 uses every CPU
+    """
+    parser = argparse.ArgumentParser(**{
+        'prog': 'FieldDoc',
+        'description': 'FieldDoc offline portfolio runner'
+    })
+
+    parser.add_argument('input', **{
+        'help': 'portfolio file (.csv, .jsonl, .json or .parquet)'
+    })
+
+    parser.add_argument('output', **{
+        'help': 'results file (.parquet, .csv, .jsonl or .json)'
+    })
+
+    parser.add_argument('--environment', **{
+        'type': str,
+        'help': 'set application environment (default: production.ProductionConfig)',
+        'default': 'production.ProductionConfig'
+    })
+
+    parser.add_argument('--workers', **{
+        'type': int,
+        'help': 'worker processes; 0 for one per CPU (default: 1)',
+        'default': 1
+    })
+
+    parser.add_argument('--chunk-size', **{
+        'type': int,
+        'help': 'practices per worker shard (default: automatic)',
+        'default': None
+    })
+
+    parser.add_argument('--input-format', **{
+        'choices': FORMATS,
+        'help': 'input format (default: from the file extension)'
+    })
+
+    parser.add_argument('--output-format', **{
+        'choices': FORMATS,
+        'help': 'output format (default: from the file extension)'
+    })
+
+    arguments = parser.parse_args()
+
+    try:
+
+        output_format = portfolio.detect_format(
+            arguments.output,
+            arguments.output_format)
+
+        if output_format == 'parquet':
+
+            portfolio.import_parquet()
+
+        items = portfolio.read(arguments.input, arguments.input_format)
+
+    except (OSError, portfolio.FormatError) as error:
+
+        parser.error(str(error))
+
+    """Instantiate the Application
+
+    Setup the basic Application class so the practices can reach the
+    database configured for the given environment.
+    """
+    instance = application.Application(
+        name=__name__,
+        environment=arguments.environment
+    )
+
+    batch = portfolio.run(
+        instance.app,
+        items,
+        workers=arguments.workers,
+        chunk_size=arguments.chunk_size)
+
+    portfolio.write(
+        arguments.output,
+        items,
+        batch['results'],
+        output_format)
+
+    logger.info(
+        'Computed %s practices (%s errors) on %s workers in %.1f s; wrote %s.',
+        batch['meta']['count'],
+        batch['meta']['errors'],
+        batch['meta']['workers'],
+        batch['meta']['elapsed_ms'] / 1000,
+        arguments.output)